@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""Benchmark batched vs per-strategy trading metric evaluation.
+
+Evaluates Sharpe, max drawdown, VaR and profit factor for N strategies over
+T daily periods with ``evaluate_trading_metrics_batch`` and compares it with
+calling ``evaluate_trading_metrics`` column by column (timed on a sample and
+extrapolated).
+
+Usage:
+  python scripts/benchmarks/bench_financial_metrics.py [--strategies 10000] [--days 1260]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Make `src` importable when run as a plain script from the repo root
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.analytics.evaluation import (
+    evaluate_trading_metrics,
+    evaluate_trading_metrics_batch,
+)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--strategies", type=int, default=10_000)
+    parser.add_argument("--days", type=int, default=252 * 5)
+    parser.add_argument("--sample", type=int, default=200)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    # Daily PnL on unit equity, so both paths compute every metric
+    pnl = rng.normal(0.0004, 0.012, size=(args.days, args.strategies))
+
+    t0 = time.perf_counter()
+    batch = evaluate_trading_metrics_batch(pnl=pnl)
+    batch_s = time.perf_counter() - t0
+
+    sample = min(args.sample, args.strategies)
+    t0 = time.perf_counter()
+    for i in range(sample):
+        evaluate_trading_metrics(pnl=pnl[:, i])
+    loop_s = (time.perf_counter() - t0) * args.strategies / sample
+
+    print(f"strategies={args.strategies} days={args.days}")
+    print(f"batch:       {batch_s:8.3f} s")
+    print(f"per-column:  {loop_s:8.3f} s (extrapolated from {sample})")
+    print(f"speedup:     {loop_s / batch_s:8.1f}x")
+    print(f"median sharpe {float(np.median(batch.sharpe_sim)):.3f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
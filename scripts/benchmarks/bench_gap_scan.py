@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""Benchmark sequential vs concurrent GapRvolScanner universe scans.
+
+Runs both scan modes against a fake IB client whose ``reqHistoricalData``
+sleeps for a jittered round-trip latency. The sequential ``scan`` is timed on
+a sample of the universe and extrapolated; ``scan_async`` is timed on the full
+universe cold (empty prev-close/ADV caches) and warm (caches populated, one
+short incremental intraday request per symbol). Intraday bars and bytes
+fetched are reported per cycle.
+
+Usage:
+  python scripts/benchmarks/bench_gap_scan.py [--symbols 200] [--latency-ms 150]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+# Make `src` importable when run as a plain script from the repo root
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.scanner.gap_rvol_scanner import GapRvolScanner
+from src.utils.time_utils import now_eastern
+
+
+class FakeIB:
+    """Blocking historical-data client with per-request latency."""
+
+    def __init__(self, latency_s: float, jitter: float = 0.3, seed: int = 1) -> None:
+        self.latency_s = latency_s
+        self.jitter = jitter
+        self.requests = 0
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def isConnected(self) -> bool:  # noqa: N802
+        return True
+
+    def reqHistoricalData(self, contract: Any, **kwargs: Any) -> pd.DataFrame:  # noqa: N802
+        with self._lock:
+            self.requests += 1
+            delay = self.latency_s * (1 + self._rng.uniform(-self.jitter, self.jitter))
+        time.sleep(delay)
+        symbol = contract["symbol"] if isinstance(contract, dict) else contract.symbol
+        # Every third symbol gaps up 10% on heavy volume
+        gapper = int(symbol[3:]) % 3 == 0
+        if kwargs.get("barSizeSetting") == "1 min":
+            price = 11.0 if gapper else 10.05
+            duration = kwargs["durationStr"]
+            if duration.endswith(" S"):
+                n = max(1, int(duration.split()[0]) // 60)
+            else:
+                n = 600  # pre-market through the current minute
+            end = pd.Timestamp(now_eastern()).floor("min")
+            index = pd.date_range(end=end, periods=n, freq="min")
+            return pd.DataFrame(
+                {"open": [price] * n, "close": [price] * n, "volume": [50_000] * n},
+                index=index,
+            )
+        days = 21 if kwargs.get("durationStr") == "21 D" else 2
+        return pd.DataFrame(
+            {"close": [10.0] * days, "volume": [1_000_000] * days},
+            index=pd.RangeIndex(days),
+        )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--symbols", type=int, default=200)
+    parser.add_argument("--latency-ms", type=float, default=150.0)
+    parser.add_argument("--sample", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--rate", type=float, default=20.0)
+    args = parser.parse_args()
+
+    universe = [f"SYM{i:04d}" for i in range(args.symbols)]
+    latency = args.latency_ms / 1000.0
+
+    seq_ib = FakeIB(latency)
+    sample = universe[: min(args.sample, len(universe))]
+    t0 = time.perf_counter()
+    GapRvolScanner(seq_ib).scan(sample)
+    seq_s = (time.perf_counter() - t0) * len(universe) / len(sample)
+
+    ib = FakeIB(latency)
+    scanner = GapRvolScanner(ib)
+    first: list[float] = []
+    t0 = time.perf_counter()
+
+    def on_candidate(_c: Any) -> None:
+        if not first:
+            first.append(time.perf_counter() - t0)
+
+    cold = asyncio.run(
+        scanner.scan_async(
+            universe,
+            on_candidate=on_candidate,
+            concurrency=args.concurrency,
+            rate_per_sec=args.rate,
+        )
+    )
+    cold_s = time.perf_counter() - t0
+    cold_requests = ib.requests
+    cold_fetch = scanner.fetch_stats
+
+    t0 = time.perf_counter()
+    warm = asyncio.run(
+        scanner.scan_async(
+            universe, concurrency=args.concurrency, rate_per_sec=args.rate
+        )
+    )
+    warm_s = time.perf_counter() - t0
+    warm_fetch = scanner.fetch_stats
+
+    print(
+        f"symbols={len(universe)} latency={args.latency_ms:.0f}ms "
+        f"concurrency={args.concurrency} rate={args.rate:g}/s"
+    )
+    print(f"sequential:  {seq_s:8.2f} s (extrapolated from {len(sample)})")
+    print(
+        f"async cold:  {cold_s:8.2f} s  requests={cold_requests} "
+        f"first candidate after {first[0] if first else float('nan'):.2f} s"
+    )
+    print(f"async warm:  {warm_s:8.2f} s  requests={ib.requests - cold_requests}")
+    print(f"speedup:     {seq_s / cold_s:8.1f}x cold, {seq_s / warm_s:.1f}x warm")
+    print(f"candidates:  {len(cold)} cold, {len(warm)} warm")
+    for label, stats in (("cold", cold_fetch), ("warm", warm_fetch)):
+        print(
+            f"intraday {label}: requests={stats.requests} "
+            f"bars={stats.bars} bytes={stats.bytes}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
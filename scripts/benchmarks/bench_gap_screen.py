@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""Benchmark the columnar gap/RVOL screen against the per-symbol path.
+
+Builds a synthetic universe with cached inputs and times one screen pass via
+``GapRvolScanner._build_candidate`` per symbol and via ``screening.screen``.
+
+Usage:
+  python scripts/benchmarks/bench_gap_screen.py [--symbols 5000] [--repeat 20]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+# Make `src` importable when run as a plain script from the repo root
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.scanner.gap_rvol_scanner import GapRvolScanner
+from src.scanner.screening import screen
+from src.utils.time_utils import US_EASTERN, normalized_time_fraction
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--symbols", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    n = args.symbols
+    symbols = [f"S{i:05d}" for i in range(n)]
+    prev = rng.uniform(0.5, 35.0, n)
+    last = prev * rng.uniform(0.9, 1.3, n)
+    volume = rng.integers(0, 5_000_000, n)
+    adv = rng.integers(1, 2_000_000, n)
+    now = datetime(2025, 3, 4, 11, 0, tzinfo=US_EASTERN)
+    tf = normalized_time_fraction(now)
+
+    def scalar() -> int:
+        found = []
+        for i, sym in enumerate(symbols):
+            p, pc = float(last[i]), float(prev[i])
+            if not GapRvolScanner._price_and_gap_ok(p, pc):
+                continue
+            c = GapRvolScanner._build_candidate(
+                sym, now, tf, pc, p, int(volume[i]), int(adv[i])
+            )
+            if c is not None:
+                found.append(c)
+        found.sort(key=lambda c: c.gap_pct * c.rvol, reverse=True)
+        return len(found)
+
+    def vectorized() -> int:
+        return len(screen(symbols, last, prev, volume, adv, tf))
+
+    for label, fn in (("per-symbol", scalar), ("columnar", vectorized)):
+        hits = fn()
+        t0 = time.perf_counter()
+        for _ in range(args.repeat):
+            fn()
+        ms = (time.perf_counter() - t0) * 1000 / args.repeat
+        print(f"{label:11s} {ms:8.2f} ms/pass  symbols={n} candidates={hits}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
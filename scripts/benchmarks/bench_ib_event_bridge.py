@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Benchmark the AsyncIBWrapper cross-thread event bridge.
+
+A producer thread (standing in for the IB reader thread) fires ``--events``
+``updateMktDepth`` callbacks while an asyncio consumer drains the depth
+queue. The legacy bridge schedules ``run_coroutine_threadsafe(q.put(...))``
+per message and the consumer awaits each item; the batched bridge buffers
+callbacks, wakes the loop once per burst and the consumer takes a list per
+wakeup. Reports events/second and CPU time spent on the loop thread.
+
+Usage:
+  python scripts/benchmarks/bench_ib_event_bridge.py [--events 200000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+# Make `src` importable when run as a plain script from the repo root
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.lib.ib_async_wrapper import AsyncIBWrapper, get_batch
+
+
+class _LegacyWrapper(AsyncIBWrapper):
+    """The previous bridge: one coroutine, Future and wakeup per message."""
+
+    def _enqueue(self, q: asyncio.Queue[Any], item: Any) -> None:
+        assert self._loop is not None
+        asyncio.run_coroutine_threadsafe(q.put(item), self._loop)
+
+
+async def _run(wrapper: AsyncIBWrapper, events: int, batched: bool):
+    wrapper.set_event_loop(asyncio.get_running_loop())
+    wrapper.set_pending_request(1, "AAPL")
+    q = wrapper.get_market_depth_events()
+
+    def producer() -> None:
+        for i in range(events):
+            wrapper.updateMktDepth(1, i % 10, 1, i % 2, 10.0 + i % 7, 100)
+
+    cpu0, t0 = time.thread_time(), time.perf_counter()
+    thread = threading.Thread(target=producer)
+    thread.start()
+    received = 0
+    while received < events:
+        if batched:
+            received += len(await get_batch(q))
+        else:
+            await q.get()
+            received += 1
+    elapsed = time.perf_counter() - t0
+    loop_cpu = time.thread_time() - cpu0
+    thread.join()
+    return elapsed, loop_cpu
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=200_000)
+    args = parser.parse_args()
+
+    print(f"{args.events:,} depth callbacks from a producer thread")
+    runs = {
+        "legacy": (_LegacyWrapper(), False),
+        "batched": (AsyncIBWrapper(), True),
+    }
+    for name, (wrapper, batched) in runs.items():
+        elapsed, loop_cpu = asyncio.run(_run(wrapper, args.events, batched))
+        line = (
+            f"{name:8s} {args.events / elapsed:>10,.0f} events/s  "
+            f"loop cpu {loop_cpu:6.2f} s ({loop_cpu / args.events * 1e6:.1f} us/event)"
+        )
+        if batched:
+            stats = wrapper.get_bridge_stats()
+            line += f"  wakeups={stats['batches']:,} avg_batch={stats['avg_batch']:.0f}"
+        print(line)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
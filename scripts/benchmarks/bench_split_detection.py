@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""Benchmark universe-wide stock split detection.
+
+Writes N symbols x Y years of synthetic daily bars (feather, one file per
+symbol, with random 2:1 / 3:1 splits injected) to a temp directory, then
+times:
+
+- the former per-row ``iloc`` loop (price gaps + volume anomalies), on a
+  sample of symbols and extrapolated;
+- the vectorized ``detect_splits``, in-process over the full universe;
+- ``scan_split_directory`` with a process pool (file reading included).
+
+Usage:
+  python scripts/benchmarks/bench_split_detection.py [--symbols 5000] [--years 10]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Make `src` importable when run as a plain script from the repo root
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.services.stock_split_detection_service import (
+    COMMON_SPLIT_RATIOS,
+    detect_splits,
+    read_daily_bars,
+    scan_split_directory,
+)
+
+
+def _write_universe(root: Path, symbols: int, days: int, seed: int) -> int:
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range("2015-01-02", periods=days, name="date")
+    injected = 0
+    for n in range(symbols):
+        close = 50 * np.cumprod(1 + rng.normal(0.0003, 0.015, days))
+        volume = rng.lognormal(13, 0.4, days)
+        if rng.random() < 0.2:
+            at = int(rng.integers(30, days))
+            close[at:] /= rng.choice([2.0, 3.0])
+            volume[at] *= 6
+            injected += 1
+        pd.DataFrame(
+            {"close": close, "volume": volume}, index=index
+        ).reset_index().to_feather(root / f"S{n:05d}_USUSD_1D.ftr")
+    return injected
+
+
+def _legacy_scan(df: pd.DataFrame, threshold: float = 0.4) -> int:
+    """Per-row loop the service used before vectorization (hit count only)."""
+    hits = 0
+    returns = df["close"].pct_change()
+    for i, value in enumerate(returns):
+        if pd.isna(value) or i == 0:
+            continue
+        if value < -threshold:
+            min(COMMON_SPLIT_RATIOS, key=lambda r: abs(r - (abs(value) + 1)))
+            hits += 1
+    volume_ma = df["volume"].rolling(window=20, min_periods=5).mean()
+    volume_ratio = df["volume"] / volume_ma
+    for i in range(len(df)):
+        if pd.isna(volume_ratio.iloc[i]) or pd.isna(returns.iloc[i]):
+            continue
+        if volume_ratio.iloc[i] > 3.0 and returns.iloc[i] < -0.2:
+            hits += 1
+    return hits
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--symbols", type=int, default=5_000)
+    parser.add_argument("--years", type=int, default=10)
+    parser.add_argument("--sample", type=int, default=50)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    days = args.years * 252
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        t0 = time.perf_counter()
+        injected = _write_universe(root, args.symbols, days, seed=42)
+        print(
+            f"universe: {args.symbols} symbols x {days} days "
+            f"({injected} splits injected), written in {time.perf_counter() - t0:.1f}s"
+        )
+        files = sorted(root.glob("*.ftr"))
+        frames = {p.stem.split("_")[0]: read_daily_bars(p) for p in files}
+
+        sample = list(frames.items())[: args.sample]
+        t0 = time.perf_counter()
+        for _, df in sample:
+            _legacy_scan(df)
+        legacy = (time.perf_counter() - t0) / len(sample) * len(frames)
+
+        t0 = time.perf_counter()
+        found = sum(len(detect_splits(sym, df)) for sym, df in frames.items())
+        vectorized = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        table = scan_split_directory(root, max_workers=args.workers)
+        batch = time.perf_counter() - t0
+
+    rows = len(frames) * days
+    print(f"legacy row loop (extrapolated): {legacy:8.2f}s")
+    print(
+        f"vectorized, in-process:         {vectorized:8.2f}s "
+        f"({rows / vectorized:,.0f} rows/s, {legacy / vectorized:.0f}x)"
+    )
+    print(
+        f"batch scan, {args.workers} process(es):     {batch:8.2f}s "
+        f"(incl. reading files; {len(frames) / batch:,.0f} symbols/s)"
+    )
+    print(f"splits found: {found} in-process, {len(table)} in batch table")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
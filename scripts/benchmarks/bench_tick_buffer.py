@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""Benchmark per-callback ``pd.concat`` vs ``ColumnBuffer`` tick capture.
+
+Simulates a tick-by-tick stream at ``--rate`` ticks/sec for ``--hours``,
+delivered in callbacks of ``--batch`` ticks. The concat approach is
+quadratic, so it is timed on the first ``--concat-minutes`` only and the
+full-session cost is extrapolated (as ~n^2). The buffer is timed on the whole
+session, spilling Parquet segments to a temp dir every ``--spill-rows`` rows,
+then converted to a DataFrame once.
+
+Usage:
+  python scripts/benchmarks/bench_tick_buffer.py [--hours 2] [--rate 500]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pandas as pd
+
+# Make `src` importable when run as a plain script from the repo root
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.services.market_data.column_buffer import ColumnBuffer
+from src.services.market_data.market_data_service import TICK_SCHEMA
+
+COLUMNS = list(TICK_SCHEMA)
+
+
+def _batches(total: int, batch: int, start: datetime):
+    step = timedelta(seconds=1) / 500
+    for base in range(0, total, batch):
+        yield [
+            (start + step * i, 10.0 + (i % 100) * 0.01, 100, "ARCA", "")
+            for i in range(base, min(base + batch, total))
+        ]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--hours", type=float, default=2.0)
+    parser.add_argument("--rate", type=int, default=500)
+    parser.add_argument("--batch", type=int, default=25)
+    parser.add_argument("--concat-minutes", type=float, default=2.0)
+    parser.add_argument("--spill-rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    total = int(args.hours * 3600 * args.rate)
+    start = datetime(2025, 3, 4, 14, 30, tzinfo=UTC)
+
+    sample = int(args.concat_minutes * 60 * args.rate)
+    frame = pd.DataFrame(columns=COLUMNS)
+    t0 = time.perf_counter()
+    for rows in _batches(sample, args.batch, start):
+        frame = pd.concat(
+            [frame, pd.DataFrame(rows, columns=COLUMNS)], ignore_index=True
+        )
+    concat_s = time.perf_counter() - t0
+    concat_full = concat_s * (total / sample) ** 2
+
+    with tempfile.TemporaryDirectory() as spill:
+        buf = ColumnBuffer(
+            TICK_SCHEMA, 4096, spill_rows=args.spill_rows, spill_dir=spill, name="ticks"
+        )
+        t0 = time.perf_counter()
+        for rows in _batches(total, args.batch, start):
+            for row in rows:
+                buf.append(*row)
+        append_s = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        out = buf.to_frame()
+        frame_s = time.perf_counter() - t0
+        segments = len(buf.segments)
+
+    print(
+        f"stream: {total:,} ticks ({args.hours:g} h @ {args.rate}/s, batch {args.batch})"
+    )
+    print(
+        f"concat:  {concat_s:8.2f} s for {sample:,} ticks "
+        f"-> ~{concat_full / 60:,.0f} min extrapolated"
+    )
+    print(
+        f"buffer:  {append_s:8.2f} s append ({append_s / total * 1e6:.2f} us/tick), "
+        f"{frame_s:.2f} s to_frame, {segments} spilled segments, rows={len(out):,}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
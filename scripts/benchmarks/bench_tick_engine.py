@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Benchmark MarketDataService tick processing under a burst of streams.
+
+Pushes ``--ticks`` ticks for ``--symbols`` symbols as fast as possible into
+a ``MarketDataService`` with a snapshot handler that costs ``--handler-us``
+microseconds per call (a GUI redraw or socket write), then reports drops,
+queue lag and handler calls. The baseline configuration mirrors the old
+processing loop: one queue of 10,000, one worker, a handler call per tick.
+
+Usage:
+  python scripts/benchmarks/bench_tick_engine.py [--ticks 200000] [--symbols 50]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Make `src` importable when run as a plain script from the repo root
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.services.market_data_service import (
+    MarketDataService,
+    MarketDataSnapshot,
+    MarketDataTick,
+    TickType,
+)
+
+
+def _run(ticks: list[MarketDataTick], symbols: list[str], handler_s: float, **kw):
+    service = MarketDataService(**kw)
+    calls = 0
+
+    def handler(_snapshot):
+        nonlocal calls
+        calls += 1
+        end = time.perf_counter() + handler_s
+        while time.perf_counter() < end:
+            pass
+
+    service.add_snapshot_handler(handler)
+    for sym in symbols:
+        service.snapshots[sym] = MarketDataSnapshot(symbol=sym)
+    service._start_processing_thread()
+    t0 = time.perf_counter()
+    for tick in ticks:
+        service.submit_tick(tick)
+    while service.engine.qsize():
+        time.sleep(0.01)
+    elapsed = time.perf_counter() - t0
+    service._stop_processing_thread()
+    stats = service.get_stream_statistics()
+    return elapsed, stats, calls
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ticks", type=int, default=200_000)
+    parser.add_argument("--symbols", type=int, default=50)
+    parser.add_argument("--handler-us", type=float, default=20.0)
+    parser.add_argument("--shards", type=int, default=4)
+    parser.add_argument("--conflation", type=float, default=0.1)
+    args = parser.parse_args()
+
+    symbols = [f"S{i:03d}" for i in range(args.symbols)]
+    kinds = [TickType.BID_PRICE, TickType.ASK_PRICE, TickType.BID_SIZE]
+    ticks = [
+        MarketDataTick(symbols[i % len(symbols)], kinds[i % 3], 10.0 + i % 100)
+        for i in range(args.ticks)
+    ]
+    handler_s = args.handler_us / 1e6
+
+    configs = {
+        "baseline": {"shards": 1, "conflation_interval": 0},
+        "engine": {"shards": args.shards, "conflation_interval": args.conflation},
+    }
+    print(
+        f"burst: {args.ticks:,} ticks over {args.symbols} symbols, "
+        f"handler {args.handler_us:g} us"
+    )
+    for name, kw in configs.items():
+        elapsed, stats, calls = _run(ticks, symbols, handler_s, **kw)
+        print(
+            f"{name:9s} {elapsed:6.2f} s  processed={stats['total_ticks_received']:,} "
+            f"dropped={stats['ticks_dropped']:,} "
+            f"lag_max={stats['queue_lag_max_ms']:.0f} ms handler_calls={calls:,}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,10 +1,16 @@
 """Analytics package: financial metrics and evaluation utilities."""
 
 from .financial_metrics import (
+    P2Quantile,
     compute_drawdown_series,
     compute_equity_curve,
+    compute_equity_curves,
     compute_max_drawdown,
+    compute_max_drawdowns,
+    compute_profit_factors,
     compute_sharpe_ratio,
+    compute_sharpe_ratios,
+    compute_value_at_risk,
 )
 
 __all__ = [
@@ -12,4 +18,10 @@ __all__ = [
     "compute_max_drawdown",
     "compute_drawdown_series",
     "compute_equity_curve",
+    "compute_sharpe_ratios",
+    "compute_max_drawdowns",
+    "compute_equity_curves",
+    "compute_value_at_risk",
+    "compute_profit_factors",
+    "P2Quantile",
 ]
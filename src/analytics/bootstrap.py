@@ -0,0 +1,436 @@
+"""Block-bootstrap confidence intervals for trading metrics.
+
+Promotion decisions based on a single Sharpe or drawdown estimate ignore how
+noisy those numbers are for short track records. This module resamples a
+return (or PnL) series with a circular block bootstrap, which preserves
+short-range autocorrelation, and reports percentile intervals for Sharpe,
+max drawdown and win rate.
+
+A resample is fully described by its block start indices. For return series
+every statistic is assembled from per-start block summaries (sums, squares,
+win counts, and log-equity extremes for drawdown), so a resample costs
+O(n / block_size) instead of O(n) and no resampled path is materialized.
+
+PnL series have additive equity: block entry levels come from per-block
+sums, win rate again from block counts, and drawdown from per-block
+min/max-prefix bounds with an exact scan of the few blocks that can hold the
+worst point. Sharpe is taken over ``eq[t] / eq[t - 1] - 1``, which depends on
+the level at every step, so it walks the equity path (gathered from
+per-start prefix sums) in row groups small enough to stay in cache.
+
+Return series with a loss of -100% or worse (no log equity) use block
+summaries for Sharpe and win rate and walk the path only for drawdown.
+Chunks can optionally be spread over worker processes.
+"""
+
+from __future__ import annotations
+
+import math
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from src.analytics.evaluation import evaluate_trading_metrics
+
+# Resamples evaluated per NumPy pass; bounds peak memory to roughly
+# chunk x series length x a few float64 temporaries.
+DEFAULT_CHUNK_SIZE = 1000
+# Resamples per row group when a statistic needs the full path; keeps the
+# (rows x n) temporaries cache-resident.
+_PATH_ROWS = 128
+
+
+@dataclass(frozen=True)
+class ConfidenceInterval:
+    point: float
+    lower: float
+    upper: float
+
+    def as_list(self) -> list[float]:
+        return [self.lower, self.upper]
+
+
+@dataclass(frozen=True)
+class BootstrapResult:
+    sharpe: ConfidenceInterval
+    max_drawdown: ConfidenceInterval
+    win_rate: ConfidenceInterval
+    n_resamples: int
+    block_size: int
+    confidence: float
+
+    def to_manifest_metrics(self) -> dict[str, Any]:
+        """Interval fields to merge into an export manifest ``metrics`` object."""
+        return {
+            "sharpe_ci": self.sharpe.as_list(),
+            "max_drawdown_ci": self.max_drawdown.as_list(),
+            "win_rate_ci": self.win_rate.as_list(),
+            "bootstrap": {
+                "resamples": self.n_resamples,
+                "block_size": self.block_size,
+                "confidence": self.confidence,
+            },
+        }
+
+
+def default_block_size(n: int) -> int:
+    """Rule-of-thumb block length ``n ** (1/3)`` (at least 1)."""
+    return max(1, round(n ** (1.0 / 3.0)))
+
+
+def _block_table(series: np.ndarray, block_size: int) -> np.ndarray:
+    """Row ``s`` holds the circular block starting at ``s``."""
+    n = series.size
+    idx = (np.arange(n)[:, None] + np.arange(block_size)[None, :]) % n
+    return series[idx]
+
+
+def _block_starts(
+    n: int, block_size: int, count: int, rng: np.random.Generator
+) -> np.ndarray:
+    """``(count, n_blocks)`` random circular block start positions."""
+    n_blocks = -(-n // block_size)
+    return rng.integers(0, n, size=(count, n_blocks))
+
+
+def _materialize(table: np.ndarray, starts: np.ndarray, n: int) -> np.ndarray:
+    """``(count, n)`` resampled series for the given block starts."""
+    count, n_blocks = starts.shape
+    rows = np.take(table, starts, axis=0)
+    return rows.reshape(count, n_blocks * table.shape[1])[:, :n]
+
+
+def _block_ends(cum: np.ndarray, starts: np.ndarray, last_len: int) -> np.ndarray:
+    """``(count, n_blocks)`` values of a cumulative block table at each block end.
+
+    Cumulative summaries along each block row let both full blocks and the
+    truncated final block be looked up by (start, length - 1). Full blocks
+    read one contiguous column with a 1-D ``take``, which is several times
+    cheaper than a 2-D fancy index over the table.
+    """
+    ends = np.ascontiguousarray(cum[:, -1]).take(starts)
+    ends[:, -1] = cum[starts[:, -1], last_len - 1]
+    return ends
+
+
+def _block_total(cum: np.ndarray, starts: np.ndarray, last_len: int) -> np.ndarray:
+    """Per-resample total of a quantity from its cumulative block table."""
+    return _block_ends(cum, starts, last_len).sum(axis=1)
+
+
+def _last_len(n: int, starts: np.ndarray, block_size: int) -> int:
+    return n - (starts.shape[1] - 1) * block_size
+
+
+def _sharpe_from_moments(
+    s1: np.ndarray, s2: np.ndarray, n: int, periods_per_year: int
+) -> np.ndarray:
+    if n < 2:
+        return np.zeros(s1.shape[0])
+    mu = s1 / n
+    with np.errstate(divide="ignore", invalid="ignore"):
+        var = (s2 - n * mu * mu) / (n - 1)
+        sigma = np.sqrt(np.maximum(var, 0.0))
+        sharpe = mu / sigma * math.sqrt(max(1, periods_per_year))
+    return np.where(np.isfinite(sharpe) & (sigma > 0), sharpe, 0.0)
+
+
+def _win_rate_from_blocks(
+    table: np.ndarray, starts: np.ndarray, last_len: int
+) -> np.ndarray:
+    w = _block_total(np.cumsum(table > 0, axis=1), starts, last_len)
+    d = _block_total(np.cumsum(table != 0, axis=1), starts, last_len)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(d > 0, w / d, 0.0)
+
+
+def _returns_sharpe_from_blocks(
+    table: np.ndarray, starts: np.ndarray, n: int, periods_per_year: int
+) -> np.ndarray:
+    last_len = _last_len(n, starts, table.shape[1])
+    s1 = _block_total(np.cumsum(table, axis=1), starts, last_len)
+    s2 = _block_total(np.cumsum(table * table, axis=1), starts, last_len)
+    return _sharpe_from_moments(s1, s2, n, periods_per_year)
+
+
+def _returns_stats_from_blocks(
+    table: np.ndarray, starts: np.ndarray, n: int, periods_per_year: int
+) -> np.ndarray:
+    """Sharpe, max drawdown and win rate of return resamples from block summaries.
+
+    Drawdown is tracked in log-equity space: entering a block at level ``L``
+    with running peak ``P``, the block's worst point is ``min(L - P + min
+    prefix, internal drawdown)`` and the peak becomes ``max(P, L + max
+    prefix)``. Requires every return to be above -1.
+    """
+    block_size = table.shape[1]
+    n_blocks = starts.shape[1]
+    last_len = _last_len(n, starts, block_size)
+
+    logc = np.cumsum(np.log1p(table), axis=1)
+    hi = np.maximum.accumulate(logc, axis=1)
+    lo = np.minimum.accumulate(logc, axis=1)
+    inner_dd = np.minimum.accumulate(logc - hi, axis=1)
+    full_k, last_k = block_size - 1, last_len - 1
+
+    count = starts.shape[0]
+    level = np.zeros(count)
+    peak = np.full(count, -np.inf)  # first equity point sets the peak
+    worst = np.zeros(count)
+    for j in range(n_blocks):
+        s = starts[:, j]
+        k = full_k if j < n_blocks - 1 else last_k
+        np.minimum(worst, level - peak + lo[s, k], out=worst)
+        np.minimum(worst, inner_dd[s, k], out=worst)
+        np.maximum(peak, level + hi[s, k], out=peak)
+        level += logc[s, k]
+
+    out = np.empty((3, count))
+    out[0] = _returns_sharpe_from_blocks(table, starts, n, periods_per_year)
+    out[1] = np.expm1(worst)
+    out[2] = _win_rate_from_blocks(table, starts, last_len)
+    return out
+
+
+def _pnl_entry_levels(prefix: np.ndarray, starts: np.ndarray) -> np.ndarray:
+    """Equity (unit start) before each block of each resample."""
+    rows, n_blocks = starts.shape
+    entry = np.empty((rows, n_blocks))
+    entry[:, 0] = 1.0
+    np.cumsum(
+        np.ascontiguousarray(prefix[:, -1]).take(starts[:, :-1]),
+        axis=1,
+        out=entry[:, 1:],
+    )
+    entry[:, 1:] += 1.0
+    return entry
+
+
+def _pnl_equity(
+    prefix: np.ndarray, starts: np.ndarray, level: np.ndarray, n: int
+) -> np.ndarray:
+    """``(rows, n)`` equity paths from per-start prefix sums and entry levels."""
+    rows, n_blocks = starts.shape
+    eq = np.take(prefix, starts, axis=0)
+    eq += level[:, :, None]
+    return eq.reshape(rows, n_blocks * prefix.shape[1])[:, :n]
+
+
+def _pnl_drawdown_from_blocks(
+    prefix: np.ndarray, starts: np.ndarray, level: np.ndarray, n: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """Max drawdown of additive-equity resamples, mostly from block summaries.
+
+    Entering a block at level ``L`` with running peak ``P``, each point's
+    ratio ``(L + c) / max(P, L + max prefix so far)`` is at least ``(L + min
+    prefix) / max(P, L + max prefix)``, and the point at the block's minimum
+    prefix attains an actual value. Only blocks whose bound is below the best
+    attained value of their resample are scanned point by point. Returns
+    ``(drawdown, needs_path)``; resamples whose equity is not positive
+    throughout get no bound and are flagged for the path computation.
+    """
+    count, n_blocks = starts.shape
+    block_size = prefix.shape[1]
+    last_len = _last_len(n, starts, block_size)
+    last_k = last_len - 1
+
+    hi = np.maximum.accumulate(prefix, axis=1)
+    lo = np.minimum.accumulate(prefix, axis=1)
+    hi_at_lo = hi.copy()  # max prefix up to the (first) minimum prefix
+    for k in range(1, block_size):
+        kept = prefix[:, k] >= lo[:, k - 1]
+        hi_at_lo[kept, k] = hi_at_lo[kept, k - 1]
+
+    low = level + _block_ends(lo, starts, last_len)
+    high = level + _block_ends(hi, starts, last_len)
+    peak = np.empty((count, n_blocks))
+    peak[:, 0] = -np.inf  # the first equity point sets the peak
+    np.maximum.accumulate(high[:, :-1], axis=1, out=peak[:, 1:])
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        hi_first = level + _block_ends(hi_at_lo, starts, last_len)
+        best = (low / np.maximum(peak, hi_first)).min(axis=1)
+        bound = low / np.maximum(peak, high)
+        r, j = np.nonzero(bound < best[:, None])
+        if r.size:
+            s = starts[r, j]
+            lvl = level[r, j][:, None]
+            ratio = (lvl + prefix[s]) / np.maximum(peak[r, j][:, None], lvl + hi[s])
+            ratio[j == n_blocks - 1, last_k + 1 :] = np.inf
+            np.minimum.at(best, r, ratio.min(axis=1))
+    return best - 1.0, (low <= 0).any(axis=1)
+
+
+def _pnl_stats_from_blocks(
+    table: np.ndarray, starts: np.ndarray, n: int, periods_per_year: int
+) -> np.ndarray:
+    """Sharpe, max drawdown and win rate of PnL resamples.
+
+    Same conventions as ``evaluate_trading_metrics(pnl=...)``: equity starts
+    at 1, Sharpe is taken over ``eq[t] / eq[t - 1] - 1``.
+    """
+    prefix = np.cumsum(table, axis=1)
+    count = starts.shape[0]
+    out = np.empty((3, count))
+    level = _pnl_entry_levels(prefix, starts)
+    out[1], needs_path = _pnl_drawdown_from_blocks(prefix, starts, level, n)
+    for r0 in range(0, count, _PATH_ROWS):
+        rows = slice(r0, r0 + _PATH_ROWS)
+        eq = _pnl_equity(prefix, starts[rows], level[rows], n)
+        path = needs_path[rows]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rets = eq[:, 1:] / eq[:, :-1]
+            rets -= 1.0
+        if path.any():
+            # Only equity that reaches zero can produce non-finite returns
+            out[1, rows][path] = _drawdown_rows(eq[path])
+            bad = path[:, None] & ~np.isfinite(rets)
+            rets[bad] = 0.0
+        s1 = rets.sum(axis=1)
+        s2 = np.einsum("ij,ij->i", rets, rets)
+        out[0, rows] = _sharpe_from_moments(s1, s2, n - 1, periods_per_year)
+    out[2] = _win_rate_from_blocks(table, starts, _last_len(n, starts, table.shape[1]))
+    return out
+
+
+def _sharpe_rows(r: np.ndarray, periods_per_year: int) -> np.ndarray:
+    if r.shape[1] < 2:
+        return np.zeros(r.shape[0])
+    mu = r.mean(axis=1)
+    sigma = r.std(axis=1, ddof=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sharpe = mu / sigma * math.sqrt(max(1, periods_per_year))
+    return np.where(np.isfinite(sharpe) & (sigma > 0), sharpe, 0.0)
+
+
+def _drawdown_rows(eq: np.ndarray) -> np.ndarray:
+    peaks = np.maximum.accumulate(eq, axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = np.divide(eq, peaks, out=peaks)
+    if not np.isfinite(ratio).all():
+        ratio[~np.isfinite(ratio)] = 1.0
+    return ratio.min(axis=1) - 1.0
+
+
+def _win_rate_rows(x: np.ndarray) -> np.ndarray:
+    wins = np.count_nonzero(x > 0, axis=1)
+    decided = np.count_nonzero(x, axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(decided > 0, wins / decided, 0.0)
+
+
+def _evaluate_chunk(
+    series: np.ndarray,
+    block_size: int,
+    count: int,
+    seed: np.random.SeedSequence,
+    is_pnl: bool,
+    periods_per_year: int,
+) -> np.ndarray:
+    """Return a ``(3, count)`` array of Sharpe, max drawdown and win rate."""
+    rng = np.random.default_rng(seed)
+    table = _block_table(series, block_size)
+    n = series.size
+    starts = _block_starts(n, block_size, count, rng)
+    if is_pnl:
+        return _pnl_stats_from_blocks(table, starts, n, periods_per_year)
+    if bool((series > -1.0).all()):
+        return _returns_stats_from_blocks(table, starts, n, periods_per_year)
+
+    out = np.empty((3, count))
+    out[0] = _returns_sharpe_from_blocks(table, starts, n, periods_per_year)
+    out[2] = _win_rate_from_blocks(table, starts, _last_len(n, starts, block_size))
+    for r0 in range(0, count, _PATH_ROWS):
+        rows = slice(r0, r0 + _PATH_ROWS)
+        eq = _materialize(table, starts[rows], n) + 1.0
+        np.cumprod(eq, axis=1, out=eq)
+        out[1, rows] = _drawdown_rows(eq)
+    return out
+
+
+def bootstrap_trading_metrics(
+    *,
+    returns: list[float] | np.ndarray | None = None,
+    pnl: list[float] | np.ndarray | None = None,
+    n_resamples: int = 10_000,
+    block_size: int | None = None,
+    confidence: float = 0.95,
+    seed: int | None = None,
+    periods_per_year: int = 252,
+    n_jobs: int = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> BootstrapResult:
+    """Percentile confidence intervals for Sharpe, max drawdown and win rate.
+
+    Args:
+        returns: Period returns. Used when ``pnl`` is not given.
+        pnl: Per-period PnL on unit starting equity (resampled instead of returns).
+        n_resamples: Number of bootstrap resamples.
+        block_size: Circular block length; defaults to ``n ** (1/3)``.
+        confidence: Two-sided interval coverage, e.g. 0.95.
+        seed: Seed for reproducible intervals.
+        n_jobs: Worker processes for resample chunks (1 = in process).
+        chunk_size: Resamples evaluated per vectorized pass.
+
+    Point estimates come from :func:`evaluate_trading_metrics` on the original
+    series, so they match the values written to export manifests.
+    """
+    if not 0.0 < confidence < 1.0:
+        raise ValueError("confidence must be in (0, 1)")
+    is_pnl = pnl is not None
+    raw = pnl if is_pnl else returns
+    if raw is None:
+        raise ValueError("returns or pnl is required")
+    series = np.asarray(raw, dtype=float)
+    series = series[np.isfinite(series)]
+
+    point = evaluate_trading_metrics(
+        returns=None if is_pnl else series,
+        pnl=series if is_pnl else None,
+    )
+    point_win_rate = float(_win_rate_rows(series.reshape(1, -1))[0])
+    if series.size < 2 or n_resamples <= 0:
+        return BootstrapResult(
+            sharpe=ConfidenceInterval(
+                point.sharpe_sim, point.sharpe_sim, point.sharpe_sim
+            ),
+            max_drawdown=ConfidenceInterval(
+                point.max_drawdown_sim, point.max_drawdown_sim, point.max_drawdown_sim
+            ),
+            win_rate=ConfidenceInterval(point_win_rate, point_win_rate, point_win_rate),
+            n_resamples=0,
+            block_size=0,
+            confidence=confidence,
+        )
+
+    block = min(block_size or default_block_size(series.size), series.size)
+    counts = [chunk_size] * (n_resamples // chunk_size)
+    if n_resamples % chunk_size:
+        counts.append(n_resamples % chunk_size)
+    seeds = np.random.SeedSequence(seed).spawn(len(counts))
+    args = [
+        (series, block, c, s, is_pnl, periods_per_year)
+        for c, s in zip(counts, seeds, strict=True)
+    ]
+
+    if n_jobs > 1 and len(counts) > 1:
+        with ProcessPoolExecutor(max_workers=n_jobs) as ex:
+            parts = list(ex.map(_evaluate_chunk, *zip(*args, strict=True)))
+    else:
+        parts = [_evaluate_chunk(*a) for a in args]
+    stats = np.concatenate(parts, axis=1)
+
+    alpha = (1.0 - confidence) / 2.0
+    lo, hi = np.quantile(stats, [alpha, 1.0 - alpha], axis=1)
+    return BootstrapResult(
+        sharpe=ConfidenceInterval(point.sharpe_sim, float(lo[0]), float(hi[0])),
+        max_drawdown=ConfidenceInterval(
+            point.max_drawdown_sim, float(lo[1]), float(hi[1])
+        ),
+        win_rate=ConfidenceInterval(point_win_rate, float(lo[2]), float(hi[2])),
+        n_resamples=n_resamples,
+        block_size=block,
+        confidence=confidence,
+    )
@@ -2,15 +2,22 @@
 
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
 from typing import Any, Literal
 
 import numpy as np
 
 from src.analytics.financial_metrics import (
+    P2Quantile,
     compute_equity_curve,
+    compute_equity_curves,
     compute_max_drawdown,
+    compute_max_drawdowns,
+    compute_profit_factors,
     compute_sharpe_ratio,
+    compute_sharpe_ratios,
+    compute_value_at_risk,
 )
 
 
@@ -36,16 +43,15 @@ def evaluate_trading_metrics(
         pnl: Per-period PnL. Used for equity and drawdown; also derives returns if returns is None.
     """
     r: np.ndarray
+    pnl_eq: np.ndarray | None = None
+    if pnl is not None:
+        pnl = np.asarray(pnl, dtype=float)
+        pnl_eq = compute_equity_curve(pnl, as_returns=False, starting_equity=1.0)
     if returns is not None:
-        r = np.asarray(list(returns), dtype=float)
-    elif pnl is not None:
-        eq = compute_equity_curve(pnl, as_returns=False, starting_equity=1.0)
-        if len(eq) >= 2:
-            r = np.asarray(
-                [eq[i] / eq[i - 1] - 1.0 for i in range(1, len(eq))], dtype=float
-            )
-        else:
-            r = np.asarray([], dtype=float)
+        r = np.asarray(returns, dtype=float)
+    elif pnl_eq is not None and len(pnl_eq) >= 2:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            r = pnl_eq[1:] / pnl_eq[:-1] - 1.0
     else:
         r = np.asarray([], dtype=float)
 
@@ -53,20 +59,20 @@ def evaluate_trading_metrics(
     sharpe = compute_sharpe_ratio(r, periods_per_year=252)
 
     # Max drawdown via equity curve (prefer PnL equity if available)
-    if pnl is not None:
-        eq_curve = compute_equity_curve(pnl, as_returns=False, starting_equity=1.0)
+    if pnl_eq is not None:
+        eq_curve = pnl_eq
     else:
         eq_curve = compute_equity_curve(r, as_returns=True, starting_equity=1.0)
     maxdd = float(compute_max_drawdown(eq_curve))
 
     # Optional extras
-    wins = [float(x) for x in (pnl or []) if x is not None and x > 0]
-    losses = [float(x) for x in (pnl or []) if x is not None and x < 0]
-    profit_factor = (
-        (sum(wins) / abs(sum(losses))) if losses else (float("inf") if wins else 0.0)
-    )
-    win_rate = (len(wins) / len(wins + losses)) if (wins or losses) else 0.0
-    var_95 = float(np.percentile(pnl, 5)) if pnl is not None and len(pnl) > 0 else 0.0
+    if pnl is not None and pnl.size > 0:
+        pf_arr, win_rate_arr = compute_profit_factors(pnl)
+        profit_factor = float(pf_arr[0])
+        win_rate = float(win_rate_arr[0])
+        var_95 = float(compute_value_at_risk(pnl, percentile=5.0)[0])
+    else:
+        profit_factor, win_rate, var_95 = 0.0, 0.0, 0.0
 
     return TradingMetrics(
         sharpe_sim=float(sharpe),
@@ -78,6 +84,154 @@ def evaluate_trading_metrics(
     )
 
 
+@dataclass(frozen=True)
+class BatchTradingMetrics:
+    """Per-column trading metrics produced by :func:`evaluate_trading_metrics_batch`."""
+
+    sharpe_sim: np.ndarray
+    max_drawdown_sim: np.ndarray
+    profit_factor: np.ndarray
+    win_rate: np.ndarray
+    var_95: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.sharpe_sim.size)
+
+    def column(self, i: int) -> TradingMetrics:
+        """Metrics of a single column as a scalar :class:`TradingMetrics`."""
+        return TradingMetrics(
+            sharpe_sim=float(self.sharpe_sim[i]),
+            max_drawdown_sim=float(self.max_drawdown_sim[i]),
+            f1_macro=None,
+            profit_factor=float(self.profit_factor[i]),
+            win_rate=float(self.win_rate[i]),
+            var_95=float(self.var_95[i]),
+        )
+
+
+def evaluate_trading_metrics_batch(
+    *,
+    returns: np.ndarray | None = None,
+    pnl: np.ndarray | None = None,
+    periods_per_year: int = 252,
+) -> BatchTradingMetrics:
+    """Vectorized :func:`evaluate_trading_metrics` over many strategies at once.
+
+    Args:
+        returns: ``(periods, strategies)`` array of period returns.
+        pnl: ``(periods, strategies)`` array of per-period PnL. As in the scalar
+            version, PnL drives the equity curve and (when ``returns`` is None)
+            the derived returns.
+
+    Profit factor, win rate and VaR are computed from ``pnl`` when given and
+    from ``returns`` otherwise. NaN/inf entries are treated as missing periods.
+    """
+    if pnl is not None:
+        pnl_eq = compute_equity_curves(pnl, as_returns=False, starting_equity=1.0)
+        if returns is None:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                returns = pnl_eq[1:] / pnl_eq[:-1] - 1.0
+        eq_curves = pnl_eq
+        outcomes = pnl
+    elif returns is not None:
+        eq_curves = compute_equity_curves(returns, as_returns=True, starting_equity=1.0)
+        outcomes = returns
+    else:
+        raise ValueError("returns or pnl is required")
+
+    profit_factor, win_rate = compute_profit_factors(outcomes)
+    return BatchTradingMetrics(
+        sharpe_sim=compute_sharpe_ratios(returns, periods_per_year=periods_per_year),
+        max_drawdown_sim=compute_max_drawdowns(eq_curves),
+        profit_factor=profit_factor,
+        win_rate=win_rate,
+        var_95=compute_value_at_risk(outcomes, percentile=5.0),
+    )
+
+
+class OnlineTradingMetrics:
+    """Incrementally updated trading metrics for a live P&L stream.
+
+    Mirrors :func:`evaluate_trading_metrics` with ``pnl`` input: equity starts
+    at ``starting_equity`` and accumulates P&L, returns are ``E_t / E_{t-1} - 1``
+    between consecutive curve points.
+    Each :meth:`update` is O(1); VaR uses a streaming P² quantile estimate.
+    """
+
+    def __init__(
+        self, *, starting_equity: float = 1.0, periods_per_year: int = 252
+    ) -> None:
+        self.periods_per_year = periods_per_year
+        self.equity = starting_equity
+        self.count = 0
+        self._peak: float | None = None
+        self._max_drawdown = 0.0
+        # Welford accumulators over derived returns
+        self._n_returns = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._gross_win = 0.0
+        self._gross_loss = 0.0
+        self._wins = 0
+        self._losses = 0
+        self._var = P2Quantile(0.05)
+
+    def update(self, pnl: float) -> None:
+        pnl = float(pnl)
+        if not np.isfinite(pnl):
+            return
+        prev = self.equity
+        self.equity = prev + pnl
+        self.count += 1
+
+        # Like the batch path, returns start at the second equity point
+        if self.count > 1 and prev != 0:
+            r = self.equity / prev - 1.0
+            self._n_returns += 1
+            delta = r - self._mean
+            self._mean += delta / self._n_returns
+            self._m2 += delta * (r - self._mean)
+
+        if self._peak is None or self.equity > self._peak:
+            self._peak = self.equity
+        if self._peak != 0:
+            dd = (self.equity - self._peak) / self._peak
+            if dd < self._max_drawdown:
+                self._max_drawdown = dd
+
+        if pnl > 0:
+            self._wins += 1
+            self._gross_win += pnl
+        elif pnl < 0:
+            self._losses += 1
+            self._gross_loss -= pnl
+        self._var.update(pnl)
+
+    @property
+    def sharpe(self) -> float:
+        if self._n_returns < 2:
+            return 0.0
+        sigma = math.sqrt(self._m2 / (self._n_returns - 1))
+        if sigma == 0.0:
+            return 0.0
+        return self._mean / sigma * math.sqrt(max(1, self.periods_per_year))
+
+    def snapshot(self) -> TradingMetrics:
+        if self._gross_loss > 0:
+            profit_factor = self._gross_win / self._gross_loss
+        else:
+            profit_factor = float("inf") if self._gross_win > 0 else 0.0
+        decided = self._wins + self._losses
+        return TradingMetrics(
+            sharpe_sim=float(self.sharpe),
+            max_drawdown_sim=float(self._max_drawdown),
+            f1_macro=None,
+            profit_factor=profit_factor,
+            win_rate=self._wins / decided if decided else 0.0,
+            var_95=self._var.value,
+        )
+
+
 def metrics_to_tf1_manifest(
     metrics: TradingMetrics, *, f1: float | None = None
 ) -> dict[str, Any]:
@@ -90,7 +244,7 @@ def metrics_to_tf1_manifest(
         "sharpe": metrics.sharpe_sim,
         "max_drawdown": metrics.max_drawdown_sim,
         "f1": float(f1) if f1 is not None else 0.0,
-        # Optional extras (ignored by validator; allowed via additionalProperties)
+        # Extras; win_rate is checked against a rule's min_win_rate when set
         "profit_factor": metrics.profit_factor,
         "win_rate": metrics.win_rate,
         "var_95": metrics.var_95,
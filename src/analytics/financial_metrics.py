@@ -14,9 +14,18 @@ import numpy as np
 
 
 def _to_array(x: Iterable[float] | np.ndarray) -> np.ndarray:
-    arr = np.asarray(list(x), dtype=float)
+    # ndarrays and sequences convert without an intermediate list; float64
+    # ndarrays are returned as-is (zero copy) when they hold no NaN/inf.
+    if not isinstance(x, np.ndarray | Sequence):
+        x = list(x)
+    arr = np.asarray(x, dtype=float)
+    if arr.ndim != 1:
+        arr = arr.ravel()
+    finite = np.isfinite(arr)
+    if finite.all():
+        return arr
     # Remove NaNs and infs
-    return arr[np.isfinite(arr)]
+    return arr[finite]
 
 
 def compute_equity_curve(
@@ -42,13 +51,7 @@ def compute_equity_curve(
 
     if as_returns:
         # Compound: E_t = E_{t-1} * (1 + r_t)
-        returns = arr
-        equity = [starting_equity]
-        eq = starting_equity
-        for r in returns:
-            eq *= 1.0 + r
-            equity.append(eq)
-        return np.asarray(equity[1:])
+        return starting_equity * np.cumprod(1.0 + arr)
     else:
         # Additive PnL: E_t = E_{t-1} + pnl_t
         cumsum = np.cumsum(arr)
@@ -126,3 +129,192 @@ def summarize_financials(
     equity = compute_equity_curve(r, as_returns=True, starting_equity=starting_equity)
     maxdd = compute_max_drawdown(equity)
     return FinancialSummary(sharpe=sharpe, max_drawdown=maxdd)
+
+
+# ---------------------------------------------------------------------------
+# Batch (2-D) variants: rows are periods, columns are strategies/parameter sets.
+# Non-finite values are treated as missing observations.
+# ---------------------------------------------------------------------------
+
+
+def _to_matrix(x: Sequence[Sequence[float]] | np.ndarray) -> np.ndarray:
+    arr = np.asarray(x, dtype=float)
+    if arr.ndim == 1:
+        arr = arr.reshape(-1, 1)
+    elif arr.ndim != 2:
+        raise ValueError("expected a 1-D or 2-D array of periods x columns")
+    if not np.isfinite(arr).all():
+        arr = np.where(np.isfinite(arr), arr, np.nan)
+    return arr
+
+
+def compute_equity_curves(
+    pnl_or_returns: Sequence[Sequence[float]] | np.ndarray,
+    *,
+    as_returns: bool = False,
+    starting_equity: float = 1.0,
+) -> np.ndarray:
+    """Column-wise :func:`compute_equity_curve`; missing periods leave equity flat."""
+    arr = _to_matrix(pnl_or_returns)
+    if np.isnan(arr).any():
+        arr = np.nan_to_num(arr, nan=0.0)
+    if as_returns:
+        eq = np.cumprod(arr + 1.0, axis=0)
+        eq *= starting_equity
+        return eq
+    eq = np.cumsum(arr, axis=0)
+    eq += starting_equity
+    return eq
+
+
+def compute_max_drawdowns(
+    equity_curves: Sequence[Sequence[float]] | np.ndarray,
+) -> np.ndarray:
+    """Column-wise :func:`compute_max_drawdown` (negative fractions)."""
+    eq = _to_matrix(equity_curves)
+    if eq.shape[0] == 0:
+        return np.zeros(eq.shape[1])
+    peaks = np.fmax.accumulate(eq, axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # (E - P) / P computed in place on the peaks buffer
+        dd = np.divide(eq, peaks, out=peaks)
+        dd -= 1.0
+    if not np.isfinite(dd).all():
+        dd[~np.isfinite(dd)] = 0.0
+    return dd.min(axis=0)
+
+
+def compute_sharpe_ratios(
+    returns: Sequence[Sequence[float]] | np.ndarray,
+    *,
+    risk_free_rate: float = 0.0,
+    periods_per_year: int = 252,
+) -> np.ndarray:
+    """Column-wise :func:`compute_sharpe_ratio`; 0.0 where undefined."""
+    r = _to_matrix(returns)
+    missing = np.isnan(r)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if missing.any():
+            valid = ~missing
+            n = valid.sum(axis=0)
+            mu = np.where(valid, r, 0.0).sum(axis=0) / n
+            dev = np.where(valid, r - mu, 0.0)
+            sigma = np.sqrt((dev * dev).sum(axis=0) / (n - 1))
+        else:
+            n = np.full(r.shape[1], r.shape[0])
+            mu = r.mean(axis=0)
+            sigma = r.std(axis=0, ddof=1) if r.shape[0] > 1 else np.zeros(r.shape[1])
+        sharpe = (mu - risk_free_rate) / sigma * math.sqrt(max(1, periods_per_year))
+    ok = (n >= 2) & np.isfinite(sharpe) & (sigma > 0)
+    return np.where(ok, sharpe, 0.0)
+
+
+def compute_value_at_risk(
+    values: Sequence[Sequence[float]] | np.ndarray, *, percentile: float = 5.0
+) -> np.ndarray:
+    """Column-wise historical VaR (the ``percentile`` of P&L or returns)."""
+    arr = _to_matrix(values)
+    if arr.shape[0] == 0:
+        return np.zeros(arr.shape[1])
+    missing = np.isnan(arr)
+    if not missing.any():
+        return np.percentile(arr, percentile, axis=0)
+    out = np.zeros(arr.shape[1])
+    has_data = ~missing.all(axis=0)
+    if has_data.any():
+        out[has_data] = np.nanpercentile(arr[:, has_data], percentile, axis=0)
+    return out
+
+
+def compute_profit_factors(
+    pnl: Sequence[Sequence[float]] | np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Column-wise ``(profit_factor, win_rate)`` with the scalar conventions.
+
+    Profit factor is gross wins over gross losses (``inf`` with no losses and
+    some wins, 0.0 with neither); win rate ignores flat and missing periods.
+    """
+    arr = _to_matrix(pnl)
+    if np.isnan(arr).any():
+        arr = np.nan_to_num(arr, nan=0.0)
+    gross_win = np.maximum(arr, 0.0).sum(axis=0)
+    gross_loss = -np.minimum(arr, 0.0).sum(axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        pf = np.where(
+            gross_loss > 0,
+            gross_win / gross_loss,
+            np.where(gross_win > 0, np.inf, 0.0),
+        )
+        n_win = np.count_nonzero(arr > 0, axis=0)
+        n_dec = np.count_nonzero(arr, axis=0)
+        win_rate = np.where(n_dec > 0, n_win / n_dec, 0.0)
+    return pf, win_rate
+
+
+class P2Quantile:
+    """Streaming quantile estimate in O(1) memory (Jain & Chlamtac P² method).
+
+    The first five observations are kept exactly; afterwards five markers are
+    adjusted with piecewise-parabolic interpolation on each update.
+    """
+
+    def __init__(self, q: float) -> None:
+        if not 0.0 < q < 1.0:
+            raise ValueError("q must be in (0, 1)")
+        self.q = q
+        self.count = 0
+        self._heights: list[float] = []
+        self._pos = [0.0, 1.0, 2.0, 3.0, 4.0]
+        self._desired = [0.0, 2 * q, 4 * q, 2 + 2 * q, 4.0]
+        self._step = [0.0, q / 2, q, (1 + q) / 2, 1.0]
+
+    def update(self, x: float) -> None:
+        self.count += 1
+        h = self._heights
+        if self.count <= 5:
+            h.append(x)
+            h.sort()
+            return
+
+        if x < h[0]:
+            h[0] = x
+            k = 0
+        elif x >= h[4]:
+            h[4] = x
+            k = 3
+        else:
+            k = 0
+            while k < 3 and x >= h[k + 1]:
+                k += 1
+        pos = self._pos
+        for i in range(k + 1, 5):
+            pos[i] += 1
+        for i in range(5):
+            self._desired[i] += self._step[i]
+
+        for i in (1, 2, 3):
+            d = self._desired[i] - pos[i]
+            if (d >= 1 and pos[i + 1] - pos[i] > 1) or (
+                d <= -1 and pos[i - 1] - pos[i] < -1
+            ):
+                s = 1 if d > 0 else -1
+                cand = h[i] + s / (pos[i + 1] - pos[i - 1]) * (
+                    (pos[i] - pos[i - 1] + s)
+                    * (h[i + 1] - h[i])
+                    / (pos[i + 1] - pos[i])
+                    + (pos[i + 1] - pos[i] - s)
+                    * (h[i] - h[i - 1])
+                    / (pos[i] - pos[i - 1])
+                )
+                if not h[i - 1] < cand < h[i + 1]:
+                    cand = h[i] + s * (h[i + s] - h[i]) / (pos[i + s] - pos[i])
+                h[i] = cand
+                pos[i] += s
+
+    @property
+    def value(self) -> float:
+        if self.count == 0:
+            return 0.0
+        if self.count <= 5:
+            return float(np.percentile(self._heights, self.q * 100))
+        return float(self._heights[2])
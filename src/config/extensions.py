@@ -7,6 +7,7 @@ from __future__ import annotations
 
 import os
 from functools import lru_cache
+from pathlib import Path
 
 from src.core.config import get_config
 
@@ -39,6 +40,62 @@ def refresh_seconds() -> int:
         return 10
 
 
+def scan_concurrency() -> int:
+    """Maximum in-flight historical requests during an async scan."""
+    try:
+        return max(1, int(_env(f"{ENV_PREFIX}SCAN_CONCURRENCY", "16")))
+    except ValueError:
+        return 16
+
+
+def hist_requests_per_sec() -> float:
+    """Historical request start rate for the async scan (IB soft limit ~50 msg/s)."""
+    try:
+        return max(0.1, float(_env(f"{ENV_PREFIX}HIST_RATE", "20")))
+    except ValueError:
+        return 20.0
+
+
+def universe_max_symbols() -> int:
+    """Cap on the scanner universe fetched per refresh cycle."""
+    try:
+        return max(1, int(_env(f"{ENV_PREFIX}UNIVERSE_MAX", "200")))
+    except ValueError:
+        return 200
+
+
+def l2_max_slots() -> int:
+    """Concurrent Level 2 (market depth) streams; IB's default allowance is 3-5."""
+    try:
+        return max(1, int(_env(f"{ENV_PREFIX}L2_SLOTS", "5")))
+    except ValueError:
+        return 5
+
+
+def l2_preempt_hysteresis() -> float:
+    """Score margin a queued symbol needs over the weakest L2 holder to preempt it."""
+    try:
+        return max(0.0, float(_env(f"{ENV_PREFIX}L2_HYSTERESIS", "0.25")))
+    except ValueError:
+        return 0.25
+
+
+def l2_min_hold_seconds() -> float:
+    """Minimum time a symbol keeps its L2 slot before it can be preempted."""
+    try:
+        return max(0.0, float(_env(f"{ENV_PREFIX}L2_MIN_HOLD_SEC", "60")))
+    except ValueError:
+        return 60.0
+
+
+def l2_score_half_life_seconds() -> float:
+    """Half-life of a symbol's slot score once the scanner stops reporting it."""
+    try:
+        return max(1.0, float(_env(f"{ENV_PREFIX}L2_SCORE_HALF_LIFE_SEC", "300")))
+    except ValueError:
+        return 300.0
+
+
 def price_min() -> float:
     return 1.0  # hard constraint
 
@@ -70,6 +127,12 @@ def runtime_state_path() -> str:
     return str(data_base_path() / "runtime" / "gap_recorder_state.json")
 
 
+def reference_data_dir() -> Path:
+    """Directory holding per-session prev-close/ADV20 reference files."""
+    path = _env(f"{ENV_PREFIX}REFERENCE_DIR", "")
+    return Path(path) if path else data_base_path() / "reference"
+
+
 def hidden_symbols_path() -> str:
     return str(data_base_path() / "runtime" / "gap_hidden_symbols.txt")
 
@@ -79,6 +142,13 @@ def all_settings() -> dict[str, object]:
         "min_gap_pct": min_gap_pct(),
         "min_rvol": min_rvol(),
         "refresh_seconds": refresh_seconds(),
+        "scan_concurrency": scan_concurrency(),
+        "hist_requests_per_sec": hist_requests_per_sec(),
+        "universe_max_symbols": universe_max_symbols(),
+        "l2_max_slots": l2_max_slots(),
+        "l2_preempt_hysteresis": l2_preempt_hysteresis(),
+        "l2_min_hold_seconds": l2_min_hold_seconds(),
+        "l2_score_half_life_seconds": l2_score_half_life_seconds(),
         "price_min": price_min(),
         "price_max": price_max(),
         "exchanges": exchanges(),
@@ -4,13 +4,28 @@ Connection Pool Manager for Interactive Brokers
 
 This module implements connection pooling and circuit breakers to address
 the root cause of connection errors in the trading system.
+
+The pool manages sessions with distinct client ids, pre-warmed at startup.
+By default a session is only a placeholder record; pools that should dial
+the gateway (bulk historical downloads) are built with
+``factory=connect_ib``. Checkout is event driven: ``get_connection`` (threads) and
+``acquire`` (asyncio) queue by priority and are handed a connection as soon
+as one is returned, routed to the least-loaded connection that is within its
+per-connection request rate. Wait times are kept as histograms per priority
+in ``get_pool_status()``.
 """
 
+import asyncio
+import concurrent.futures
+import heapq
+import inspect
+import itertools
 import logging
 import sys
 import threading
 import time
-from collections.abc import Callable
+from collections import deque
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
@@ -22,6 +37,12 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.core.config import get_config
 from src.core.error_handler import TradingSystemError, get_error_handler, handle_error
+from src.observability.latency import LatencyHistogram
+from src.observability.metrics import inc
+
+# Opens a connection for a client id (default: a placeholder session record;
+# pass ``connect_ib`` to dial the gateway)
+ConnectionFactory = Callable[[int], Awaitable[Any]]
 
 
 class ConnectionState(Enum):
@@ -66,6 +87,10 @@ class ConnectionConfig:
     circuit_breaker_threshold: int = 5
     circuit_breaker_timeout: float = 60.0
     health_check_interval: float = 30.0
+    base_client_id: int = 1000
+    # Per connection; IB accepts about 50 API messages per second per client
+    max_requests_per_second: float = 40.0
+    load_window: float = 60.0  # seconds of checkouts counted as load
 
 
 class CircuitBreaker:
@@ -82,6 +107,36 @@ class CircuitBreaker:
     def call(self, func: Callable, *args, **kwargs) -> Any:
         """Execute function with circuit breaker protection"""
 
+        self._check_open()
+
+        try:
+            result = func(*args, **kwargs)
+            self._on_success()
+            return result
+
+        except Exception:
+            self._on_failure()
+            raise
+
+    async def call_async(
+        self, func: Callable[..., Awaitable[Any]], *args, **kwargs
+    ) -> Any:
+        """Await coroutine function with circuit breaker protection"""
+
+        self._check_open()
+
+        try:
+            result = await func(*args, **kwargs)
+            self._on_success()
+            return result
+
+        except Exception:
+            self._on_failure()
+            raise
+
+    def _check_open(self) -> None:
+        """Raise while the circuit is open; move to HALF_OPEN after the timeout"""
+
         if self.state == ConnectionState.OPEN:
             if self._should_attempt_reset():
                 self.state = ConnectionState.HALF_OPEN
@@ -96,15 +151,6 @@ class CircuitBreaker:
                     },
                 )
 
-        try:
-            result = func(*args, **kwargs)
-            self._on_success()
-            return result
-
-        except Exception:
-            self._on_failure()
-            raise
-
     def _should_attempt_reset(self) -> bool:
         """Check if we should attempt to reset the circuit breaker"""
         if self.last_failure_time is None:
@@ -140,11 +186,87 @@ class CircuitBreaker:
             )
 
 
-class ConnectionPool:
-    """High-performance connection pool for Interactive Brokers"""
+class _Waiter:
+    """A pending checkout; resolved with a lease or a reserved client id"""
+
+    __slots__ = ("priority", "notify", "lease", "slot", "cancelled")
+
+    def __init__(self, priority: ConnectionPriority, notify: Callable[[], None]):
+        self.priority = priority
+        self.notify = notify
+        self.lease: ManagedConnection | None = None
+        self.slot: int | None = None  # client id this waiter should open
+        self.cancelled = False
+
+    @property
+    def pending(self) -> bool:
+        return self.lease is None and self.slot is None
+
+
+async def connect_placeholder(client_id: int) -> dict[str, Any]:
+    """Session record for ``client_id`` that does not touch the network
+
+    Default factory, so pools built without one (the global pool behind
+    ``with_connection`` and ``IntegratedErrorHandler``) never dial IB.
+    """
+    config = get_config().ib_connection
+    return {
+        "client_id": client_id,
+        "host": config.host,
+        "port": config.port,
+        "paper_trading": config.paper_trading,
+        "connected": True,
+        "created_at": datetime.now(),
+    }
+
+
+async def connect_ib(client_id: int) -> Any:
+    """Open an ``IBAsync`` session with ``client_id`` on the configured gateway"""
+    from src.lib.ib_async_wrapper import IBAsync
+
+    config = get_config().ib_connection
+    ib = IBAsync()
+    ok = await ib.connect(
+        config.host or None, config.port, client_id, timeout=config.timeout
+    )
+    if ok and ib.client_id != client_id:
+        # IBAsync retries the handshake with clientId+1, which may belong to
+        # another pooled session
+        await ib.disconnect()
+        ok = False
+    if not ok:
+        raise TradingSystemError(
+            f"IB connection failed for client_id {client_id}",
+            context={"host": config.host, "port": config.port},
+        )
+    return ib
+
 
-    def __init__(self, config: ConnectionConfig | None = None):
+class ConnectionPool:
+    """High-performance connection pool for Interactive Brokers
+
+    Connections are whatever ``factory`` returns, each with its own client
+    id. The default factory only records a placeholder session; pass
+    ``factory=connect_ib`` for real ``IBAsync`` sessions (bulk downloads). Checkout hands out the least-loaded idle
+    connection (fewest checkouts in ``load_window``) that is under its
+    ``max_requests_per_second``. When none is free the caller joins a
+    priority queue and the connection is handed over directly on return, so
+    ``get_connection`` blocks on an event and ``acquire`` awaits a future
+    instead of polling.
+
+    Connections live on one event loop: the loop of the first async caller,
+    or a private loop thread when the pool is only used synchronously.
+    ``start``/``start_async`` pre-warm ``min_connections`` and start health
+    monitoring; otherwise connections are opened on demand.
+    """
+
+    def __init__(
+        self,
+        config: ConnectionConfig | None = None,
+        factory: ConnectionFactory | None = None,
+    ):
         self.config = config or ConnectionConfig()
+        self.factory: ConnectionFactory = factory or connect_placeholder
         self.error_handler = get_error_handler()
         self.logger = logging.getLogger(__name__)
 
@@ -153,6 +275,22 @@ class ConnectionPool:
         self._available_connections: list[int] = []
         self._busy_connections: dict[int, float] = {}  # clientId -> start_time
         self._connection_metrics: dict[int, ConnectionMetrics] = {}
+        self._checkouts: dict[int, deque[float]] = {}  # clientId -> checkout times
+        self._opening: set[int] = set()  # client ids being connected
+        self._closing: list[concurrent.futures.Future[Any]] = []
+
+        # Priority queue of pending checkouts: (priority, seq, waiter)
+        self._waiters: list[tuple[int, int, _Waiter]] = []
+        self._seq = itertools.count()
+        self._pacing_timer: threading.Timer | None = None
+
+        # Wait-time histograms per priority
+        self._wait_times = {p: LatencyHistogram() for p in ConnectionPriority}
+        self._wait_timeouts = dict.fromkeys(ConnectionPriority, 0)
+
+        # Event loop hosting the connections
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread: threading.Thread | None = None
 
         # Thread safety
         self._lock = threading.RLock()
@@ -164,9 +302,41 @@ class ConnectionPool:
             timeout=self.config.circuit_breaker_timeout,
         )
 
-        # Health monitoring
-        self._health_check_thread = None
+        # Health monitoring (started by start()/start_async())
+        self._health_check_thread: threading.Thread | None = None
+        self._stopping = threading.Event()
+
+    # Startup -------------------------------------------------------------
+
+    def start(self) -> int:
+        """Open ``min_connections`` and start health monitoring; returns opened"""
+        client_ids = self._reserve_missing()
+        for client_id in client_ids:
+            self._open(client_id, lease=False)
+        self._start_health_monitoring()
+        with self._lock:
+            return sum(1 for client_id in client_ids if client_id in self._connections)
+
+    async def start_async(self) -> int:
+        """Async :meth:`start`; connections live on the running loop"""
+        self._bind_loop()
+        results = await asyncio.gather(
+            *(
+                self._open_async(client_id, lease=False)
+                for client_id in self._reserve_missing()
+            ),
+            return_exceptions=True,
+        )
         self._start_health_monitoring()
+        return sum(1 for r in results if not isinstance(r, BaseException))
+
+    def _reserve_missing(self) -> list[int]:
+        with self._lock:
+            missing = self.config.min_connections - len(self._connections)
+            missing -= len(self._opening)
+            return [self._reserve_client_id() for _ in range(max(0, missing))]
+
+    # Checkout --------------------------------------------------------------
 
     def get_connection(
         self,
@@ -176,120 +346,295 @@ class ConnectionPool:
         """Get a connection from the pool with priority handling"""
 
         timeout = timeout or self.config.connection_timeout
-        start_time = time.time()
+        start_time = time.monotonic()
+        ready = threading.Event()
+        waiter = self._checkout_or_wait(priority, ready.set)
+        if waiter.pending:
+            ready.wait(timeout)
+            self._settle(waiter, timeout)
+        if waiter.slot is not None:
+            lease = self._open(waiter.slot, lease=True)
+            if lease is None:
+                raise TradingSystemError(
+                    "Failed to open a pooled connection",
+                    context={"priority": priority.name, "client_id": waiter.slot},
+                )
+            waiter.lease = lease
+        assert waiter.lease is not None
+        self._wait_times[priority].record_seconds(time.monotonic() - start_time)
+        return waiter.lease
 
-        while time.time() - start_time < timeout:
-            with self._lock:
-                if self._shutdown:
-                    raise TradingSystemError("Connection pool is shut down")
+    async def acquire(
+        self,
+        priority: ConnectionPriority = ConnectionPriority.NORMAL,
+        timeout: float | None = None,
+    ) -> "ManagedConnection":
+        """Await a connection; use as ``async with await pool.acquire() as ib``"""
 
-                # Try to get an available connection
-                available_conn = self._get_available_connection(priority)
-                if available_conn is not None:
-                    return available_conn
+        timeout = timeout or self.config.connection_timeout
+        start_time = time.monotonic()
+        loop = self._bind_loop()
+        ready = loop.create_future()
 
-                # If no connections available, try to create one
-                if len(self._connections) < self.config.max_connections:
-                    new_conn = self._create_connection()
-                    if new_conn is not None:
-                        return new_conn
+        def wake() -> None:
+            if not ready.done():
+                ready.set_result(None)
 
-            # Wait a bit before retrying
-            time.sleep(0.1)
+        waiter = self._checkout_or_wait(
+            priority, lambda: loop.call_soon_threadsafe(wake)
+        )
+        if waiter.pending:
+            try:
+                await asyncio.wait_for(ready, timeout)
+            except TimeoutError:
+                pass
+            except asyncio.CancelledError:
+                with self._lock:
+                    waiter.cancelled = True
+                if waiter.lease is not None:
+                    waiter.lease.return_to_pool()
+                elif waiter.slot is not None:
+                    self._release_reservation(waiter.slot)
+                raise
+            self._settle(waiter, timeout)
+        if waiter.slot is not None:
+            waiter.lease = await self._open_async(waiter.slot, lease=True)
+            if waiter.lease is None:
+                raise TradingSystemError("Connection pool is shut down")
+        assert waiter.lease is not None
+        self._wait_times[priority].record_seconds(time.monotonic() - start_time)
+        return waiter.lease
+
+    def _checkout_or_wait(
+        self, priority: ConnectionPriority, notify: Callable[[], None]
+    ) -> _Waiter:
+        waiter = _Waiter(priority, notify)
+        with self._lock:
+            if self._shutdown:
+                raise TradingSystemError("Connection pool is shut down")
+            # Never overtake a queued request of the same or higher priority
+            queued_ahead = any(
+                p <= priority.value and not w.cancelled for p, _, w in self._waiters
+            )
+            if not queued_ahead:
+                client_id = self._pick_available()
+                if client_id is not None:
+                    waiter.lease = self._lease(client_id)
+                elif self._can_grow():
+                    waiter.slot = self._reserve_client_id()
+            if waiter.pending:
+                heapq.heappush(self._waiters, (priority.value, next(self._seq), waiter))
+                self._arm_pacing_timer()
+        return waiter
+
+    def _settle(self, waiter: _Waiter, timeout: float) -> None:
+        """After a wait: keep a late hand-over, otherwise give up on timeout"""
+        with self._lock:
+            if not waiter.pending:
+                return
+            waiter.cancelled = True
+            if self._shutdown:
+                raise TradingSystemError("Connection pool is shut down")
+            self._wait_timeouts[waiter.priority] += 1
+            inc("connection_pool_wait_timeouts_total")
+            raise TradingSystemError(
+                f"Connection timeout after {timeout}s",
+                context={
+                    "priority": waiter.priority.name,
+                    "active_connections": len(self._busy_connections),
+                    "total_connections": len(self._connections),
+                    "waiting": self._waiting(),
+                },
+            )
 
-        raise TradingSystemError(
-            f"Connection timeout after {timeout}s",
-            context={
-                "priority": priority.name,
-                "active_connections": len(self._busy_connections),
-                "total_connections": len(self._connections),
-            },
+    def _dispatch(self) -> None:
+        """Hand free connections (or room to open one) to queued requests"""
+        while self._waiters:
+            waiter = self._waiters[0][2]
+            if waiter.cancelled:
+                heapq.heappop(self._waiters)
+                continue
+            client_id = self._pick_available()
+            if client_id is not None:
+                waiter.lease = self._lease(client_id)
+            elif self._can_grow():
+                waiter.slot = self._reserve_client_id()
+            else:
+                self._arm_pacing_timer()
+                return
+            heapq.heappop(self._waiters)
+            waiter.notify()
+
+    # Routing and pacing ----------------------------------------------------
+
+    def _recent(self, client_id: int, now: float) -> deque[float]:
+        times = self._checkouts.setdefault(client_id, deque())
+        while times and times[0] <= now - self.config.load_window:
+            times.popleft()
+        return times
+
+    def _paced_until(self, times: deque[float], now: float) -> float:
+        """When this connection may take another request (``now`` if it may)"""
+        limit = self.config.max_requests_per_second
+        if limit <= 0 or len(times) < limit:
+            return now
+        # ``times`` is ascending; the request fits once the ``limit``-th most
+        # recent checkout is more than a second old
+        return max(now, times[-int(limit)] + 1.0)
+
+    def _pick_available(self) -> int | None:
+        """Least-loaded idle connection that is within its request rate"""
+        now = time.monotonic()
+        best: tuple[int, int] | None = None
+        for client_id in self._available_connections:
+            times = self._recent(client_id, now)
+            if self._paced_until(times, now) > now:
+                continue
+            if best is None or (len(times), client_id) < best:
+                best = (len(times), client_id)
+        if best is None:
+            return None
+        self._available_connections.remove(best[1])
+        return best[1]
+
+    def _arm_pacing_timer(self) -> None:
+        """Re-dispatch when the first rate-limited idle connection frees up"""
+        if self._pacing_timer is not None or not self._available_connections:
+            return
+        now = time.monotonic()
+        delay = min(
+            self._paced_until(self._recent(client_id, now), now) - now
+            for client_id in self._available_connections
         )
 
-    def _get_available_connection(
-        self, priority: ConnectionPriority
-    ) -> Optional["ManagedConnection"]:
-        """Get an available connection based on priority"""
+        def fire() -> None:
+            with self._lock:
+                self._pacing_timer = None
+                self._dispatch()
 
-        if not self._available_connections:
-            return None
+        self._pacing_timer = threading.Timer(max(0.0, delay), fire)
+        self._pacing_timer.daemon = True
+        self._pacing_timer.start()
 
-        # For critical operations, try to free up a connection if needed
-        if priority == ConnectionPriority.CRITICAL and not self._available_connections:
-            self._handle_critical_priority()
+    def _lease(self, client_id: int) -> "ManagedConnection":
+        self._busy_connections[client_id] = time.time()
+        self._recent(client_id, time.monotonic()).append(time.monotonic())
+        return ManagedConnection(self, client_id, self._connections[client_id])
 
-        if self._available_connections:
-            client_id = self._available_connections.pop(0)
-            connection = self._connections[client_id]
-            self._busy_connections[client_id] = time.time()
+    def _waiting(self) -> int:
+        return sum(1 for _, _, w in self._waiters if not w.cancelled)
 
-            return ManagedConnection(self, client_id, connection)
+    # Opening connections -----------------------------------------------------
 
-        return None
+    def _can_grow(self) -> bool:
+        return len(self._connections) + len(self._opening) < self.config.max_connections
 
-    def _handle_critical_priority(self):
-        """Handle critical priority requests by freeing up connections"""
+    def _reserve_client_id(self) -> int:
+        """Lowest free client id; IB rejects a client id that is in use"""
+        client_id = self.config.base_client_id
+        while client_id in self._connections or client_id in self._opening:
+            client_id += 1
+        self._opening.add(client_id)
+        return client_id
 
-        # Find the longest running non-critical connection
-        longest_running = None
-        longest_time = 0
+    def _release_reservation(self, client_id: int) -> None:
+        with self._lock:
+            self._opening.discard(client_id)
+            self._dispatch()
 
-        for client_id, start_time in self._busy_connections.items():
-            running_time = time.time() - start_time
-            if running_time > longest_time:
-                longest_time = running_time
-                longest_running = client_id
+    def _bind_loop(self) -> asyncio.AbstractEventLoop:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                self._loop = loop
+        return loop
 
-        # If found a long-running connection, mark it for interruption
-        if longest_running and longest_time > 30:  # 30 seconds threshold
-            self.logger.warning(
-                f"Interrupting long-running connection {longest_running} for critical request"
+    def _connection_loop(self) -> asyncio.AbstractEventLoop:
+        """Loop hosting the connections, started on a thread if there is none"""
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                loop = asyncio.new_event_loop()
+                self._loop_thread = threading.Thread(
+                    target=loop.run_forever, name="ib-pool-loop", daemon=True
+                )
+                self._loop_thread.start()
+                self._loop = loop
+            return self._loop
+
+    def _open(self, client_id: int, lease: bool) -> Optional["ManagedConnection"]:
+        """Open ``client_id`` from a thread other than the connection loop"""
+
+        loop = self._connection_loop()
+        if _running_loop() is loop:
+            self._release_reservation(client_id)
+            raise TradingSystemError(
+                "get_connection() would block the event loop; use await pool.acquire()"
             )
-            # Note: Actual interruption would depend on IB API implementation
 
-    def _create_connection(self) -> Optional["ManagedConnection"]:
-        """Create a new connection"""
+        def open_blocking() -> Any:
+            return asyncio.run_coroutine_threadsafe(
+                asyncio.wait_for(
+                    self.factory(client_id), self.config.connection_timeout
+                ),
+                loop,
+            ).result()
 
         try:
-            # Circuit breaker protection
-            def create_ib_connection():
-                return self._create_ib_connection()
-
-            connection = self.circuit_breaker.call(create_ib_connection)
-
-            if connection is not None:
-                client_id = len(self._connections) + 1000  # Start from 1000
-                self._connections[client_id] = connection
-                self._connection_metrics[client_id] = ConnectionMetrics()
-                self._busy_connections[client_id] = time.time()
-
-                self.logger.info(f"Created new connection with client_id {client_id}")
-                return ManagedConnection(self, client_id, connection)
-
+            connection = self.circuit_breaker.call(open_blocking)
         except Exception as e:
-            handle_error(e, module=__name__, function="_create_connection")
-
-        return None
+            handle_error(e, module=__name__, function="_open")
+            self._release_reservation(client_id)
+            return None
+        return self._register(client_id, connection, lease)
 
-    def _create_ib_connection(self):
-        """Create actual IB connection (placeholder for IB API integration)"""
+    async def _open_async(
+        self, client_id: int, lease: bool
+    ) -> Optional["ManagedConnection"]:
+        """Open ``client_id`` from async code; raises TradingSystemError"""
 
-        # This would integrate with the actual IB API
-        # For now, return a mock connection for testing
-        config = get_config()
+        loop = self._loop
 
-        # Simulate connection creation
-        time.sleep(0.1)  # Simulate connection time
+        async def open_on_loop() -> Any:
+            coro = asyncio.wait_for(
+                self.factory(client_id), self.config.connection_timeout
+            )
+            if loop is None or loop is asyncio.get_running_loop():
+                return await coro
+            return await asyncio.wrap_future(
+                asyncio.run_coroutine_threadsafe(coro, loop)
+            )
 
-        mock_connection = {
-            "host": config.ib_connection.host,
-            "port": config.ib_connection.port,
-            "paper_trading": config.ib_connection.paper_trading,
-            "connected": True,
-            "created_at": datetime.now(),
-        }
+        try:
+            connection = await self.circuit_breaker.call_async(open_on_loop)
+        except BaseException as e:
+            self._release_reservation(client_id)
+            if not isinstance(e, Exception):
+                raise
+            handle_error(e, module=__name__, function="_open_async")
+            raise TradingSystemError(
+                f"Failed to open pooled connection {client_id}",
+                context={"client_id": client_id},
+            ) from e
+        return self._register(client_id, connection, lease)
+
+    def _register(
+        self, client_id: int, connection: Any, lease: bool
+    ) -> Optional["ManagedConnection"]:
+        with self._lock:
+            self._opening.discard(client_id)
+            if self._shutdown:
+                self._close(connection)
+                return None
+            self._connections[client_id] = connection
+            self._connection_metrics[client_id] = ConnectionMetrics()
+            self.logger.info(f"Created new connection with client_id {client_id}")
+            if lease:
+                return self._lease(client_id)
+            self._available_connections.append(client_id)
+            self._dispatch()
+            return None
 
-        return mock_connection
+    # Returning connections -----------------------------------------------------
 
     def return_connection(self, client_id: int, had_error: bool = False):
         """Return a connection to the pool"""
@@ -308,6 +653,7 @@ class ConnectionPool:
                 else:
                     # Remove faulty connection
                     self._remove_connection(client_id)
+                self._dispatch()
 
     def _update_metrics(self, client_id: int, duration: float, had_error: bool):
         """Update connection metrics"""
@@ -344,32 +690,54 @@ class ConnectionPool:
         """Remove a connection from the pool"""
 
         if client_id in self._connections:
-            # Cleanup connection
-            connection = self._connections[client_id]
-            try:
-                # This would call actual IB API disconnect
-                connection["connected"] = False
-            except Exception:
-                # Swallow any cleanup error to ensure removal proceeds
-                pass
-
-            del self._connections[client_id]
+            connection = self._connections.pop(client_id)
+            self._close(connection)
 
             if client_id in self._available_connections:
                 self._available_connections.remove(client_id)
+            self._busy_connections.pop(client_id, None)
+            self._checkouts.pop(client_id, None)
+            self._connection_metrics.pop(client_id, None)
 
             self.logger.info(f"Removed connection {client_id} from pool")
 
+    def _close(self, connection: Any) -> None:
+        """Disconnect a connection on its loop without waiting for it"""
+        try:
+            if isinstance(connection, dict):
+                connection["connected"] = False
+                return
+            disconnect = getattr(connection, "disconnect", None)
+            if disconnect is not None and inspect.iscoroutinefunction(disconnect):
+                loop = self._loop
+                if loop is None or not loop.is_running():
+                    return
+                if _running_loop() is loop:
+                    loop.create_task(disconnect())
+                else:
+                    self._closing.append(
+                        asyncio.run_coroutine_threadsafe(disconnect(), loop)
+                    )
+            elif callable(close := getattr(connection, "close", disconnect)):
+                close()
+        except Exception:
+            # Swallow any cleanup error to ensure removal proceeds
+            pass
+
     def _start_health_monitoring(self):
         """Start health monitoring thread"""
 
+        if self._health_check_thread and self._health_check_thread.is_alive():
+            return
+
         def health_check():
             while not self._shutdown:
                 try:
                     self._perform_health_check()
-                    time.sleep(self.config.health_check_interval)
                 except Exception as e:
                     handle_error(e, module=__name__, function="health_check")
+                if self._stopping.wait(self.config.health_check_interval):
+                    break
 
         self._health_check_thread = threading.Thread(target=health_check, daemon=True)
         self._health_check_thread.start()
@@ -381,7 +749,9 @@ class ConnectionPool:
             unhealthy_connections = []
 
             for client_id, metrics in self._connection_metrics.items():
-                # Check for unhealthy connections
+                # Check for unhealthy connections; busy ones are checked on return
+                if client_id in self._busy_connections:
+                    continue
                 if metrics.consecutive_failures >= 3 or metrics.uptime_percentage < 80:
                     unhealthy_connections.append(client_id)
 
@@ -390,21 +760,21 @@ class ConnectionPool:
                 self.logger.warning(f"Removing unhealthy connection {client_id}")
                 self._remove_connection(client_id)
 
-            # Ensure minimum connections
-            while (
-                len(self._connections) < self.config.min_connections
-                and len(self._connections) < self.config.max_connections
-            ):
-                self._create_connection()
+        # Ensure minimum connections
+        for client_id in self._reserve_missing():
+            self._open(client_id, lease=False)
 
     def get_pool_status(self) -> dict[str, Any]:
         """Get current pool status"""
 
         with self._lock:
+            now = time.monotonic()
             return {
                 "total_connections": len(self._connections),
                 "available_connections": len(self._available_connections),
                 "busy_connections": len(self._busy_connections),
+                "opening_connections": len(self._opening),
+                "waiting_requests": self._waiting(),
                 "circuit_breaker_state": self.circuit_breaker.state.value,
                 "circuit_breaker_failures": self.circuit_breaker.failure_count,
                 "metrics": {
@@ -413,9 +783,18 @@ class ConnectionPool:
                         "success_rate": metrics.uptime_percentage,
                         "avg_response_time": metrics.average_response_time,
                         "consecutive_failures": metrics.consecutive_failures,
+                        "load": len(self._recent(client_id, now)),
+                        "busy": client_id in self._busy_connections,
                     }
                     for client_id, metrics in self._connection_metrics.items()
                 },
+                "wait_times": {
+                    priority.name: {
+                        **histogram.summary(),
+                        "timeouts": self._wait_timeouts[priority],
+                    }
+                    for priority, histogram in self._wait_times.items()
+                },
             }
 
     def shutdown(self):
@@ -425,6 +804,10 @@ class ConnectionPool:
 
         with self._lock:
             self._shutdown = True
+            self._stopping.set()
+            if self._pacing_timer is not None:
+                self._pacing_timer.cancel()
+                self._pacing_timer = None
 
             # Close all connections
             for client_id in list(self._connections.keys()):
@@ -434,13 +817,36 @@ class ConnectionPool:
             self._available_connections.clear()
             self._busy_connections.clear()
 
+            # Wake queued requests; they fail instead of waiting for a dead pool
+            for _, _, waiter in self._waiters:
+                waiter.notify()
+            self._waiters.clear()
+            closing, self._closing = self._closing, []
+
+        # Let disconnects scheduled on the connection loop finish
+        if closing and _running_loop() is not self._loop:
+            concurrent.futures.wait(closing, timeout=5.0)
+
         # Wait for health check thread to finish
         if self._health_check_thread and self._health_check_thread.is_alive():
             self._health_check_thread.join(timeout=5.0)
 
+        # Stop the private connection loop, if the pool started one
+        if self._loop_thread is not None and self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._loop_thread.join(timeout=5.0)
+            self._loop_thread = None
+
         self.logger.info("Connection pool shutdown complete")
 
 
+def _running_loop() -> asyncio.AbstractEventLoop | None:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
 class ManagedConnection:
     """Managed connection with automatic return to pool"""
 
@@ -459,6 +865,12 @@ class ManagedConnection:
             self._had_error = True
         self.return_to_pool()
 
+    async def __aenter__(self):
+        return self.connection
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.__exit__(exc_type, exc_val, exc_tb)
+
     def return_to_pool(self):
         """Return connection to pool"""
         if not self._returned:
@@ -488,6 +900,17 @@ def with_connection(priority: ConnectionPriority = ConnectionPriority.NORMAL):
     """Decorator for functions that need IB connections"""
 
     def decorator(func):
+        if inspect.iscoroutinefunction(func):
+
+            async def async_wrapper(*args, **kwargs):
+                pool = get_connection_pool()
+
+                async with await pool.acquire(priority) as connection:
+                    kwargs["connection"] = connection
+                    return await func(*args, **kwargs)
+
+            return async_wrapper
+
         def wrapper(*args, **kwargs):
             pool = get_connection_pool()
 
@@ -20,7 +20,11 @@ from typing import Any
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.core.config import get_config
-from src.core.connection_pool import ConnectionPriority, get_connection_pool
+from src.core.connection_pool import (
+    ConnectionPool,
+    ConnectionPriority,
+    get_connection_pool,
+)
 from src.core.error_handler import TradingSystemError, get_error_handler, handle_error
 from src.core.retry_manager import RetryConfig, get_retry_manager
 
@@ -111,10 +115,10 @@ class ServiceConfig:
 class IntegratedErrorHandler:
     """Integrated error handling system combining all strategies"""
 
-    def __init__(self):
+    def __init__(self, connection_pool: ConnectionPool | None = None):
         self.config = get_config()
         self.error_handler = get_error_handler()
-        self.connection_pool = get_connection_pool()
+        self.connection_pool = connection_pool or get_connection_pool()
         self.retry_manager = get_retry_manager()
         self.logger = logging.getLogger(__name__)
 
@@ -4,9 +4,18 @@ Retry Mechanism with Exponential Backoff
 
 This module provides robust retry mechanisms to handle transient failures
 in the trading system, addressing root causes of error proliferation.
+
+Failures are classified into a ``FailureType`` by exception type and IB/HTTP
+error code, and each type can carry its own ``FailurePolicy``. Policies are
+opt-in: ``failure_type_policies()`` makes rate limits back off linearly and
+for longer and stops retrying data errors. ``execute_with_retry_async`` is the event-loop
+variant: backoff sleeps with ``asyncio.sleep`` and, for idempotent reads,
+can hedge an attempt that runs past a latency percentile by launching a
+second one and taking whichever returns first.
 """
 
 import asyncio
+import inspect
 import logging
 import random
 import sys
@@ -23,6 +32,7 @@ from src.types.project_types import AnyFn
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.core.error_handler import TradingSystemError, get_error_handler, handle_error
+from src.observability.latency import LatencyHistogram
 
 
 class RetryStrategy(Enum):
@@ -45,6 +55,95 @@ class FailureType(Enum):
     SYSTEM_ERROR = "system_error"
 
 
+# IB: 100 = max message rate exceeded, 420 = pacing violation; HTTP 429
+_RATE_LIMIT_CODES = frozenset({100, 420, 429})
+_CODE_ATTRIBUTES = ("errorCode", "error_code", "status_code", "http_status", "code")
+
+
+def _error_code(exception: BaseException) -> int | None:
+    """IB error code or HTTP status carried by ``exception``, if any"""
+    for source in (exception, getattr(exception, "response", None)):
+        for name in _CODE_ATTRIBUTES:
+            code = getattr(source, name, None)
+            if isinstance(code, int) and not isinstance(code, bool):
+                return code
+    context = getattr(exception, "context", None)
+    if isinstance(context, dict):
+        code = context.get("errorCode", context.get("status_code"))
+        if isinstance(code, int) and not isinstance(code, bool):
+            return code
+    return None
+
+
+def classify_failure(exception: BaseException) -> FailureType:
+    """Map an exception to the ``FailureType`` its retry policy is keyed on
+
+    Rate limits are recognised by IB error code or HTTP status only, never
+    by message text.
+    """
+    if _error_code(exception) in _RATE_LIMIT_CODES:
+        return FailureType.RATE_LIMIT_ERROR
+    # TimeoutError is an OSError subclass, so it is checked first
+    if isinstance(exception, TimeoutError | asyncio.TimeoutError):
+        return FailureType.TIMEOUT_ERROR
+    if isinstance(exception, ConnectionError | OSError):
+        return FailureType.CONNECTION_ERROR
+    if isinstance(exception, ValueError | TypeError | KeyError):
+        return FailureType.DATA_ERROR
+    if isinstance(exception, TradingSystemError):
+        return FailureType.TEMPORARY_ERROR
+    return FailureType.SYSTEM_ERROR
+
+
+@dataclass
+class FailurePolicy:
+    """Per-failure-type overrides; None fields fall back to ``RetryConfig``"""
+
+    retryable: bool | None = None
+    max_attempts: int | None = None
+    base_delay: float | None = None
+    max_delay: float | None = None
+    strategy: RetryStrategy | None = None
+
+
+def failure_type_policies() -> dict[FailureType, FailurePolicy]:
+    """Rate limits back off linearly for up to 5 minutes; bad data is final
+
+    Pass as ``RetryConfig.failure_policies`` to opt in; without policies a
+    ``RetryManager`` retries by exception type alone.
+    """
+    return {
+        FailureType.RATE_LIMIT_ERROR: FailurePolicy(
+            retryable=True,
+            base_delay=5.0,
+            max_delay=300.0,
+            strategy=RetryStrategy.LINEAR_BACKOFF,
+        ),
+        FailureType.DATA_ERROR: FailurePolicy(retryable=False),
+    }
+
+
+@dataclass
+class HedgeConfig:
+    """
+    Request hedging for idempotent reads
+
+    When an attempt has not returned after the ``percentile`` latency of
+    the operation, a second attempt is launched and the first result wins.
+    Until ``min_samples`` latencies are recorded the hedge fires after
+    ``initial_delay`` (never when None).
+
+    Every hedge is a duplicate request, so do not hedge billed endpoints.
+    A losing coroutine is cancelled; a losing plain callable keeps running
+    in its worker thread until it returns.
+    """
+
+    percentile: float = 95.0
+    min_samples: int = 20
+    initial_delay: float | None = None
+    name: str | None = None  # latency histogram key; defaults to the callable
+
+
 @dataclass
 class RetryConfig:
     """Configuration for retry mechanisms"""
@@ -60,6 +159,7 @@ class RetryConfig:
     retryable_exceptions: list[type] | None = None
     non_retryable_exceptions: list[type] | None = None
     failure_conditions: list[AnyFn] | None = None
+    failure_policies: dict[FailureType, FailurePolicy] | None = None
 
     # Callbacks
     on_retry: AnyFn | None = None
@@ -89,6 +189,9 @@ class RetryStats:
         self.total_retry_time = 0.0
         self.retry_counts: dict[int, int] = {}  # attempts -> count
         self.failure_types: dict[str, int] = {}
+        self.failure_classes: dict[str, int] = {}  # FailureType -> failed attempts
+        self.hedges_launched = 0
+        self.hedges_won = 0
 
     def record_operation(
         self,
@@ -113,6 +216,23 @@ class RetryStats:
 
         self.retry_counts[attempts] = self.retry_counts.get(attempts, 0) + 1
 
+    def record_failure(self, failure_type: FailureType):
+        """Record one failed attempt by failure class"""
+        key = failure_type.value
+        self.failure_classes[key] = self.failure_classes.get(key, 0) + 1
+
+    def record_hedge(self, won: bool):
+        """Record a launched hedge and whether it beat the original attempt"""
+        self.hedges_launched += 1
+        if won:
+            self.hedges_won += 1
+
+    def get_added_load(self) -> float:
+        """Hedged requests as a percentage of attempts"""
+        if self.total_attempts == 0:
+            return 0.0
+        return (self.hedges_launched / self.total_attempts) * 100
+
     def get_success_rate(self) -> float:
         """Get success rate percentage"""
         if self.total_operations == 0:
@@ -134,6 +254,10 @@ class RetryStats:
             "total_retry_time": self.total_retry_time,
             "retry_distribution": self.retry_counts,
             "failure_types": self.failure_types,
+            "failure_classes": self.failure_classes,
+            "hedges_launched": self.hedges_launched,
+            "hedges_won": self.hedges_won,
+            "added_load": self.get_added_load(),
         }
 
 
@@ -145,6 +269,10 @@ class RetryManager:
         self.error_handler = get_error_handler()
         self.logger = logging.getLogger(__name__)
         self.stats = RetryStats()
+        self._latencies: dict[str, LatencyHistogram] = {}
+
+        if self.config.failure_policies is None:
+            self.config.failure_policies = {}
 
         # Default retryable exceptions
         if self.config.retryable_exceptions is None:
@@ -171,7 +299,7 @@ class RetryManager:
         attempts: list[RetryAttempt] = []
         last_exception = None
 
-        for attempt in range(1, self.config.max_attempts + 1):
+        for attempt in range(1, self._attempt_ceiling() + 1):
             attempt_start = time.time()
 
             try:
@@ -197,6 +325,7 @@ class RetryManager:
             except Exception as e:
                 last_exception = e
                 elapsed = time.time() - attempt_start
+                policy = self._policy_for(e)
 
                 # Check if this exception should be retried
                 if not self._should_retry(e, attempt):
@@ -239,7 +368,7 @@ class RetryManager:
                 )
 
                 # If this was the last attempt, give up
-                if attempt >= self.config.max_attempts:
+                if attempt >= self._max_attempts(policy):
                     # Record failed operation
                     self.stats.record_operation(
                         attempts=attempt,
@@ -257,7 +386,7 @@ class RetryManager:
                     raise
 
                 # Calculate delay for next attempt
-                delay = self._calculate_delay(attempt)
+                delay = self._calculate_delay(attempt, policy)
                 attempts[-1].delay = delay
 
                 self.logger.warning(
@@ -275,22 +404,44 @@ class RetryManager:
         if last_exception:
             raise last_exception
 
+    def _policy_for(self, exception: BaseException) -> FailurePolicy | None:
+        """Failure policy for the class of ``exception``, if one is configured"""
+        failure_type = classify_failure(exception)
+        self.stats.record_failure(failure_type)
+        return (self.config.failure_policies or {}).get(failure_type)
+
+    def _max_attempts(self, policy: FailurePolicy | None) -> int:
+        if policy is not None and policy.max_attempts is not None:
+            return policy.max_attempts
+        return self.config.max_attempts
+
+    def _attempt_ceiling(self) -> int:
+        """Largest attempt count any failure policy allows"""
+        policies = (self.config.failure_policies or {}).values()
+        return max(
+            [self.config.max_attempts, *(self._max_attempts(p) for p in policies)]
+        )
+
     def _should_retry(self, exception: Exception, attempt: int) -> bool:
         """Determine if an exception should be retried"""
 
+        policy = (self.config.failure_policies or {}).get(classify_failure(exception))
+
         # Check if we've reached max attempts
-        if attempt >= self.config.max_attempts:
+        if attempt >= self._max_attempts(policy):
             return False
 
         # Check non-retryable exceptions first
-        for exc_type in self.config.non_retryable_exceptions or []:
-            if isinstance(exception, exc_type):
-                return False
+        if isinstance(exception, tuple(self.config.non_retryable_exceptions or ())):
+            return False
 
         # Check retryable exceptions
-        for exc_type in self.config.retryable_exceptions or []:
-            if isinstance(exception, exc_type):
-                return True
+        if isinstance(exception, tuple(self.config.retryable_exceptions or ())):
+            return True
+
+        # Then the policy for this failure type
+        if policy is not None and policy.retryable is not None:
+            return policy.retryable
 
         # Check custom failure conditions
         if self.config.failure_conditions:
@@ -305,44 +456,168 @@ class RetryManager:
         # Default: don't retry unknown exceptions
         return False
 
-    def _calculate_delay(self, attempt: int) -> float:
+    def _calculate_delay(
+        self, attempt: int, policy: FailurePolicy | None = None
+    ) -> float:
         """Calculate delay for next retry attempt"""
 
-        if self.config.strategy == RetryStrategy.FIXED_DELAY:
-            delay = self.config.base_delay
+        strategy = self.config.strategy
+        base = self.config.base_delay
+        max_delay = self.config.max_delay
+        if policy is not None:
+            strategy = policy.strategy or strategy
+            base = base if policy.base_delay is None else policy.base_delay
+            max_delay = max_delay if policy.max_delay is None else policy.max_delay
 
-        elif self.config.strategy == RetryStrategy.LINEAR_BACKOFF:
-            delay = self.config.base_delay * attempt
+        if strategy == RetryStrategy.FIXED_DELAY:
+            delay = base
 
-        elif self.config.strategy == RetryStrategy.EXPONENTIAL_BACKOFF:
-            delay = self.config.base_delay * (
-                self.config.backoff_multiplier ** (attempt - 1)
-            )
+        elif strategy == RetryStrategy.LINEAR_BACKOFF:
+            delay = base * attempt
 
-        elif self.config.strategy == RetryStrategy.JITTERED_EXPONENTIAL:
-            base_delay = self.config.base_delay * (
-                self.config.backoff_multiplier ** (attempt - 1)
-            )
+        elif strategy == RetryStrategy.EXPONENTIAL_BACKOFF:
+            delay = base * (self.config.backoff_multiplier ** (attempt - 1))
+
+        elif strategy == RetryStrategy.JITTERED_EXPONENTIAL:
+            base_delay = base * (self.config.backoff_multiplier ** (attempt - 1))
             # Add random jitter (±25%)
             jitter_range = base_delay * 0.25
             delay = base_delay + random.uniform(-jitter_range, jitter_range)
 
         else:
-            delay = self.config.base_delay
+            delay = base
 
         # Apply jitter if enabled (for non-jittered strategies)
-        if (
-            self.config.jitter
-            and self.config.strategy != RetryStrategy.JITTERED_EXPONENTIAL
-        ):
+        if self.config.jitter and strategy != RetryStrategy.JITTERED_EXPONENTIAL:
             jitter_range = delay * 0.1  # ±10% jitter
             delay += random.uniform(-jitter_range, jitter_range)
 
         # Ensure delay is within bounds
-        delay = max(0.1, min(delay, self.config.max_delay))
+        delay = max(0.1, min(delay, max_delay))
 
         return delay
 
+    # Async engine -------------------------------------------------------
+
+    async def execute_with_retry_async(
+        self,
+        func: AnyFn,
+        *args: Any,
+        hedge: HedgeConfig | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Async ``execute_with_retry``: backoff never blocks the event loop
+
+        Coroutine functions are awaited; plain callables run in a worker
+        thread. With ``hedge`` each attempt may race a second copy of the
+        request (only for idempotent operations).
+        """
+        operation_start = time.time()
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                if hedge is None:
+                    result = await _invoke(func, args, kwargs)
+                else:
+                    result = await self._call_hedged(func, args, kwargs, hedge)
+            except Exception as e:
+                policy = self._policy_for(e)
+                if not self._should_retry(e, attempt):
+                    self.stats.record_operation(
+                        attempts=attempt,
+                        success=False,
+                        total_time=time.time() - operation_start,
+                        failure_type=type(e).__name__,
+                    )
+                    self.logger.error(f"Operation failed after {attempt} attempts: {e}")
+                    if self.config.on_failure:
+                        self.config.on_failure(e, attempt)
+                    raise
+
+                delay = self._calculate_delay(attempt, policy)
+                self.logger.warning(
+                    f"Attempt {attempt} failed: {e}. Retrying in {delay:.1f}s..."
+                )
+                if self.config.on_retry:
+                    self.config.on_retry(e, attempt, delay)
+                await asyncio.sleep(delay)
+                continue
+
+            if self.config.on_success:
+                self.config.on_success(attempt, time.time() - operation_start)
+            self.stats.record_operation(
+                attempts=attempt,
+                success=True,
+                total_time=time.time() - operation_start,
+            )
+            if attempt > 1:
+                self.logger.info(f"Operation succeeded on attempt {attempt}")
+            return result
+
+    def latency(self, name: str) -> LatencyHistogram:
+        """Latency histogram of a hedged operation"""
+        hist = self._latencies.get(name)
+        if hist is None:
+            hist = self._latencies[name] = LatencyHistogram()
+        return hist
+
+    def _hedge_delay(self, hist: LatencyHistogram, hedge: HedgeConfig) -> float | None:
+        if hist.count < hedge.min_samples:
+            return hedge.initial_delay
+        return hist.percentile(hedge.percentile) / 1_000_000
+
+    async def _call_hedged(
+        self,
+        func: AnyFn,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        hedge: HedgeConfig,
+    ) -> Any:
+        """One attempt, plus a hedge if it outlives the latency percentile"""
+        hist = self.latency(hedge.name or getattr(func, "__qualname__", repr(func)))
+        first = asyncio.ensure_future(_invoke(func, args, kwargs))
+        launched = {first: time.monotonic()}
+        pending = {first}
+        error: BaseException | None = None
+        try:
+            done, pending = await asyncio.wait(
+                pending, timeout=self._hedge_delay(hist, hedge)
+            )
+            if pending:
+                second = asyncio.ensure_future(_invoke(func, args, kwargs))
+                launched[second] = time.monotonic()
+                pending.add(second)
+            while True:
+                for task in done:
+                    if task.exception() is None:
+                        if len(launched) > 1:
+                            self.stats.record_hedge(won=task is not first)
+                        hist.record_seconds(time.monotonic() - launched[task])
+                        return task.result()
+                    error = error or task.exception()
+                if not pending:
+                    break
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+        finally:
+            # The loser is abandoned; a worker thread runs to completion
+            for task in pending:
+                task.cancel()
+        if len(launched) > 1:
+            self.stats.record_hedge(won=False)
+        assert error is not None
+        raise error
+
+
+async def _invoke(func: AnyFn, args: tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
+    if inspect.iscoroutinefunction(func):
+        return await func(*args, **kwargs)
+    result = await asyncio.to_thread(func, *args, **kwargs)
+    return await result if inspect.isawaitable(result) else result
+
 
 # Global retry manager instance
 _retry_manager: RetryManager | None = None
@@ -372,25 +647,16 @@ def retry_on_failure(config: RetryConfig | None = None):
     return decorator
 
 
-def retry_async(config: RetryConfig | None = None):
-    """Decorator for async functions with retry logic"""
+def retry_async(config: RetryConfig | None = None, hedge: HedgeConfig | None = None):
+    """Decorator for async functions with retry logic (and optional hedging)"""
 
     def decorator(func: AnyFn) -> AnyFn:
         @wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> Any:
             retry_manager = RetryManager(config) if config else get_retry_manager()
-
-            # Async wrapper for the retry logic
-            def sync_func() -> Any:
-                # Create a new event loop for this thread
-                try:
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                    return loop.run_until_complete(func(*args, **kwargs))
-                finally:
-                    loop.close()
-
-            return retry_manager.execute_with_retry(sync_func)
+            return await retry_manager.execute_with_retry_async(
+                func, *args, hedge=hedge, **kwargs
+            )
 
         return wrapper
 
@@ -45,6 +45,7 @@ from src.core.integrated_error_handling import with_error_handling
 from src.data.parquet_repository import ParquetRepository
 from src.domain.interfaces import PositionSizeResult
 from src.domain.ml_types import SizingMode
+from src.observability.latency import LatencyStage, get_latency_tracker
 from src.services.order_management_service import (
     OrderAction,
     OrderManagementService,
@@ -209,6 +210,7 @@ class MLSignalExecutor:
             "average_slippage_pct": 0.0,
             "total_commission_paid": 0.0,
         }
+        self.latency_tracker = get_latency_tracker()
 
         # Event handlers for ML repository callbacks
         self.signal_status_handlers: list[Callable[[SignalExecution], None]] = []
@@ -334,6 +336,12 @@ class MLSignalExecutor:
             execution = SignalExecution(signal_id=execution_id, signal=signal)
             self.active_signals[execution_id] = execution
             self.execution_stats["total_signals_received"] += 1
+        self.latency_tracker.mark(
+            signal.signal_id,
+            LatencyStage.SIGNAL_RECEIVED,
+            signal.strategy_name,
+            at=execution.received_time,
+        )
 
         self.logger.info(
             f"Received ML signal {execution_id}: {signal.symbol} "
@@ -431,6 +439,9 @@ class MLSignalExecutor:
 
             execution.status = SignalStatus.VALIDATED
             execution.validation_time = datetime.now(UTC)
+            self.latency_tracker.mark(
+                signal.signal_id, LatencyStage.VALIDATED, at=execution.validation_time
+            )
 
             self.logger.info(f"Signal {execution.signal_id} validated successfully")
             return True
@@ -517,6 +528,9 @@ class MLSignalExecutor:
             if order:
                 execution.orders_created.append(order.order_id)
                 self.daily_trade_count += 1
+                self.latency_tracker.mark(
+                    signal.signal_id, LatencyStage.ORDER_SUBMITTED
+                )
 
                 self.logger.info(
                     f"Order {order.order_id} placed for signal {execution.signal_id}"
@@ -632,6 +646,10 @@ class MLSignalExecutor:
         total_commission: float,
     ) -> None:
         """Update execution with aggregate totals and derived averages."""
+        if total_filled > 0 and execution.total_filled_quantity == 0:
+            self.latency_tracker.mark(
+                execution.signal.signal_id, LatencyStage.FIRST_FILL
+            )
         execution.total_filled_quantity = total_filled
         execution.total_commission = total_commission
         if total_filled > 0:
@@ -644,6 +662,11 @@ class MLSignalExecutor:
         execution.signal_to_execution_latency_ms = (
             execution.execution_complete_time - execution.received_time
         ).total_seconds() * 1000
+        self.latency_tracker.mark(
+            execution.signal.signal_id,
+            LatencyStage.COMPLETE,
+            at=execution.execution_complete_time,
+        )
         # Move to completed signals
         with self._signal_lock:
             self.completed_signals[execution.signal_id] = execution
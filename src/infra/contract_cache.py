@@ -0,0 +1,395 @@
+"""Process-wide cache of qualified IB contract details.
+
+Qualifying a contract costs a ``reqContractDetails`` round trip, and every
+service used to pay it again for the same symbols. ``ContractCache`` keeps
+what qualification returns (conId, primary exchange, tick size, trading and
+liquid hours, time zone) per symbol/exchange/currency in a JSON file, so a
+fresh process builds fully specified contracts for every known symbol
+without talking to IB:
+
+- ``contract`` returns a contract built from the cache (stale entries
+  included; a conId does not change overnight), or a plain unqualified one
+  for unknown symbols - never a round trip;
+- ``qualify`` does the same but falls back to ``ib.qualifyContracts`` for
+  unknown symbols and entries older than the TTL, and records the result;
+- ``qualify_many`` resolves many symbols with concurrent
+  ``reqContractDetailsAsync`` calls under a rate limiter, requesting only
+  symbols that are missing or older than the TTL.
+
+``stats`` reports hits, misses and round trips. The file is written
+atomically and merged with entries other processes saved in the meantime.
+
+Typical use::
+
+    cache = get_contract_cache()
+    await cache.qualify_many(ib, universe)  # once, at startup
+    contract = cache.contract("AAPL")  # O(1), no request
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from src.infra.async_utils import RateLimiter
+from src.infra.contract_factories import stock
+
+logger = logging.getLogger(__name__)
+
+CACHE_ENV = "IB_CONTRACT_CACHE"
+DEFAULT_TTL = 7 * 24 * 3600.0  # seconds
+DEFAULT_CONCURRENCY = 8
+DEFAULT_RATE = 10.0  # contract detail requests per second (IB: ~50 msg/s)
+
+
+def cache_key(symbol: str, exchange: str = "SMART", currency: str = "USD") -> str:
+    return f"{symbol.strip().upper()}|{exchange}|{currency}"
+
+
+@dataclass(frozen=True, slots=True)
+class ContractInfo:
+    """What qualification returns for one stock contract"""
+
+    symbol: str
+    exchange: str
+    currency: str
+    con_id: int
+    primary_exchange: str = ""
+    min_tick: float = 0.0
+    trading_hours: str = ""
+    liquid_hours: str = ""
+    time_zone: str = ""
+    long_name: str = ""
+    fetched_at: float = 0.0  # time.time()
+
+    @property
+    def key(self) -> str:
+        return cache_key(self.symbol, self.exchange, self.currency)
+
+    @property
+    def has_details(self) -> bool:
+        """False when only a qualified contract (no contract details) was seen"""
+        return bool(self.trading_hours)
+
+    @classmethod
+    def from_details(
+        cls, details: Any, exchange: str = "SMART", currency: str = "USD"
+    ) -> ContractInfo:
+        """Build from an ``ib_async`` ``ContractDetails``"""
+        contract = details.contract
+        return cls(
+            symbol=str(contract.symbol).upper(),
+            exchange=exchange,
+            currency=str(getattr(contract, "currency", "") or currency),
+            con_id=int(contract.conId),
+            primary_exchange=str(getattr(contract, "primaryExchange", "") or ""),
+            min_tick=float(getattr(details, "minTick", 0.0) or 0.0),
+            trading_hours=str(getattr(details, "tradingHours", "") or ""),
+            liquid_hours=str(getattr(details, "liquidHours", "") or ""),
+            time_zone=str(getattr(details, "timeZoneId", "") or ""),
+            long_name=str(getattr(details, "longName", "") or ""),
+            fetched_at=time.time(),
+        )
+
+    @classmethod
+    def from_contract(
+        cls, contract: Any, exchange: str = "SMART", currency: str = "USD"
+    ) -> ContractInfo:
+        """Build from a contract returned by ``qualifyContracts``"""
+        return cls(
+            symbol=str(contract.symbol).upper(),
+            exchange=exchange,
+            currency=str(getattr(contract, "currency", "") or currency),
+            con_id=int(contract.conId),
+            primary_exchange=str(getattr(contract, "primaryExchange", "") or ""),
+            fetched_at=time.time(),
+        )
+
+    def to_contract(self) -> Any:
+        """Fully specified stock contract (no qualification needed)"""
+        contract = stock(self.symbol, self.exchange, self.currency)  # type: ignore[arg-type]
+        contract.conId = self.con_id
+        contract.primaryExchange = self.primary_exchange
+        return contract
+
+
+def default_cache_path() -> Path | None:
+    """``$IB_CONTRACT_CACHE`` (``memory`` disables persistence), else data cache."""
+    env = os.environ.get(CACHE_ENV, "").strip()
+    if env.lower() == "memory":
+        return None
+    if env:
+        return Path(env)
+    try:
+        from src.core.config import get_config
+
+        return get_config().data_paths.base_path / "cache" / "contract_details.json"
+    except Exception:  # noqa: BLE001 - config is optional here
+        return Path(tempfile.gettempdir()) / "contract_details.json"
+
+
+class ContractCache:
+    """
+    Contract details per symbol/exchange/currency, persisted to ``path``
+
+    Args:
+        path: JSON file (None keeps the cache in memory)
+        ttl: Seconds after which ``qualify``/``qualify_many`` refresh an entry
+    """
+
+    def __init__(self, path: Path | None = None, ttl: float = DEFAULT_TTL):
+        self.path = path
+        self.ttl = ttl
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.requests = 0
+        self.failures = 0
+        self._dirty = False
+        self._lock = threading.Lock()
+        self._entries: dict[str, ContractInfo] = self._read()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, symbol: str) -> bool:
+        return cache_key(symbol) in self._entries
+
+    def _read(self) -> dict[str, ContractInfo]:
+        if self.path is None or not self.path.exists():
+            return {}
+        try:
+            raw = json.loads(self.path.read_text())
+            return {key: ContractInfo(**value) for key, value in raw.items()}
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning("Ignoring unreadable contract cache %s: %s", self.path, e)
+            return {}
+
+    def is_fresh(self, info: ContractInfo, now: float | None = None) -> bool:
+        return (now or time.time()) - info.fetched_at < self.ttl
+
+    def get(
+        self,
+        symbol: str,
+        exchange: str = "SMART",
+        currency: str = "USD",
+        *,
+        allow_stale: bool = True,
+    ) -> ContractInfo | None:
+        """Cached details, or None (also for stale entries unless allowed)"""
+        with self._lock:
+            info = self._entries.get(cache_key(symbol, exchange, currency))
+            if info is None:
+                self.misses += 1
+                return None
+            if self.is_fresh(info):
+                self.hits += 1
+            elif allow_stale:
+                self.stale_hits += 1
+            else:
+                self.misses += 1
+                return None
+            return info
+
+    def put(self, info: ContractInfo) -> None:
+        with self._lock:
+            self._entries[info.key] = info
+            self._dirty = True
+
+    def contract(
+        self, symbol: str, exchange: str = "SMART", currency: str = "USD"
+    ) -> Any:
+        """Contract for ``symbol`` without any IB request"""
+        info = self.get(symbol, exchange, currency)
+        if info is not None:
+            return info.to_contract()
+        return stock(symbol.strip().upper(), exchange, currency)  # type: ignore[arg-type]
+
+    def qualify(
+        self, ib: Any, symbol: str, exchange: str = "SMART", currency: str = "USD"
+    ) -> Any:
+        """
+        Qualified contract for ``symbol``
+
+        Fresh entries cost nothing; unknown symbols and entries older than the
+        TTL go through ``ib.qualifyContracts``. Best-effort: if that fails the
+        stale entry, or else the unqualified contract, is returned.
+        """
+        info = self.get(symbol, exchange, currency)
+        can_request = ib is not None and hasattr(ib, "qualifyContracts")
+        if info is not None and (self.is_fresh(info) or not can_request):
+            return info.to_contract()
+        if can_request:
+            qualified = self.request_qualified(ib, symbol, exchange, currency)
+            if qualified is not None:
+                return qualified
+        if info is not None:
+            return info.to_contract()
+        return stock(symbol.strip().upper(), exchange, currency)  # type: ignore[arg-type]
+
+    def request_qualified(
+        self, ib: Any, symbol: str, exchange: str = "SMART", currency: str = "USD"
+    ) -> Any | None:
+        """``ib.qualifyContracts`` for ``symbol``, recorded; None if it fails"""
+        self.requests += 1
+        contract = stock(symbol.strip().upper(), exchange, currency)  # type: ignore[arg-type]
+        try:
+            qualified = ib.qualifyContracts(contract)
+        except Exception as e:  # noqa: BLE001 - qualification is best-effort
+            self.failures += 1
+            logger.debug("qualifyContracts failed for %s: %s", symbol, e)
+            return None
+        if not qualified or not getattr(qualified[0], "conId", 0):
+            self.failures += 1
+            return None
+        contract = qualified[0]
+        self.put(ContractInfo.from_contract(contract, exchange, currency))
+        self.save()
+        return contract
+
+    async def qualify_many(
+        self,
+        ib: Any,
+        symbols: Iterable[str],
+        exchange: str = "SMART",
+        currency: str = "USD",
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        rate_per_sec: float = DEFAULT_RATE,
+        refresh: bool = False,
+    ) -> dict[str, ContractInfo | None]:
+        """
+        Resolve many symbols, requesting contract details only where needed
+
+        Symbols with a fresh entry that includes contract details are
+        answered from the cache; the rest are requested concurrently with
+        ``ib.reqContractDetailsAsync`` (``concurrency`` in flight, started at
+        ``rate_per_sec``). Symbols IB does not know map to None; a failed
+        request keeps a stale entry if there is one.
+
+        Args:
+            ib: ``ib_async`` client (must run on its event loop)
+            symbols: Symbols to resolve
+            refresh: Request every symbol, ignoring the TTL
+
+        Returns:
+            {symbol: details or None}, in input order
+        """
+        wanted = list(dict.fromkeys(s.strip().upper() for s in symbols))
+        now = time.time()
+        results: dict[str, ContractInfo | None] = {}
+        pending: list[str] = []
+        for symbol in wanted:
+            info = self.get(symbol, exchange, currency)
+            results[symbol] = info
+            if (
+                refresh
+                or info is None
+                or not info.has_details
+                or not self.is_fresh(info, now)
+            ):
+                pending.append(symbol)
+        if pending and ib is not None:
+            limiter = RateLimiter(rate_per_sec, max(1, concurrency))
+
+            async def resolve(symbol: str) -> None:
+                async with limiter:
+                    fetched = await self._request_details(
+                        ib, symbol, exchange, currency
+                    )
+                if fetched is not None or results[symbol] is None:
+                    results[symbol] = fetched
+
+            await asyncio.gather(*(resolve(s) for s in pending))
+            self.save()
+            logger.info(
+                "Contract cache: %d of %d symbols requested (%d unresolved)",
+                len(pending),
+                len(wanted),
+                sum(1 for s in pending if results[s] is None),
+            )
+        return {symbol: results[symbol] for symbol in wanted}
+
+    async def _request_details(
+        self, ib: Any, symbol: str, exchange: str, currency: str
+    ) -> ContractInfo | None:
+        self.requests += 1
+        try:
+            details = await ib.reqContractDetailsAsync(
+                stock(symbol, exchange, currency)  # type: ignore[arg-type]
+            )
+        except Exception as e:  # noqa: BLE001 - one symbol must not stop the batch
+            self.failures += 1
+            logger.debug("reqContractDetails failed for %s: %s", symbol, e)
+            return None
+        if not details:
+            self.failures += 1
+            return None
+        info = ContractInfo.from_details(details[0], exchange, currency)
+        self.put(info)
+        return info
+
+    def save(self) -> None:
+        """Write changed entries, keeping newer ones saved by other processes"""
+        if self.path is None:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            merged = self._read()
+            for key, info in self._entries.items():
+                other = merged.get(key)
+                if other is None or other.fetched_at <= info.fetched_at:
+                    merged[key] = info
+            self._entries = merged
+            self._dirty = False
+            payload = {key: asdict(info) for key, info in merged.items()}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(payload))
+            tmp.replace(self.path)
+        except OSError as e:
+            logger.warning("Could not save contract cache %s: %s", self.path, e)
+
+    def clear(self) -> None:
+        """Forget the in-memory entries (the file is left alone)"""
+        with self._lock:
+            self._entries.clear()
+            self._dirty = False
+
+    def stats(self) -> dict[str, Any]:
+        lookups = self.hits + self.stale_hits + self.misses
+        return {
+            "path": str(self.path) if self.path else None,
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits + self.stale_hits) / lookups if lookups else 0.0,
+            "requests": self.requests,
+            "failures": self.failures,
+        }
+
+
+_caches: dict[Path | None, ContractCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_contract_cache(path: Path | str | None = None) -> ContractCache:
+    """Process-wide cache for ``path`` (default: :func:`default_cache_path`)."""
+    resolved = Path(path) if path is not None else default_cache_path()
+    with _caches_lock:
+        cache = _caches.get(resolved)
+        if cache is None:
+            cache = _caches[resolved] = ContractCache(resolved)
+        return cache
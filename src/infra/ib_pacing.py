@@ -0,0 +1,368 @@
+"""Shared IB historical-data pacing governor.
+
+One governor models IB's historical pacing rules for small bars (30 secs or
+less) and is shared by every process talking to the same gateway:
+
+- at most 60 requests in any 10 minute window;
+- fewer than six requests for the same contract, exchange and tick type
+  within 2 seconds;
+- no identical request within 15 seconds;
+- ``BID_ASK`` requests count twice toward the first two limits.
+
+Larger bars are not subject to these limits and pass straight through.
+
+State is a small ledger (the last 60 request times, per-contract times from
+the last 2 s and identical-request times from the last 15 s), so every check
+is O(1) regardless of history. With a ledger path the state lives in a JSON
+file guarded by an ``fcntl`` lock, so the backfill, the scanner and a
+recorder started as separate processes see each other's requests; without
+one (or where ``fcntl`` is unavailable) it is process-local.
+
+Typical use::
+
+    gov = get_pacing_governor()
+    key = request_key(contract_key("AAPL"), "1 secs", end_datetime=end)
+    gov.acquire(contract_key("AAPL"), bar_size="1 secs", request=key)  # sync
+    await gov.acquire_async(contract_key("AAPL"), bar_size="5 secs")  # async
+
+``projected_wait`` reports how long a request would wait without recording
+it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+try:  # POSIX only; elsewhere the ledger is process-local
+    import fcntl
+
+    FCNTL_AVAILABLE = True
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+    FCNTL_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+LEDGER_ENV = "IB_PACING_LEDGER"
+DOUBLE_COST = frozenset({"BID_ASK"})
+_SMALL_BAR = re.compile(r"^\s*(\d+)\s*secs?\s*$", re.IGNORECASE)
+
+
+@dataclass(frozen=True)
+class PacingLimits:
+    """IB historical pacing limits (small bars)."""
+
+    window: float = 600.0
+    max_requests: int = 60
+    contract_window: float = 2.0
+    contract_max: int = 5  # six or more within the window is a violation
+    identical_window: float = 15.0
+
+
+def contract_key(symbol: str, exchange: str = "SMART", sec_type: str = "STK") -> str:
+    """Ledger key for a contract (tick type is appended by the governor)."""
+    return f"{symbol}|{sec_type}|{exchange}"
+
+
+def request_key(
+    contract: str,
+    bar_size: str,
+    what_to_show: str = "TRADES",
+    *,
+    end_datetime: str | None = "",
+    duration: str = "",
+    use_rth: bool | int = True,
+) -> str:
+    """Key for the identical-request rule; ``contract`` is a ``contract_key``.
+
+    IB treats requests as identical when contract, end time, duration, bar
+    size, data type and RTH flag all match.
+    """
+    rth = int(bool(use_rth))
+    return f"{contract}|{end_datetime or ''}|{duration}|{bar_size}|{what_to_show}|{rth}"
+
+
+def is_small_bar(bar_size: str | None) -> bool:
+    """True for bar sizes IB paces (30 secs or less); unknown sizes count."""
+    if bar_size is None:
+        return True
+    m = _SMALL_BAR.match(bar_size)
+    return m is not None and int(m.group(1)) <= 30
+
+
+def default_ledger_path() -> Path | None:
+    """``$IB_PACING_LEDGER`` (``memory`` disables sharing), else runtime dir."""
+    env = os.environ.get(LEDGER_ENV, "").strip()
+    if env.lower() == "memory":
+        return None
+    if env:
+        return Path(env)
+    try:
+        from src.core.config import get_config
+
+        return get_config().data_paths.base_path / "runtime" / "ib_pacing.json"
+    except Exception:  # noqa: BLE001 - config is optional here
+        return Path(tempfile.gettempdir()) / "ib_pacing.json"
+
+
+def _window_wait(
+    times: list[float], limit: int, window: float, cost: int, now: float
+) -> float:
+    # ``times`` is ascending and holds at most ``limit`` entries: the request
+    # fits once the ``excess`` oldest of them have left the window
+    excess = len(times) + cost - limit
+    if excess <= 0:
+        return 0.0
+    return max(0.0, times[excess - 1] + window - now)
+
+
+def _record(times: list[float], limit: int, cost: int, now: float) -> None:
+    times.extend([now] * cost)
+    del times[:-limit]
+
+
+def _empty_state() -> dict[str, Any]:
+    return {"hist": [], "contract": {}, "identical": {}}
+
+
+class PacingGovernor:
+    """IB pacing limits shared across threads and, via a ledger, processes.
+
+    Args:
+        ledger: JSON ledger path shared between processes; None keeps the
+            state in memory.
+        limits: Pacing limits to enforce.
+        clock: Wall-clock source (seconds); shared ledgers need wall time.
+    """
+
+    def __init__(
+        self,
+        ledger: Path | str | None = None,
+        limits: PacingLimits | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.ledger = Path(ledger) if ledger is not None else None
+        self.limits = limits or PacingLimits()
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = _empty_state()
+        self._dirty = False  # set by _grant; the ledger is written only then
+        self.granted = 0
+        self.waits = 0
+        self.waited_seconds = 0.0
+
+    # Ledger access -----------------------------------------------------
+    @contextmanager
+    def _locked(self) -> Iterator[dict[str, Any]]:
+        with self._lock:
+            if self.ledger is None or not FCNTL_AVAILABLE:
+                yield self._state
+                return
+            self.ledger.parent.mkdir(parents=True, exist_ok=True)
+            with self.ledger.with_suffix(".lock").open("a") as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    state = self._load()
+                    yield state
+                    if self._dirty:
+                        self._save(state)
+                finally:
+                    self._dirty = False
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _load(self) -> dict[str, Any]:
+        assert self.ledger is not None
+        try:
+            state = json.loads(self.ledger.read_text())
+        except FileNotFoundError:
+            return _empty_state()
+        except (OSError, ValueError) as e:
+            logger.warning(
+                "Unreadable pacing ledger %s (%s); starting empty", self.ledger, e
+            )
+            return _empty_state()
+        return {**_empty_state(), **state}
+
+    def _save(self, state: dict[str, Any]) -> None:
+        assert self.ledger is not None
+        tmp = self.ledger.with_suffix(".tmp")
+        tmp.write_text(json.dumps(state))
+        tmp.replace(self.ledger)
+
+    # Rules ---------------------------------------------------------------
+    def _wait(
+        self,
+        state: dict[str, Any],
+        contract: str,
+        what_to_show: str,
+        request: str | None,
+        now: float,
+    ) -> float:
+        lim = self.limits
+        cost = 2 if what_to_show.upper() in DOUBLE_COST else 1
+        wait = _window_wait(state["hist"], lim.max_requests, lim.window, cost, now)
+        per_contract = state["contract"].get(f"{contract}|{what_to_show.upper()}", [])
+        wait = max(
+            wait,
+            _window_wait(
+                per_contract, lim.contract_max, lim.contract_window, cost, now
+            ),
+        )
+        if request is not None and request in state["identical"]:
+            wait = max(wait, state["identical"][request] + lim.identical_window - now)
+        return wait
+
+    def _grant(
+        self,
+        state: dict[str, Any],
+        contract: str,
+        what_to_show: str,
+        request: str | None,
+        now: float,
+    ) -> None:
+        lim = self.limits
+        cost = 2 if what_to_show.upper() in DOUBLE_COST else 1
+        _record(state["hist"], lim.max_requests, cost, now)
+        key = f"{contract}|{what_to_show.upper()}"
+        _record(state["contract"].setdefault(key, []), lim.contract_max, cost, now)
+        if request is not None:
+            state["identical"][request] = now
+        self._dirty = True
+        # Entries outside their window can no longer delay anyone
+        state["contract"] = {
+            k: v
+            for k, v in state["contract"].items()
+            if v[-1] > now - lim.contract_window
+        }
+        state["identical"] = {
+            k: t
+            for k, t in state["identical"].items()
+            if t > now - lim.identical_window
+        }
+
+    # Public API ----------------------------------------------------------
+    def projected_wait(
+        self,
+        contract: str = "",
+        *,
+        bar_size: str | None = None,
+        what_to_show: str = "TRADES",
+        request: str | None = None,
+    ) -> float:
+        """Seconds until this request could be sent (nothing is recorded)."""
+        if not is_small_bar(bar_size):
+            return 0.0
+        with self._locked() as state:
+            return max(
+                0.0, self._wait(state, contract, what_to_show, request, self._clock())
+            )
+
+    def try_acquire(
+        self,
+        contract: str = "",
+        *,
+        bar_size: str | None = None,
+        what_to_show: str = "TRADES",
+        request: str | None = None,
+    ) -> float:
+        """Record the request and return 0 if it may go now, else the wait."""
+        if not is_small_bar(bar_size):
+            return 0.0
+        with self._locked() as state:
+            now = self._clock()
+            wait = self._wait(state, contract, what_to_show, request, now)
+            if wait > 0:
+                return wait
+            self._grant(state, contract, what_to_show, request, now)
+        self.granted += 1
+        return 0.0
+
+    def acquire(
+        self,
+        contract: str = "",
+        *,
+        bar_size: str | None = None,
+        what_to_show: str = "TRADES",
+        request: str | None = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> float:
+        """Block until the request may be sent and record it; returns seconds waited."""
+        waited = 0.0
+        while (
+            wait := self.try_acquire(
+                contract, bar_size=bar_size, what_to_show=what_to_show, request=request
+            )
+        ) > 0:
+            self._note_wait(contract, wait)
+            sleep(wait)
+            waited += wait
+        return waited
+
+    async def acquire_async(
+        self,
+        contract: str = "",
+        *,
+        bar_size: str | None = None,
+        what_to_show: str = "TRADES",
+        request: str | None = None,
+    ) -> float:
+        """Async :meth:`acquire`."""
+        waited = 0.0
+        while (
+            wait := self.try_acquire(
+                contract, bar_size=bar_size, what_to_show=what_to_show, request=request
+            )
+        ) > 0:
+            self._note_wait(contract, wait)
+            await asyncio.sleep(wait)
+            waited += wait
+        return waited
+
+    def remaining(self) -> int:
+        """Requests that fit in the 10 minute window right now."""
+        with self._locked() as state:
+            now = self._clock()
+            cutoff = now - self.limits.window
+            used = sum(1 for t in state["hist"] if t > cutoff)
+        return max(0, self.limits.max_requests - used)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "ledger": str(self.ledger) if self.ledger else None,
+            "granted": self.granted,
+            "waits": self.waits,
+            "waited_seconds": self.waited_seconds,
+            "remaining": self.remaining(),
+            "projected_wait": self.projected_wait(),
+        }
+
+    def _note_wait(self, contract: str, wait: float) -> None:
+        self.waits += 1
+        self.waited_seconds += wait
+        logger.info("IB pacing: %s waits %.1fs", contract or "request", wait)
+
+
+_governors: dict[Path | None, PacingGovernor] = {}
+_governors_lock = threading.Lock()
+
+
+def get_pacing_governor(ledger: Path | str | None = None) -> PacingGovernor:
+    """Process-wide governor for ``ledger`` (default: :func:`default_ledger_path`)."""
+    path = Path(ledger) if ledger is not None else default_ledger_path()
+    with _governors_lock:
+        gov = _governors.get(path)
+        if gov is None:
+            gov = _governors[path] = PacingGovernor(path)
+        return gov
@@ -4,12 +4,25 @@ Stock Split Integration Module
 This module integrates stock split detection into the main trading system
 to ensure data integrity for machine learning models.
 
+Batch validation runs the split checks in a process pool. Results are cached
+per (symbol, data fingerprint) in a JSON file, so symbols whose bar file or
+frame is unchanged skip revalidation on the next run, and bar files are read
+through a process-wide LRU cache shared by validation and training loads.
+
 Author: Interactive Brokers Trading System
 Created: July 2025 (ML Data Integrity Enhancement)
 """
 
+import hashlib
+import json
+import logging
+import os
 import sys
-from collections.abc import Callable
+import tempfile
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -26,6 +39,12 @@ ErrorHandler = Callable[[Exception, dict[str, Any] | None, str, str], Any]
 
 # --- Dependency aliases to avoid conditional redefinitions ---
 try:
+    from src.services.stock_split_detection_service import (
+        _symbol_from_path,
+        detect_splits,
+        read_daily_bars,
+        split_analysis,
+    )
     from src.services.stock_split_detection_service import (
         get_split_detection_service as _real_get_split_detection_service,
     )
@@ -88,6 +107,217 @@ SERVICES_AVAILABLE = (
     and _real_get_data_persistence_service is not None
 )
 
+logger = logging.getLogger(__name__)
+
+_BAR_SUFFIXES = (".ftr", ".feather", ".parquet", ".csv")
+
+
+def file_fingerprint(path: Path) -> str:
+    """Size and modification time of a bar file; changes when it is rewritten."""
+    stat = path.stat()
+    return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def frame_fingerprint(df: pd.DataFrame) -> str:
+    """Content hash of an in-memory bar frame (index, columns and values)."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr(list(df.columns)).encode())
+    digest.update(pd.util.hash_pandas_object(df).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def default_validation_cache_path() -> Path:
+    """Validation cache under the data cache directory (temp dir without config)."""
+    name = "ml_data_integrity_cache.json"
+    try:
+        from src.core.config import get_config
+
+        return get_config().data_paths.base_path / "cache" / name
+    except Exception:  # noqa: BLE001 - config is optional here
+        return Path(tempfile.gettempdir()) / name
+
+
+class BarFileCache:
+    """
+    LRU cache of daily bar files, shared by everything in the process
+
+    Entries are keyed by resolved path and reread when the file fingerprint
+    changes. Frames are shared between callers and must not be modified in
+    place.
+    """
+
+    def __init__(self, max_entries: int = 512):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._frames: OrderedDict[Path, tuple[str, pd.DataFrame]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, path: Path | str) -> pd.DataFrame:
+        """Bars of ``path``, read from disk only when new or changed"""
+        path = Path(path).resolve()
+        fingerprint = file_fingerprint(path)
+        with self._lock:
+            entry = self._frames.get(path)
+            if entry is not None and entry[0] == fingerprint:
+                self._frames.move_to_end(path)
+                self.hits += 1
+                return entry[1]
+        df = read_daily_bars(path)
+        with self._lock:
+            self.misses += 1
+            self._frames[path] = (fingerprint, df)
+            self._frames.move_to_end(path)
+            while len(self._frames) > self.max_entries:
+                self._frames.popitem(last=False)
+        return df
+
+    def clear(self) -> None:
+        with self._lock:
+            self._frames.clear()
+
+
+_bar_file_cache = BarFileCache()
+
+
+def get_bar_file_cache() -> BarFileCache:
+    """Process-wide bar file cache"""
+    return _bar_file_cache
+
+
+class ValidationCache:
+    """
+    Validation results keyed by (symbol, data fingerprint)
+
+    Persisted as JSON at ``path`` (if given); a symbol whose fingerprint no
+    longer matches is simply revalidated and overwritten.
+    """
+
+    def __init__(self, path: Path | str | None = None):
+        self.path = Path(path) if path is not None else None
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._dirty = False
+        if self.path is not None and self.path.exists():
+            try:
+                self._entries = json.loads(self.path.read_text())
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable validation cache {self.path}: {e}")
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, symbol: str, fingerprint: str) -> dict[str, Any] | None:
+        entry = self._entries.get(symbol)
+        if entry is None or entry["fingerprint"] != fingerprint:
+            return None
+        return dict(entry["result"])
+
+    def put(self, symbol: str, fingerprint: str, result: dict[str, Any]) -> None:
+        self._entries[symbol] = {"fingerprint": fingerprint, "result": result}
+        self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache if it changed (atomically, via a temp file)"""
+        if self.path is None or not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(self._entries, default=str))
+        tmp.replace(self.path)
+        self._dirty = False
+
+
+def _unavailable_result(symbol: str) -> dict[str, Any]:
+    return {
+        "symbol": symbol,
+        "validation_status": "warning",
+        "message": "Split detection service unavailable",
+        "ml_ready": True,  # Allow training but warn
+        "recommendations": ["Service unavailable - proceed with caution"],
+    }
+
+
+def _error_result(symbol: str, error: Exception) -> dict[str, Any]:
+    return {
+        "symbol": symbol,
+        "validation_status": "error",
+        "message": f"Validation failed: {str(error)}",
+        "ml_ready": False,
+        "recommendations": ["Fix validation errors before ML training"],
+    }
+
+
+def ml_validation_result(symbol: str, analysis: dict[str, Any]) -> dict[str, Any]:
+    """
+    Convert a split analysis into an ML validation result.
+
+    Args:
+        symbol: Stock symbol
+        analysis: ``analyze_data_for_splits`` / ``split_analysis`` output
+
+    Returns:
+        Validation results with recommendations
+    """
+    # Convert to ML-focused validation result
+    if analysis["data_quality"] == "good":
+        return {
+            "symbol": symbol,
+            "validation_status": "passed",
+            "message": "Data is clean and ready for ML training",
+            "ml_ready": True,
+            "splits_detected": 0,
+            "recommendations": ["Data quality excellent for ML models"],
+        }
+
+    elif analysis["data_quality"] == "poor":
+        return {
+            "symbol": symbol,
+            "validation_status": "failed",
+            "message": f"HIGH PRIORITY: Data contains {analysis['splits_detected']} splits - NOT suitable for ML",
+            "ml_ready": False,
+            "splits_detected": analysis["splits_detected"],
+            "detected_splits": analysis["detected_splits"],
+            "recommendations": [
+                "❌ DO NOT use this data for ML training",
+                "🔄 Refresh data from before earliest split",
+                f"📅 Suggested start date: {analysis['recommendation']['recommended_fresh_start']}",
+                "🎯 Get split-adjusted data or fresh data",
+            ],
+        }
+
+    else:  # questionable quality
+        return {
+            "symbol": symbol,
+            "validation_status": "warning",
+            "message": "MEDIUM PRIORITY: Potential splits detected - verify data quality",
+            "ml_ready": False,  # Be conservative for ML
+            "splits_detected": analysis["splits_detected"],
+            "detected_splits": analysis.get("detected_splits", []),
+            "recommendations": [
+                "⚠️  Verify data quality before ML training",
+                "🔍 Consider refreshing data to be safe",
+                "📊 Review detected split events",
+            ],
+        }
+
+
+def _validate_source(
+    symbol: str,
+    source: Path | pd.DataFrame,
+    options: dict[str, Any],
+    read: Callable[[Path], pd.DataFrame] | None = None,
+) -> dict[str, Any]:
+    # Module-level so process pool workers can run it
+    try:
+        if isinstance(source, Path):
+            df = (read or read_daily_bars)(source)
+        else:
+            df = source
+        splits = detect_splits(symbol, df, **options)
+        return ml_validation_result(symbol, split_analysis(symbol, df, splits))
+    except Exception as e:  # noqa: BLE001 - one bad symbol must not stop the batch
+        return _error_result(symbol, e)
+
 
 class MLDataIntegrityManager:
     """
@@ -97,13 +327,29 @@ class MLDataIntegrityManager:
     data quality before using it for machine learning model training.
     """
 
-    def __init__(self):
-        """Initialize the ML Data Integrity Manager."""
-        self.split_service = get_split_detection_service_fn(None)
-        self.data_service = get_data_persistence_service_fn()
+    def __init__(
+        self,
+        cache_path: Path | str | None = None,
+        max_workers: int | None = None,
+        data_service: DataPersistenceService | None = None,
+    ):
+        """
+        Initialize the ML Data Integrity Manager.
+
+        Args:
+            cache_path: Validation result cache (default: data cache directory)
+            max_workers: Processes for batch validation (default: CPU count)
+            data_service: Data persistence service, shared with split detection
+        """
+        self.data_service = data_service or get_data_persistence_service_fn()
+        self.split_service = get_split_detection_service_fn(self.data_service)
         self.checked_symbols: set[str] = set()  # Track already checked symbols
         self.split_detected_symbols: set[str] = set()  # Track symbols with splits
         self.services_available = SERVICES_AVAILABLE
+        self.max_workers = max_workers
+        self.cache = ValidationCache(cache_path or default_validation_cache_path())
+        self.bar_cache = get_bar_file_cache()
+        self.last_batch_stats: dict[str, int] = {}
 
     def validate_data_for_ml(
         self, symbol: str, df: pd.DataFrame, timeframe: str = "1 day"
@@ -121,91 +367,196 @@ class MLDataIntegrityManager:
         """
         try:
             if self.split_service is None:
-                return {
-                    "symbol": symbol,
-                    "validation_status": "warning",
-                    "message": "Split detection service unavailable",
-                    "ml_ready": True,  # Allow training but warn
-                    "recommendations": ["Service unavailable - proceed with caution"],
-                }
+                return _unavailable_result(symbol)
 
             # Perform split analysis
             analysis = self.split_service.analyze_data_for_splits(symbol, df)
-
-            # Convert to ML-focused validation result
-            if analysis["data_quality"] == "good":
-                return {
-                    "symbol": symbol,
-                    "validation_status": "passed",
-                    "message": "Data is clean and ready for ML training",
-                    "ml_ready": True,
-                    "splits_detected": 0,
-                    "recommendations": ["Data quality excellent for ML models"],
-                }
-
-            elif analysis["data_quality"] == "poor":
+            result = ml_validation_result(symbol, analysis)
+            if result["validation_status"] == "failed":
                 self.split_detected_symbols.add(symbol)
-                return {
-                    "symbol": symbol,
-                    "validation_status": "failed",
-                    "message": f"HIGH PRIORITY: Data contains {analysis['splits_detected']} splits - NOT suitable for ML",
-                    "ml_ready": False,
-                    "splits_detected": analysis["splits_detected"],
-                    "detected_splits": analysis["detected_splits"],
-                    "recommendations": [
-                        "❌ DO NOT use this data for ML training",
-                        "🔄 Refresh data from before earliest split",
-                        f"📅 Suggested start date: {analysis['recommendation']['recommended_fresh_start']}",
-                        "🎯 Get split-adjusted data or fresh data",
-                    ],
-                }
-
-            else:  # questionable quality
-                return {
-                    "symbol": symbol,
-                    "validation_status": "warning",
-                    "message": "MEDIUM PRIORITY: Potential splits detected - verify data quality",
-                    "ml_ready": False,  # Be conservative for ML
-                    "splits_detected": analysis["splits_detected"],
-                    "detected_splits": analysis.get("detected_splits", []),
-                    "recommendations": [
-                        "⚠️  Verify data quality before ML training",
-                        "🔍 Consider refreshing data to be safe",
-                        "📊 Review detected split events",
-                    ],
-                }
+            return result
 
         except Exception as e:
             handle_error_fn(e, None, "MLDataIntegrity", "validate_data_for_ml")
-            return {
-                "symbol": symbol,
-                "validation_status": "error",
-                "message": f"Validation failed: {str(e)}",
-                "ml_ready": False,
-                "recommendations": ["Fix validation errors before ML training"],
-            }
+            return _error_result(symbol, e)
 
     def batch_validate_symbols(
-        self, symbol_data_dict: dict[str, pd.DataFrame]
+        self,
+        symbol_data_dict: dict[str, pd.DataFrame],
+        max_workers: int | None = None,
     ) -> dict[str, dict[str, Any]]:
         """
         Validate multiple symbols for ML readiness.
 
+        Symbols whose frame content is unchanged since a cached validation
+        are not revalidated.
+
         Args:
             symbol_data_dict: Dictionary of {symbol: dataframe}
+            max_workers: Validation processes (default: manager setting)
 
         Returns:
             Dictionary of validation results per symbol
         """
-        results = {}
-
         print(f"🔍 Validating {len(symbol_data_dict)} symbols for ML data integrity...")
+        jobs: dict[str, tuple[str, Path | pd.DataFrame]] = {
+            symbol: (frame_fingerprint(df), df)
+            for symbol, df in symbol_data_dict.items()
+        }
+        results = self._validate_jobs(jobs, max_workers)
+        self._print_summary(results)
+        return results
 
-        for symbol, df in symbol_data_dict.items():
-            print(f"   Checking {symbol}...")
-            results[symbol] = self.validate_data_for_ml(symbol, df)
+    def batch_validate_files(
+        self,
+        files: Mapping[str, Path | str] | Path | str,
+        pattern: str = "*",
+        max_workers: int | None = None,
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Validate daily bar files for ML readiness.
+
+        Files are read inside the validation processes; a symbol whose file
+        size and modification time match a cached validation is skipped.
 
-        # Summary
+        Args:
+            files: {symbol: path}, or a directory of per-symbol bar files
+                (``AAPL_USUSD_1D.ftr`` style names)
+            pattern: Glob used when ``files`` is a directory
+            max_workers: Validation processes (default: manager setting)
+
+        Returns:
+            Dictionary of validation results per symbol
+        """
+        paths = self._bar_files(files, pattern)
+        print(f"🔍 Validating {len(paths)} bar files for ML data integrity...")
+        jobs: dict[str, tuple[str, Path | pd.DataFrame]] = {}
+        missing: dict[str, dict[str, Any]] = {}
+        for symbol, path in paths.items():
+            try:
+                jobs[symbol] = (file_fingerprint(path), path)
+            except OSError as e:
+                missing[symbol] = _error_result(symbol, e)
+        results = {**self._validate_jobs(jobs, max_workers), **missing}
+        results = {symbol: results[symbol] for symbol in paths}
+        self._print_summary(results)
+        return results
+
+    def load_ml_ready_files(
+        self,
+        files: Mapping[str, Path | str] | Path | str,
+        pattern: str = "*",
+        max_workers: int | None = None,
+    ) -> dict[str, pd.DataFrame]:
+        """
+        Validate bar files and load the ML-ready ones through the bar cache.
+
+        Returns:
+            Dictionary of {symbol: dataframe} for ML-ready symbols only
+        """
+        paths = self._bar_files(files, pattern)
+        results = self.batch_validate_files(paths, max_workers=max_workers)
+        ready = {}
+        for symbol, path in paths.items():
+            if results[symbol]["ml_ready"]:
+                ready[symbol] = self.bar_cache.get(path)
+            else:
+                print(
+                    f"⚠️  Excluding {symbol} from ML training: "
+                    f"{results[symbol]['message']}"
+                )
+        print(f"🎯 ML-Ready Symbols: {len(ready)}/{len(paths)}")
+        return ready
+
+    @staticmethod
+    def _bar_files(
+        files: Mapping[str, Path | str] | Path | str, pattern: str
+    ) -> dict[str, Path]:
+        if isinstance(files, Mapping):
+            return {symbol: Path(path) for symbol, path in files.items()}
+        return {
+            _symbol_from_path(path): path
+            for path in sorted(Path(files).glob(pattern))
+            if path.suffix.lower() in _BAR_SUFFIXES
+        }
+
+    def _detection_options(self) -> dict[str, Any]:
+        service = self.split_service
+        return {
+            "price_jump_threshold": service.price_jump_threshold,
+            "volume_spike_threshold": service.volume_spike_threshold,
+            "min_confidence": service.min_confidence,
+            "common_ratios": tuple(service.common_ratios),
+        }
+
+    def _validate_jobs(
+        self,
+        jobs: dict[str, tuple[str, Path | pd.DataFrame]],
+        max_workers: int | None,
+    ) -> dict[str, dict[str, Any]]:
+        """Validate {symbol: (fingerprint, frame or path)}, using the cache"""
+        if self.split_service is None:
+            return {symbol: _unavailable_result(symbol) for symbol in jobs}
+
+        options = self._detection_options()
+        # Changing a threshold invalidates every cached result
+        options_key = hashlib.blake2b(
+            repr(sorted(options.items())).encode(), digest_size=8
+        ).hexdigest()
+        results: dict[str, dict[str, Any]] = {}
+        pending: list[tuple[str, str, Path | pd.DataFrame]] = []
+        for symbol, (fingerprint, source) in jobs.items():
+            key = f"{fingerprint}|{options_key}"
+            cached = self.cache.get(symbol, key)
+            if cached is not None:
+                results[symbol] = cached
+            else:
+                pending.append((symbol, key, source))
+
+        symbols = [symbol for symbol, _, _ in pending]
+        sources = [source for _, _, source in pending]
+        workers = max_workers or self.max_workers or os.cpu_count() or 1
+        if workers > 1 and len(pending) > 1:
+            workers = min(workers, len(pending))
+            with ProcessPoolExecutor(max_workers=workers) as ex:
+                fresh = list(
+                    ex.map(
+                        _validate_source,
+                        symbols,
+                        sources,
+                        [options] * len(pending),
+                        chunksize=max(1, len(pending) // (workers * 4)),
+                    )
+                )
+        else:
+            fresh = [
+                _validate_source(symbol, source, options, self.bar_cache.get)
+                for symbol, source in zip(symbols, sources, strict=True)
+            ]
+
+        for (symbol, key, _), result in zip(pending, fresh, strict=True):
+            results[symbol] = result
+            if result["validation_status"] != "error":
+                self.cache.put(symbol, key, result)
+        self.cache.save()
+
+        self.last_batch_stats = {
+            "symbols": len(jobs),
+            "cached": len(jobs) - len(pending),
+            "validated": len(pending),
+        }
+        for symbol, result in results.items():
+            self.checked_symbols.add(symbol)
+            if result["validation_status"] == "failed":
+                self.split_detected_symbols.add(symbol)
+        # Keep the split service's history in step with the single-symbol path
+        self.split_service.record_splits(
+            [s for r in results.values() for s in r.get("detected_splits", [])]
+        )
+        return {symbol: results[symbol] for symbol in jobs}
+
+    @staticmethod
+    def _print_summary(results: dict[str, dict[str, Any]]) -> None:
         passed = sum(1 for r in results.values() if r["validation_status"] == "passed")
         failed = sum(1 for r in results.values() if r["validation_status"] == "failed")
         warnings = sum(
@@ -217,8 +568,6 @@ class MLDataIntegrityManager:
         print(f"   ⚠️  Warnings: {warnings}")
         print(f"   ❌ Failed: {failed}")
 
-        return results
-
     def get_ml_ready_data(
         self, symbol_data_dict: dict[str, pd.DataFrame]
     ) -> dict[str, pd.DataFrame]:
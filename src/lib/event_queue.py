@@ -0,0 +1,177 @@
+"""Bounded asyncio queues with an overflow policy for IB event streams.
+
+``EventQueue`` is an ``asyncio.Queue`` whose ``put_nowait`` never raises:
+when the queue is at ``maxsize`` it applies the stream's policy instead.
+
+- ``DROP_OLDEST`` evicts the oldest queued event to make room.
+- ``CONFLATE`` replaces the newest queued event with the same key (for
+  ticks, ``(symbol, tick_type)``) in place, so under pressure consumers see
+  the latest value per key rather than losing whole keys; a new key evicts
+  the oldest event.
+- ``BLOCK`` makes producer threads wait in ``reserve()`` until the consumer
+  frees a slot (backpressure onto the IB reader thread), up to
+  ``block_timeout`` seconds; after that, and for producers on the loop thread
+  which must never block, the oldest event is evicted.
+
+Each queue counts drops, conflations, producer waits and its high-water
+mark; ``stats()`` returns them. Capacity and policy can be overridden per
+stream with ``IB_QUEUE_<NAME>_SIZE`` / ``IB_QUEUE_<NAME>_POLICY``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass, replace
+from enum import Enum
+from typing import Any
+
+from src.observability.metrics import inc
+
+
+class OverflowPolicy(Enum):
+    DROP_OLDEST = "drop_oldest"
+    CONFLATE = "conflate"
+    BLOCK = "block"
+
+
+@dataclass(frozen=True)
+class StreamLimit:
+    """Capacity (0 = unbounded) and overflow policy for one event stream."""
+
+    maxsize: int = 0
+    policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST
+    block_timeout: float = 5.0
+
+
+def stream_limit_from_env(name: str, default: StreamLimit) -> StreamLimit:
+    """Apply ``IB_QUEUE_<NAME>_SIZE`` / ``_POLICY`` overrides to ``default``."""
+    prefix = f"IB_QUEUE_{name.upper()}"
+    limit = default
+    size = os.environ.get(f"{prefix}_SIZE", "").strip()
+    if size:
+        try:
+            limit = replace(limit, maxsize=max(0, int(size)))
+        except ValueError:
+            pass
+    policy = os.environ.get(f"{prefix}_POLICY", "").strip().lower()
+    if policy:
+        try:
+            limit = replace(limit, policy=OverflowPolicy(policy))
+        except ValueError:
+            pass
+    return limit
+
+
+class EventQueue(asyncio.Queue[Any]):
+    """Bounded event queue; see the module docstring for the policies.
+
+    Args:
+        name: Stream name used in stats and metrics.
+        limit: Capacity and overflow policy.
+        key: Conflation key for an event (``CONFLATE`` only).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        limit: StreamLimit | None = None,
+        key: Callable[[Any], Hashable] | None = None,
+    ) -> None:
+        self.name = name
+        self.limit = limit or StreamLimit()
+        self.policy = self.limit.policy
+        self._key = key or (lambda item: item)
+        super().__init__(maxsize=self.limit.maxsize)
+        self._space = threading.Condition()
+        self._inflight = 0  # reserved by producers, not yet delivered
+        self.dropped = 0
+        self.conflated = 0
+        self.blocked = 0
+        self.blocked_seconds = 0.0
+        self.high_water = 0
+
+    # asyncio.Queue storage hooks; conflation queues (key, [event]) cells and
+    # indexes the newest cell per key so it can be overwritten in place
+    def _init(self, maxsize: int) -> None:
+        self._queue: deque[Any] = deque()
+        self._newest: dict[Hashable, list[Any]] = {}
+
+    def _put(self, item: Any) -> None:
+        if self.policy is OverflowPolicy.CONFLATE:
+            k, cell = self._key(item), [item]
+            self._queue.append((k, cell))
+            self._newest[k] = cell
+        else:
+            self._queue.append(item)
+
+    def _get(self) -> Any:
+        item = self._queue.popleft()
+        if self.policy is OverflowPolicy.CONFLATE:
+            k, cell = item
+            if self._newest.get(k) is cell:
+                del self._newest[k]
+            item = cell[0]
+        elif self.policy is OverflowPolicy.BLOCK:
+            with self._space:
+                self._space.notify()
+        return item
+
+    def put_nowait(self, item: Any) -> None:
+        """Queue ``item``, applying the overflow policy instead of raising."""
+        full = self.full()
+        if full and self.policy is OverflowPolicy.CONFLATE:
+            cell = self._newest.get(self._key(item))
+            if cell is not None:
+                cell[0] = item
+                self.conflated += 1
+                return
+        if full:
+            self._get()
+            self.task_done()
+            self.dropped += 1
+            inc(f"ib_queue_{self.name}_dropped_total")
+        super().put_nowait(item)
+        if len(self._queue) > self.high_water:
+            self.high_water = len(self._queue)
+
+    def reserve(self) -> bool:
+        """Wait for a free slot from a producer thread (``BLOCK`` only).
+
+        Returns False when ``block_timeout`` expired; the event is still
+        delivered and evicts the oldest one. Pair with ``release()`` after
+        the event has been put.
+        """
+        with self._space:
+            if not self.maxsize or self._inflight + len(self._queue) < self.maxsize:
+                self._inflight += 1
+                return True
+            self.blocked += 1
+            t0 = time.monotonic()
+            ok = self._space.wait_for(
+                lambda: self._inflight + len(self._queue) < self.maxsize,
+                self.limit.block_timeout,
+            )
+            self.blocked_seconds += time.monotonic() - t0
+            self._inflight += 1
+            return ok
+
+    def release(self) -> None:
+        with self._space:
+            self._inflight -= 1
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "policy": self.policy.value,
+            "maxsize": self.maxsize,
+            "depth": self.qsize(),
+            "high_water": self.high_water,
+            "dropped": self.dropped,
+            "conflated": self.conflated,
+            "blocked": self.blocked,
+            "blocked_seconds": self.blocked_seconds,
+        }
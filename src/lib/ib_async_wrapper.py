@@ -9,8 +9,9 @@ no legacy dependencies.
 import asyncio
 import logging
 import os
+import threading
 import time
-from collections import defaultdict, deque
+from collections import defaultdict
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
@@ -26,12 +27,63 @@ from ibapi.common import BarData, TickerId
 from ibapi.contract import Contract
 from ibapi.wrapper import EWrapper
 
+from ..infra.contract_cache import get_contract_cache
+from ..infra.ib_pacing import (
+    PacingGovernor,
+    contract_key,
+    get_pacing_governor,
+    request_key,
+)
+
 # Type imports from our custom types
 from ..types import ErrorContext, Price, RequestId, Symbol, Volume
+from .event_queue import EventQueue, OverflowPolicy, StreamLimit, stream_limit_from_env
 
 # TickType is just an int, define it for compatibility
 TickType = int
 
+# Upper bound on events handed to a consumer per get_batch() call
+DEFAULT_BATCH_SIZE = 1000
+
+# Per-stream queue bounds; override with IB_QUEUE_<NAME>_SIZE/_POLICY or the
+# AsyncIBWrapper(stream_limits=...) argument. Historical responses are rare
+# and must not be lost, so they block the reader; ticks keep the latest value
+# per (symbol, tick_type); the depth book itself is kept in the wrapper, so
+# the depth event stream sheds its oldest updates.
+DEFAULT_STREAM_LIMITS: dict[str, StreamLimit] = {
+    "connection": StreamLimit(0),
+    "errors": StreamLimit(1_000, OverflowPolicy.DROP_OLDEST),
+    "historical": StreamLimit(100, OverflowPolicy.BLOCK, block_timeout=10.0),
+    "market_data": StreamLimit(10_000, OverflowPolicy.CONFLATE),
+    "market_depth": StreamLimit(50_000, OverflowPolicy.DROP_OLDEST),
+    "orders": StreamLimit(0),
+}
+
+# Conflation keys per stream (used when a stream's policy is CONFLATE)
+_CONFLATE_KEYS: dict[str, Callable[[Any], Any]] = {
+    "errors": lambda e: (e["reqId"], e["errorCode"]),
+    "historical": lambda e: e[0],
+    "market_data": lambda t: (t["symbol"], t["tick_type"]),
+    "market_depth": lambda d: (d["symbol"], d["side"], d["position"]),
+}
+
+
+async def get_batch(
+    q: asyncio.Queue[Any], max_items: int = DEFAULT_BATCH_SIZE
+) -> list[Any]:
+    """Wait for one event on ``q`` then take whatever else is already queued.
+
+    Consumers that handle a list per wakeup instead of awaiting each item keep
+    up with bursty streams (L2 depth, ticks) at a fraction of the loop cost.
+    """
+    batch = [await q.get()]
+    while len(batch) < max_items:
+        try:
+            batch.append(q.get_nowait())
+        except asyncio.QueueEmpty:
+            break
+    return batch
+
 
 class ConnectionState(Enum):
     """Connection states"""
@@ -82,23 +134,38 @@ class AsyncIBWrapper(EWrapper):
     Uses asyncio-based queues for non-blocking event handling
     """
 
-    def __init__(self) -> None:
+    def __init__(self, stream_limits: dict[str, StreamLimit] | None = None) -> None:
         EWrapper.__init__(self)
         self.logger: logging.Logger = logging.getLogger(__name__)
         # Event loop reference for thread-safe scheduling from IB callbacks
         self._loop: asyncio.AbstractEventLoop | None = None
-
-        # Event queues for async communication - properly typed
+        self._loop_thread: int | None = None  # learned on the first drain
+
+        # Cross-thread bridge: callbacks append (queue, item) pairs and the
+        # first append into an empty buffer schedules one drain on the loop
+        self._bridge_lock = threading.Lock()
+        self._bridge: list[tuple[EventQueue, Any, bool]] = []
+        self._drain_scheduled: bool = False
+        self._bridge_events: int = 0
+        self._bridge_batches: int = 0
+        self._bridge_max_batch: int = 0
+
+        # Event queues for async communication, bounded per stream
         # Events: (event_name, payload)
         # event_name in {"socket_open", "api_ready", "disconnected"}
-        self._connection_events: asyncio.Queue[tuple[str, Any]] = asyncio.Queue()
-        self._error_events: asyncio.Queue[ErrorContext] = asyncio.Queue()
-        self._historical_data_events: asyncio.Queue[
-            tuple[RequestId, list[dict[str, Any]]]
-        ] = asyncio.Queue()
-        self._market_data_events: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
-        self._market_depth_events: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
-        self._order_events: asyncio.Queue[Any] = asyncio.Queue()
+        limits = {**DEFAULT_STREAM_LIMITS, **(stream_limits or {})}
+        self._queues: dict[str, EventQueue] = {
+            name: EventQueue(
+                name, stream_limit_from_env(name, limit), _CONFLATE_KEYS.get(name)
+            )
+            for name, limit in limits.items()
+        }
+        self._connection_events: EventQueue = self._queues["connection"]
+        self._error_events: EventQueue = self._queues["errors"]
+        self._historical_data_events: EventQueue = self._queues["historical"]
+        self._market_data_events: EventQueue = self._queues["market_data"]
+        self._market_depth_events: EventQueue = self._queues["market_depth"]
+        self._order_events: EventQueue = self._queues["orders"]
 
         # Data storage - properly typed
         self._historical_data: dict[RequestId, list[dict[str, Any]]] = {}
@@ -123,33 +190,76 @@ class AsyncIBWrapper(EWrapper):
         queue operations onto the main loop in a thread-safe way.
         """
         self._loop = loop
-
-    def _enqueue(self, q: asyncio.Queue[Any], item: Any) -> None:
-        """Thread-safe enqueue into an asyncio.Queue without creating orphaned coroutines.
-
-        Prefer run_coroutine_threadsafe when we have a target loop. If we're
-        already on the loop thread, use create_task. As a last-resort fallback
-        (no loop yet), try put_nowait to avoid dropping data and avoid creating
-        an un-awaited coroutine. This path is best-effort and should be rare.
+        self._loop_thread = None
+
+    def _enqueue(self, q: EventQueue, item: Any) -> None:
+        """Thread-safe enqueue into an asyncio.Queue, batched per loop wakeup.
+
+        With a running target loop the item is appended to a shared buffer;
+        only the append that finds the buffer empty schedules a drain via
+        ``call_soon_threadsafe``, so a burst of callbacks costs one loop wakeup
+        instead of a coroutine, a Future and a wakeup per message. A BLOCK
+        stream first waits for a free slot when called off the loop thread.
+        Without a loop yet, fall back to a best-effort put_nowait; this
+        should be rare.
         """
+        loop = self._loop
+        if loop is not None and loop.is_running():
+            reserved = (
+                q.policy is OverflowPolicy.BLOCK
+                and self._loop_thread != threading.get_ident()
+            )
+            if reserved:
+                q.reserve()
+            with self._bridge_lock:
+                self._bridge.append((q, item, reserved))
+                if self._drain_scheduled:
+                    return
+                self._drain_scheduled = True
+            try:
+                loop.call_soon_threadsafe(self._drain_bridge)
+            except RuntimeError:
+                # Loop closed between the check and the schedule
+                self._drain_bridge()
+            return
         try:
-            # If we know the loop and it's running, schedule thread-safe
-            if self._loop is not None and self._loop.is_running():
-                asyncio.run_coroutine_threadsafe(q.put(item), self._loop)
-                return
-            # If we're on a running loop thread, schedule normally
-            loop = asyncio.get_running_loop()
-            loop.create_task(q.put(item))
-        except RuntimeError:
-            # No running loop context; best-effort immediate enqueue
+            q.put_nowait(item)
+        except Exception:
+            # As a last resort, drop with a debug log to avoid crashing callbacks
             try:
-                q.put_nowait(item)
+                self.logger.debug("Dropping event; no loop to enqueue")
             except Exception:
-                # As a last resort, drop with a debug log to avoid crashing callbacks
-                try:
-                    self.logger.debug("Dropping event; no loop to enqueue")
-                except Exception:
-                    pass
+                pass
+
+    def _drain_bridge(self) -> None:
+        """Move every buffered event into its queue (runs on the loop)."""
+        with self._bridge_lock:
+            batch, self._bridge = self._bridge, []
+            self._drain_scheduled = False
+        self._loop_thread = threading.get_ident()
+        for q, item, reserved in batch:
+            q.put_nowait(item)
+            if reserved:
+                q.release()
+        self._bridge_events += len(batch)
+        self._bridge_batches += 1
+        if len(batch) > self._bridge_max_batch:
+            self._bridge_max_batch = len(batch)
+
+    def get_bridge_stats(self) -> dict[str, float]:
+        """Events delivered, loop wakeups used, and batch sizes."""
+        batches = self._bridge_batches
+        return {
+            "events": self._bridge_events,
+            "batches": batches,
+            "avg_batch": self._bridge_events / batches if batches else 0.0,
+            "max_batch": self._bridge_max_batch,
+            "pending": len(self._bridge),
+        }
+
+    def get_queue_stats(self) -> dict[str, dict[str, Any]]:
+        """Per-stream depth, high-water mark, drops, conflations and waits."""
+        return {name: q.stats() for name, q in self._queues.items()}
 
     def get_next_request_id(self) -> int:
         """Get next available request ID"""
@@ -465,7 +575,6 @@ class AsyncIBClient(EClient):
         """
         import socket
         import subprocess
-        import time
 
         def _tcp_probe(h: str, p: int, t: float = 2.0) -> bool:
             s: socket.socket | None = None
@@ -637,9 +746,9 @@ class IBAsync:
     - Optimized for ML data collection
     """
 
-    def __init__(self) -> None:
+    def __init__(self, stream_limits: dict[str, StreamLimit] | None = None) -> None:
         super().__init__()  # Call parent class __init__ if needed
-        self.wrapper: AsyncIBWrapper = AsyncIBWrapper()
+        self.wrapper: AsyncIBWrapper = AsyncIBWrapper(stream_limits)
         self.client: AsyncIBClient = AsyncIBClient(self.wrapper)
         self.logger: logging.Logger = logging.getLogger(__name__)
 
@@ -669,11 +778,8 @@ class IBAsync:
         self.reconnect_attempts = 0
         self.max_reconnect_attempts = 5
 
-        # Pacing control - implements IB rate limits from your checklist
-        self.historical_requests: deque[float] = deque(
-            maxlen=60
-        )  # Track last 60 requests
-        self.identical_request_cache: dict[str, float] = {}  # Track identical requests
+        # Pacing control - shared with every other IB client process
+        self.pacing: PacingGovernor = get_pacing_governor()
         self.market_data_subscriptions = 0
         self.max_market_data_subscriptions = 100
 
@@ -988,48 +1094,33 @@ class IBAsync:
         if not success:
             await self._attempt_reconnect()
 
-    async def _enforce_historical_pacing(self, contract_key: str) -> None:
-        """
-        Enforce IB historical data pacing rules from your checklist:
-        - Max 60 requests per 10 minutes
-        - No identical requests within 15 seconds
-        """
-        current_time = time.time()
-
-        # Remove old requests (older than 10 minutes)
-        cutoff_time = current_time - 600  # 10 minutes
-        while self.historical_requests and self.historical_requests[0] < cutoff_time:
-            self.historical_requests.popleft()
-
-        # Check 60 requests per 10 minutes limit
-        if len(self.historical_requests) >= 60:
-            wait_time = 600 - (current_time - self.historical_requests[0])
-            if wait_time > 0:
-                self.logger.info(
-                    f"Historical data pacing limit reached. Waiting {wait_time:.1f}s"
-                )
-                await asyncio.sleep(wait_time)
-
-        # Check identical request rule (15 seconds)
-        last_request_time = self.identical_request_cache.get(contract_key, 0)
-        if current_time - last_request_time < 15:
-            wait_time = 15 - (current_time - last_request_time)
-            self.logger.info(f"Identical request too recent. Waiting {wait_time:.1f}s")
-            await asyncio.sleep(wait_time)
-
-        # Record this request
-        self.historical_requests.append(current_time)
-        self.identical_request_cache[contract_key] = current_time
+    async def _enforce_historical_pacing(
+        self, contract: Contract, bar_size: str, what_to_show: str, request: str
+    ) -> None:
+        """Wait for the shared pacing governor (60 per 10 min, 6 per 2 s per
+        contract, identical requests 15 s apart, BID_ASK counting double)."""
+        waited = await self.pacing.acquire_async(
+            contract_key(contract.symbol, contract.exchange, contract.secType),
+            bar_size=bar_size,
+            what_to_show=what_to_show,
+            request=request,
+        )
+        if waited:
+            self.logger.info(f"Historical data pacing: waited {waited:.1f}s")
 
     def create_stock_contract(
         self, symbol: str, exchange: str = "SMART", currency: str = "USD"
     ) -> Contract:
-        """Create stock contract"""
+        """Create stock contract (with conId/primary exchange when cached)"""
         contract = Contract()
         contract.symbol = symbol
         contract.secType = "STK"
         contract.exchange = exchange
         contract.currency = currency
+        info = get_contract_cache().get(symbol, exchange, currency)
+        if info is not None:
+            contract.conId = info.con_id
+            contract.primaryExchange = info.primary_exchange
         return contract
 
     async def req_historical_data(
@@ -1057,13 +1148,18 @@ class IBAsync:
 
         req_id = -1  # Initialize to handle cleanup in finally block
         try:
-            # Generate contract key for pacing
-            contract_key = (
-                f"{contract.symbol}_{contract.exchange}_{duration}_{bar_size}"
+            # Enforce pacing rules; identical requests share this key
+            request = request_key(
+                contract_key(contract.symbol, contract.exchange, contract.secType),
+                bar_size,
+                what_to_show,
+                end_datetime=end_datetime,
+                duration=duration,
+                use_rth=use_rth,
+            )
+            await self._enforce_historical_pacing(
+                contract, bar_size, what_to_show, request
             )
-
-            # Enforce pacing rules
-            await self._enforce_historical_pacing(contract_key)
 
             # Get request ID and make request
             req_id = self.wrapper.get_next_request_id()
@@ -1272,9 +1368,10 @@ class IBAsync:
                 pending_requests = self.wrapper.get_pending_requests()
                 while req_id in pending_requests:
                     try:
-                        tick_data = await self.wrapper.get_market_data_events().get()
-                        if tick_data["symbol"] == contract.symbol:
-                            callback(tick_data)
+                        batch = await get_batch(self.wrapper.get_market_data_events())
+                        for tick_data in batch:
+                            if tick_data["symbol"] == contract.symbol:
+                                callback(tick_data)
                     except Exception as e:
                         self.logger.error(f"Error in tick processor: {e}")
 
@@ -1300,9 +1397,10 @@ class IBAsync:
                 pending_requests = self.wrapper.get_pending_requests()
                 while req_id in pending_requests:
                     try:
-                        depth_data = await self.wrapper.get_market_depth_events().get()
-                        if depth_data["symbol"] == contract.symbol:
-                            callback(depth_data)
+                        batch = await get_batch(self.wrapper.get_market_depth_events())
+                        for depth_data in batch:
+                            if depth_data["symbol"] == contract.symbol:
+                                callback(depth_data)
                     except Exception as e:
                         self.logger.error(f"Error in depth processor: {e}")
 
@@ -1310,6 +1408,10 @@ class IBAsync:
 
         return req_id
 
+    def get_queue_stats(self) -> dict[str, dict[str, Any]]:
+        """Event queue depth, high-water marks and drops per stream"""
+        return self.wrapper.get_queue_stats()
+
     def add_error_handler(self, handler: Callable[[dict[str, Any]], None]) -> None:
         """Add custom error handler"""
         self.error_handlers.append(handler)
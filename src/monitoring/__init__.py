@@ -1,5 +1,6 @@
 """Monitoring module for ML performance monitoring and analytics."""
 
+from .metric_buffer import MetricRingBuffer, TagTable
 from .ml_performance_monitor import (
     Alert,
     AlertSeverity,
@@ -8,12 +9,18 @@ from .ml_performance_monitor import (
     ModelPerformanceReport,
     PerformanceMetric,
 )
+from .outcome_store import OutcomeAggregates, OutcomeWindow, SignalOutcomeStore
 
 __all__ = [
     "Alert",
     "AlertSeverity",
+    "MetricRingBuffer",
     "MetricType",
     "MLPerformanceMonitor",
     "ModelPerformanceReport",
+    "OutcomeAggregates",
+    "OutcomeWindow",
     "PerformanceMetric",
+    "SignalOutcomeStore",
+    "TagTable",
 ]
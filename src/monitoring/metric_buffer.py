@@ -0,0 +1,243 @@
+"""Columnar ring buffer for monitoring time series.
+
+Each metric series keeps its samples in preallocated NumPy arrays (epoch
+timestamps, float values and integer tag codes for strategy/model/symbol)
+instead of a deque of dataclasses. Appends are O(1), windows are returned as
+array views where the ring is contiguous, and a rolling mean/variance over the
+most recent ``stats_window`` samples is maintained incrementally so anomaly
+checks do not need to touch the history at all.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from typing import Any
+
+import numpy as np
+
+NO_TAG = -1
+
+# Tag columns stored per sample, in code-array column order
+TAG_FIELDS: tuple[str, ...] = ("strategy_name", "model_version", "symbol")
+
+
+class TagTable:
+    """Interns optional string tags into small integer codes."""
+
+    def __init__(self) -> None:
+        self._codes: dict[str, int] = {}
+        self._names: list[str] = []
+
+    def encode(self, name: str | None) -> int:
+        if name is None:
+            return NO_TAG
+        code = self._codes.get(name)
+        if code is None:
+            code = len(self._names)
+            self._codes[name] = code
+            self._names.append(name)
+        return code
+
+    def decode(self, code: int) -> str | None:
+        return None if code == NO_TAG else self._names[code]
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+
+class MetricRingBuffer:
+    """Fixed-capacity columnar time series for a single metric.
+
+    Samples are expected to arrive in timestamp order (they are stamped on
+    record), which keeps both halves of the ring sorted and lets time windows
+    be located with a binary search.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 10000,
+        stats_window: int = 20,
+        tags: TagTable | None = None,
+    ) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self.stats_window = max(1, min(stats_window, capacity))
+        self.tags = tags if tags is not None else TagTable()
+
+        self._ts = np.zeros(capacity, dtype=np.float64)
+        self._values = np.zeros(capacity, dtype=np.float64)
+        self._codes = np.full((capacity, len(TAG_FIELDS)), NO_TAG, dtype=np.int32)
+        self._head = 0  # next write position
+        self._size = 0
+
+        # Rolling moments over the last ``stats_window`` values, shifted by
+        # the first observed value to limit cancellation error.
+        self._shift: float | None = None
+        self._win_sum = 0.0
+        self._win_sumsq = 0.0
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+    def append(
+        self,
+        value: float,
+        timestamp: datetime | float | None = None,
+        strategy_name: str | None = None,
+        model_version: str | None = None,
+        symbol: str | None = None,
+    ) -> None:
+        """Append one sample, overwriting the oldest when full."""
+        if timestamp is None:
+            ts = datetime.now(UTC).timestamp()
+        elif isinstance(timestamp, datetime):
+            ts = timestamp.timestamp()
+        else:
+            ts = float(timestamp)
+        value = float(value)
+
+        if self._shift is None:
+            self._shift = value
+        if self._size >= self.stats_window:
+            leaving = self._values[(self._head - self.stats_window) % self.capacity]
+            d_old = leaving - self._shift
+            self._win_sum -= d_old
+            self._win_sumsq -= d_old * d_old
+        d_new = value - self._shift
+        self._win_sum += d_new
+        self._win_sumsq += d_new * d_new
+
+        i = self._head
+        self._ts[i] = ts
+        self._values[i] = value
+        codes = self._codes[i]
+        codes[0] = self.tags.encode(strategy_name)
+        codes[1] = self.tags.encode(model_version)
+        codes[2] = self.tags.encode(symbol)
+
+        self._head = (i + 1) % self.capacity
+        if self._size < self.capacity:
+            self._size += 1
+
+    def clear(self) -> None:
+        self._head = 0
+        self._size = 0
+        self._shift = None
+        self._win_sum = 0.0
+        self._win_sumsq = 0.0
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+    def __len__(self) -> int:
+        return self._size
+
+    def __bool__(self) -> bool:
+        return self._size > 0
+
+    @property
+    def last_value(self) -> float | None:
+        if not self._size:
+            return None
+        return float(self._values[self._head - 1])
+
+    @property
+    def last_timestamp(self) -> datetime | None:
+        if not self._size:
+            return None
+        return datetime.fromtimestamp(float(self._ts[self._head - 1]), UTC)
+
+    def _segments(self) -> tuple[slice, slice]:
+        """Physical slices holding samples oldest→newest."""
+        if self._size < self.capacity:
+            return slice(0, self._size), slice(0, 0)
+        return slice(self._head, self.capacity), slice(0, self._head)
+
+    def _window_slices(self, start: int) -> tuple[slice, slice]:
+        """Physical slices for logical positions ``start..size`` (0 = oldest)."""
+        older, newer = self._segments()
+        older_len = older.stop - older.start
+        if start >= older_len:
+            off = start - older_len
+            return slice(newer.start + off, newer.stop), slice(0, 0)
+        return slice(older.start + start, older.stop), newer
+
+    def _gather(self, column: np.ndarray, start: int) -> np.ndarray:
+        a, b = self._window_slices(start)
+        if b.stop == b.start:
+            return column[a]  # contiguous: zero-copy view
+        return np.concatenate((column[a], column[b]))
+
+    def tail(self, n: int) -> np.ndarray:
+        """Values of the ``n`` most recent samples, oldest first."""
+        n = max(0, min(n, self._size))
+        return self._gather(self._values, self._size - n)
+
+    def values(self) -> np.ndarray:
+        return self._gather(self._values, 0)
+
+    def timestamps(self) -> np.ndarray:
+        """Epoch-second timestamps, oldest first."""
+        return self._gather(self._ts, 0)
+
+    def _index_since(self, since: float) -> int:
+        """Logical index of the first sample with timestamp > ``since``."""
+        older, newer = self._segments()
+        older_ts = self._ts[older]
+        pos = int(np.searchsorted(older_ts, since, side="right"))
+        if pos < older_ts.size:
+            return pos
+        newer_ts = self._ts[newer]
+        return older_ts.size + int(np.searchsorted(newer_ts, since, side="right"))
+
+    def since(self, cutoff: datetime | float) -> np.ndarray:
+        """Values recorded strictly after ``cutoff``, oldest first."""
+        ts = cutoff.timestamp() if isinstance(cutoff, datetime) else float(cutoff)
+        return self._gather(self._values, self._index_since(ts))
+
+    def rolling_stats(self) -> tuple[int, float, float]:
+        """Return ``(count, mean, sample_stdev)`` over the stats window in O(1)."""
+        n = min(self._size, self.stats_window)
+        if n == 0 or self._shift is None:
+            return 0, 0.0, 0.0
+        mean_d = self._win_sum / n
+        mean = self._shift + mean_d
+        if n < 2:
+            return n, mean, 0.0
+        var = (self._win_sumsq - n * mean_d * mean_d) / (n - 1)
+        return n, mean, math.sqrt(var) if var > 0 else 0.0
+
+    def summary_since(self, cutoff: datetime | float) -> dict[str, Any] | None:
+        """Dashboard summary (current/avg/min/max/count) for a time window."""
+        window = self.since(cutoff)
+        if window.size == 0:
+            return None
+        return {
+            "current": float(window[-1]),
+            "avg": float(window.mean()),
+            "min": float(window.min()),
+            "max": float(window.max()),
+            "count": int(window.size),
+        }
+
+    def iter_records(self, last: int | None = None) -> Iterator[dict[str, Any]]:
+        """Yield samples as dicts (oldest first), materializing lazily."""
+        start = 0 if last is None else max(0, self._size - last)
+        ts = self._gather(self._ts, start)
+        values = self._gather(self._values, start)
+        codes = self._gather(self._codes, start)
+        for t, v, row in zip(ts, values, codes, strict=True):
+            record: dict[str, Any] = {
+                "timestamp": datetime.fromtimestamp(float(t), UTC),
+                "value": float(v),
+            }
+            for field, code in zip(TAG_FIELDS, row, strict=True):
+                record[field] = self.tags.decode(int(code))
+            yield record
+
+    @property
+    def nbytes(self) -> int:
+        return self._ts.nbytes + self._values.nbytes + self._codes.nbytes
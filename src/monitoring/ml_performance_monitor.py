@@ -13,7 +13,6 @@ Integrates with all ML trading components to provide unified monitoring.
 """
 
 import logging
-import statistics
 import sys
 import threading
 import time
@@ -32,6 +31,7 @@ import pandas as pd
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from src.analytics.evaluation import OnlineTradingMetrics
 from src.analytics.financial_metrics import (
     compute_equity_curve,
     compute_max_drawdown,
@@ -41,6 +41,9 @@ from src.core.config import get_config
 from src.core.integrated_error_handling import handle_error, with_error_handling
 from src.data.parquet_repository import ParquetRepository
 from src.execution.ml_signal_executor import MLTradingSignal, SignalStatus
+from src.monitoring.metric_buffer import MetricRingBuffer, TagTable
+from src.monitoring.outcome_store import SignalOutcomeStore
+from src.observability.latency import get_latency_tracker
 from src.services.ml_order_management_service import (
     MLExecutionQuality,
 )
@@ -201,10 +204,12 @@ class MLPerformanceMonitor:
         self.min_accuracy_threshold = monitor_config.get("min_accuracy_threshold", 0.6)
         self.max_drawdown_threshold = monitor_config.get("max_drawdown_threshold", 0.1)
 
-        # Real-time data storage
-        self.metrics: dict[str, deque[PerformanceMetric]] = defaultdict(
-            lambda: deque[PerformanceMetric](maxlen=10000)
-        )  # metric_name -> values
+        # Real-time data storage: one columnar ring buffer per metric key
+        self.metric_capacity = monitor_config.get("metric_capacity", 10000)
+        self.anomaly_window = monitor_config.get("anomaly_window", 20)
+        self.metrics: dict[str, MetricRingBuffer] = {}  # metric_key -> series
+        self._metric_kinds: dict[str, tuple[MetricType, str]] = {}
+        self._metric_tags = TagTable()  # shared strategy/model/symbol codes
         self.alerts: deque[Alert] = deque(maxlen=1000)  # Recent alerts
 
         # Performance tracking
@@ -217,6 +222,12 @@ class MLPerformanceMonitor:
         self.signal_outcomes: dict[
             str, dict[str, Any]
         ] = {}  # signal_id -> outcome data
+        # Columnar copy of outcomes indexed by (model_version, strategy) for reports
+        self.outcome_store = SignalOutcomeStore()
+        # Streaming Sharpe/drawdown/VaR per model over final P&L
+        self.live_model_metrics: dict[str, OnlineTradingMetrics] = {}
+        # Stage latency histograms shared with the executor, risk manager and OMS
+        self.latency_tracker = get_latency_tracker()
 
         # Real-time dashboard data
         self.dashboard_data: dict[str, Any] = {}
@@ -272,6 +283,14 @@ class MLPerformanceMonitor:
                     "final_pnl": None,
                     "outcome_determined": False,
                 }
+                self.outcome_store.add_signal(
+                    signal.signal_id,
+                    signal.model_version,
+                    signal.strategy_name,
+                    signal.signal_timestamp,
+                    signal.confidence,
+                    signal.target_quantity,
+                )
 
                 # Update strategy metrics
                 strategy_key = f"{signal.strategy_name}_{signal.model_version}"
@@ -318,6 +337,12 @@ class MLPerformanceMonitor:
                     self.signal_outcomes[quality.signal_id]["status"] = (
                         SignalStatus.EXECUTED
                     )
+                    self.outcome_store.record_execution(
+                        quality.signal_id,
+                        quality.execution_score,
+                        quality.total_execution_latency_ms,
+                        quality.price_slippage_bps,
+                    )
 
                 # Record execution metrics
                 self._record_metric(
@@ -377,8 +402,17 @@ class MLPerformanceMonitor:
             with self._lock:
                 if signal_id in self.signal_outcomes:
                     self.signal_outcomes[signal_id]["final_pnl"] = pnl
-                    if is_final:
-                        self.signal_outcomes[signal_id]["outcome_determined"] = True
+                    self.outcome_store.record_pnl(signal_id, pnl)
+                    outcome = self.signal_outcomes[signal_id]
+                    if is_final and not outcome["outcome_determined"]:
+                        outcome["outcome_determined"] = True
+                        # Closed trades feed the per-model streaming metrics
+                        model_version = outcome["signal"].model_version
+                        live = self.live_model_metrics.get(model_version)
+                        if live is None:
+                            live = OnlineTradingMetrics()
+                            self.live_model_metrics[model_version] = live
+                        live.update(pnl)
 
                 # Record P&L metric
                 signal_data = self.signal_outcomes.get(signal_id, {})
@@ -409,19 +443,38 @@ class MLPerformanceMonitor:
         symbol: str | None = None,
     ):
         """Record a performance metric"""
-        metric = PerformanceMetric(
-            timestamp=datetime.now(UTC),
-            metric_type=metric_type,
-            metric_name=metric_name,
-            value=value,
+        metric_key = f"{metric_type.value}_{metric_name}"
+        series = self.metrics.get(metric_key)
+        if series is None:
+            series = MetricRingBuffer(
+                capacity=self.metric_capacity,
+                stats_window=self.anomaly_window,
+                tags=self._metric_tags,
+            )
+            self.metrics[metric_key] = series
+            self._metric_kinds[metric_key] = (metric_type, metric_name)
+
+        # Store in time series
+        series.append(
+            value,
             strategy_name=strategy_name,
             model_version=model_version,
             symbol=symbol,
         )
 
-        # Store in time series
-        metric_key = f"{metric_type.value}_{metric_name}"
-        self.metrics[metric_key].append(metric)
+    def get_metric_history(
+        self, metric_type: MetricType, metric_name: str, last: int | None = None
+    ) -> list[PerformanceMetric]:
+        """Materialize recorded samples of one metric as PerformanceMetric objects"""
+        series = self.metrics.get(f"{metric_type.value}_{metric_name}")
+        if series is None:
+            return []
+        return [
+            PerformanceMetric(
+                metric_type=metric_type, metric_name=metric_name, **record
+            )
+            for record in series.iter_records(last)
+        ]
 
     def _create_alert(
         self,
@@ -468,20 +521,11 @@ class MLPerformanceMonitor:
 
             # Get recent metrics (last hour)
             recent_metrics: dict[str, dict[str, Any]] = {}
-            for metric_key, metric_deque in self.metrics.items():
-                recent_values = [
-                    m.value
-                    for m in metric_deque
-                    if m.timestamp > now - timedelta(hours=1)
-                ]
-                if recent_values:
-                    recent_metrics[metric_key] = {
-                        "current": recent_values[-1],
-                        "avg": statistics.mean(recent_values),
-                        "min": min(recent_values),
-                        "max": max(recent_values),
-                        "count": len(recent_values),
-                    }
+            cutoff = now - timedelta(hours=1)
+            for metric_key, series in list(self.metrics.items()):
+                summary = series.summary_since(cutoff)
+                if summary is not None:
+                    recent_metrics[metric_key] = summary
 
             # Get active alerts
             active_alerts = [a for a in self.alerts if not a.resolved]
@@ -503,6 +547,7 @@ class MLPerformanceMonitor:
                 },
                 "strategies": self._get_strategy_summary(),
                 "models": self._get_model_summary(),
+                "latency": self.latency_tracker.summary(),
             }
 
             self.last_dashboard_update = now
@@ -546,10 +591,21 @@ class MLPerformanceMonitor:
 
     def _get_model_summary(self) -> dict[str, dict]:
         """Get summary of model performance"""
-        summary = {}
+        summary = self.outcome_store.model_summaries()
+
+        for model_version, live in self.live_model_metrics.items():
+            snap = live.snapshot()
+            summary.setdefault(model_version, {}).update(
+                {
+                    "live_sharpe": snap.sharpe_sim,
+                    "live_max_drawdown": snap.max_drawdown_sim,
+                    "live_profit_factor": snap.profit_factor,
+                    "live_var_95": snap.var_95,
+                }
+            )
 
         for model_version, data in self.model_performance.items():
-            summary[model_version] = data
+            summary.setdefault(model_version, {}).update(data)
 
         return summary
 
@@ -559,12 +615,13 @@ class MLPerformanceMonitor:
             now = datetime.now(UTC)
 
             # Check for stale data
-            if self.metrics:
-                latest_metric_time = max(
-                    max(m.timestamp for m in metric_deque)
-                    for metric_deque in self.metrics.values()
-                    if metric_deque
-                )
+            latest_times = [
+                ts
+                for series in list(self.metrics.values())
+                if (ts := series.last_timestamp) is not None
+            ]
+            if latest_times:
+                latest_metric_time = max(latest_times)
 
                 if now - latest_metric_time > timedelta(minutes=10):
                     self._create_alert(
@@ -583,23 +640,14 @@ class MLPerformanceMonitor:
     def _check_metric_anomalies(self):
         """Check for anomalies in metrics"""
         try:
-            for metric_key, metric_deque in self.metrics.items():
-                if len(metric_deque) < 10:
-                    continue
-
-                recent_values = [
-                    m.value for m in list(metric_deque)[-20:]
-                ]  # Last 20 values
-
-                if len(recent_values) >= 10:
-                    mean_val = statistics.mean(recent_values)
-                    stdev = (
-                        statistics.stdev(recent_values) if len(recent_values) > 1 else 0
-                    )
+            for metric_key, series in list(self.metrics.items()):
+                # Rolling stats over the last ``anomaly_window`` values, O(1)
+                count, mean_val, stdev = series.rolling_stats()
 
+                if count >= 10:
                     # Check latest value against 2-sigma bounds
-                    if stdev > 0:
-                        latest_value = recent_values[-1]
+                    latest_value = series.last_value
+                    if stdev > 0 and latest_value is not None:
                         z_score = abs(latest_value - mean_val) / stdev
 
                         if z_score > 2.5:  # More than 2.5 standard deviations
@@ -625,18 +673,12 @@ class MLPerformanceMonitor:
             end_time = datetime.now(UTC)
             start_time = end_time - timedelta(days=days_lookback)
 
-            # Filter signals for this model
-            relevant_signals = {}
-            for signal_id, outcome_data in self.signal_outcomes.items():
-                signal = outcome_data["signal"]
-                if (
-                    signal.model_version == model_version
-                    and (not strategy_name or signal.strategy_name == strategy_name)
-                    and signal.signal_timestamp >= start_time
-                ):
-                    relevant_signals[signal_id] = outcome_data
-
-            if not relevant_signals:
+            # Indexed, time-ordered slice of this model's outcomes
+            window = self.outcome_store.window(
+                model_version, strategy_name, start=start_time
+            )
+
+            if len(window) == 0:
                 # Return empty report
                 return ModelPerformanceReport(
                     model_version=model_version,
@@ -667,75 +709,53 @@ class MLPerformanceMonitor:
                 )
 
             # Calculate metrics
-            total_signals = len(relevant_signals)
-            executed_signals = len(
-                [
-                    s
-                    for s in relevant_signals.values()
-                    if s["execution_data"] is not None
-                ]
-            )
+            total_signals = len(window)
+            executed = window.executed
+            executed_signals = int(executed.sum())
 
-            # Financial metrics
-            pnl_values = [
-                s["final_pnl"]
-                for s in relevant_signals.values()
-                if s["final_pnl"] is not None
-            ]
-            total_pnl = sum(pnl_values) if pnl_values else 0
+            # Financial metrics (P&L in signal time order)
+            pnl_arr = window.pnl[~np.isnan(window.pnl)]
+            pnl_values: list[float] = pnl_arr.tolist()
+            total_pnl = float(pnl_arr.sum()) if pnl_arr.size else 0
 
-            wins = [p for p in pnl_values if p > 0]
-            losses = [p for p in pnl_values if p < 0]
+            wins_arr = pnl_arr[pnl_arr > 0]
+            losses_arr = pnl_arr[pnl_arr < 0]
+            wins: list[float] = wins_arr.tolist()
+            losses: list[float] = losses_arr.tolist()
 
-            win_rate = len(wins) / len(pnl_values) if pnl_values else 0
-            avg_win = statistics.mean(wins) if wins else 0
-            avg_loss = statistics.mean(losses) if losses else 0
+            win_rate = wins_arr.size / pnl_arr.size if pnl_arr.size else 0
+            avg_win = float(wins_arr.mean()) if wins_arr.size else 0
+            avg_loss = float(losses_arr.mean()) if losses_arr.size else 0
 
             # Execution quality metrics
-            execution_data = [
-                s["execution_data"]
-                for s in relevant_signals.values()
-                if s["execution_data"] is not None
-            ]
-
             avg_execution_score = (
-                statistics.mean([e.execution_score for e in execution_data])
-                if execution_data
+                float(window.execution_score[executed].mean())
+                if executed_signals
                 else 0
             )
             avg_latency = (
-                statistics.mean([e.total_execution_latency_ms for e in execution_data])
-                if execution_data
-                else 0
+                float(window.latency_ms[executed].mean()) if executed_signals else 0
             )
             avg_slippage = (
-                statistics.mean([e.price_slippage_bps for e in execution_data])
-                if execution_data
-                else 0
+                float(window.slippage_bps[executed].mean()) if executed_signals else 0
             )
 
             # Confidence metrics
-            confidences = [s["signal"].confidence for s in relevant_signals.values()]
-            avg_confidence = statistics.mean(confidences) if confidences else 0
+            avg_confidence = float(window.confidence.mean())
 
             # Build equity curve from P&L sequence (start at 1.0 as normalized equity)
-            equity_curve: list[float] = (
-                compute_equity_curve(pnl_values, as_returns=False, starting_equity=1.0)
-                .astype(float)
-                .tolist()
-                if pnl_values
-                else []
+            equity_arr = (
+                compute_equity_curve(pnl_arr, as_returns=False, starting_equity=1.0)
+                if pnl_arr.size
+                else np.empty(0)
             )
+            equity_curve: list[float] = equity_arr.astype(float).tolist()
             # Returns derived from equity curve: r_t = E_t / E_{t-1} - 1
+            prev_equity = equity_arr[:-1]
+            nonzero = prev_equity != 0
             returns: list[float] = (
-                [
-                    (equity_curve[i] / equity_curve[i - 1] - 1.0)
-                    for i in range(1, len(equity_curve))
-                    if equity_curve[i - 1] != 0
-                ]
-                if equity_curve
-                else []
-            )
+                equity_arr[1:][nonzero] / prev_equity[nonzero] - 1.0
+            ).tolist()
 
             # Financial risk metrics
             max_drawdown = (
@@ -779,10 +799,7 @@ class MLPerformanceMonitor:
                 avg_latency_ms=avg_latency,
                 avg_slippage_bps=avg_slippage,
                 var_95=var_95,
-                max_position_size=max(
-                    [s["signal"].target_quantity for s in relevant_signals.values()],
-                    default=0,
-                ),
+                max_position_size=int(window.quantity.max()),
                 avg_confidence=avg_confidence,
             )
 
@@ -839,17 +856,19 @@ class MLPerformanceMonitor:
         try:
             # Save recent metrics
             all_metrics: list[dict[str, Any]] = []
-            for _metric_key, metric_deque in self.metrics.items():
-                for metric in list(metric_deque)[-1000:]:  # Last 1000 per metric
+            for metric_key, series in list(self.metrics.items()):
+                metric_type, metric_name = self._metric_kinds[metric_key]
+                # Last 1000 per metric
+                for record in series.iter_records(last=1000):
                     all_metrics.append(
                         {
-                            "timestamp": metric.timestamp.isoformat(),
-                            "metric_type": metric.metric_type.value,
-                            "metric_name": metric.metric_name,
-                            "value": metric.value,
-                            "strategy_name": metric.strategy_name,
-                            "model_version": metric.model_version,
-                            "symbol": metric.symbol,
+                            "timestamp": record["timestamp"].isoformat(),
+                            "metric_type": metric_type.value,
+                            "metric_name": metric_name,
+                            "value": record["value"],
+                            "strategy_name": record["strategy_name"],
+                            "model_version": record["model_version"],
+                            "symbol": record["symbol"],
                         }
                     )
 
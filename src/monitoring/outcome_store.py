@@ -0,0 +1,294 @@
+"""Indexed store of ML signal outcomes for performance reporting.
+
+Outcomes are partitioned by ``(model_version, strategy_name)``. Each partition
+keeps growable NumPy columns (signal time, confidence, quantity, P&L and
+execution quality) plus running aggregates that are adjusted in place whenever
+an outcome is updated. Reports select a time window with a binary search over
+the partition's sorted timestamps and reduce the slice with NumPy, so the cost
+does not depend on how many unrelated outcomes are stored.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+import numpy as np
+
+_FLOAT_COLUMNS = (
+    "ts",
+    "confidence",
+    "pnl",
+    "execution_score",
+    "latency_ms",
+    "slippage_bps",
+)
+
+
+@dataclass
+class OutcomeAggregates:
+    """Running totals for one partition (or a merge of several)."""
+
+    total_signals: int = 0
+    signals_executed: int = 0
+    confidence_sum: float = 0.0
+    pnl_count: int = 0
+    pnl_sum: float = 0.0
+    win_count: int = 0
+    win_sum: float = 0.0
+    loss_count: int = 0
+    loss_sum: float = 0.0
+    execution_score_sum: float = 0.0
+    latency_sum_ms: float = 0.0
+    slippage_sum_bps: float = 0.0
+
+    def merge(self, other: OutcomeAggregates) -> None:
+        for name in self.__dataclass_fields__:
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+
+    def apply_pnl(self, pnl: float, sign: int) -> None:
+        if math.isnan(pnl):
+            return
+        self.pnl_count += sign
+        self.pnl_sum += sign * pnl
+        if pnl > 0:
+            self.win_count += sign
+            self.win_sum += sign * pnl
+        elif pnl < 0:
+            self.loss_count += sign
+            self.loss_sum += sign * pnl
+
+    def to_dict(self) -> dict[str, Any]:
+        executed = self.signals_executed
+        return {
+            "total_signals": self.total_signals,
+            "signals_executed": executed,
+            "avg_confidence": self.confidence_sum / self.total_signals
+            if self.total_signals
+            else 0.0,
+            "total_pnl": self.pnl_sum,
+            "win_rate": self.win_count / self.pnl_count if self.pnl_count else 0.0,
+            "avg_execution_score": self.execution_score_sum / executed
+            if executed
+            else 0.0,
+            "avg_latency_ms": self.latency_sum_ms / executed if executed else 0.0,
+        }
+
+
+@dataclass
+class OutcomeWindow:
+    """Column slices for the outcomes selected by a query, in time order."""
+
+    ts: np.ndarray
+    confidence: np.ndarray
+    quantity: np.ndarray
+    pnl: np.ndarray  # NaN where no P&L has been recorded
+    executed: np.ndarray
+    execution_score: np.ndarray
+    latency_ms: np.ndarray
+    slippage_bps: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.ts.size)
+
+
+@dataclass
+class _Partition:
+    """Append-only columns for a single (model_version, strategy) pair."""
+
+    capacity: int = 64
+    size: int = 0
+    sorted_upto: int = 0  # rows [0, sorted_upto) are known to be time ordered
+    columns: dict[str, np.ndarray] = field(default_factory=dict)
+    totals: OutcomeAggregates = field(default_factory=OutcomeAggregates)
+    _order: np.ndarray | None = None
+
+    def __post_init__(self) -> None:
+        for name in _FLOAT_COLUMNS:
+            self.columns[name] = np.full(self.capacity, np.nan, dtype=np.float64)
+        self.columns["quantity"] = np.zeros(self.capacity, dtype=np.int64)
+        self.columns["executed"] = np.zeros(self.capacity, dtype=bool)
+
+    def _grow(self) -> None:
+        new_cap = self.capacity * 2
+        for name, col in self.columns.items():
+            fill = np.nan if col.dtype == np.float64 else 0
+            grown = np.full(new_cap, fill, dtype=col.dtype)
+            grown[: self.size] = col[: self.size]
+            self.columns[name] = grown
+        self.capacity = new_cap
+
+    def append(self, ts: float, confidence: float, quantity: int) -> int:
+        if self.size == self.capacity:
+            self._grow()
+        row = self.size
+        cols = self.columns
+        cols["ts"][row] = ts
+        cols["confidence"][row] = confidence
+        cols["quantity"][row] = quantity
+        if self.sorted_upto == row and (row == 0 or cols["ts"][row - 1] <= ts):
+            self.sorted_upto = row + 1
+        self._order = None
+        self.size = row + 1
+        self.totals.total_signals += 1
+        self.totals.confidence_sum += confidence
+        return row
+
+    def order(self) -> np.ndarray | None:
+        """Row permutation into time order, or None when already ordered."""
+        if self.sorted_upto == self.size:
+            return None
+        if self._order is None:
+            self._order = np.argsort(self.columns["ts"][: self.size], kind="stable")
+        return self._order
+
+    def select(self, start_ts: float, end_ts: float) -> np.ndarray | slice:
+        order = self.order()
+        ts = self.columns["ts"][: self.size]
+        if order is None:
+            lo = int(np.searchsorted(ts, start_ts, side="left"))
+            hi = int(np.searchsorted(ts, end_ts, side="right"))
+            return slice(lo, hi)
+        sorted_ts = ts[order]
+        lo = int(np.searchsorted(sorted_ts, start_ts, side="left"))
+        hi = int(np.searchsorted(sorted_ts, end_ts, side="right"))
+        return order[lo:hi]
+
+
+class SignalOutcomeStore:
+    """Signal outcomes indexed by model version and strategy, ordered by time."""
+
+    def __init__(self) -> None:
+        self._partitions: dict[tuple[str, str], _Partition] = {}
+        self._by_model: dict[str, list[str]] = {}
+        self._rows: dict[str, tuple[_Partition, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, signal_id: object) -> bool:
+        return signal_id in self._rows
+
+    def add_signal(
+        self,
+        signal_id: str,
+        model_version: str,
+        strategy_name: str,
+        timestamp: datetime,
+        confidence: float,
+        quantity: int,
+    ) -> None:
+        """Register a newly generated signal (re-registration is ignored)."""
+        if signal_id in self._rows:
+            return
+        key = (model_version, strategy_name)
+        part = self._partitions.get(key)
+        if part is None:
+            part = _Partition()
+            self._partitions[key] = part
+            self._by_model.setdefault(model_version, []).append(strategy_name)
+        row = part.append(timestamp.timestamp(), float(confidence), int(quantity))
+        self._rows[signal_id] = (part, row)
+
+    def record_execution(
+        self,
+        signal_id: str,
+        execution_score: float,
+        latency_ms: float,
+        slippage_bps: float,
+    ) -> bool:
+        """Attach execution quality to a signal; returns False when unknown."""
+        located = self._rows.get(signal_id)
+        if located is None:
+            return False
+        part, row = located
+        cols, totals = part.columns, part.totals
+        if cols["executed"][row]:
+            totals.execution_score_sum -= cols["execution_score"][row]
+            totals.latency_sum_ms -= cols["latency_ms"][row]
+            totals.slippage_sum_bps -= cols["slippage_bps"][row]
+        else:
+            cols["executed"][row] = True
+            totals.signals_executed += 1
+        cols["execution_score"][row] = execution_score
+        cols["latency_ms"][row] = latency_ms
+        cols["slippage_bps"][row] = slippage_bps
+        totals.execution_score_sum += execution_score
+        totals.latency_sum_ms += latency_ms
+        totals.slippage_sum_bps += slippage_bps
+        return True
+
+    def record_pnl(self, signal_id: str, pnl: float) -> bool:
+        """Set (or replace) a signal's P&L; returns False when unknown."""
+        located = self._rows.get(signal_id)
+        if located is None:
+            return False
+        part, row = located
+        pnl_col = part.columns["pnl"]
+        part.totals.apply_pnl(float(pnl_col[row]), -1)
+        pnl_col[row] = pnl
+        part.totals.apply_pnl(float(pnl), +1)
+        return True
+
+    def _select_partitions(
+        self, model_version: str, strategy_name: str | None
+    ) -> list[_Partition]:
+        if strategy_name:
+            part = self._partitions.get((model_version, strategy_name))
+            return [part] if part is not None else []
+        return [
+            self._partitions[(model_version, s)]
+            for s in self._by_model.get(model_version, [])
+        ]
+
+    def aggregates(
+        self, model_version: str, strategy_name: str | None = None
+    ) -> OutcomeAggregates:
+        """All-time running totals for a model (optionally one strategy), O(1)."""
+        merged = OutcomeAggregates()
+        for part in self._select_partitions(model_version, strategy_name):
+            merged.merge(part.totals)
+        return merged
+
+    def model_summaries(self) -> dict[str, dict[str, Any]]:
+        """All-time totals per model version, merged across strategies."""
+        return {model: self.aggregates(model).to_dict() for model in self._by_model}
+
+    def window(
+        self,
+        model_version: str,
+        strategy_name: str | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> OutcomeWindow:
+        """Outcomes for a model/strategy with ``start <= signal time <= end``."""
+        start_ts = start.timestamp() if start is not None else -np.inf
+        end_ts = end.timestamp() if end is not None else np.inf
+        pieces: dict[str, list[np.ndarray]] = {}
+        for part in self._select_partitions(model_version, strategy_name):
+            idx = part.select(start_ts, end_ts)
+            for name, col in part.columns.items():
+                pieces.setdefault(name, []).append(col[: part.size][idx])
+
+        if not pieces:
+            empty_f = np.empty(0, dtype=np.float64)
+            return OutcomeWindow(
+                ts=empty_f,
+                confidence=empty_f,
+                quantity=np.empty(0, dtype=np.int64),
+                pnl=empty_f,
+                executed=np.empty(0, dtype=bool),
+                execution_score=empty_f,
+                latency_ms=empty_f,
+                slippage_bps=empty_f,
+            )
+
+        if len(pieces["ts"]) == 1:
+            merged = {name: arrs[0] for name, arrs in pieces.items()}
+        else:
+            merged = {name: np.concatenate(arrs) for name, arrs in pieces.items()}
+            order = np.argsort(merged["ts"], kind="stable")
+            merged = {name: col[order] for name, col in merged.items()}
+        return OutcomeWindow(**merged)
@@ -0,0 +1,278 @@
+"""Log-bucketed latency histograms for the ML signal-to-fill path.
+
+Each signal is tracked by id through a fixed set of stages (received,
+validated, risk assessed, order submitted, first fill, complete). Marking a
+stage costs a dict lookup and one histogram increment: the elapsed time since
+the previous mark is bucketed HDR-style (a power-of-two exponent plus 32 linear
+sub-buckets, ~3% relative error) into a per-strategy histogram. Percentiles
+are only computed when a summary is requested.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Iterable
+from datetime import datetime
+from enum import Enum
+from typing import Any
+
+_SUB_BUCKET_BITS = 5
+_SUB_BUCKETS = 1 << _SUB_BUCKET_BITS
+# Largest trackable value is ~2**36 us (about 19 hours); larger values clamp.
+_MAX_SHIFT = 31
+_BUCKET_COUNT = (_MAX_SHIFT + 2) * _SUB_BUCKETS
+
+DEFAULT_PERCENTILES: tuple[float, ...] = (50.0, 90.0, 99.0)
+
+
+def _bucket_index(value_us: int) -> int:
+    if value_us < _SUB_BUCKETS:
+        return value_us if value_us > 0 else 0
+    shift = value_us.bit_length() - _SUB_BUCKET_BITS - 1
+    if shift > _MAX_SHIFT:
+        return _BUCKET_COUNT - 1
+    return (shift + 1) * _SUB_BUCKETS + (value_us >> shift) - _SUB_BUCKETS
+
+
+def _bucket_bounds(index: int) -> tuple[int, int]:
+    """Inclusive lower bound and width of a bucket, in microseconds."""
+    if index < _SUB_BUCKETS:
+        return index, 1
+    shift = index // _SUB_BUCKETS - 1
+    return (_SUB_BUCKETS + index % _SUB_BUCKETS) << shift, 1 << shift
+
+
+class LatencyHistogram:
+    """Fixed-size log-bucketed histogram of durations in microseconds."""
+
+    __slots__ = ("_lock", "_counts", "count", "total_us", "min_us", "max_us")
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counts = [0] * _BUCKET_COUNT
+        self.count = 0
+        self.total_us = 0
+        self.min_us = 0
+        self.max_us = 0
+
+    def record(self, value_us: int) -> None:
+        value_us = max(0, int(value_us))
+        index = _bucket_index(value_us)
+        with self._lock:
+            self._counts[index] += 1
+            if self.count == 0 or value_us < self.min_us:
+                self.min_us = value_us
+            if value_us > self.max_us:
+                self.max_us = value_us
+            self.count += 1
+            self.total_us += value_us
+
+    def record_seconds(self, seconds: float) -> None:
+        self.record(int(seconds * 1_000_000))
+
+    def merge(self, other: LatencyHistogram) -> None:
+        with other._lock:
+            counts = list(other._counts)
+            count, total = other.count, other.total_us
+            lo, hi = other.min_us, other.max_us
+        if not count:
+            return
+        with self._lock:
+            self._counts = [a + b for a, b in zip(self._counts, counts, strict=True)]
+            self.min_us = lo if self.count == 0 else min(self.min_us, lo)
+            self.max_us = max(self.max_us, hi)
+            self.count += count
+            self.total_us += total
+
+    def percentiles(
+        self, qs: Iterable[float] = DEFAULT_PERCENTILES
+    ) -> dict[float, float]:
+        """Value (microseconds) at each percentile in ``qs`` (0-100)."""
+        with self._lock:
+            counts = list(self._counts)
+            count, lo, hi = self.count, self.min_us, self.max_us
+        out: dict[float, float] = {}
+        if not count:
+            return {q: 0.0 for q in qs}
+        targets = sorted((max(1, round(q / 100.0 * count)), q) for q in qs)
+        seen = 0
+        t = 0
+        for index, c in enumerate(counts):
+            if not c:
+                continue
+            seen += c
+            while t < len(targets) and seen >= targets[t][0]:
+                start, width = _bucket_bounds(index)
+                mid = start + (width - 1) / 2.0
+                out[targets[t][1]] = float(min(max(mid, lo), hi))
+                t += 1
+            if t == len(targets):
+                break
+        return out
+
+    def percentile(self, q: float) -> float:
+        return self.percentiles((q,))[q]
+
+    def summary(self) -> dict[str, Any]:
+        """Count plus mean/p50/p90/p99/max in milliseconds."""
+        pct = self.percentiles()
+        count = self.count
+        return {
+            "count": count,
+            "mean_ms": self.total_us / count / 1000.0 if count else 0.0,
+            "p50_ms": pct[50.0] / 1000.0,
+            "p90_ms": pct[90.0] / 1000.0,
+            "p99_ms": pct[99.0] / 1000.0,
+            "max_ms": self.max_us / 1000.0,
+        }
+
+
+class LatencyStage(Enum):
+    """Stages of the signal-to-fill path, in pipeline order."""
+
+    SIGNAL_RECEIVED = "signal_received"
+    VALIDATED = "validated"
+    RISK_ASSESSED = "risk_assessed"
+    ORDER_SUBMITTED = "order_submitted"
+    FIRST_FILL = "first_fill"
+    COMPLETE = "complete"
+
+
+# Cumulative histograms recorded in addition to the per-stage intervals
+SIGNAL_TO_FIRST_FILL = "signal_to_first_fill"
+END_TO_END = "end_to_end"
+
+# Stages that never open a new entry
+_CLOSING_STAGES = frozenset({LatencyStage.FIRST_FILL, LatencyStage.COMPLETE})
+
+
+class _OpenSignal:
+    __slots__ = ("strategy", "received", "last", "stages")
+
+    def __init__(self, strategy: str, at: float) -> None:
+        self.strategy = strategy
+        self.received = at
+        self.last = at
+        self.stages: set[LatencyStage] = set()
+
+
+class LatencyTracker:
+    """Per-strategy stage latency histograms keyed by signal id.
+
+    ``mark`` records the time since the signal's previous mark under the
+    stage's name. A stage is recorded at most once per signal, so repeated
+    fills only count toward ``first_fill``. ``COMPLETE`` closes the signal;
+    fill or completion marks for unknown (already closed) ids are ignored.
+    Signals that never complete are evicted oldest-first beyond ``max_open``.
+    """
+
+    def __init__(self, max_open: int = 10000) -> None:
+        self.max_open = max_open
+        self._lock = threading.Lock()
+        self._open: dict[str, _OpenSignal] = {}
+        self._histograms: dict[tuple[str, str], LatencyHistogram] = {}
+        self.evicted = 0
+
+    def _histogram(self, strategy: str, name: str) -> LatencyHistogram:
+        key = (strategy, name)
+        hist = self._histograms.get(key)
+        if hist is None:
+            with self._lock:
+                hist = self._histograms.setdefault(key, LatencyHistogram())
+        return hist
+
+    def _open_entry(
+        self, signal_id: str, stage: LatencyStage, strategy: str | None, ts: float
+    ) -> _OpenSignal | None:
+        """Entry for a stage mark (caller holds the lock); None when ignored."""
+        entry = self._open.get(signal_id)
+        if entry is None:
+            if stage in _CLOSING_STAGES:
+                return None  # late fill/completion for a closed or evicted signal
+            entry = _OpenSignal(strategy or "unknown", ts)
+            self._open[signal_id] = entry
+            if len(self._open) > self.max_open:
+                self._open.pop(next(iter(self._open)))
+                self.evicted += 1
+            return entry
+        if stage in entry.stages:
+            return None
+        if stage is LatencyStage.SIGNAL_RECEIVED:
+            # Origin reported after a later stage already opened the entry
+            entry.received = min(entry.received, ts)
+            entry.stages.add(stage)
+            return None
+        if strategy and entry.strategy == "unknown":
+            entry.strategy = strategy
+        return entry
+
+    def mark(
+        self,
+        signal_id: str,
+        stage: LatencyStage,
+        strategy: str | None = None,
+        at: datetime | float | None = None,
+    ) -> None:
+        """Record that ``signal_id`` reached ``stage`` (now, or at ``at``)."""
+        if at is None:
+            ts = time.time()
+        else:
+            ts = at.timestamp() if isinstance(at, datetime) else float(at)
+
+        with self._lock:
+            entry = self._open_entry(signal_id, stage, strategy, ts)
+            if entry is None:
+                return
+            entry.stages.add(stage)
+            interval = ts - entry.last
+            since_received = ts - entry.received
+            entry.last = max(entry.last, ts)
+            if stage is LatencyStage.COMPLETE:
+                del self._open[signal_id]
+
+        if stage is LatencyStage.SIGNAL_RECEIVED:
+            return
+        self._histogram(entry.strategy, stage.value).record_seconds(interval)
+        if stage is LatencyStage.FIRST_FILL:
+            self._histogram(entry.strategy, SIGNAL_TO_FIRST_FILL).record_seconds(
+                since_received
+            )
+        elif stage is LatencyStage.COMPLETE:
+            self._histogram(entry.strategy, END_TO_END).record_seconds(since_received)
+
+    def histogram(self, strategy: str, name: str) -> LatencyHistogram | None:
+        return self._histograms.get((strategy, name))
+
+    def open_signals(self) -> int:
+        return len(self._open)
+
+    def summary(self, strategy: str | None = None) -> dict[str, dict[str, Any]]:
+        """``{strategy: {histogram name: stats}}`` plus an ``"all"`` rollup."""
+        with self._lock:
+            items = list(self._histograms.items())
+        out: dict[str, dict[str, Any]] = {}
+        rollup: dict[str, LatencyHistogram] = {}
+        for (strat, name), hist in items:
+            if strategy is not None and strat != strategy:
+                continue
+            out.setdefault(strat, {})[name] = hist.summary()
+            if strategy is None:
+                rollup.setdefault(name, LatencyHistogram()).merge(hist)
+        if rollup:
+            out["all"] = {name: hist.summary() for name, hist in rollup.items()}
+        return out
+
+    def reset(self) -> None:
+        with self._lock:
+            self._open.clear()
+            self._histograms.clear()
+            self.evicted = 0
+
+
+_default_tracker = LatencyTracker()
+
+
+def get_latency_tracker() -> LatencyTracker:
+    """Process-wide tracker shared by the executor, risk manager and OMS."""
+    return _default_tracker
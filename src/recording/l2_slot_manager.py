@@ -1,23 +1,63 @@
-"""L2SlotManager enforces a hard cap of 5 concurrent Level 2 streams.
+"""L2SlotManager allocates a capped number of concurrent Level 2 streams.
 
-Provides FIFO upgrade queue and emits structured events via metrics.emit_event.
+Slots go to symbols by a live score fed from the scanner (gap % x RVOL, see
+``update_scores``). A score decays with a configurable half-life from the
+moment the scanner last reported the symbol, so an early gapper that has gone
+quiet gradually loses priority. Queued symbols are promoted best score first
+(FIFO among equal scores, which is the behaviour when no scores are fed).
+
+When every slot is taken, ``preempt`` hands the weakest holder's slot to the
+best queued symbol, but only if the challenger beats it by the hysteresis
+margin and the holder has kept its slot for at least the minimum hold time;
+both guards keep two similar candidates from trading the slot back and forth.
+
+The manager only does bookkeeping; ``SessionManager`` starts and stops the
+actual subscriptions. Decisions are emitted via ``metrics.emit_event``.
 """
 
 from __future__ import annotations
 
+import itertools
 import threading
-from collections import deque
+import time
+from collections.abc import Callable, Mapping
 
+from src.config import extensions as cfg_ext
 from src.observability.metrics import emit_event, inc
 
-MAX_L2_SLOTS = 5
+MAX_L2_SLOTS = 5  # default capacity; see cfg_ext.l2_max_slots()
+
+# Scores older than this many half-lives are negligible and get dropped
+_SCORE_PRUNE_HALF_LIVES = 20
 
 
 class L2SlotManager:
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        capacity: int | None = None,
+        *,
+        hysteresis: float | None = None,
+        min_hold_seconds: float | None = None,
+        half_life_seconds: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
         self._lock = threading.Lock()
-        self._active: set[str] = set()
-        self._queue: deque[str] = deque()
+        self.capacity = capacity or cfg_ext.l2_max_slots()
+        self._hysteresis = (
+            cfg_ext.l2_preempt_hysteresis() if hysteresis is None else hysteresis
+        )
+        self._min_hold = (
+            cfg_ext.l2_min_hold_seconds()
+            if min_hold_seconds is None
+            else min_hold_seconds
+        )
+        self._half_life = half_life_seconds or cfg_ext.l2_score_half_life_seconds()
+        self._clock = clock
+        self._active: dict[str, float] = {}  # symbol -> acquired at
+        self._queue: dict[str, int] = {}  # symbol -> enqueue order
+        self._order = itertools.count()
+        self._front = itertools.count(-1, -1)  # requeued failures go first
+        self._scores: dict[str, tuple[float, float]] = {}  # symbol -> (score, at)
         self._attempts: dict[str, int] = {}
 
     # --- Public API ---
@@ -25,62 +65,131 @@ class L2SlotManager:
         with self._lock:
             if symbol in self._active:
                 return True
-            if len(self._active) < MAX_L2_SLOTS and symbol not in self._queue:
-                self._active.add(symbol)
-                emit_event("l2_acquired", symbol=symbol, active=len(self._active))
-                inc("active_l2", 1)
+            if len(self._active) < self.capacity and symbol not in self._queue:
+                self._activate(symbol, "l2_acquired")
                 return True
-            # enqueue if not already queued
-            if symbol not in self._queue and symbol not in self._active:
-                self._queue.append(symbol)
+            if symbol not in self._queue:
+                self._queue[symbol] = next(self._order)
             return False
 
     def release(self, symbol: str) -> None:
+        """Free ``symbol``'s slot; the next ``promote_next`` call refills it."""
         with self._lock:
-            if symbol in self._active:
-                self._active.remove(symbol)
+            if self._active.pop(symbol, None) is not None:
+                emit_event("l2_released", symbol=symbol, active=len(self._active))
+                inc("active_l2", -1)
+
+    def discard(self, symbol: str) -> None:
+        """Forget ``symbol`` entirely (its session stopped)."""
+        with self._lock:
+            self._queue.pop(symbol, None)
+            self._scores.pop(symbol, None)
+            if self._active.pop(symbol, None) is not None:
                 emit_event("l2_released", symbol=symbol, active=len(self._active))
                 inc("active_l2", -1)
-        self._promote_if_possible()
 
     def fail_and_requeue(self, symbol: str) -> None:
         with self._lock:
-            if symbol in self._active:
-                self._active.remove(symbol)
+            if self._active.pop(symbol, None) is not None:
                 inc("active_l2", -1)
-            if symbol not in self._queue:
-                self._queue.appendleft(symbol)
+            self._queue[symbol] = next(self._front)
             self._attempts[symbol] = self._attempts.get(symbol, 0) + 1
             emit_event(
                 "l2_subscribe_failed", symbol=symbol, attempts=self._attempts[symbol]
             )
-        self._promote_if_possible()
 
     def promote_next(self) -> str | None:
+        """Give a free slot to the best queued symbol, if any."""
         with self._lock:
-            if len(self._active) >= MAX_L2_SLOTS:
+            if len(self._active) >= self.capacity or not self._queue:
                 return None
-            while self._queue:
-                sym = self._queue.popleft()
-                if sym in self._active:
-                    continue
-                self._active.add(sym)
-                emit_event("l2_promoted", symbol=sym, active=len(self._active))
-                inc("active_l2", 1)
-                return sym
-            return None
+            now = self._clock()
+            sym = min(self._queue, key=lambda s: self._rank(s, now))
+            del self._queue[sym]
+            self._activate(sym, "l2_promoted", now)
+            return sym
+
+    def preempt(self) -> tuple[str, str] | None:
+        """Move the weakest eligible holder's slot to the best queued symbol.
+
+        Returns ``(victim, challenger)`` after the swap (the victim is queued
+        again), or None when slots are free, nothing is queued, no holder is
+        past its minimum hold time or the margin is not met.
+        """
+        with self._lock:
+            if len(self._active) < self.capacity or not self._queue:
+                return None
+            now = self._clock()
+            challenger = min(self._queue, key=lambda s: self._rank(s, now))
+            challenger_score = self._score(challenger, now)
+            eligible = [
+                s for s, at in self._active.items() if now - at >= self._min_hold
+            ]
+            if not eligible or challenger_score <= 0:
+                return None
+            victim = min(eligible, key=lambda s: self._score(s, now))
+            victim_score = self._score(victim, now)
+            if challenger_score <= victim_score * (1 + self._hysteresis):
+                return None
+            held = now - self._active.pop(victim)
+            del self._queue[challenger]
+            self._queue[victim] = next(self._order)
+            self._active[challenger] = now
+            inc("l2_preemptions_total")
+            emit_event(
+                "l2_preempted",
+                victim=victim,
+                challenger=challenger,
+                victim_score=round(victim_score, 3),
+                challenger_score=round(challenger_score, 3),
+                held_s=round(held, 1),
+            )
+            return victim, challenger
+
+    def update_scores(self, scores: Mapping[str, float]) -> None:
+        """Record fresh scanner scores; unreported symbols keep decaying."""
+        with self._lock:
+            now = self._clock()
+            for sym, score in scores.items():
+                self._scores[sym] = (float(score), now)
+            horizon = _SCORE_PRUNE_HALF_LIVES * self._half_life
+            for sym in [s for s, (_, at) in self._scores.items() if now - at > horizon]:
+                if sym not in self._active and sym not in self._queue:
+                    del self._scores[sym]
+
+    def score(self, symbol: str) -> float:
+        """Current (decayed) score of ``symbol``; 0 when never scored."""
+        with self._lock:
+            return self._score(symbol, self._clock())
 
     def queued(self) -> list[str]:
+        """Queued symbols in promotion order."""
         with self._lock:
-            return list(self._queue)
+            now = self._clock()
+            return sorted(self._queue, key=lambda s: self._rank(s, now))
 
     def active(self) -> list[str]:
         with self._lock:
             return list(self._active)
 
-    # --- Internal ---
-    def _promote_if_possible(self) -> None:
-        promoted = self.promote_next()
-        if promoted is not None:
-            # event already emitted
-            pass
+    # --- Internal (lock held) ---
+    def _activate(self, symbol: str, event: str, now: float | None = None) -> None:
+        now = self._clock() if now is None else now
+        self._active[symbol] = now
+        emit_event(
+            event,
+            symbol=symbol,
+            active=len(self._active),
+            score=round(self._score(symbol, now), 3),
+        )
+        inc("active_l2", 1)
+
+    def _score(self, symbol: str, now: float) -> float:
+        entry = self._scores.get(symbol)
+        if entry is None:
+            return 0.0
+        score, at = entry
+        return score * 0.5 ** (max(0.0, now - at) / self._half_life)
+
+    def _rank(self, symbol: str, now: float) -> tuple[float, int]:
+        return -self._score(symbol, now), self._queue[symbol]
@@ -1,7 +1,13 @@
-"""SessionManager orchestrates tick + L2 recording with slot enforcement."""
+"""SessionManager orchestrates tick + L2 recording with slot enforcement.
+
+Each ``upgrade_cycle`` fills free L2 slots from the queue and then performs at
+most one preemption, stopping depth on the displaced symbol (which keeps its
+tick stream and goes back to the queue) before starting it on the challenger.
+"""
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from datetime import UTC, datetime
 
 from src.observability import metrics
@@ -53,33 +59,60 @@ class SessionManager:
         info = self._sessions.get(symbol)
         if not info:
             return
-        # Stop L2 if active
+        # Stop L2 if active; either way the symbol no longer competes for a slot
         if info.mode == "l2":
             self._md.stop_level2(symbol)
-            self._slots.release(symbol)
+        self._slots.discard(symbol)
         # Always stop ticks
         self._md.stop_ticks(symbol)
         metrics.emit_event("session_stopped", symbol=symbol)
         self._sessions.pop(symbol, None)
 
+    def update_scores(self, scores: Mapping[str, float]) -> None:
+        """Feed scanner scores (symbol -> score) to the slot scheduler."""
+        self._slots.update_scores(scores)
+
     def upgrade_cycle(self) -> None:
-        # Attempt promotions
-        promoted = self._slots.promote_next()
-        if promoted:
-            if self._md.start_level2(promoted):
-                s = self._sessions.get(promoted)
-                if s:
-                    s.mode = "l2"
-                    s.queued = False
-                    metrics.emit_event("session_upgraded", symbol=promoted)
-            else:
-                self._slots.fail_and_requeue(promoted)
+        # Fill free slots first, best queued symbol first; stop at a failure
+        # so a rejected subscription is retried next cycle, not in a loop
+        for _ in range(self._slots.capacity):
+            promoted = self._slots.promote_next()
+            if promoted is None or not self._start_level2(promoted):
+                break
+        swap = self._slots.preempt()
+        if swap is not None:
+            victim, challenger = swap
+            self._md.stop_level2(victim)
+            v = self._sessions.get(victim)
+            if v:
+                v.mode = "queued"
+                v.queued = True
+            metrics.emit_event(
+                "session_preempted", symbol=victim, replaced_by=challenger
+            )
+            self._start_level2(challenger)
+
+    def _start_level2(self, symbol: str) -> bool:
+        if not self._md.start_level2(symbol):
+            self._slots.fail_and_requeue(symbol)
+            return False
+        s = self._sessions.get(symbol)
+        if s:
+            s.mode = "l2"
+            s.queued = False
+            metrics.emit_event("session_upgraded", symbol=symbol)
+        return True
 
     def active_summary(self) -> dict[str, int]:
         ticks = len(self._sessions)
         l2 = sum(1 for s in self._sessions.values() if s.mode == "l2")
         queued = sum(1 for s in self._sessions.values() if s.mode == "queued")
-        return {"ticks": ticks, "l2": l2, "queued": queued}
+        return {
+            "ticks": ticks,
+            "l2": l2,
+            "queued": queued,
+            "l2_capacity": self._slots.capacity,
+        }
 
     def list_sessions(self) -> list[SessionInfo]:
         return list(self._sessions.values())
@@ -37,6 +37,7 @@ from src.domain.ml_types import (
     RiskLevel,
     SizingMode,  # Keep this for method parameter
 )
+from src.observability.latency import LatencyStage, get_latency_tracker
 
 
 @dataclass
@@ -120,6 +121,8 @@ class MLRiskManager(RiskManager):
         self.risk_breaches: list[dict[str, Any]] = []
         self.daily_pnl_tracker: dict[str, float] = defaultdict(float)  # date -> pnl
 
+        self.latency_tracker = get_latency_tracker()
+
         # Threading
         self._lock = threading.Lock()
 
@@ -420,6 +423,9 @@ class MLRiskManager(RiskManager):
             self.logger.info(
                 f"Risk assessment for {signal.symbol}: {risk_level.value} ({overall_risk_score:.3f}) - {recommended_action}"
             )
+            self.latency_tracker.mark(
+                signal.signal_id, LatencyStage.RISK_ASSESSED, signal.strategy_name
+            )
 
             return assessment
 
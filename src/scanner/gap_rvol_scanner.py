@@ -1,18 +1,37 @@
-"""Gap & RVOL scanner logic (skeleton implementation).
+"""Gap & RVOL scanner.
 
-Uses placeholder price/volume values until IB integration is wired.
+Flags symbols gapping from the previous close on high relative volume.
+``scan`` evaluates symbols sequentially; ``scan_async`` evaluates them
+concurrently behind a shared pacing limiter and hands each candidate to an
+optional callback as soon as it qualifies. Prev close and ADV20 come from the
+session reference file when one is loaded (``reference_data``), intraday
+volume is accumulated incrementally (``intraday_volume``), and contracts come
+from the shared contract cache (``src.infra.contract_cache``). ``screen``
+re-applies the thresholds to cached values without any requests
+(``screening``).
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from collections.abc import Iterable
+import time
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from typing import Any, Protocol
 
+import numpy as np
+
 from src.config import extensions as cfg_ext
+from src.infra.async_utils import RateLimiter
+from src.infra.contract_cache import ContractCache, ContractInfo, get_contract_cache
 from src.observability import metrics
+from src.scanner.intraday_volume import IntradayFetchStats, IntradayVolumeAccumulator
+from src.scanner.reference_data import ReferenceData, load_reference
+from src.scanner.screening import RVOL_CAP
+from src.scanner.screening import screen as screen_arrays
 from src.utils.time_utils import is_premarket, normalized_time_fraction, now_eastern
 
 try:
@@ -41,6 +60,18 @@ class IB(Protocol):  # minimal protocol
 
 logger = logging.getLogger(__name__)
 
+# Historical bar requests issued per symbol
+_PREV_CLOSE_BARS: dict[str, Any] = {
+    "durationStr": "2 D",
+    "barSizeSetting": "1 day",
+    "whatToShow": "TRADES",
+}
+_ADV_BARS: dict[str, Any] = {
+    "durationStr": "21 D",
+    "barSizeSetting": "1 day",
+    "whatToShow": "TRADES",
+}
+
 
 @dataclass
 class Candidate:
@@ -55,9 +86,19 @@ class Candidate:
     premarket: bool
     updated: datetime
 
+    @property
+    def score(self) -> float:
+        """Ranking score (gap % x RVOL), as used by ``screen`` and L2 slots."""
+        return self.gap_pct * 100 * self.rvol
+
 
 class GapRvolScanner:
-    def __init__(self, ib: IB | None = None) -> None:
+    def __init__(
+        self,
+        ib: IB | None = None,
+        reference: ReferenceData | None = None,
+        contracts: ContractCache | None = None,
+    ) -> None:
         self._prev_close_cache: dict[str, tuple[float, datetime]] = {}
         self._adv_cache: dict[str, tuple[int, datetime]] = {}
         self._hidden: set[str] = set()
@@ -67,14 +108,60 @@ class GapRvolScanner:
         self._adv_ttl = timedelta(minutes=30)
         # Previous close cache should survive full trading day; use 24h TTL.
         self._prev_close_ttl = timedelta(hours=24)
+        self._intraday = IntradayVolumeAccumulator()
+        # Per-session prev-close/ADV20 table; consulted before the caches
+        self._reference = reference
+        self.fetch_stats = IntradayFetchStats()  # most recent scan cycle
+        self._contracts = contracts if contracts is not None else get_contract_cache()
 
     def set_hidden(self, symbols: Iterable[str]) -> None:
         self._hidden = {s.upper() for s in symbols}
 
+    def load_reference(self, session: date | None = None) -> bool:
+        """Memory-map the session's reference file if it exists and is fresh."""
+        self._reference = load_reference(session or now_eastern().date())
+        if self._reference is not None:
+            metrics.emit_event(
+                "gap_reference_loaded",
+                session=self._reference.session,
+                symbols=len(self._reference),
+            )
+        return self._reference is not None
+
+    async def qualify_universe(
+        self, symbols: Iterable[str], refresh: bool = False
+    ) -> dict[str, ContractInfo | None]:
+        """Fill the contract cache for ``symbols``; known symbols cost nothing.
+
+        Must run on the IB client's event loop. Returns the details per
+        symbol (None where IB does not know the symbol).
+        """
+        if not self._ib_ready() or not hasattr(self._ib, "reqContractDetailsAsync"):
+            return {s: self._contracts.get(s) for s in symbols}
+        return await self._contracts.qualify_many(
+            self._ib,
+            symbols,
+            concurrency=cfg_ext.scan_concurrency(),
+            rate_per_sec=cfg_ext.hist_requests_per_sec(),
+            refresh=refresh,
+        )
+
+    def feed_realtime_bar(
+        self,
+        symbol: str,
+        ts: datetime | float,
+        open_: float,
+        close: float,
+        volume: int,
+    ) -> None:
+        """Feed a real-time 5-sec bar; streaming symbols skip intraday requests."""
+        self._intraday.apply_realtime_bar(symbol, ts, open_, close, volume)
+
     def scan(self, symbols: list[str]) -> list[Candidate]:
         """Scan provided symbols, computing gap% and RVOL, returning qualifying candidates."""
         now = now_eastern()
         tf = normalized_time_fraction(now)
+        self.fetch_stats = IntradayFetchStats()
         results: list[Candidate] = []
         for sym in symbols:
             cand = self._evaluate_symbol(sym, now, tf)
@@ -82,8 +169,176 @@ class GapRvolScanner:
                 results.append(cand)
         metrics.inc("scans_total")
         metrics.inc("candidates_total", len(results))
+        self._record_fetch_stats()
         return results
 
+    async def scan_async(
+        self,
+        symbols: list[str],
+        on_candidate: Callable[[Candidate], None] | None = None,
+        concurrency: int | None = None,
+        rate_per_sec: float | None = None,
+    ) -> list[Candidate]:
+        """Concurrent variant of :meth:`scan`.
+
+        Args:
+            symbols: Universe to evaluate.
+            on_candidate: Called with each qualifying candidate as soon as it is
+                known (from the event loop thread), for progressive display.
+            concurrency: Maximum in-flight historical requests
+                (default ``cfg_ext.scan_concurrency()``).
+            rate_per_sec: Request start rate (default
+                ``cfg_ext.hist_requests_per_sec()``).
+
+        Returns candidates in universe order, like :meth:`scan`. When the IB
+        client exposes ``reqHistoricalDataAsync`` it is awaited directly (so the
+        scan must run on that client's event loop); otherwise the blocking
+        ``reqHistoricalData`` runs on a scan-local thread pool.
+        """
+        now = now_eastern()
+        tf = normalized_time_fraction(now)
+        limit = concurrency or cfg_ext.scan_concurrency()
+        limiter = RateLimiter(rate_per_sec or cfg_ext.hist_requests_per_sec(), limit)
+        started = time.perf_counter()
+        self.fetch_stats = IntradayFetchStats()
+
+        # Cached symbols need one request instead of three: schedule them first
+        # so the first candidates reach the UI within a few round trips.
+        ordered = sorted(
+            (s for s in symbols if s not in self._hidden),
+            key=lambda s: self._requests_needed(s, now),
+        )
+        # Contracts for the universe: a no-op once the cache is warm and fresh
+        if self._ib_ready():
+            await self.qualify_universe(ordered)
+        pending = iter(ordered)
+        found: dict[str, Candidate] = {}
+        requests = [0]
+
+        with ThreadPoolExecutor(
+            max_workers=limit, thread_name_prefix="gap-scan"
+        ) as pool:
+
+            async def fetch(contract: Any, params: dict[str, Any]) -> Any:
+                async with limiter:
+                    requests[0] += 1
+                    req_async = getattr(self._ib, "reqHistoricalDataAsync", None)
+                    if req_async is not None:
+                        return await req_async(contract, **params)
+                    loop = asyncio.get_running_loop()
+                    return await loop.run_in_executor(
+                        pool, lambda: self._ib.reqHistoricalData(contract, **params)
+                    )
+
+            async def worker() -> None:
+                for sym in pending:
+                    cand = await self._evaluate_symbol_async(sym, now, tf, fetch)
+                    if cand is None:
+                        continue
+                    found[sym] = cand
+                    if on_candidate is not None:
+                        try:
+                            on_candidate(cand)
+                        except Exception as e:  # noqa: BLE001
+                            logger.debug("on_candidate callback failed: %s", e)
+
+            await asyncio.gather(*(worker() for _ in range(min(limit, len(ordered)))))
+
+        results = [found[s] for s in symbols if s in found]
+        metrics.inc("scans_total")
+        metrics.inc("candidates_total", len(results))
+        metrics.emit_event(
+            "gap_scan_async",
+            symbols=len(ordered),
+            candidates=len(results),
+            requests=requests[0],
+            elapsed_ms=int((time.perf_counter() - started) * 1000),
+        )
+        self._record_fetch_stats()
+        return results
+
+    def screen(
+        self,
+        symbols: Sequence[str],
+        now: datetime | None = None,
+        *,
+        min_gap_pct: float | None = None,
+        min_rvol: float | None = None,
+        exclude: Iterable[str] = (),
+    ) -> list[Candidate]:
+        """Screen ``symbols`` from cached inputs only, strongest first.
+
+        No historical requests are made: prev close/ADV come from the
+        reference file or the caches (stale entries included), price and
+        volume from the intraday accumulator. Symbols lacking any input are
+        dropped. Thresholds default to the configured values.
+        """
+        now = now or now_eastern()
+        skip = self._hidden | {s.upper() for s in exclude}
+        universe = [s for s in symbols if s not in skip]
+        prev_close, adv20 = self._reference_arrays(universe)
+        last, cum_volume = self._intraday.arrays(universe, now)
+        frame = screen_arrays(
+            universe,
+            last,
+            prev_close,
+            cum_volume,
+            adv20,
+            normalized_time_fraction(now),
+            min_gap_pct=min_gap_pct,
+            min_rvol=min_rvol,
+        )
+        premarket = is_premarket(now)
+        metrics.inc("screens_total")
+        return [
+            Candidate(
+                symbol=row.symbol,
+                last=float(row.last),
+                prev_close=float(row.prev_close),
+                cum_volume=int(row.cum_volume),
+                adv20=int(row.adv20),
+                gap_pct=float(row.gap_pct),
+                rvol=float(row.rvol),
+                exchange="SMART",
+                premarket=premarket,
+                updated=now,
+            )
+            for row in frame.itertuples(index=False)
+        ]
+
+    def _reference_arrays(
+        self, symbols: Sequence[str]
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Prev close and ADV20 per symbol (NaN where unknown).
+
+        Reference-file rows are gathered with one array index; only symbols
+        missing from it fall back to the per-symbol caches.
+        """
+        n = len(symbols)
+        prev_close = np.full(n, np.nan)
+        adv20 = np.full(n, np.nan)
+        missing = np.ones(n, dtype=bool)
+        if self._reference is not None and n:
+            rows = self._reference.rows(symbols)
+            hit = rows >= 0
+            prev_close[hit] = self._reference.prev_close[rows[hit]]
+            adv20[hit] = self._reference.adv20[rows[hit]]
+            missing = ~hit | (adv20 <= 0)
+        for i in np.flatnonzero(missing):
+            sym = symbols[i]
+            if np.isnan(prev_close[i]) and sym in self._prev_close_cache:
+                prev_close[i] = self._prev_close_cache[sym][0]
+            if sym in self._adv_cache:
+                adv20[i] = self._adv_cache[sym][0]
+        return prev_close, adv20
+
+    def _record_fetch_stats(self) -> None:
+        stats = self.fetch_stats
+        metrics.inc("intraday_requests_total", stats.requests)
+        metrics.inc("intraday_bars_fetched_total", stats.bars)
+        metrics.inc("intraday_bytes_fetched_total", stats.bytes)
+        metrics.emit_event("gap_scan_intraday_fetch", **stats.to_dict())
+
     def _evaluate_symbol(self, sym: str, now: datetime, tf: float) -> Candidate | None:
         if sym in self._hidden:
             return None
@@ -91,19 +346,55 @@ class GapRvolScanner:
         if prev_close is None or prev_close <= 0:
             return None
         price, cum_vol = self._get_intraday_price_volume(sym, now)
-        if price is None:
-            return None
-        if not (cfg_ext.price_min() <= price <= cfg_ext.price_max()):
+        if not self._price_and_gap_ok(price, prev_close):
             return None
         adv20 = self._get_adv20(sym, now)
-        if adv20 is None or adv20 <= 0:
+        return self._build_candidate(sym, now, tf, prev_close, price, cum_vol, adv20)
+
+    async def _evaluate_symbol_async(
+        self,
+        sym: str,
+        now: datetime,
+        tf: float,
+        fetch: Callable[[Any, dict[str, Any]], Any],
+    ) -> Candidate | None:
+        """Async twin of :meth:`_evaluate_symbol`; prev close and intraday bars
+        are requested together, ADV only once the price/gap pre-screen passes."""
+        prev_close, (price, cum_vol) = await asyncio.gather(
+            self._get_prev_close_async(sym, now, fetch),
+            self._get_intraday_price_volume_async(sym, now, fetch),
+        )
+        if prev_close is None or prev_close <= 0:
+            return None
+        if not self._price_and_gap_ok(price, prev_close):
+            return None
+        adv20 = await self._get_adv20_async(sym, now, fetch)
+        return self._build_candidate(sym, now, tf, prev_close, price, cum_vol, adv20)
+
+    @staticmethod
+    def _price_and_gap_ok(price: float | None, prev_close: float) -> bool:
+        if price is None:
+            return False
+        if not (cfg_ext.price_min() <= price <= cfg_ext.price_max()):
+            return False
+        return price > prev_close
+
+    @staticmethod
+    def _build_candidate(
+        sym: str,
+        now: datetime,
+        tf: float,
+        prev_close: float,
+        price: float | None,
+        cum_vol: int,
+        adv20: int | None,
+    ) -> Candidate | None:
+        if price is None or adv20 is None or adv20 <= 0:
             return None
         gap_pct = (price - prev_close) / prev_close
         if gap_pct <= 0:
             return None
-        rvol = (cum_vol / max(1, adv20)) / tf
-        if rvol > 20:
-            rvol = 20.0
+        rvol = min((cum_vol / max(1, adv20)) / tf, RVOL_CAP)
         if gap_pct * 100 < cfg_ext.min_gap_pct() or rvol < cfg_ext.min_rvol():
             return None
         return Candidate(
@@ -123,96 +414,177 @@ class GapRvolScanner:
     # Internal data acquisition helpers
     # ------------------------------------------------------------------
     def _qualify(self, symbol: str) -> Any | None:  # best-effort
+        # Cached contract (conId, primary exchange) or a plain one; no request
         try:
-            return _stock(symbol, "SMART", "USD")
+            return self._contracts.contract(symbol)
         except Exception:
-            return None
+            return _stock(symbol, "SMART", "USD")
+
+    def _ib_ready(self) -> bool:
+        return bool(self._ib) and bool(getattr(self._ib, "isConnected", False))
+
+    @staticmethod
+    def _cached(
+        cache: dict[str, tuple[Any, datetime]],
+        ttl: timedelta,
+        symbol: str,
+        now: datetime,
+    ) -> tuple[bool, Any]:
+        """``(fresh, value)`` for a cache entry; value may be stale or None."""
+        cached = cache.get(symbol)
+        if cached is None:
+            return False, None
+        return now - cached[1] < ttl, cached[0]
+
+    def _lookup_prev_close(self, symbol: str, now: datetime) -> tuple[bool, Any]:
+        if self._reference is not None:
+            ref = self._reference.get_prev_close(symbol)
+            if ref is not None:
+                return True, ref
+        return self._cached(self._prev_close_cache, self._prev_close_ttl, symbol, now)
+
+    def _lookup_adv20(self, symbol: str, now: datetime) -> tuple[bool, Any]:
+        if self._reference is not None:
+            ref = self._reference.get_adv20(symbol)
+            if ref is not None:
+                return True, ref
+        return self._cached(self._adv_cache, self._adv_ttl, symbol, now)
+
+    def _requests_needed(self, symbol: str, now: datetime) -> int:
+        prev_fresh, _ = self._lookup_prev_close(symbol, now)
+        adv_fresh, _ = self._lookup_adv20(symbol, now)
+        streaming = self._intraday.request_params(symbol, now) is None
+        return (not streaming) + (not prev_fresh) + (not adv_fresh)
 
     def _get_prev_close(self, symbol: str, now: datetime) -> float | None:
-        cached = self._prev_close_cache.get(symbol)
-        if cached and now - cached[1] < self._prev_close_ttl:
-            return cached[0]
-        if not self._ib or not getattr(self._ib, "isConnected", False):
-            return cached[0] if cached else None
+        fresh, cached = self._lookup_prev_close(symbol, now)
+        if fresh or not self._ib_ready():
+            return cached
         contract = self._qualify(symbol)
         if contract is None:
             return None
         try:
             # Request 2 days of daily bars to ensure we get previous trading day
-            df = self._ib.reqHistoricalData(
-                contract, durationStr="2 D", barSizeSetting="1 day", whatToShow="TRADES"
-            )
-            if df is None or df.empty:
-                return None
-            # Last row is most recent completed (assuming RTH). Use second-to-last if current day incomplete pre-open.
-            df_sorted = df.sort_index()
-            prev_close = float(df_sorted.iloc[-1].close)
-            self._prev_close_cache[symbol] = (prev_close, now)
-            return prev_close
+            df = self._ib.reqHistoricalData(contract, **_PREV_CLOSE_BARS)
+            return self._store_prev_close(symbol, df, now)
+        except Exception as e:  # noqa: BLE001
+            logger.debug("prev_close fetch failed %s: %s", symbol, e)
+            return cached
+
+    async def _get_prev_close_async(
+        self, symbol: str, now: datetime, fetch: Callable[[Any, dict[str, Any]], Any]
+    ) -> float | None:
+        fresh, cached = self._lookup_prev_close(symbol, now)
+        if fresh or not self._ib_ready():
+            return cached
+        contract = self._qualify(symbol)
+        if contract is None:
+            return None
+        try:
+            df = await fetch(contract, _PREV_CLOSE_BARS)
+            return self._store_prev_close(symbol, df, now)
         except Exception as e:  # noqa: BLE001
             logger.debug("prev_close fetch failed %s: %s", symbol, e)
-            return cached[0] if cached else None
+            return cached
+
+    def _store_prev_close(self, symbol: str, df: Any, now: datetime) -> float | None:
+        if df is None or df.empty:
+            return None
+        # Last row is most recent completed (assuming RTH). Use second-to-last if current day incomplete pre-open.
+        prev_close = float(df.sort_index().iloc[-1].close)
+        self._prev_close_cache[symbol] = (prev_close, now)
+        return prev_close
 
     def _get_adv20(self, symbol: str, now: datetime) -> int | None:
-        cached = self._adv_cache.get(symbol)
-        if cached and now - cached[1] < self._adv_ttl:
-            return cached[0]
-        if not self._ib or not getattr(self._ib, "isConnected", False):
-            return cached[0] if cached else None
+        fresh, cached = self._lookup_adv20(symbol, now)
+        if fresh or not self._ib_ready():
+            return cached
         contract = self._qualify(symbol)
         if contract is None:
             return None
         try:
-            df = self._ib.reqHistoricalData(
-                contract,
-                durationStr="21 D",
-                barSizeSetting="1 day",
-                whatToShow="TRADES",
-            )
-            if df is None or df.empty:
-                return None
-            vols = df.volume.tail(20)
-            if vols.empty:
-                return None
-            adv = int(vols.mean())
-            self._adv_cache[symbol] = (adv, now)
-            return adv
+            df = self._ib.reqHistoricalData(contract, **_ADV_BARS)
+            return self._store_adv20(symbol, df, now)
         except Exception as e:  # noqa: BLE001
             logger.debug("adv20 fetch failed %s: %s", symbol, e)
-            return cached[0] if cached else None
+            return cached
+
+    async def _get_adv20_async(
+        self, symbol: str, now: datetime, fetch: Callable[[Any, dict[str, Any]], Any]
+    ) -> int | None:
+        fresh, cached = self._lookup_adv20(symbol, now)
+        if fresh or not self._ib_ready():
+            return cached
+        contract = self._qualify(symbol)
+        if contract is None:
+            return None
+        try:
+            df = await fetch(contract, _ADV_BARS)
+            return self._store_adv20(symbol, df, now)
+        except Exception as e:  # noqa: BLE001
+            logger.debug("adv20 fetch failed %s: %s", symbol, e)
+            return cached
+
+    def _store_adv20(self, symbol: str, df: Any, now: datetime) -> int | None:
+        if df is None or df.empty:
+            return None
+        vols = df.volume.tail(20)
+        if vols.empty:
+            return None
+        adv = int(vols.mean())
+        self._adv_cache[symbol] = (adv, now)
+        return adv
 
     def _get_intraday_price_volume(
         self, symbol: str, now: datetime
     ) -> tuple[float | None, int]:
-        # If premarket: approximate using most recent minute bar (1 D 1 min) else use first minute open or last trade
-        if not self._ib or not getattr(self._ib, "isConnected", False):
+        # If premarket: approximate using most recent minute bar else use first minute open
+        params = self._intraday.request_params(symbol, now)
+        if params is None:
+            self.fetch_stats.skipped_streaming += 1
+            return self._intraday.price_volume(symbol, now)
+        if not self._ib_ready():
             return None, 0
         contract = self._qualify(symbol)
         if contract is None:
             return None, 0
         try:
-            # 1 day 1 min bars for intraday volume accumulation
-            df = self._ib.reqHistoricalData(
-                contract,
-                durationStr="1 D",
-                barSizeSetting="1 min",
-                whatToShow="TRADES",
-                useRTH=False,
-            )
-            if df is None or df.empty:
-                return None, 0
-            df_sorted = df.sort_index()
-            # Cumulative volume
-            cum_vol = int(df_sorted.volume.sum())
-            if is_premarket(now):
-                # Use last available bar as premarket proxy
-                last_bar = df_sorted.iloc[-1]
-                price = float(last_bar.close)
-            else:
-                # Use first regular-hours bar open (approx) or last bar close if not yet open
-                first_bar = df_sorted.iloc[0]
-                price = float(first_bar.open)
-            return price, cum_vol
+            df = self._ib.reqHistoricalData(contract, **params)
+            return self._apply_intraday(symbol, df, now, params)
         except Exception as e:  # noqa: BLE001
             logger.debug("intraday price/volume fetch failed %s: %s", symbol, e)
             return None, 0
+
+    async def _get_intraday_price_volume_async(
+        self, symbol: str, now: datetime, fetch: Callable[[Any, dict[str, Any]], Any]
+    ) -> tuple[float | None, int]:
+        params = self._intraday.request_params(symbol, now)
+        if params is None:
+            self.fetch_stats.skipped_streaming += 1
+            return self._intraday.price_volume(symbol, now)
+        if not self._ib_ready():
+            return None, 0
+        contract = self._qualify(symbol)
+        if contract is None:
+            return None, 0
+        try:
+            df = await fetch(contract, params)
+            return self._apply_intraday(symbol, df, now, params)
+        except Exception as e:  # noqa: BLE001
+            logger.debug("intraday price/volume fetch failed %s: %s", symbol, e)
+            return None, 0
+
+    def _apply_intraday(
+        self, symbol: str, df: Any, now: datetime, params: dict[str, Any]
+    ) -> tuple[float | None, int]:
+        seed = params["durationStr"] == "1 D"
+        stats = self.fetch_stats
+        stats.requests += 1
+        stats.seed_requests += seed
+        if df is None or df.empty:
+            # Nothing new since the last bar is fine; an empty seed is not
+            return (None, 0) if seed else self._intraday.price_volume(symbol, now)
+        stats.bars += len(df)
+        stats.bytes += int(df.memory_usage(index=True, deep=True).sum())
+        self._intraday.apply_bars(symbol, df, now, seed=seed)
+        return self._intraday.price_volume(symbol, now)
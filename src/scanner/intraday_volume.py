@@ -0,0 +1,320 @@
+"""Per-symbol intraday volume accumulation for RVOL.
+
+The scanner needs two numbers per symbol and cycle: today's cumulative volume
+and a reference price. Instead of re-downloading the whole day of 1-minute
+bars every cycle, each symbol is seeded once with ``1 D`` of bars and then
+extended with a short ``N S`` request starting at its last seen bar. The last
+bar is usually still forming, so a re-delivered minute replaces the volume
+already counted for it instead of adding to it. Real-time 5-second bars can
+feed the accumulator directly, in which case no request is needed once the
+symbol has been seeded; when the stream stops, the next increment replaces the
+minutes it covered. Bars streamed before the seed arrives are kept and merged
+with it minute by minute, so the overlap is not counted twice.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Sequence
+from dataclasses import asdict, dataclass, field
+from datetime import date, datetime
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from src.utils.time_utils import US_EASTERN, is_premarket
+
+BAR_SECONDS = 60
+REALTIME_BAR_SECONDS = 5
+# Incremental requests never ask for less than this (IB minimum is 60 S)
+_MIN_REQUEST_SECONDS = 120
+# Beyond this gap a fresh full-day seed is cheaper than catching up
+_MAX_INCREMENT_SECONDS = 4 * 3600
+# A symbol counts as streaming while real-time bars keep arriving
+_STREAM_STALE_SECONDS = 3 * REALTIME_BAR_SECONDS
+
+
+@dataclass
+class IntradayFetchStats:
+    """Historical data pulled for intraday volume during one scan cycle."""
+
+    requests: int = 0
+    seed_requests: int = 0
+    bars: int = 0
+    bytes: int = 0
+    skipped_streaming: int = 0
+
+    def to_dict(self) -> dict[str, int]:
+        return asdict(self)
+
+
+@dataclass
+class _SymbolState:
+    session: date
+    cum_volume: int = 0
+    first_open: float | None = None
+    last_close: float | None = None
+    last_bar_ts: float | None = None  # start of the newest 1-min bar
+    # Volume counted per minute from the newest historical bar on (that bar
+    # plus later streamed minutes), replaced when history re-delivers them
+    open_minutes: dict[float, int] = field(default_factory=dict)
+    covered_until: float = 0.0  # end of the period already counted
+    incremental: bool = True  # False when bars carry no timestamps
+    last_stream_ts: float | None = None
+    seeded: bool = False  # a full-day historical response has been applied
+    # Real-time (ts, volume) bars received before the seed, merged into it
+    stream_bars: list[tuple[float, int]] = field(default_factory=list)
+
+
+def _bar_times(df: Any) -> np.ndarray | None:
+    """Epoch seconds for each bar, or None when the frame has no timestamps."""
+    if isinstance(df.index, pd.DatetimeIndex):
+        idx = df.index
+    elif "date" in getattr(df, "columns", ()):
+        idx = pd.DatetimeIndex(pd.to_datetime(df["date"]))
+    else:
+        return None
+    if idx.tz is None:
+        idx = idx.tz_localize(US_EASTERN)
+    # Unit-independent (pandas may store us or ns resolution)
+    return idx.tz_convert(None).to_numpy().astype("datetime64[s]").astype(np.int64)
+
+
+def _minute(t: float) -> float:
+    return t // BAR_SECONDS * BAR_SECONDS
+
+
+def _merge_stream(
+    times: np.ndarray, volumes: np.ndarray, stream: list[tuple[float, int]]
+) -> tuple[int, dict[float, int]]:
+    """Session volume from seed bars plus earlier real-time bars.
+
+    Minutes before the first streamed bar come from history alone. From that
+    minute on each minute counts once, as the larger of the historical bar
+    and the streamed bars inside it: the first minute is only partly
+    streamed, and the newest historical bar may still be forming. Returns
+    (cumulative volume, volume counted per minute from the first streamed one).
+    """
+    first = _minute(min(t for t, _ in stream))
+    split = int(np.searchsorted(times, first, side="left"))
+    minutes: dict[float, int] = {}
+    for t, vol in stream:
+        minute = _minute(t)
+        minutes[minute] = minutes.get(minute, 0) + vol
+    for ts, vol in zip(times[split:].tolist(), volumes[split:].tolist(), strict=True):
+        minutes[float(ts)] = max(minutes.get(float(ts), 0), int(vol))
+    cum = int(volumes[:split].sum()) + sum(minutes.values())
+    return cum, minutes
+
+
+class IntradayVolumeAccumulator:
+    """Running cumulative volume and reference prices per symbol."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._state: dict[str, _SymbolState] = {}
+
+    def __contains__(self, symbol: object) -> bool:
+        return symbol in self._state
+
+    def _current(self, symbol: str, now: datetime) -> _SymbolState | None:
+        state = self._state.get(symbol)
+        if state is None or state.session != now.astimezone(US_EASTERN).date():
+            return None
+        return state
+
+    def is_streaming(self, symbol: str, now: datetime) -> bool:
+        state = self._current(symbol, now)
+        return (
+            state is not None
+            and state.last_stream_ts is not None
+            and now.timestamp() - state.last_stream_ts <= _STREAM_STALE_SECONDS
+        )
+
+    def request_params(self, symbol: str, now: datetime) -> dict[str, Any] | None:
+        """Historical request needed to bring ``symbol`` up to date.
+
+        Returns None while real-time bars are streaming for a seeded symbol,
+        a ``1 D`` seed for unknown, stale or stream-only symbols, otherwise a short request that re-reads
+        the newest bar and anything after it.
+        """
+        state = self._current(symbol, now)
+        if state is not None and state.seeded and self.is_streaming(symbol, now):
+            return None
+        params: dict[str, Any] = {
+            "durationStr": "1 D",
+            "barSizeSetting": "1 min",
+            "whatToShow": "TRADES",
+            "useRTH": False,
+        }
+        if state is None or not state.incremental or state.last_bar_ts is None:
+            return params
+        behind = now.timestamp() - state.last_bar_ts
+        if behind > _MAX_INCREMENT_SECONDS:
+            return params
+        seconds = max(_MIN_REQUEST_SECONDS, int(behind) + BAR_SECONDS)
+        params["durationStr"] = f"{seconds} S"
+        return params
+
+    def apply_bars(self, symbol: str, df: Any, now: datetime, seed: bool) -> int:
+        """Fold a frame of 1-min bars into the symbol's totals.
+
+        ``seed`` replaces any existing state (a ``1 D`` response), keeping
+        real-time bars that arrived before it. Returns the number of bars
+        that changed the totals.
+        """
+        if df is None or df.empty:
+            return 0
+        times = _bar_times(df)
+        if times is not None:
+            order = np.argsort(times, kind="stable")
+            times = times[order]
+        else:
+            order = np.arange(len(df))
+        volumes = df["volume"].to_numpy()[order].astype(np.int64)
+        opens = df["open"].to_numpy()[order] if "open" in df else None
+        closes = df["close"].to_numpy()[order]
+
+        session = now.astimezone(US_EASTERN).date()
+        with self._lock:
+            state = self._state.get(symbol)
+            if (
+                seed
+                or times is None
+                or state is None
+                or state.session != session
+                or not state.seeded
+            ):
+                self._seed(symbol, session, state, times, volumes, opens, closes)
+                return len(volumes)
+            # Skip bars already counted, keeping the (re-delivered) newest one
+            last = state.last_bar_ts if state.last_bar_ts is not None else -1.0
+            start = int(np.searchsorted(times, last, side="left"))
+            if start >= len(times):
+                return 0
+
+            applied = 0
+            minutes = state.open_minutes
+            for i in range(start, len(times)):
+                ts, vol = float(times[i]), int(volumes[i])
+                if ts not in minutes and ts + BAR_SECONDS <= state.covered_until:
+                    continue  # already counted and not re-deliverable
+                # Replace whatever the forming bar or the stream counted
+                state.cum_volume += vol - minutes.get(ts, 0)
+                if state.first_open is None and opens is not None:
+                    state.first_open = float(opens[i])
+                minutes[ts] = vol
+                state.last_bar_ts = ts
+                state.covered_until = max(state.covered_until, ts + BAR_SECONDS)
+                applied += 1
+            newest = state.last_bar_ts
+            state.open_minutes = {m: v for m, v in minutes.items() if m >= newest}
+            state.last_close = float(closes[-1])
+            return applied
+
+    def _seed(
+        self,
+        symbol: str,
+        session: date,
+        prior: _SymbolState | None,
+        times: np.ndarray | None,
+        volumes: np.ndarray,
+        opens: np.ndarray | None,
+        closes: np.ndarray,
+    ) -> None:
+        """Replace ``symbol``'s state with whole-frame totals (lock held)."""
+        state = _SymbolState(
+            session=session, incremental=times is not None, seeded=True
+        )
+        self._state[symbol] = state
+        state.cum_volume = int(volumes.sum())
+        state.first_open = float(opens[0]) if opens is not None else None
+        state.last_close = float(closes[-1])
+        if times is None:
+            return
+        state.last_bar_ts = float(times[-1])
+        state.open_minutes = {state.last_bar_ts: int(volumes[-1])}
+        state.covered_until = state.last_bar_ts + BAR_SECONDS
+        if prior is None or prior.session != session or not prior.stream_bars:
+            return
+        state.cum_volume, minutes = _merge_stream(times, volumes, prior.stream_bars)
+        state.open_minutes = {
+            m: v for m, v in minutes.items() if m >= state.last_bar_ts
+        }
+        state.last_stream_ts = prior.last_stream_ts
+        last_stream = max(t for t, _ in prior.stream_bars)
+        if last_stream >= state.last_bar_ts:
+            # The stream is ahead of the forming bar: keep adding from it
+            state.covered_until = last_stream + REALTIME_BAR_SECONDS
+            if prior.last_close is not None:
+                state.last_close = prior.last_close
+
+    def apply_realtime_bar(
+        self,
+        symbol: str,
+        ts: datetime | float,
+        open_: float,
+        close: float,
+        volume: int,
+    ) -> None:
+        """Add a real-time 5-second bar (ignored if its period is counted)."""
+        t = ts.timestamp() if isinstance(ts, datetime) else float(ts)
+        session = datetime.fromtimestamp(t, US_EASTERN).date()
+        with self._lock:
+            state = self._state.get(symbol)
+            if state is None or state.session != session:
+                state = _SymbolState(session=session)
+                self._state[symbol] = state
+            state.last_stream_ts = t
+            if t < state.covered_until:
+                return
+            vol = int(volume)
+            if state.seeded:
+                minute = _minute(t)
+                state.open_minutes[minute] = state.open_minutes.get(minute, 0) + vol
+            else:
+                state.stream_bars.append((t, vol))
+            state.cum_volume += vol
+            if state.first_open is None:
+                state.first_open = float(open_)
+            state.last_close = float(close)
+            state.covered_until = t + REALTIME_BAR_SECONDS
+
+    def price_volume(self, symbol: str, now: datetime) -> tuple[float | None, int]:
+        """Reference price and cumulative volume, as the scanner defines them.
+
+        Pre-market uses the latest close; otherwise the first bar's open.
+        """
+        state = self._current(symbol, now)
+        if state is None:
+            return None, 0
+        price = state.last_close if is_premarket(now) else state.first_open
+        return price, state.cum_volume
+
+    def arrays(
+        self, symbols: Sequence[str], now: datetime
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """``price_volume`` for many symbols as (float prices, int volumes).
+
+        Unknown symbols get NaN price and zero volume.
+        """
+        premarket = is_premarket(now)
+        session = now.astimezone(US_EASTERN).date()
+        prices = np.full(len(symbols), np.nan)
+        volumes = np.zeros(len(symbols), dtype=np.int64)
+        with self._lock:
+            get = self._state.get
+            for i, symbol in enumerate(symbols):
+                state = get(symbol)
+                if state is None or state.session != session:
+                    continue
+                price = state.last_close if premarket else state.first_open
+                if price is not None:
+                    prices[i] = price
+                volumes[i] = state.cum_volume
+        return prices, volumes
+
+    def clear(self) -> None:
+        with self._lock:
+            self._state.clear()
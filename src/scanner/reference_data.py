@@ -0,0 +1,351 @@
+"""Per-session prev-close / ADV20 reference data for the gap scanner.
+
+A pre-open job writes one file per trading session covering the whole
+universe: symbol, previous close and 20-day average daily volume, all derived
+from daily bars strictly before the session. The file is an uncompressed
+Arrow IPC (Feather v2) table, so the scanner can memory-map it at startup and
+read the numeric columns as zero-copy NumPy arrays; lookups are a dict probe
+plus an array index and never touch the network.
+
+Schema metadata records the session, the previous session the bars end on,
+the build time and the source, which is what the freshness check compares
+against the trading calendar. Freshness is also enforced per row: a symbol
+whose own bars stop before the previous session (e.g. its download failed)
+is dropped at build time and never served by lookups.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+pa: Any
+feather: Any
+try:
+    import pyarrow as pa  # type: ignore[no-redef]
+    import pyarrow.feather as feather  # type: ignore[no-redef]
+
+    PYARROW_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    pa, feather = None, None
+    PYARROW_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+ADV_WINDOW = 20
+FILE_PREFIX = "gap_reference_"
+FILE_SUFFIX = ".arrow"
+
+
+def reference_path(session: date, root: Path | str | None = None) -> Path:
+    """Location of the reference file for ``session``."""
+    if root is None:
+        from src.config import extensions as cfg_ext
+
+        root = cfg_ext.reference_data_dir()
+    return Path(root) / f"{FILE_PREFIX}{session.isoformat()}{FILE_SUFFIX}"
+
+
+def previous_session(session: date) -> date:
+    """Last trading day strictly before ``session`` (NYSE calendar)."""
+    try:
+        from src.services.market_calendar_service import get_market_calendar_service
+
+        return get_market_calendar_service("NYSE").get_last_trading_day(
+            session - timedelta(days=1)
+        )
+    except Exception as e:  # noqa: BLE001
+        logger.debug("calendar lookup failed, using weekday fallback: %s", e)
+        day = session - timedelta(days=1)
+        while day.weekday() >= 5:
+            day -= timedelta(days=1)
+        return day
+
+
+def _daily_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Normalize a daily-bar frame to a sorted ``date``/``close``/``volume`` view."""
+    out = df.rename(columns=str.lower)
+    if "date" not in out.columns:
+        out = out.rename_axis("date").reset_index()
+    dates = pd.to_datetime(out["date"])
+    if getattr(dates.dt, "tz", None) is not None:
+        dates = dates.dt.tz_localize(None)
+    return pd.DataFrame(
+        {
+            "date": dates.dt.date,
+            "close": out["close"].astype(float),
+            "volume": out["volume"].astype(float),
+        }
+    ).sort_values("date", kind="stable")
+
+
+def build_reference_frame(
+    daily_bars: Mapping[str, pd.DataFrame],
+    session: date,
+    expected_prev_session: date | None = None,
+) -> pd.DataFrame:
+    """Prev close, ADV20 and last bar date per symbol from daily bars.
+
+    Only bars dated before ``session`` are used, so a build that runs after
+    the open (or with a partial bar for today) still yields yesterday's close.
+    With ``expected_prev_session``, symbols whose last bar is older than that
+    day are left out instead of carrying a stale close.
+    """
+    frames = []
+    for symbol, df in daily_bars.items():
+        if df is None or df.empty:
+            continue
+        try:
+            daily = _daily_frame(df)
+        except (KeyError, ValueError, TypeError) as e:
+            logger.debug("skipping %s: unusable daily bars (%s)", symbol, e)
+            continue
+        daily = daily[daily["date"] < session].tail(ADV_WINDOW)
+        if not daily.empty:
+            frames.append(daily.assign(symbol=symbol.upper()))
+    if not frames:
+        return pd.DataFrame(
+            {
+                "symbol": pd.Series(dtype=object),
+                "prev_close": pd.Series(dtype="float64"),
+                "adv20": pd.Series(dtype="int64"),
+                "bar_date": pd.Series(dtype=object),
+            }
+        )
+
+    bars = pd.concat(frames, ignore_index=True)
+    grouped = bars.groupby("symbol", sort=True)
+    out = pd.DataFrame(
+        {
+            "prev_close": grouped["close"].last(),
+            "adv20": grouped["volume"].mean().round().astype("int64"),
+            "bar_date": grouped["date"].last(),
+        }
+    ).reset_index()
+    keep = out["prev_close"] > 0
+    if expected_prev_session is not None:
+        fresh = out["bar_date"] >= expected_prev_session
+        if not fresh.all():
+            logger.info(
+                "dropping %d symbols with bars before %s: %s",
+                int((~fresh).sum()),
+                expected_prev_session,
+                out.loc[~fresh, "symbol"].tolist()[:20],
+            )
+        keep &= fresh
+    return out[keep].reset_index(drop=True)
+
+
+def write_reference(
+    frame: pd.DataFrame,
+    session: date,
+    root: Path | str | None = None,
+    source: str = "local",
+) -> Path:
+    """Atomically write ``frame`` as the reference file for ``session``."""
+    if not PYARROW_AVAILABLE:
+        raise RuntimeError("pyarrow is required to write reference data")
+    path = reference_path(session, root)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    table = pa.table(
+        {
+            "symbol": pa.array(frame["symbol"].astype(str).tolist(), pa.string()),
+            "prev_close": pa.array(frame["prev_close"].to_numpy(np.float64)),
+            "adv20": pa.array(frame["adv20"].to_numpy(np.int64)),
+            "bar_date": pa.array(list(frame["bar_date"]), pa.date32()),
+        }
+    )
+    table = table.replace_schema_metadata(
+        {
+            "session": session.isoformat(),
+            "prev_session": previous_session(session).isoformat(),
+            "built_at": datetime.now(UTC).isoformat(),
+            "source": source,
+        }
+    )
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    feather.write_feather(table, tmp, compression="uncompressed")
+    tmp.replace(path)
+    return path
+
+
+class ReferenceData:
+    """Memory-mapped reference table with O(1) symbol lookups.
+
+    Rows whose ``bar_date`` is before the file's previous session are stale:
+    they are counted in ``stale_symbols`` but lookups treat them as missing.
+    """
+
+    def __init__(self, table: Any, path: Path | None = None) -> None:
+        self.path = path
+        meta = {
+            k.decode(): v.decode() for k, v in (table.schema.metadata or {}).items()
+        }
+        self.session = (
+            date.fromisoformat(meta["session"]) if "session" in meta else None
+        )
+        self.prev_session = (
+            date.fromisoformat(meta["prev_session"]) if "prev_session" in meta else None
+        )
+        self.built_at = (
+            datetime.fromisoformat(meta["built_at"]) if "built_at" in meta else None
+        )
+        self.source = meta.get("source", "")
+        # Fixed-width, null-free columns convert without copying
+        self.prev_close = table.column("prev_close").to_numpy()
+        self.adv20 = table.column("adv20").to_numpy()
+        self.bar_date = table.column("bar_date").to_numpy()
+        symbols = table.column("symbol").to_pylist()
+        stale = (
+            self.bar_date < np.datetime64(self.prev_session, "D")
+            if self.prev_session is not None
+            else np.zeros(len(symbols), dtype=bool)
+        )
+        self.stale_symbols = [s for s, old in zip(symbols, stale, strict=True) if old]
+        self._rows = {
+            sym: i
+            for i, (sym, old) in enumerate(zip(symbols, stale, strict=True))
+            if not old
+        }
+        self._table = table  # keeps the mapping alive
+
+    @classmethod
+    def open(cls, path: Path | str) -> ReferenceData:
+        if not PYARROW_AVAILABLE:
+            raise RuntimeError("pyarrow is required to read reference data")
+        path = Path(path)
+        return cls(feather.read_table(path, memory_map=True), path)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, symbol: object) -> bool:
+        return symbol in self._rows
+
+    def symbols(self) -> list[str]:
+        return list(self._rows)
+
+    def row(self, symbol: str) -> int:
+        """Row index for ``symbol``, or -1."""
+        return self._rows.get(symbol, -1)
+
+    def rows(self, symbols: Iterable[str]) -> np.ndarray:
+        """Row indices for many symbols (-1 where missing), for array gathers."""
+        get = self._rows.get
+        return np.fromiter((get(s, -1) for s in symbols), dtype=np.int64)
+
+    def get_prev_close(self, symbol: str) -> float | None:
+        i = self._rows.get(symbol)
+        return None if i is None else float(self.prev_close[i])
+
+    def get_adv20(self, symbol: str) -> int | None:
+        i = self._rows.get(symbol)
+        if i is None:
+            return None
+        adv = int(self.adv20[i])
+        return adv if adv > 0 else None
+
+
+@dataclass
+class ReferenceFreshness:
+    path: Path
+    session: date
+    expected_prev_session: date
+    exists: bool = False
+    fresh: bool = False
+    symbols: int = 0
+    stale_symbols: int = 0
+    prev_session: date | None = None
+    built_at: datetime | None = None
+    reason: str = ""
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "path": str(self.path),
+            "session": self.session.isoformat(),
+            "expected_prev_session": self.expected_prev_session.isoformat(),
+            "exists": self.exists,
+            "fresh": self.fresh,
+            "symbols": self.symbols,
+            "stale_symbols": self.stale_symbols,
+            "prev_session": self.prev_session.isoformat()
+            if self.prev_session
+            else None,
+            "built_at": self.built_at.isoformat() if self.built_at else None,
+            "reason": self.reason,
+        }
+
+
+def _assess(status: ReferenceFreshness, ref: ReferenceData) -> ReferenceFreshness:
+    status.symbols = len(ref)
+    status.stale_symbols = len(ref.stale_symbols)
+    status.prev_session = ref.prev_session
+    status.built_at = ref.built_at
+    expected = np.datetime64(status.expected_prev_session, "D")
+    if not len(ref.bar_date):
+        status.reason = "empty"
+    elif ref.session != status.session:
+        status.reason = f"built for session {ref.session}"
+    elif ref.bar_date.max() < expected:
+        status.reason = (
+            f"bars end {ref.bar_date.max()}, expected {status.expected_prev_session}"
+        )
+    elif not len(ref):
+        status.reason = "every symbol is stale"
+    else:
+        status.fresh = True
+    return status
+
+
+def _open_checked(
+    session: date, root: Path | str | None, expected_prev_session: date | None
+) -> tuple[ReferenceFreshness, ReferenceData | None]:
+    status = ReferenceFreshness(
+        path=reference_path(session, root),
+        session=session,
+        expected_prev_session=expected_prev_session or previous_session(session),
+    )
+    if not status.path.exists():
+        status.reason = "missing"
+        return status, None
+    status.exists = True
+    try:
+        ref = ReferenceData.open(status.path)
+    except Exception as e:  # noqa: BLE001
+        status.reason = f"unreadable: {e}"
+        return status, None
+    return _assess(status, ref), ref
+
+
+def check_freshness(
+    session: date,
+    root: Path | str | None = None,
+    expected_prev_session: date | None = None,
+) -> ReferenceFreshness:
+    """Whether a usable reference file exists for ``session``.
+
+    Fresh means the file exists, is readable, is not empty and was built from
+    bars ending on the trading day before ``session``. Individually stale
+    rows are reported in ``stale_symbols`` and ignored by lookups.
+    """
+    return _open_checked(session, root, expected_prev_session)[0]
+
+
+def load_reference(
+    session: date, root: Path | str | None = None, require_fresh: bool = True
+) -> ReferenceData | None:
+    """Open the session's reference file, or None if missing/stale/unreadable."""
+    if not PYARROW_AVAILABLE:
+        return None
+    status, ref = _open_checked(session, root, None)
+    if ref is None or (require_fresh and not status.fresh):
+        logger.info("reference data not used for %s: %s", session, status.reason)
+        return None
+    return ref
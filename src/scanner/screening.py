@@ -0,0 +1,98 @@
+"""Columnar gap/RVOL screen.
+
+Applies the same rules as ``GapRvolScanner._build_candidate`` (price band,
+positive gap, ADV present, capped RVOL, gap and RVOL thresholds) to whole
+arrays at once, so screening thousands of symbols whose inputs are already
+cached costs a handful of NumPy operations instead of a Python loop. Missing
+inputs are NaN and simply fail every comparison.
+
+Qualifying rows are returned sorted by ``score`` (gap % x RVOL), strongest
+first.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import numpy as np
+import pandas as pd
+
+from src.config import extensions as cfg_ext
+
+RVOL_CAP = 20.0
+
+SCREEN_COLUMNS = (
+    "symbol",
+    "last",
+    "prev_close",
+    "cum_volume",
+    "adv20",
+    "gap_pct",
+    "rvol",
+    "score",
+)
+
+
+def screen(
+    symbols: Sequence[str],
+    last: np.ndarray,
+    prev_close: np.ndarray,
+    cum_volume: np.ndarray,
+    adv20: np.ndarray,
+    tf: float,
+    *,
+    price_min: float | None = None,
+    price_max: float | None = None,
+    min_gap_pct: float | None = None,
+    min_rvol: float | None = None,
+) -> pd.DataFrame:
+    """Qualifying rows of the universe, sorted by score descending.
+
+    Args:
+        symbols: Symbol per row.
+        last: Reference price per symbol (NaN when unknown).
+        prev_close: Previous close (NaN when unknown).
+        cum_volume: Cumulative volume today.
+        adv20: 20-day average daily volume (NaN or <= 0 when unknown).
+        tf: Elapsed fraction of the session (``normalized_time_fraction``).
+        price_min, price_max, min_gap_pct, min_rvol: Thresholds; default to
+            the configured values. ``min_gap_pct`` is in percent.
+    """
+    price_min = cfg_ext.price_min() if price_min is None else price_min
+    price_max = cfg_ext.price_max() if price_max is None else price_max
+    min_gap_pct = cfg_ext.min_gap_pct() if min_gap_pct is None else min_gap_pct
+    min_rvol = cfg_ext.min_rvol() if min_rvol is None else min_rvol
+
+    last = np.asarray(last, dtype=np.float64)
+    prev_close = np.asarray(prev_close, dtype=np.float64)
+    volume = np.asarray(cum_volume, dtype=np.float64)
+    adv = np.asarray(adv20, dtype=np.float64)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        gap_pct = (last - prev_close) / prev_close
+        rvol = np.minimum(volume / np.maximum(adv, 1.0) / tf, RVOL_CAP)
+        mask = (
+            (prev_close > 0)
+            & (last >= price_min)
+            & (last <= price_max)
+            & (last > prev_close)
+            & (adv > 0)
+            & (gap_pct * 100 >= min_gap_pct)
+            & (rvol >= min_rvol)
+        )
+    idx = np.flatnonzero(mask)
+    score = gap_pct[idx] * 100 * rvol[idx]
+    idx = idx[np.argsort(-score, kind="stable")]
+    return pd.DataFrame(
+        {
+            "symbol": np.asarray(symbols, dtype=object)[idx],
+            "last": last[idx],
+            "prev_close": prev_close[idx],
+            "cum_volume": volume[idx].astype(np.int64),
+            "adv20": adv[idx].astype(np.int64),
+            "gap_pct": gap_pct[idx],
+            "rvol": rvol[idx],
+            "score": gap_pct[idx] * 100 * rvol[idx],
+        },
+        columns=list(SCREEN_COLUMNS),
+    )
@@ -27,6 +27,7 @@ else:
 
 from src.core.config import get_config
 from src.core.error_handler import get_error_handler
+from src.infra.contract_cache import ContractCache, get_contract_cache
 
 
 def _make_stock_safe(symbol: str, exchange: str, currency: str) -> ContractType:
@@ -65,16 +66,28 @@ class ContractManagerService:
     - Exchange and currency mapping
     - Contract caching for performance
     - Error handling and recovery
+
+    Stock contracts live in the shared contract cache, qualified once per
+    TTL (and persisted), so other services reuse the result. Only option
+    contracts, which that cache does not hold, are kept per instance.
     """
 
-    def __init__(self, ib_connection: Any | None = None, config: Any | None = None):
+    def __init__(
+        self,
+        ib_connection: Any | None = None,
+        config: Any | None = None,
+        contract_cache: ContractCache | None = None,
+    ):
         """Initialize contract manager with IB connection."""
         self.error_handler: Any = get_error_handler()
         self.config: Any = config or get_config()
         self.ib: Any | None = ib_connection
 
-        # Contract cache for performance
-        self._contract_cache: dict[str, ContractType] = {}
+        # Stock contracts: shared cache; options: per instance
+        self.contracts = (
+            contract_cache if contract_cache is not None else get_contract_cache()
+        )
+        self._option_contracts: dict[str, ContractType] = {}
 
         # Default settings
         self.default_exchange = "SMART"
@@ -119,38 +132,32 @@ class ContractManagerService:
             exchange = exchange or self.default_exchange
             currency = currency or self.default_currency
 
-            # Check cache first
-            cache_key = f"{symbol}_{exchange}_{currency}"
-            if cache_key in self._contract_cache:
-                self.error_handler.logger.debug(
-                    f"Using cached contract for {cache_key}"
-                )
-                return self._contract_cache[cache_key]
-
             # Validate symbol
             if not self._validate_symbol(symbol):
                 self.error_handler.logger.error(f"Invalid symbol: {symbol}")
                 return None
 
-            # Create contract
-            contract = _make_stock_safe(symbol, exchange, currency)
-
-            # Qualify contract if IB connection available
-            if self.ib and hasattr(self.ib, "qualifyContracts"):
-                qualified_contracts = self.ib.qualifyContracts(contract)
-                if qualified_contracts:
-                    contract = qualified_contracts[0]
-                    self.error_handler.logger.info(f"Qualified contract for {symbol}")
-                else:
-                    self.error_handler.logger.warning(
-                        f"Could not qualify contract for {symbol}"
-                    )
-                    return None
-
-            # Cache the contract
-            self._contract_cache[cache_key] = cast(ContractType, contract)
-
-            return cast(ContractType, contract)
+            # Fresh entries in the shared cache are already qualified
+            info = self.contracts.get(symbol, exchange, currency)
+            can_qualify = bool(self.ib) and hasattr(self.ib, "qualifyContracts")
+            if info is not None and (self.contracts.is_fresh(info) or not can_qualify):
+                return cast(ContractType, info.to_contract())
+            if not can_qualify:
+                return _make_stock_safe(symbol, exchange, currency)
+
+            # Unknown or past the TTL: qualify and record in the shared cache
+            contract = self.contracts.request_qualified(
+                self.ib, symbol, exchange, currency
+            )
+            if contract is not None:
+                self.error_handler.logger.info(f"Qualified contract for {symbol}")
+                return cast(ContractType, contract)
+            if info is not None:
+                return cast(ContractType, info.to_contract())
+            self.error_handler.logger.warning(
+                f"Could not qualify contract for {symbol}"
+            )
+            return None
 
         except Exception as e:
             self.error_handler.handle_error(
@@ -201,8 +208,8 @@ class ContractManagerService:
 
             # Check cache
             cache_key = f"OPT_{symbol}_{expiry}_{strike}_{right}_{exchange}_{currency}"
-            if cache_key in self._contract_cache:
-                return self._contract_cache[cache_key]
+            if cache_key in self._option_contracts:
+                return self._option_contracts[cache_key]
 
             # Create option contract via low-level construction to satisfy typing
             try:
@@ -241,7 +248,7 @@ class ContractManagerService:
                     return None
 
             # Cache the contract
-            self._contract_cache[cache_key] = contract
+            self._option_contracts[cache_key] = contract
 
             return contract
 
@@ -290,19 +297,9 @@ class ContractManagerService:
                 )
                 return None
 
-            # Create cache key
-            cache_key = f"FX_{base_currency}_{quote_currency}"
-            if cache_key in self._contract_cache:
-                return self._contract_cache[cache_key]
-
-            # Create forex contract
+            # Create forex contract (local construction, nothing to cache)
             pair = f"{base_currency}{quote_currency}"
-            contract = _make_forex_safe(pair)
-
-            # Cache the contract
-            self._contract_cache[cache_key] = contract
-
-            return contract
+            return _make_forex_safe(pair)
 
         except Exception as e:
             self.error_handler.handle_error(
@@ -434,16 +431,18 @@ class ContractManagerService:
         return results
 
     def clear_cache(self):
-        """Clear the contract cache."""
-        cache_size = len(self._contract_cache)
-        self._contract_cache.clear()
+        """Clear the contract cache (in memory; the shared file is kept)."""
+        cache_size = len(self.contracts) + len(self._option_contracts)
+        self.contracts.clear()
+        self._option_contracts.clear()
         self.error_handler.logger.info(f"Cleared contract cache ({cache_size} entries)")
 
     def get_cache_statistics(self) -> dict[str, Any]:
         """Get contract cache statistics."""
         return {
-            "cached_contracts": len(self._contract_cache),
-            "cache_keys": list(self._contract_cache.keys()),
+            "cached_contracts": len(self.contracts) + len(self._option_contracts),
+            "cache_keys": list(self._option_contracts.keys()),
+            "shared_cache": self.contracts.stats(),
         }
 
 
@@ -0,0 +1,336 @@
+"""
+Bulk Download Engine
+
+Runs large symbol x bar-size x date download batches for the historical
+data service:
+
+- ``plan_bulk_jobs`` deduplicates the full job list and pre-filters it in one
+  pass against a snapshot of the download tracker (already downloaded, known
+  failures, before the earliest available bar), so no job reaches the IB
+  queue only to be skipped;
+- ``BulkDownloader`` runs the remaining jobs concurrently, one worker per
+  pooled IB connection. Requests are paced by the shared IB pacing governor
+  (``IBAsync`` paces itself; custom fetchers can pass ``pacing``), each result
+  is written to storage as soon as it arrives, and a ``BulkReport`` tracks
+  progress and throughput.
+"""
+
+import asyncio
+import inspect
+import logging
+import sys
+import time
+from collections.abc import Awaitable, Callable, Iterable, Sequence
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+try:
+    from ...core.connection_pool import ConnectionPool, ConnectionPriority
+    from ...infra.ib_pacing import PacingGovernor, contract_key, request_key
+    from ..market_data.request_planner import RTH, windows_for_gaps
+    from .availability_checker import AvailabilityChecker
+    from .download_tracker import DownloadTracker, TrackerSnapshot
+except ImportError:
+    # Fallback for direct execution
+    sys.path.append(str(Path(__file__).parent.parent.parent.parent))
+    from availability_checker import AvailabilityChecker
+    from download_tracker import DownloadTracker, TrackerSnapshot
+
+    from src.core.connection_pool import ConnectionPool, ConnectionPriority
+    from src.infra.ib_pacing import PacingGovernor, contract_key, request_key
+    from src.services.market_data.request_planner import RTH, windows_for_gaps
+
+logger = logging.getLogger(__name__)
+
+# fetch(connection, job) -> bars (may be a coroutine); store(job, bars) -> bool
+BulkFetch = Callable[[Any, "BulkJob"], "pd.DataFrame | None | Awaitable[Any]"]
+BulkStore = Callable[["BulkJob", pd.DataFrame], bool]
+
+# Errors that mean the connection itself is unusable
+_CONNECTION_ERRORS = (ConnectionError, OSError, TimeoutError)
+
+
+@dataclass(frozen=True)
+class BulkJob:
+    """One symbol / bar size / date download"""
+
+    symbol: str
+    bar_size: str
+    for_date: str = ""
+
+    @property
+    def key(self) -> str:
+        return f"{self.symbol}|{self.bar_size}|{self.for_date}"
+
+
+@dataclass
+class BulkReport:
+    """Progress and throughput of a bulk download"""
+
+    requested: int = 0
+    duplicates: int = 0
+    skipped: dict[str, int] = field(default_factory=dict)
+    queued: int = 0
+    successful: int = 0
+    failed: int = 0
+    rows: int = 0
+    errors: list[str] = field(default_factory=list)
+    by_connection: dict[Any, int] = field(default_factory=dict)
+    started: float = field(default_factory=time.monotonic)
+    finished: float | None = None
+
+    @property
+    def completed(self) -> int:
+        return self.successful + self.failed
+
+    @property
+    def elapsed(self) -> float:
+        return (self.finished or time.monotonic()) - self.started
+
+    @property
+    def jobs_per_second(self) -> float:
+        return self.completed / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.elapsed if self.elapsed > 0 else 0.0
+
+    def progress(self) -> str:
+        """One-line progress summary"""
+        return (
+            f"{self.completed}/{self.queued} jobs "
+            f"({self.successful} ok, {self.failed} failed) "
+            f"{self.jobs_per_second:.2f} jobs/s {self.rows_per_second:,.0f} rows/s"
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Result dict; keeps the keys ``bulk_download`` has always returned"""
+        return {
+            "total_requests": self.requested,
+            "successful": self.successful,
+            "failed": self.failed,
+            "skipped": self.duplicates + sum(self.skipped.values()),
+            "errors": list(self.errors),
+            "duplicates": self.duplicates,
+            "skipped_by_reason": dict(self.skipped),
+            "queued": self.queued,
+            "rows": self.rows,
+            "elapsed_seconds": round(self.elapsed, 3),
+            "jobs_per_second": round(self.jobs_per_second, 3),
+            "rows_per_second": round(self.rows_per_second, 1),
+            "by_connection": dict(self.by_connection),
+        }
+
+    def _skip(self, reason: str) -> None:
+        self.skipped[reason] = self.skipped.get(reason, 0) + 1
+
+
+def plan_bulk_jobs(
+    symbols: Iterable[str],
+    bar_sizes: Iterable[str],
+    for_dates: Iterable[str],
+    tracker: DownloadTracker,
+    checker: AvailabilityChecker | None = None,
+) -> tuple[list[BulkJob], BulkReport]:
+    """
+    Deduplicate and pre-filter the full job list
+
+    Args:
+        symbols: Stock symbols
+        bar_sizes: Bar sizes
+        for_dates: Date strings ("" for the most recent data)
+        tracker: Download tracker, read once through ``snapshot``
+        checker: Used for symbol validation and the data-file existence check;
+            jobs whose file already exists are marked downloaded
+
+    Returns:
+        Jobs to run, and a report with the duplicate/skip counts filled in
+    """
+    report = BulkReport()
+    bar_sizes = list(bar_sizes)
+    for_dates = list(for_dates) or [""]
+    snapshot = tracker.snapshot(bar_sizes)
+    seen: set[BulkJob] = set()
+    jobs: list[BulkJob] = []
+    for raw in symbols:
+        symbol = str(raw).strip().upper()
+        for bar_size in bar_sizes:
+            for for_date in for_dates:
+                report.requested += 1
+                job = BulkJob(symbol, bar_size, for_date)
+                if job in seen:
+                    report.duplicates += 1
+                    continue
+                seen.add(job)
+                reason = _skip_reason(job, snapshot, checker)
+                if reason == "file_exists":
+                    tracker.mark_downloaded(symbol, bar_size, for_date)
+                if reason:
+                    report._skip(reason)
+                else:
+                    jobs.append(job)
+    report.queued = len(jobs)
+    return jobs, report
+
+
+def _skip_reason(
+    job: BulkJob, snapshot: TrackerSnapshot, checker: AvailabilityChecker | None
+) -> str | None:
+    if checker is not None and not checker.validate_symbol_format(job.symbol):
+        return "invalid_symbol"
+    if snapshot.is_downloaded(job.symbol, job.bar_size, job.for_date):
+        return "downloaded"
+    if not snapshot.is_available(job.symbol, job.bar_size, job.for_date):
+        return "unavailable"
+    if checker is not None and checker.check_data_exists(
+        job.symbol, job.bar_size, job.for_date
+    ):
+        return "file_exists"
+    return None
+
+
+async def fetch_ib_bars(ib: Any, job: BulkJob) -> pd.DataFrame | None:
+    """
+    Download one job's bars over an ``IBAsync`` session
+
+    Dated jobs cover the regular session with IB-legal windows from the
+    request planner; undated jobs request the most recent day.
+    """
+    contract = ib.create_stock_contract(job.symbol)
+    if not job.for_date:
+        return await ib.req_historical_data(
+            contract, duration="1 D", bar_size=job.bar_size
+        )
+    day = pd.Timestamp(job.for_date).date()
+    session = [(datetime.combine(day, RTH[0]), datetime.combine(day, RTH[1]))]
+    parts = []
+    for window in windows_for_gaps(job.symbol, job.bar_size, session):
+        part = await ib.req_historical_data(
+            contract,
+            duration=window.duration,
+            bar_size=window.bar_size,
+            end_datetime=window.end_datetime,
+        )
+        if part is not None and not part.empty:
+            parts.append(part)
+    if not parts:
+        return None
+    bars = pd.concat(parts).sort_index()
+    return bars[~bars.index.duplicated()]
+
+
+class BulkDownloader:
+    """
+    Concurrent executor for bulk download jobs
+
+    Args:
+        fetch: ``fetch(connection, job)`` returning bars (sync or async)
+        store: ``store(job, bars)`` writing bars; runs in a worker thread
+        pool: Connection pool; one worker per pooled connection
+        connection: Single connection to use when there is no pool
+        concurrency: Worker count (default: pool size, else 1)
+        pacing: Governor to acquire before each fetch; leave None when the
+            fetcher paces itself (``IBAsync`` does)
+        on_success / on_failure: Called on the event loop thread after each
+            job, e.g. to update the download tracker
+        progress_every: Log progress after this many completed jobs
+    """
+
+    def __init__(
+        self,
+        fetch: BulkFetch,
+        store: BulkStore,
+        *,
+        pool: ConnectionPool | None = None,
+        connection: Any = None,
+        concurrency: int | None = None,
+        pacing: PacingGovernor | None = None,
+        priority: ConnectionPriority = ConnectionPriority.HIGH,
+        on_success: Callable[[BulkJob, int], None] | None = None,
+        on_failure: Callable[[BulkJob, str], None] | None = None,
+        progress_every: int = 25,
+    ):
+        self.fetch = fetch
+        self.store = store
+        self.pool = pool
+        self.connection = connection
+        self.concurrency = concurrency or (
+            pool.config.max_connections if pool is not None else 1
+        )
+        self.pacing = pacing
+        self.priority = priority
+        self.on_success = on_success
+        self.on_failure = on_failure
+        self.progress_every = max(1, progress_every)
+
+    async def run(
+        self, jobs: Sequence[BulkJob], report: BulkReport | None = None
+    ) -> BulkReport:
+        """Run ``jobs`` and return the filled-in report"""
+        report = report or BulkReport(requested=len(jobs), queued=len(jobs))
+        report.started = time.monotonic()
+        queue: asyncio.Queue[BulkJob] = asyncio.Queue()
+        for job in jobs:
+            queue.put_nowait(job)
+        workers = min(self.concurrency, len(jobs))
+        await asyncio.gather(*(self._worker(queue, report) for _ in range(workers)))
+        report.finished = time.monotonic()
+        logger.info("Bulk download finished: %s", report.progress())
+        return report
+
+    async def _worker(self, queue: asyncio.Queue[BulkJob], report: BulkReport):
+        while not queue.empty():
+            job = queue.get_nowait()
+            try:
+                rows, error = await self._run_job(job, report)
+            except Exception as e:  # noqa: BLE001 - one job must not stop the batch
+                rows, error = 0, str(e)
+            if error is None:
+                report.successful += 1
+                report.rows += rows
+                if self.on_success:
+                    self.on_success(job, rows)
+            else:
+                report.failed += 1
+                report.errors.append(f"{job.symbol} {job.bar_size}: {error}")
+                if self.on_failure:
+                    self.on_failure(job, error)
+            if report.completed % self.progress_every == 0:
+                logger.info("Bulk download progress: %s", report.progress())
+
+    async def _run_job(
+        self, job: BulkJob, report: BulkReport
+    ) -> tuple[int, str | None]:
+        if self.pool is not None:
+            lease = await self.pool.acquire(self.priority)
+            connection, conn_id = lease.connection, lease.client_id
+        else:
+            lease, connection, conn_id = None, self.connection, 0
+        try:
+            if self.pacing is not None:
+                key = contract_key(job.symbol)
+                await self.pacing.acquire_async(
+                    key,
+                    bar_size=job.bar_size,
+                    request=request_key(key, job.bar_size, end_datetime=job.for_date),
+                )
+            result = self.fetch(connection, job)
+            bars = await result if inspect.isawaitable(result) else result
+        except _CONNECTION_ERRORS:
+            if lease is not None:
+                lease.mark_error()
+            raise
+        finally:
+            # Free the connection before storing so the next request can go
+            if lease is not None:
+                lease.return_to_pool()
+        report.by_connection[conn_id] = report.by_connection.get(conn_id, 0) + 1
+        if bars is None or bars.empty:
+            return 0, "No data returned from IB"
+        if not await asyncio.to_thread(self.store, job, bars):
+            return 0, "Failed to store bars"
+        return len(bars), None
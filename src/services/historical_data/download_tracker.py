@@ -12,6 +12,8 @@ Responsibilities:
 """
 
 import sys
+from collections.abc import Iterable
+from dataclasses import dataclass, field
 from datetime import date, datetime
 from pathlib import Path
 from typing import Any
@@ -29,6 +31,50 @@ except ImportError:
     from src.core.error_handler import DataError, ErrorSeverity
 
 
+def _stock_date_key(symbol: str, for_date: str | date | datetime) -> str:
+    """``YYYY-MM-DD-SYMBOL`` key used by the downloaded-stocks sheet"""
+    if isinstance(for_date, str):
+        date_str = for_date[:10]  # Take first 10 characters (YYYY-MM-DD)
+    elif hasattr(for_date, "strftime"):
+        date_str = for_date.strftime("%Y-%m-%d")
+    else:
+        date_str = str(for_date)[:10]
+    return f"{date_str}-{symbol}"
+
+
+@dataclass
+class TrackerSnapshot:
+    """
+    Plain-dict view of the tracking sheets for bulk pre-filtering.
+
+    Built once per bulk run so each job is checked with set/dict lookups
+    instead of DataFrame ``.loc``/``.at`` calls. ``is_available`` applies the
+    same rules as ``AvailabilityChecker.is_available_for_download``.
+    """
+
+    downloaded: set[tuple[str, str]] = field(default_factory=set)
+    non_existent: set[str] = field(default_factory=set)
+    latest_failed: dict[tuple[str, str], str] = field(default_factory=dict)
+    earliest_available: dict[str, pd.Timestamp] = field(default_factory=dict)
+
+    def is_downloaded(self, symbol: str, bar_size: str, for_date: str) -> bool:
+        return (_stock_date_key(symbol, for_date), bar_size) in self.downloaded
+
+    def is_available(self, symbol: str, bar_size: str, for_date: str) -> bool:
+        if symbol in self.non_existent:
+            return False
+        if not for_date:
+            return True
+        # Any recorded failure date for this bar size blocks dated requests
+        if (symbol, bar_size) in self.latest_failed:
+            return False
+        earliest = self.earliest_available.get(symbol)
+        if earliest is None:
+            return True
+        check = pd.to_datetime(for_date, errors="coerce")
+        return pd.isnull(check) or earliest <= check
+
+
 class DownloadTracker:
     """
     Manages tracking of historical data downloads.
@@ -233,14 +279,7 @@ class DownloadTracker:
             True if marked successfully
         """
         # Create the compound key
-        if isinstance(for_date, str):
-            date_str = for_date[:10]  # Take first 10 characters (YYYY-MM-DD)
-        elif hasattr(for_date, "strftime"):
-            date_str = for_date.strftime("%Y-%m-%d")
-        else:
-            date_str = str(for_date)[:10]
-
-        stock_date = f"{date_str}-{symbol}"
+        stock_date = _stock_date_key(symbol, for_date)
 
         # Mark as downloaded
         if stock_date not in self.df_downloaded.index:
@@ -275,14 +314,7 @@ class DownloadTracker:
             True if already downloaded
         """
         # Create the compound key
-        if isinstance(for_date, str):
-            date_str = for_date[:10]
-        elif hasattr(for_date, "strftime"):
-            date_str = for_date.strftime("%Y-%m-%d")
-        else:
-            date_str = str(for_date)[:10]
-
-        stock_date = f"{date_str}-{symbol}"
+        stock_date = _stock_date_key(symbol, for_date)
 
         if stock_date not in self.df_downloaded.index:
             return False
@@ -293,6 +325,37 @@ class DownloadTracker:
         except (KeyError, IndexError):
             return False
 
+    def snapshot(self, bar_sizes: Iterable[str]) -> TrackerSnapshot:
+        """
+        Capture downloaded/failed state for ``bar_sizes`` in one pass
+
+        Args:
+            bar_sizes: Bar sizes the caller is about to check
+
+        Returns:
+            TrackerSnapshot for set/dict lookups
+        """
+        snap = TrackerSnapshot()
+        failed = self.df_failed
+        for bar_size in dict.fromkeys(bar_sizes):
+            if bar_size in self.df_downloaded.columns:
+                done = self.df_downloaded.index[self.df_downloaded[bar_size] == "Yes"]
+                snap.downloaded.update((key, bar_size) for key in done)
+            latest_col = f"{bar_size}-LatestFailed"
+            if latest_col in failed.columns:
+                latest = failed[latest_col].dropna()
+                snap.latest_failed.update(
+                    ((symbol, bar_size), str(value)) for symbol, value in latest.items()
+                )
+        if "NonExistant" in failed.columns:
+            snap.non_existent.update(failed.index[failed["NonExistant"] == "Yes"])
+        if "EarliestAvailBar" in failed.columns:
+            earliest = pd.to_datetime(
+                failed["EarliestAvailBar"].dropna().astype(str), errors="coerce"
+            ).dropna()
+            snap.earliest_available.update(earliest.items())
+        return snap
+
     def _save_failed_if_needed(self):
         """Save failed stocks if threshold reached"""
         if self.fail_changes >= self.FAIL_SAVE_THRESHOLD:
@@ -10,24 +10,54 @@ Priority: IMMEDIATE (Week 1-2)
 Impact: Maintainability, testability, separation of concerns
 """
 
+import asyncio
 import sys
-import time
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+import pandas as pd
+
 # Import configuration management
 try:
     from ...core.config import get_config
+    from ...core.connection_pool import ConnectionPool
+    from ...infra.ib_pacing import (
+        contract_key,
+        get_pacing_governor,
+        request_key,
+    )
     from .availability_checker import AvailabilityChecker
+    from .bulk_download import (
+        BulkDownloader,
+        BulkFetch,
+        BulkJob,
+        BulkStore,
+        fetch_ib_bars,
+        plan_bulk_jobs,
+    )
     from .download_tracker import DownloadTracker
 except ImportError:
     # Fallback for direct execution
     sys.path.append(str(Path(__file__).parent.parent.parent.parent))
     from availability_checker import AvailabilityChecker
+    from bulk_download import (
+        BulkDownloader,
+        BulkFetch,
+        BulkJob,
+        BulkStore,
+        fetch_ib_bars,
+        plan_bulk_jobs,
+    )
     from download_tracker import DownloadTracker
 
     from src.core.config import get_config
+    from src.core.connection_pool import ConnectionPool
+    from src.infra.ib_pacing import (
+        contract_key,
+        get_pacing_governor,
+        request_key,
+    )
 
 
 @dataclass
@@ -58,12 +88,8 @@ class HistoricalDataService:
         self.download_tracker = DownloadTracker()
         self.availability_checker = AvailabilityChecker(self.download_tracker)
 
-        # Request throttling
-        self.request_times = []
-        self.timeframe_requests = []
-
-        # Load saved request timing data
-        self._load_request_timing()
+        # Request throttling, shared with every other IB client process
+        self.pacing = get_pacing_governor()
 
         # Statistics
         self.stats = {
@@ -73,60 +99,6 @@ class HistoricalDataService:
             "cache_hits": 0,
         }
 
-    def _load_request_timing(self):
-        """Load saved request timing data"""
-        try:
-            try:
-                request_file = self.config.get_special_file("request_checker_bin")
-            except Exception:
-                request_file = Path("./Files/requestChecker.bin")
-            if request_file.exists():
-                from joblib import load
-
-                self.timeframe_requests, self.request_times = load(str(request_file))
-
-                # Adjust timing based on file age
-                file_age = time.time() - request_file.stat().st_mtime
-                max_time = (
-                    max(
-                        max(self.timeframe_requests, default=0),
-                        max(self.request_times, default=0),
-                    )
-                    + file_age
-                )
-
-                # Reset perf_counter-based times
-                current_time = time.perf_counter()
-                self.request_times = [
-                    t - max_time + current_time for t in self.request_times
-                ]
-                self.timeframe_requests = [
-                    t - max_time + current_time for t in self.timeframe_requests
-                ]
-        except Exception as e:
-            print(f"Warning: Could not load request timing data: {e}")
-            self.timeframe_requests = []
-            self.request_times = []
-
-    def _save_request_timing(self):
-        """Save request timing data"""
-        try:
-            from joblib import dump
-
-            try:
-                request_file = self.config.get_special_file("request_checker_bin")
-            except Exception:
-                request_file = Path("./Files/requestChecker.bin")
-            request_file.parent.mkdir(parents=True, exist_ok=True)
-
-            dump(
-                [self.timeframe_requests, self.request_times],
-                str(request_file),
-                compress=True,
-            )
-        except Exception as e:
-            print(f"Warning: Could not save request timing data: {e}")
-
     def check_if_downloaded(
         self, symbol: str, bar_size: str, for_date: str = ""
     ) -> bool:
@@ -224,43 +196,22 @@ class HistoricalDataService:
         self, bar_size: str, symbol: str, end_datetime: str, what_to_show: str
     ):
         """
-        Implement request throttling based on IB API limits
+        Wait for the shared IB pacing governor before a request
 
-        IB API Limits:
-        - 60 requests per 10 minutes (general)
-        - 6 requests per 2 seconds (for second-based data)
+        IB API Limits (small bars, enforced across processes):
+        - 60 requests per 10 minutes
+        - 6 requests per 2 seconds for the same contract
+        - No identical request within 15 seconds
         """
-        current_time = time.perf_counter()
-
-        # Check for identical requests (15 second gap)
-        # This would need to be implemented with proper state tracking
-
-        # 60 requests in 10 minutes limit
-        timeout_10min = current_time - (10 * 60)
-        self.request_times = [t for t in self.request_times if t >= timeout_10min]
-        self.request_times.append(current_time)
-
-        if len(self.request_times) > 60:
-            sleep_time = max(0, (10 * 60) - (current_time - self.request_times[0]))
-            if sleep_time > 0:
-                print(f"⏳ Rate limit: sleeping {sleep_time:.1f}s for 10-minute limit")
-                time.sleep(sleep_time)
-
-        # 6 requests in 2 seconds limit (for second-based data)
-        if "sec" in bar_size.lower():
-            timeout_2sec = current_time - 2
-            self.timeframe_requests = [
-                t for t in self.timeframe_requests if t >= timeout_2sec
-            ]
-            self.timeframe_requests.append(current_time)
-
-            if len(self.timeframe_requests) > 6:
-                sleep_time = max(0, 2 - (current_time - self.timeframe_requests[0]))
-                if sleep_time > 0:
-                    print(
-                        f"⏳ Rate limit: sleeping {sleep_time:.1f}s for 2-second limit"
-                    )
-                    time.sleep(sleep_time)
+        key = contract_key(symbol)
+        waited = self.pacing.acquire(
+            key,
+            bar_size=bar_size,
+            what_to_show=what_to_show,
+            request=request_key(key, bar_size, what_to_show, end_datetime=end_datetime),
+        )
+        if waited:
+            print(f"⏳ Rate limit: waited {waited:.1f}s for IB pacing")
 
         self.stats["requests_made"] += 1
 
@@ -350,46 +301,137 @@ class HistoricalDataService:
             return False
 
     def bulk_download(
-        self, symbols: list[str], bar_sizes: list[str], for_date: str = ""
+        self,
+        symbols: list[str],
+        bar_sizes: list[str],
+        for_date: str = "",
+        **kwargs: Any,
     ) -> dict[str, Any]:
         """
         Perform bulk downloads for multiple symbols and bar sizes
 
-        Args:
-            symbols: List of stock symbols
-            bar_sizes: List of bar sizes
-            for_date: Date string
+        Synchronous wrapper around :meth:`bulk_download_async`, which takes
+        the same arguments; use that one from async code. The download runs
+        on the loop that owns the IB connection (or pool) so the session is
+        never driven from a throwaway loop.
 
         Returns:
             Statistics about the bulk download
         """
-        results = {
-            "total_requests": 0,
-            "successful": 0,
-            "failed": 0,
-            "skipped": 0,
-            "errors": [],
-        }
-
-        for symbol in symbols:
-            for bar_size in bar_sizes:
-                request = self.prepare_download_request(symbol, bar_size, for_date)
-                results["total_requests"] += 1
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        owner = self._owning_loop(kwargs.get("pool"))
+        if owner is not None and owner.is_running() and owner is not running:
+            # Connection loop runs on another thread: hand the work over
+            return asyncio.run_coroutine_threadsafe(
+                self.bulk_download_async(symbols, bar_sizes, for_date, **kwargs),
+                owner,
+            ).result()
+        if running is not None:
+            raise RuntimeError(
+                "bulk_download() would block the running event loop; "
+                "await bulk_download_async() instead"
+            )
+        coro = self.bulk_download_async(symbols, bar_sizes, for_date, **kwargs)
+        if owner is not None and not owner.is_closed():
+            return owner.run_until_complete(coro)
+        return asyncio.run(coro)
+
+    def _owning_loop(
+        self, pool: ConnectionPool | None
+    ) -> asyncio.AbstractEventLoop | None:
+        """Event loop the pool or IB connection is bound to, if known"""
+        if pool is not None:
+            loop = pool._loop
+        else:
+            wrapper = getattr(self.ib_connection, "wrapper", None)
+            loop = getattr(wrapper, "_loop", None)
+        return loop if isinstance(loop, asyncio.AbstractEventLoop) else None
+
+    async def bulk_download_async(
+        self,
+        symbols: list[str],
+        bar_sizes: list[str],
+        for_date: str = "",
+        *,
+        for_dates: list[str] | None = None,
+        pool: ConnectionPool | None = None,
+        fetch: BulkFetch | None = None,
+        store: BulkStore | None = None,
+        concurrency: int | None = None,
+    ) -> dict[str, Any]:
+        """
+        Download every symbol x bar size x date concurrently
 
-                if not request:
-                    results["skipped"] += 1
-                    continue
+        The job list is deduplicated and checked against the download tracker
+        in one pass, then run with one worker per pooled IB connection. Each
+        result is saved and tracked as it arrives.
 
-                try:
-                    if self.execute_download_request(request):
-                        results["successful"] += 1
-                    else:
-                        results["failed"] += 1
-                except Exception as e:
-                    results["failed"] += 1
-                    results["errors"].append(f"{symbol} {bar_size}: {str(e)}")
+        Args:
+            symbols: List of stock symbols
+            bar_sizes: List of bar sizes
+            for_date: Date string (ignored when ``for_dates`` is given)
+            for_dates: Several date strings
+            pool: IB connection pool, e.g.
+                ``ConnectionPool(factory=connect_ib)``; defaults to the
+                service's connection
+            fetch: ``fetch(connection, job)``; defaults to an IBAsync download,
+                which paces itself. Custom fetchers are paced by the service.
+            store: ``store(job, bars)``; defaults to the IB download file
+            concurrency: Worker count (default: pool size)
 
-        return results
+        Returns:
+            Statistics about the bulk download, including throughput
+        """
+        jobs, report = plan_bulk_jobs(
+            symbols,
+            bar_sizes,
+            for_dates or [for_date],
+            self.download_tracker,
+            self.availability_checker,
+        )
+        self.stats["cache_hits"] += report.skipped.get("downloaded", 0)
+        self.stats["cache_hits"] += report.skipped.get("file_exists", 0)
+        print(
+            f"📋 Bulk download: {report.queued} queued of {report.requested} "
+            f"({report.duplicates} duplicates, {sum(report.skipped.values())} skipped)"
+        )
+        if jobs and pool is None and not self.ib_connection:
+            print("❌ No IB connection available for download")
+            report.failed = len(jobs)
+            return report.to_dict()
+
+        downloader = BulkDownloader(
+            fetch or fetch_ib_bars,
+            store or self._store_bars,
+            pool=pool,
+            connection=self.ib_connection,
+            concurrency=concurrency,
+            pacing=self.pacing if fetch is not None else None,
+            on_success=lambda job, rows: self.mark_download_completed(
+                job.symbol, job.bar_size, job.for_date
+            ),
+            on_failure=lambda job, error: self.mark_download_failed(
+                job.symbol, job.bar_size, job.for_date, error
+            ),
+        )
+        report = await downloader.run(jobs, report)
+        self.stats["requests_made"] += report.completed
+        print(f"✅ Bulk download: {report.progress()}")
+        return report.to_dict()
+
+    def _store_bars(self, job: BulkJob, bars: pd.DataFrame) -> bool:
+        """Write one job's bars to the IB download file"""
+        file_path = self.config.get_data_file_path(
+            "ib_download",
+            symbol=job.symbol,
+            timeframe=job.bar_size,
+            date_str=job.for_date,
+        )
+        bars.reset_index().to_feather(file_path)
+        return True
 
     def get_service_statistics(self) -> dict[str, Any]:
         """Get comprehensive service statistics"""
@@ -400,16 +442,12 @@ class HistoricalDataService:
             **self.stats,
             "download_tracking": download_stats,
             "availability_cache": cache_stats,
-            "request_throttling": {
-                "recent_requests": len(self.request_times),
-                "recent_timeframe_requests": len(self.timeframe_requests),
-            },
+            "request_throttling": self.pacing.stats(),
         }
 
     def cleanup(self):
         """Clean up and save data"""
         self.download_tracker.save_all()
-        self._save_request_timing()
         self.availability_checker.clear_cache()
         print("🧹 Historical data service cleanup completed")
 
@@ -12,6 +12,7 @@ This replaces the Download_Historical method from requestCheckerCLS.
 import logging
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta
 from enum import Enum
@@ -27,6 +28,7 @@ from src.core.config import get_config
 from src.core.integrated_error_handling import with_error_handling
 from src.data.data_manager import DataManager
 from src.data.parquet_repository import ParquetRepository
+from src.infra.ib_pacing import contract_key, get_pacing_governor, request_key
 
 
 class BarSize(Enum):
@@ -100,6 +102,9 @@ class HistoricalDataService:
         self.data_manager = DataManager()
         self.logger = logging.getLogger(__name__)
 
+        # IB pacing, shared with every other IB client process
+        self.pacing = get_pacing_governor()
+
         # Performance tracking
         self.download_stats = {
             "total_requests": 0,
@@ -164,6 +169,20 @@ class HistoricalDataService:
             )
 
             # This would use the actual IB connection
+            key = contract_key(request.symbol)
+            self.pacing.acquire(
+                key,
+                bar_size=request.bar_size.value,
+                what_to_show=request.what_to_show.value,
+                request=request_key(
+                    key,
+                    request.bar_size.value,
+                    request.what_to_show.value,
+                    end_datetime=download_params["endDateTime"],
+                    duration=download_params["durationStr"],
+                    use_rth=request.use_rth,
+                ),
+            )
             bars = self._download_from_ib(connection, contract, download_params)
 
             if not bars:
@@ -400,33 +419,43 @@ class HistoricalDataService:
         return dt.strftime("%Y-%m-%d")
 
     def download_multiple_symbols(
-        self, symbols: list[str], bar_size: BarSize, **kwargs
+        self,
+        symbols: list[str],
+        bar_size: BarSize,
+        max_workers: int | None = None,
+        **kwargs,
     ) -> dict[str, DownloadResult]:
-        """Download historical data for multiple symbols"""
+        """Download historical data for multiple symbols concurrently
+
+        Each download checks a connection out of the shared pool; the worker
+        count defaults to the configured ``MAX_WORKERS``. IB pacing is left
+        to the shared pacing governor instead of a fixed delay between
+        requests.
+        """
 
-        results = {}
+        unique_symbols = list(dict.fromkeys(symbols))
+        workers = max_workers or get_config().get_performance_settings()["max_workers"]
 
-        for symbol in symbols:
+        def download(symbol: str) -> DownloadResult:
             request = DownloadRequest(symbol=symbol, bar_size=bar_size, **kwargs)
 
             try:
                 # Use the integrated error handling
-                result = self.download_historical_data(request)
-                results[symbol] = result
-
-                # Short delay between requests to avoid rate limiting
-                time.sleep(0.5)
+                return self.download_historical_data(request)
 
             except Exception as e:
                 # Create failed result
-                results[symbol] = DownloadResult(
+                return DownloadResult(
                     success=False,
                     symbol=symbol,
                     bar_size=bar_size,
                     error_message=str(e),
                 )
 
-        return results
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            return dict(
+                zip(unique_symbols, executor.map(download, unique_symbols), strict=True)
+            )
 
     def get_download_statistics(self) -> dict[str, Any]:
         """Get comprehensive download statistics"""
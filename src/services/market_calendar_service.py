@@ -24,6 +24,8 @@ except ImportError:
     has_market_cal = False
     print("Note: pandas_market_calendars not available. Using fallback implementation.")
 
+from src.services.trading_calendar import TradingCalendarIndex, get_trading_calendar
+
 # --- Dependency aliases (avoid conditional redefinitions) ---
 try:
     from src.core.config import get_config as _real_get_config
@@ -93,6 +95,10 @@ class MarketCalendarService:
     - Holiday handling
     - Multi-market support
     - Timezone management
+
+    Trading-day lookups go through the process-wide ``TradingCalendarIndex``
+    when ``pandas_market_calendars`` is available and the date is inside its
+    range; otherwise they fall back to per-call calendar queries.
     """
 
     # Explicit attribute declarations for mypy
@@ -102,6 +108,7 @@ class MarketCalendarService:
     market_timezone: pytz.BaseTzInfo
     utc_timezone: pytz.BaseTzInfo
     calendar: Any | None
+    _index: TradingCalendarIndex | None
     default_market_hours: dict[str, str]
     static_holidays_2024: list[date]
 
@@ -116,6 +123,7 @@ class MarketCalendarService:
 
         # Market calendars (if available)
         self.calendar = None
+        self._index = None
         if has_market_cal:
             try:
                 if mcal is not None:
@@ -178,6 +186,17 @@ class MarketCalendarService:
         }
         return cal_map.get(market, "NYSE")
 
+    def _index_for(self, *dates: date) -> TradingCalendarIndex | None:
+        """Calendar index if it covers ``dates`` (built on first use)."""
+        if self.calendar is None:
+            return None
+        if self._index is None:
+            self._index = get_trading_calendar(self._get_market_cal_name(self.market))
+        index = self._index
+        if index is None or not all(index.covers(d) for d in dates):
+            return None
+        return index
+
     def is_market_open(self, check_time: datetime | None = None) -> bool:
         """
         Check if the market is currently open.
@@ -200,6 +219,10 @@ class MarketCalendarService:
             if not self.is_trading_day(check_time.date()):
                 return False
 
+            if (index := self._index_for(check_time.date())) is not None:
+                session = index.session(check_time.date())
+                return session is not None and session[0] <= check_time <= session[1]
+
             # Use pandas_market_calendars if available
             if self.calendar:
                 try:
@@ -258,6 +281,9 @@ class MarketCalendarService:
             if check_date.weekday() >= 5:  # Saturday = 5, Sunday = 6
                 return False
 
+            if (index := self._index_for(check_date)) is not None:
+                return index.is_trading_day(check_date)
+
             # Use pandas_market_calendars if available
             if self.calendar:
                 try:
@@ -288,6 +314,11 @@ class MarketCalendarService:
         """
         base_date: date = from_date or date.today()
         try:
+            if (index := self._index_for(base_date)) is not None:
+                last = index.previous_trading_day(base_date)
+                if last is not None:
+                    return last
+
             # Use pandas_market_calendars if available
             if self.calendar:
                 try:
@@ -337,6 +368,11 @@ class MarketCalendarService:
         try:
             base_date: date = from_date or date.today()
 
+            if (index := self._index_for(base_date)) is not None:
+                following = index.next_trading_day(base_date)
+                if following is not None:
+                    return following
+
             # Use pandas_market_calendars if available
             if self.calendar:
                 try:
@@ -386,6 +422,9 @@ class MarketCalendarService:
             List of trading days
         """
         try:
+            if (index := self._index_for(start_date, end_date)) is not None:
+                return index.trading_days(start_date, end_date).tolist()
+
             # Use pandas_market_calendars if available
             if self.calendar:
                 try:
@@ -443,6 +482,18 @@ class MarketCalendarService:
                 result["reason"] = "Not a trading day"
                 return result
 
+            index = self._index_for(for_date)
+            if index is not None and (session := index.session(for_date)) is not None:
+                result.update(
+                    {
+                        "market_open": session[0].time(),
+                        "market_close": session[1].time(),
+                        "early_close": index.is_early_close(for_date),
+                        "hours_source": "pandas_market_calendars",
+                    }
+                )
+                return result
+
             # Use pandas_market_calendars if available
             if self.calendar:
                 try:
@@ -503,6 +554,9 @@ class MarketCalendarService:
             "timezone": str(self.market_timezone),
             "has_market_calendars": has_market_cal,
             "calendar_available": self.calendar is not None,
+            "calendar_index": (
+                f"{self._index.start} to {self._index.end}" if self._index else None
+            ),
             "current_market_open": self.is_market_open(),
             "today_is_trading_day": self.is_trading_day(),
             "last_trading_day": str(self.get_last_trading_day()),
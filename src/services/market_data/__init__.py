@@ -19,6 +19,7 @@ Usage:
     service.start_tick_data("AAPL")
 """
 
+from .column_buffer import ColumnBuffer
 from .market_data_service import (
     MarketDataService,
     MarketDepthManager,
@@ -27,6 +28,7 @@ from .market_data_service import (
 )
 
 __all__ = [
+    "ColumnBuffer",
     "MarketDataService",
     "MarketDepthManager",
     "TickByTickManager",
@@ -0,0 +1,297 @@
+"""Growable columnar append buffer for streaming market data.
+
+Tick-by-tick and DOM callbacks used to ``pd.concat`` a one-row frame onto the
+session frame on every update, which copies the whole session each time. A
+``ColumnBuffer`` keeps one preallocated NumPy array per column and appends in
+place; when an array fills up it is doubled, so appends are amortized O(1).
+
+Rows can be moved out of memory into a *sink*: either every ``spill_rows``
+rows or whenever the owner calls ``spill`` (e.g. on a flush interval). The
+default sink (``spill_dir``) writes one Parquet segment per spill; a
+``SessionJournal`` appends them to a single per-session file instead.
+``to_frame`` stitches sink contents and in-memory rows into a DataFrame only
+when asked.
+
+Timestamp columns are stored as int64 epoch microseconds (naive values are
+taken as UTC) and come back as tz-aware ``datetime64`` columns in the
+buffer's timezone. ``float_list`` and
+``str_list`` columns hold one Python list per row (e.g. book levels).
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Mapping, Sequence
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any, Protocol
+
+import numpy as np
+import pandas as pd
+
+pa: Any
+pq: Any
+try:
+    import pyarrow as pa  # type: ignore[no-redef]
+    import pyarrow.parquet as pq  # type: ignore[no-redef]
+
+    PYARROW_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    pa, pq = None, None
+    PYARROW_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+TIMESTAMP = "timestamp"  # column kind: epoch microseconds
+_KINDS: dict[str, Any] = {
+    TIMESTAMP: np.int64,
+    "float": np.float64,
+    "int": np.int64,
+    "str": object,
+    "float_list": object,
+    "str_list": object,
+}
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_US = timedelta(microseconds=1)
+
+
+def _epoch_us(ts: Any) -> int:
+    """Epoch microseconds; naive timestamps and datetimes are both UTC."""
+    if isinstance(ts, pd.Timestamp):  # a datetime subclass: check it first
+        return ts.value // 1000  # exact; .value is always nanoseconds
+    if isinstance(ts, datetime):
+        if ts.tzinfo is None:
+            ts = ts.replace(tzinfo=UTC)
+        return (ts - _EPOCH) // _US  # exact, unlike .timestamp()
+    return round(float(ts) * 1_000_000)  # epoch seconds
+
+
+def arrow_schema(schema: Mapping[str, str], tz: str = "UTC") -> Any:
+    """Arrow schema for a ColumnBuffer schema (requires pyarrow)."""
+    types = {
+        TIMESTAMP: pa.timestamp("us", tz=tz),
+        "float": pa.float64(),
+        "int": pa.int64(),
+        "str": pa.string(),
+        "float_list": pa.list_(pa.float64()),
+        "str_list": pa.list_(pa.string()),
+    }
+    return pa.schema([(col, types[kind]) for col, kind in schema.items()])
+
+
+class SpillSink(Protocol):
+    """Destination for rows moved out of a ColumnBuffer."""
+
+    def write(self, table: Any) -> None: ...  # noqa: D401,E701
+    def read(self) -> Any: ...  # noqa: D401,E701
+    def close(self) -> Any: ...  # noqa: D401,E701
+
+
+class ParquetSegments:
+    """Sink writing one Parquet file per spill into ``directory``."""
+
+    def __init__(self, directory: Path | str, name: str = "buffer") -> None:
+        self.directory = Path(directory)
+        self.name = name
+        self.segments: list[Path] = []
+
+    def write(self, table: Any) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / f"{self.name}_{len(self.segments):05d}.parquet"
+        pq.write_table(table, path)
+        self.segments.append(path)
+
+    def read(self) -> Any:
+        return pa.concat_tables([pq.read_table(p) for p in self.segments])
+
+    def close(self) -> None:
+        return None
+
+
+class ColumnBuffer:
+    """Append-only columnar store with amortized doubling and spill to a sink.
+
+    Args:
+        schema: Column name -> kind (``"timestamp"``, ``"float"``, ``"int"``,
+            ``"str"``, ``"float_list"`` or ``"str_list"``), in output order.
+        capacity: Initial rows per column.
+        spill_rows: Spill automatically once this many rows are held in
+            memory (requires a sink and pyarrow).
+        spill_dir: Use a ``ParquetSegments`` sink in this directory.
+        sink: Explicit sink (takes precedence over ``spill_dir``).
+        name: Segment file prefix.
+        tz: Timezone of timestamp columns.
+    """
+
+    def __init__(
+        self,
+        schema: Mapping[str, str],
+        capacity: int = 1024,
+        *,
+        spill_rows: int | None = None,
+        spill_dir: Path | str | None = None,
+        sink: SpillSink | None = None,
+        name: str = "buffer",
+        tz: str = "UTC",
+    ) -> None:
+        unknown = {k for k in schema.values() if k not in _KINDS}
+        if unknown:
+            raise ValueError(f"unknown column kinds: {sorted(unknown)}")
+        self.schema = dict(schema)
+        self.name = name
+        self.tz = tz
+        self._lock = threading.Lock()
+        self._columns = list(self.schema)
+        self._ts_columns = frozenset(
+            c for c, k in self.schema.items() if k == TIMESTAMP
+        )
+        self._capacity = max(1, capacity)
+        self._arrays = self._allocate(self._capacity)
+        self._size = 0
+        self._spilled_rows = 0
+        if sink is None and spill_dir is not None:
+            sink = ParquetSegments(spill_dir, name)
+        if sink is not None and not PYARROW_AVAILABLE:
+            logger.warning("pyarrow unavailable; %s buffer will not spill", name)
+            sink = None
+        self.sink = sink
+        self._spill_rows = spill_rows if sink is not None else None
+
+    def __len__(self) -> int:
+        return self._spilled_rows + self._size
+
+    @property
+    def in_memory(self) -> int:
+        return self._size
+
+    @property
+    def segments(self) -> list[Path]:
+        """Parquet segment files written so far (``spill_dir`` sink only)."""
+        return list(getattr(self.sink, "segments", []))
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the column arrays (object columns: pointers)."""
+        return sum(a.nbytes for a in self._arrays.values())
+
+    def append(self, *values: Any) -> None:
+        """Append one row, values in schema order."""
+        with self._lock:
+            if self._size == self._capacity:
+                self._grow(self._size + 1)
+            i = self._size
+            for col, value in zip(self._columns, values, strict=True):
+                if col in self._ts_columns:
+                    value = _epoch_us(value)
+                self._arrays[col][i] = value
+            self._size = i + 1
+            self._maybe_spill()
+
+    def extend(self, columns: Mapping[str, Sequence[Any] | np.ndarray]) -> None:
+        """Append many rows given as column name -> equal-length sequences."""
+        n = len(next(iter(columns.values()))) if columns else 0
+        if not n:
+            return
+        with self._lock:
+            if self._size + n > self._capacity:
+                self._grow(self._size + n)
+            sl = slice(self._size, self._size + n)
+            for col in self._columns:
+                values = columns[col]
+                if col in self._ts_columns and not (
+                    isinstance(values, np.ndarray) and values.dtype == np.int64
+                ):
+                    values = [_epoch_us(v) for v in values]
+                self._arrays[col][sl] = values
+            self._size += n
+            self._maybe_spill()
+
+    def to_frame(self) -> pd.DataFrame:
+        """All rows (spilled ones first) as a DataFrame."""
+        with self._lock:
+            current = self._frame(slice(0, self._size))
+            if self.sink is None or not self._spilled_rows:
+                return current
+            spilled = self.sink.read().to_pandas()
+        return pd.concat([spilled, current], ignore_index=True)
+
+    def spill(self) -> int:
+        """Move in-memory rows to the sink; returns the number of rows moved."""
+        with self._lock:
+            return self._spill()
+
+    def close(self) -> Any:
+        """Spill what is left and close the sink (returns its result)."""
+        with self._lock:
+            self._spill()
+            return self.sink.close() if self.sink is not None else None
+
+    def clear(self) -> None:
+        """Drop in-memory rows and forget (but keep on disk) spilled rows."""
+        with self._lock:
+            self._size = 0
+            self._spilled_rows = 0
+            if isinstance(self.sink, ParquetSegments):
+                self.sink.segments = []
+
+    # --- Internal (lock held) ---
+    def _allocate(self, rows: int) -> dict[str, np.ndarray]:
+        arrays = {}
+        for col, kind in self.schema.items():
+            dtype = _KINDS[kind]
+            if kind == "str":
+                arrays[col] = np.full(rows, "", dtype=object)
+            elif dtype is object:
+                arrays[col] = np.empty(rows, dtype=object)
+            else:
+                arrays[col] = np.zeros(rows, dtype=dtype)
+        return arrays
+
+    def _grow(self, needed: int) -> None:
+        capacity = self._capacity
+        while capacity < needed:
+            capacity *= 2
+        if self._spill_rows:
+            capacity = min(capacity, max(needed, self._spill_rows))
+        grown = self._allocate(capacity)
+        for col, arr in self._arrays.items():
+            grown[col][: self._size] = arr[: self._size]
+        self._arrays = grown
+        self._capacity = capacity
+
+    def _maybe_spill(self) -> None:
+        if self._spill_rows and self._size >= self._spill_rows:
+            self._spill()
+
+    def _spill(self) -> int:
+        n = self._size
+        if not n or self.sink is None:
+            return 0
+        self.sink.write(self._table(slice(0, n)))
+        self._spilled_rows += n
+        self._size = 0  # arrays are reused for the next batch
+        return n
+
+    def _table(self, rows: slice) -> Any:
+        schema = arrow_schema(self.schema, self.tz)
+        arrays = []
+        for field in schema:
+            arr = self._arrays[field.name][rows]
+            if field.name in self._ts_columns:
+                arrays.append(pa.array(arr, pa.int64()).cast(field.type))
+            else:
+                arrays.append(pa.array(arr, field.type))
+        return pa.Table.from_arrays(arrays, schema=schema)
+
+    def _frame(self, rows: slice) -> pd.DataFrame:
+        data: dict[str, Any] = {}
+        for col in self._columns:
+            arr = self._arrays[col][rows].copy()
+            if col in self._ts_columns:
+                data[col] = pd.to_datetime(arr, unit="us", utc=True).tz_convert(self.tz)
+            else:
+                data[col] = arr
+        return pd.DataFrame(data, columns=self._columns)
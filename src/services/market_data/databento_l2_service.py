@@ -16,6 +16,8 @@ from zoneinfo import ZoneInfo
 
 import pandas as pd
 
+from src.core.retry_manager import RetryConfig, RetryManager, RetryStrategy
+
 try:  # Optional import guard
     from databento import Historical  # type: ignore
 except Exception:  # pragma: no cover - absence path
@@ -39,6 +41,36 @@ class VendorUnavailable(RuntimeError):  # noqa: N818 - keep public name stable
     """Raised when vendor client or API key is unavailable."""
 
 
+_L2_COLUMNS = [
+    "ts_event",
+    "action",
+    "side",
+    "price",
+    "size",
+    "level",
+    "exchange",
+    "symbol",
+]
+
+
+def _backoff_bounds_ms() -> tuple[int, int]:
+    """``L2_TASK_BACKOFF_BASE_MS`` / ``L2_TASK_BACKOFF_MAX_MS`` with defaults."""
+    try:
+        base_ms = int(os.getenv("L2_TASK_BACKOFF_BASE_MS", "250") or 250)
+    except ValueError:
+        base_ms = 250
+    try:
+        max_ms = int(os.getenv("L2_TASK_BACKOFF_MAX_MS", "2000") or 2000)
+    except ValueError:
+        max_ms = 2000
+    return base_ms, max(base_ms, max_ms)
+
+
+def _is_invalid_symbol(exc: Exception) -> bool:
+    msg = repr(exc)
+    return "symbology_invalid_symbol" in msg or "symbology_invalid_request" in msg
+
+
 class DataBentoL2Service:
     def __init__(self, api_key: str | None):
         self.api_key = api_key
@@ -59,6 +91,22 @@ class DataBentoL2Service:
             except TypeError:
                 return Historical()  # type: ignore[call-arg]
 
+    @staticmethod
+    def _get_range(
+        client: Any, req: VendorL2Request, start_iso: str, end_iso: str
+    ) -> pd.DataFrame:
+        store = client.timeseries.get_range(
+            dataset=req.dataset,
+            start=start_iso,
+            end=end_iso,
+            symbols=req.symbol,
+            schema=req.schema,
+            stype_in="raw_symbol",
+            stype_out="instrument_id",
+            limit=None,
+        )
+        return store.to_df()
+
     def _get_with_backoff(
         self, client: Any, req: VendorL2Request, start_iso: str, end_iso: str
     ) -> pd.DataFrame:
@@ -70,38 +118,15 @@ class DataBentoL2Service:
         apply a small exponential backoff and retry up to 3 attempts.
         """
 
-        try:
-            base_ms = int(os.getenv("L2_TASK_BACKOFF_BASE_MS", "250") or 250)
-        except ValueError:
-            base_ms = 250
-        try:
-            max_ms = int(os.getenv("L2_TASK_BACKOFF_MAX_MS", "2000") or 2000)
-        except ValueError:
-            max_ms = 2000
-        if max_ms < base_ms:
-            max_ms = base_ms
+        base_ms, max_ms = _backoff_bounds_ms()
 
         last_err: Exception | None = None
         for attempt in range(1, 4):
             try:
-                store = client.timeseries.get_range(
-                    dataset=req.dataset,
-                    start=start_iso,
-                    end=end_iso,
-                    symbols=req.symbol,
-                    schema=req.schema,
-                    stype_in="raw_symbol",
-                    stype_out="instrument_id",
-                    limit=None,
-                )
-                return store.to_df()
+                return self._get_range(client, req, start_iso, end_iso)
             except Exception as e:  # noqa: PERF203 - narrow on message
                 last_err = e
-                msg = repr(e)
-                if (
-                    "symbology_invalid_symbol" in msg
-                    or "symbology_invalid_request" in msg
-                ):
+                if _is_invalid_symbol(e):
                     return pd.DataFrame()
                 if attempt == 3:
                     raise
@@ -112,12 +137,8 @@ class DataBentoL2Service:
             raise last_err
         raise RuntimeError("Unknown DataBento fetch failure")
 
-    def fetch_l2(self, req: VendorL2Request) -> pd.DataFrame:  # noqa: C901
-        """Return vendor-native L2 DataFrame with normalized columns.
-
-        Expected output columns (after light normalization):
-        ts_event, action, side, price, size, level, exchange, symbol
-        """
+    def _window(self, req: VendorL2Request) -> tuple[str, str]:
+        """Validate ``req`` and return its ET window as ISO strings."""
         # Enforce L2-only usage to avoid unintended vendor costs
         allowed_l2_schemas = {"mbp-1", "mbp-10", "mbp-20", "mbp-50", "book"}
         if req.schema.lower() not in allowed_l2_schemas:
@@ -131,11 +152,10 @@ class DataBentoL2Service:
         et = ZoneInfo("America/New_York")
         start_dt = datetime.combine(req.trading_day, req.start_et, et)
         end_dt = datetime.combine(req.trading_day, req.end_et, et)
-        start_iso = start_dt.isoformat()
-        end_iso = end_dt.isoformat()
-        client = self._make_client()
-        df: pd.DataFrame = self._get_with_backoff(client, req, start_iso, end_iso)
+        return start_dt.isoformat(), end_dt.isoformat()
 
+    @staticmethod
+    def _normalize(df: pd.DataFrame, req: VendorL2Request) -> pd.DataFrame:
         df = df.rename(
             columns={
                 "act": "action",
@@ -157,15 +177,62 @@ class DataBentoL2Service:
             if col not in df.columns:
                 df[col] = default
 
-        return df[
-            [
-                "ts_event",
-                "action",
-                "side",
-                "price",
-                "size",
-                "level",
-                "exchange",
-                "symbol",
-            ]
-        ]
+        return df[_L2_COLUMNS]
+
+    def fetch_l2(self, req: VendorL2Request) -> pd.DataFrame:
+        """Return vendor-native L2 DataFrame with normalized columns.
+
+        Expected output columns (after light normalization):
+        ts_event, action, side, price, size, level, exchange, symbol
+        """
+        start_iso, end_iso = self._window(req)
+        client = self._make_client()
+        df: pd.DataFrame = self._get_with_backoff(client, req, start_iso, end_iso)
+        return self._normalize(df, req)
+
+    async def fetch_l2_async(
+        self,
+        req: VendorL2Request,
+        *,
+        retry: RetryManager | None = None,
+    ) -> pd.DataFrame:
+        """Async :meth:`fetch_l2` with non-blocking backoff.
+
+        The blocking client call runs in a worker thread. Range fetches are
+        billed per request, so they are retried but never hedged.
+        """
+        start_iso, end_iso = self._window(req)
+        retry = retry or _range_retry_manager()
+
+        def attempt() -> pd.DataFrame:
+            try:
+                return self._get_range(self._make_client(), req, start_iso, end_iso)
+            except Exception as e:
+                if _is_invalid_symbol(e):
+                    return pd.DataFrame()
+                raise
+
+        df = await retry.execute_with_retry_async(attempt)
+        return self._normalize(df, req)
+
+
+_range_retry: RetryManager | None = None
+
+
+def _range_retry_manager() -> RetryManager:
+    """Shared manager so retry statistics accumulate across fetches."""
+    global _range_retry
+    if _range_retry is None:
+        base_ms, max_ms = _backoff_bounds_ms()
+        _range_retry = RetryManager(
+            RetryConfig(
+                max_attempts=3,
+                base_delay=base_ms / 1000.0,
+                max_delay=max_ms / 1000.0,
+                strategy=RetryStrategy.JITTERED_EXPONENTIAL,
+                # Same as the sync path: any vendor error is retried
+                retryable_exceptions=[Exception],
+                non_retryable_exceptions=[],
+            )
+        )
+    return _range_retry
@@ -13,6 +13,21 @@ from typing import Any
 import pandas as pd
 import pytz
 
+from .column_buffer import ColumnBuffer
+
+DEPTH_SCHEMA = {
+    "timestamp": "timestamp",
+    "symbol": "str",
+    "bid_price": "float",
+    "ask_price": "float",
+    "bid_size": "float",
+    "ask_size": "float",
+}
+
+
+def _num(value: Any) -> float:
+    return float("nan") if value is None else float(value)
+
 
 class MarketDepthService:
     """
@@ -36,11 +51,16 @@ class MarketDepthService:
 
         # Initialize data storage
         self.tick_data = pd.DataFrame()
-        self.depth_data = pd.DataFrame()
+        self._depth = ColumnBuffer(DEPTH_SCHEMA, tz="US/Eastern")
 
         # Start market depth subscription
         self._setup_market_depth()
 
+    @property
+    def depth_data(self) -> pd.DataFrame:
+        """Depth updates recorded so far (built on access)."""
+        return self._depth.to_frame()
+
     def _setup_market_depth(self) -> None:
         """Setup market depth subscription."""
         try:
@@ -58,19 +78,15 @@ class MarketDepthService:
             # In practice, you'd want more sophisticated processing
             timestamp = datetime.now(pytz.timezone("US/Eastern"))
 
-            # Store basic depth information
-            depth_info = {
-                "timestamp": timestamp,
-                "symbol": self.symbol,
-                "bid_price": getattr(ticker, "bid", None),
-                "ask_price": getattr(ticker, "ask", None),
-                "bid_size": getattr(ticker, "bidSize", None),
-                "ask_size": getattr(ticker, "askSize", None),
-            }
-
-            # Add to storage (in practice, you'd want more efficient storage)
-            new_row = pd.DataFrame([depth_info])
-            self.depth_data = pd.concat([self.depth_data, new_row], ignore_index=True)
+            # Append in place; a DataFrame is only built on access
+            self._depth.append(
+                timestamp,
+                self.symbol,
+                _num(getattr(ticker, "bid", None)),
+                _num(getattr(ticker, "ask", None)),
+                _num(getattr(ticker, "bidSize", None)),
+                _num(getattr(ticker, "askSize", None)),
+            )
 
         except Exception as e:
             print(f"Error processing depth update for {self.symbol}: {e}")
@@ -95,7 +111,7 @@ class MarketDepthService:
         filepath = base_path / filename
 
         # Save data
-        if not self.depth_data.empty:
+        if len(self._depth):
             self.depth_data.to_csv(filepath, index=False)
             return str(filepath)
 
@@ -11,8 +11,10 @@ tests that only import the module (without a live IB connection) won't fail.
 
 from __future__ import annotations
 
+import logging
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import UTC, datetime
+from pathlib import Path
 from time import perf_counter
 from typing import Any, Protocol, runtime_checkable
 
@@ -21,7 +23,10 @@ import pytz
 
 from src.core.config import get_config
 from src.core.error_handler import handle_error
+from src.infra.contract_cache import get_contract_cache
 from src.notifications import get_notification_manager
+from src.services.market_data.column_buffer import ColumnBuffer, arrow_schema
+from src.services.market_data.session_journal import SessionJournal, recover_journals
 
 try:  # Prefer async infra: typed client and contract factories
     from src.infra.contract_factories import stock as _cf_stock
@@ -32,6 +37,8 @@ from typing import Any as _AnyAlias
 
 _real_stock: _AnyAlias | None = _cf_stock
 
+logger = logging.getLogger(__name__)
+
 
 def build_stock(symbol: str, exchange: str = "SMART", currency: str = "USD") -> Any:
     """Create a stock contract via infra when available; else return a stub."""
@@ -67,6 +74,61 @@ except Exception:  # pragma: no cover
         return None
 
 
+DOM_TICK_SCHEMA = {
+    "timestamp": "timestamp",
+    "position": "int",
+    "operation": "int",
+    "side": "int",
+    "price": "float",
+    "size": "float",
+    "market_maker": "str",
+}
+SNAPSHOT_SCHEMA = {
+    "timestamp": "timestamp",
+    "bid_sizes": "float_list",
+    "bid_prices": "float_list",
+    "bid_market_makers": "str_list",
+    "ask_sizes": "float_list",
+    "ask_prices": "float_list",
+    "ask_market_makers": "str_list",
+}
+TICK_SCHEMA = {
+    "timestamp": "timestamp",
+    "price": "float",
+    "size": "float",
+    "exchange": "str",
+    "special_conditions": "str",
+}
+# Rows held in memory per stream before spilling to disk
+SPILL_ROWS = 1_000_000
+
+
+def _journaled_buffer(
+    schema: dict[str, str], path: Path | None, tz: str = "US/Eastern"
+) -> ColumnBuffer:
+    """Buffer whose flushes append to the session file at ``path``."""
+    sink = None
+    if path is not None:
+        try:
+            sink = SessionJournal(path, arrow_schema(schema, tz))
+        except Exception as e:  # noqa: BLE001 - pyarrow missing: memory only
+            logger.warning("session persistence disabled for %s: %s", path, e)
+    return ColumnBuffer(schema, 4096, spill_rows=SPILL_ROWS, sink=sink, tz=tz)
+
+
+def _recover_previous_sessions(directory: Path, symbol: str) -> None:
+    """Finalize journals a crashed session of ``symbol`` left behind."""
+    if not directory.is_dir():
+        return
+    try:
+        recovered = recover_journals(directory)
+    except Exception as e:  # noqa: BLE001 - never block a new session
+        logger.warning("journal recovery failed for %s: %s", directory, e)
+        return
+    if recovered:
+        logger.info("recovered %d session files for %s", len(recovered), symbol)
+
+
 @dataclass(slots=True)
 class _SessionInfo:
     session_id: str
@@ -82,11 +144,13 @@ class MarketDepthManager:
         symbol: str,
         num_levels: int = 20,
         update_interval: float = 0.1,
+        flush_interval: float = 5.0,
     ) -> None:
         self.ib = ib
         self.symbol = symbol
         self.num_levels = num_levels
         self.update_interval = update_interval
+        self.flush_interval = flush_interval
 
         # Optional components (predeclare optionals for type checker)
         self.config: Any | None = None
@@ -104,31 +168,38 @@ class MarketDepthManager:
         self.is_active = False
         self.last_update_time = 0.0
         self.last_save_time = 0.0
+        self.last_flush_time = 0.0
         self.session: _SessionInfo | None = None
-
-        # DataFrames (typed containers)
-        self.market_depth_data: pd.DataFrame = pd.DataFrame(
-            columns=[
-                "timestamp",
-                "bid_sizes",
-                "bid_prices",
-                "bid_market_makers",
-                "ask_sizes",
-                "ask_prices",
-                "ask_market_makers",
-            ]
-        )
-        self.tick_data: pd.DataFrame = pd.DataFrame(
-            columns=[
-                "timestamp",
-                "position",
-                "operation",
-                "side",
-                "price",
-                "size",
-                "market_maker",
-            ]
-        )
+        self.saved_paths: list[Path] = []
+
+        # Appended in place; flushed to the session files every flush_interval
+        self._dom_ticks = ColumnBuffer(DOM_TICK_SCHEMA, tz="US/Eastern")
+        self._snapshots = ColumnBuffer(SNAPSHOT_SCHEMA, tz="US/Eastern")
+
+    @property
+    def tick_data(self) -> pd.DataFrame:
+        """DOM ticks recorded so far (built on access)."""
+        return self._dom_ticks.to_frame()
+
+    @property
+    def market_depth_data(self) -> pd.DataFrame:
+        """Book snapshots recorded so far (built on access)."""
+        return self._snapshots.to_frame()
+
+    def session_paths(self) -> dict[str, Path] | None:
+        """Parquet files this session writes to, or None without a data dir."""
+        if self.session is None or self.config is None:
+            return None
+        try:
+            l2_dir = self.config.get_env("LEVEL2_DIRNAME", "Level2")
+            base = self.config.data_paths.base_path / l2_dir / self.symbol
+        except Exception:  # noqa: BLE001 - config without data paths
+            return None
+        sid = self.session.session_id
+        return {
+            "dom": base / f"{sid}_dom.parquet",
+            "snapshots": base / f"{sid}_snapshots.parquet",
+        }
 
     # ---------------------------------------------------------------------
     # Lifecycle
@@ -138,11 +209,8 @@ class MarketDepthManager:
         if self.is_active:
             return True
         try:
-            self.contract = build_stock(self.symbol, "SMART", "USD")
-            try:
-                self.ib.qualifyContracts(self.contract)
-            except Exception:
-                pass  # Qualification is best-effort in test environments
+            # Cached symbols skip the qualification round trip
+            self.contract = get_contract_cache().qualify(self.ib, self.symbol)
 
             self.ticker = req_mkt_depth(
                 self.ib,
@@ -161,6 +229,12 @@ class MarketDepthManager:
                 session_id=f"{self.symbol}_{start_time.strftime('%Y%m%d_%H%M%S')}",
                 start_time=start_time,
             )
+            paths = self.session_paths() or {}
+            if paths:
+                _recover_previous_sessions(paths["dom"].parent, self.symbol)
+            self._dom_ticks = _journaled_buffer(DOM_TICK_SCHEMA, paths.get("dom"))
+            self._snapshots = _journaled_buffer(SNAPSHOT_SCHEMA, paths.get("snapshots"))
+            self.last_flush_time = perf_counter()
             self.is_active = True
 
             if self.notifications:
@@ -189,11 +263,16 @@ class MarketDepthManager:
                 except Exception:
                     pass
             self.is_active = False
+            self.saved_paths = [
+                p
+                for p in (self._dom_ticks.close(), self._snapshots.close())
+                if p is not None
+            ]
             if self.notifications:
                 self.notifications.send_trading_alert(
                     "MARKET_DATA",
                     self.symbol,
-                    f"Level 2 stopped - {len(self.tick_data)} ticks",
+                    f"Level 2 stopped - {len(self._dom_ticks)} ticks",
                 )
             return True
         except Exception as e:  # noqa: BLE001
@@ -216,63 +295,50 @@ class MarketDepthManager:
             if now - self.last_save_time > 5.0:
                 self._snapshot(ticker)
                 self.last_save_time = now
+            if now - self.last_flush_time >= self.flush_interval:
+                self.flush()
+                self.last_flush_time = now
         except Exception as e:  # noqa: BLE001
             if self.notifications:
                 handle_error(
                     e, context={"symbol": self.symbol, "operation": "depth_update"}
                 )
 
+    def flush(self) -> int:
+        """Append rows received since the last flush to the session files."""
+        return self._dom_ticks.spill() + self._snapshots.spill()
+
     def _process_dom_ticks(self, dom_ticks: Any) -> None:
         if not dom_ticks:
             return
         ts = datetime.now(pytz.timezone("US/Eastern"))
-        rows: list[dict[str, Any]] = []
+        append = self._dom_ticks.append
         for t in dom_ticks:
             try:
-                rows.append(
-                    {
-                        "timestamp": ts,
-                        "position": getattr(t, "position", 0),
-                        "operation": getattr(t, "operation", 0),
-                        "side": getattr(t, "side", 0),
-                        "price": getattr(t, "price", 0.0),
-                        "size": getattr(t, "size", 0.0),
-                        "market_maker": getattr(t, "marketMaker", ""),
-                    }
+                append(
+                    ts,
+                    getattr(t, "position", 0),
+                    getattr(t, "operation", 0),
+                    getattr(t, "side", 0),
+                    getattr(t, "price", 0.0),
+                    getattr(t, "size", 0.0),
+                    getattr(t, "marketMaker", ""),
                 )
             except Exception:
                 continue
-        if rows:
-            self.tick_data = pd.concat(
-                [self.tick_data, pd.DataFrame(rows)], ignore_index=True
-            )
 
     def _snapshot(self, ticker: Any) -> None:
         try:
-            if not self.data_repo or not self.session:
-                return
-            bids = list(getattr(ticker, "domBids", []) or [])
-            asks = list(getattr(ticker, "domAsks", []) or [])
-            snap = {
-                "timestamp": datetime.now(pytz.timezone("US/Eastern")),
-                "bid_sizes": [getattr(b, "size", 0) for b in bids[: self.num_levels]],
-                "bid_prices": [
-                    getattr(b, "price", 0.0) for b in bids[: self.num_levels]
-                ],
-                "bid_market_makers": [
-                    getattr(b, "marketMaker", "") for b in bids[: self.num_levels]
-                ],
-                "ask_sizes": [getattr(a, "size", 0) for a in asks[: self.num_levels]],
-                "ask_prices": [
-                    getattr(a, "price", 0.0) for a in asks[: self.num_levels]
-                ],
-                "ask_market_makers": [
-                    getattr(a, "marketMaker", "") for a in asks[: self.num_levels]
-                ],
-            }
-            df = pd.DataFrame([snap])
-            self.data_repo.save_data(
-                df, self.symbol, "level2_snapshots", self.session.session_id
+            bids = list(getattr(ticker, "domBids", []) or [])[: self.num_levels]
+            asks = list(getattr(ticker, "domAsks", []) or [])[: self.num_levels]
+            self._snapshots.append(
+                datetime.now(pytz.timezone("US/Eastern")),
+                [float(getattr(b, "size", 0)) for b in bids],
+                [float(getattr(b, "price", 0.0)) for b in bids],
+                [str(getattr(b, "marketMaker", "")) for b in bids],
+                [float(getattr(a, "size", 0)) for a in asks],
+                [float(getattr(a, "price", 0.0)) for a in asks],
+                [str(getattr(a, "marketMaker", "")) for a in asks],
             )
         except Exception as e:  # noqa: BLE001
             if self.notifications:
@@ -288,15 +354,9 @@ class TickByTickManager:
         self.ib = ib
         self.symbol = symbol
         self.config: Any | None = None
-        self.data_repo: Any | None = None
         self.notifications: Any | None = None
         try:
             self.config = get_config()
-            from src.data.parquet_repository import ParquetRepository
-
-            # Avoid calling an untyped constructor in a typed context.
-            repo_cls: Any = ParquetRepository
-            self.data_repo = repo_cls()
             self.notifications = get_notification_manager()
         except Exception:  # pragma: no cover
             pass
@@ -304,19 +364,33 @@ class TickByTickManager:
         self.ticker: Any | None = None
         self.is_active = False
         self.tick_type: str | None = None
-        self.tick_data: pd.DataFrame = pd.DataFrame(
-            columns=["timestamp", "price", "size", "exchange", "special_conditions"]
-        )
+        self.session_id: str | None = None
+        self.saved_path: Path | None = None
+        # Appended in place; every SPILL_ROWS rows go to the session file
+        self._ticks = ColumnBuffer(TICK_SCHEMA)
+
+    @property
+    def tick_data(self) -> pd.DataFrame:
+        """Ticks recorded so far (built on access)."""
+        return self._ticks.to_frame()
+
+    def session_path(self) -> Path | None:
+        """Parquet file this session writes to, or None without a data dir."""
+        if self.session_id is None or self.config is None:
+            return None
+        try:
+            ticks_dir = self.config.get_env("TICKS_DIRNAME", "TickByTick")
+            base = self.config.data_paths.base_path / ticks_dir / self.symbol
+        except Exception:  # noqa: BLE001 - config without data paths
+            return None
+        return base / f"{self.session_id}_ticks.parquet"
 
     def start(self, tick_type: str = "AllLast") -> bool:
         if self.is_active:
             return True
         try:
-            self.contract = build_stock(self.symbol, "SMART", "USD")
-            try:
-                self.ib.qualifyContracts(self.contract)
-            except Exception:
-                pass
+            # Cached symbols skip the qualification round trip
+            self.contract = get_contract_cache().qualify(self.ib, self.symbol)
             self.ticker = req_tick_by_tick_data(
                 self.ib,
                 self.contract,
@@ -330,6 +404,13 @@ class TickByTickManager:
                 except Exception:
                     pass
             self.tick_type = tick_type
+            self.session_id = (
+                f"{self.symbol}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            )
+            path = self.session_path()
+            if path is not None:
+                _recover_previous_sessions(path.parent, self.symbol)
+            self._ticks = _journaled_buffer(TICK_SCHEMA, path, tz="UTC")
             self.is_active = True
             return True
         except Exception as e:  # noqa: BLE001
@@ -350,12 +431,9 @@ class TickByTickManager:
                     )
                 except Exception:
                     pass
-            if self.data_repo and not self.tick_data.empty:
-                sid = datetime.now().strftime("%Y%m%d_%H%M%S")
-                self.data_repo.save_data(
-                    self.tick_data, self.symbol, "tick_by_tick", sid
-                )
             self.is_active = False
+            # Writes only the unflushed tail; earlier rows are already on disk
+            self.saved_path = self._ticks.close()
             return True
         except Exception as e:  # noqa: BLE001
             if self.notifications:
@@ -369,20 +447,14 @@ class TickByTickManager:
             ticks = getattr(ticker, "ticks", []) or []
             if not ticks:
                 return
-            rows: list[dict[str, Any]] = []
+            append = self._ticks.append
             for t in ticks:
-                rows.append(
-                    {
-                        "timestamp": getattr(t, "time", datetime.now()),
-                        "price": getattr(t, "price", 0.0),
-                        "size": getattr(t, "size", 0.0),
-                        "exchange": getattr(t, "exchange", ""),
-                        "special_conditions": getattr(t, "specialConditions", ""),
-                    }
-                )
-            if rows:
-                self.tick_data = pd.concat(
-                    [self.tick_data, pd.DataFrame(rows)], ignore_index=True
+                append(
+                    getattr(t, "time", None) or datetime.now(UTC),
+                    getattr(t, "price", 0.0),
+                    getattr(t, "size", 0.0),
+                    getattr(t, "exchange", ""),
+                    getattr(t, "specialConditions", ""),
                 )
         except Exception as e:  # noqa: BLE001
             if self.notifications:
@@ -0,0 +1,371 @@
+"""Plan IB historical bar requests for long backfill ranges.
+
+``plan_requests`` turns (symbols, bar size, date range, already-covered
+intervals) into the smallest set of IB-legal request windows:
+
+1. per trading day, the session window minus what the coverage manifest
+   already has gives the gaps;
+2. gaps are covered greedily from the earliest uncovered point by windows no
+   longer than IB's maximum duration for the bar size (1 secs: 1800 S,
+   1 min: 1 D, ...), merging neighbouring gaps (also across days) when one
+   window reaches them. Greedy from the left is optimal for covering points
+   with fixed-length windows;
+3. windows are interleaved round-robin across symbols so the
+   same-contract pacing rule (six per 2 s) does not bind while the 60 per
+   10 minutes budget is being spent.
+
+The plan carries an estimated completion time, simulated against the shared
+pacing governor's limits. ``execute_plan`` runs a plan through a fetch
+callback and records each completed window in a checkpoint file, so an
+interrupted backfill resumes where it stopped.
+"""
+
+from __future__ import annotations
+
+import inspect
+import itertools
+import json
+import logging
+import math
+import re
+from collections.abc import Awaitable, Callable, Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from pathlib import Path
+from typing import Any
+
+from src.infra.ib_pacing import PacingGovernor, PacingLimits, contract_key, request_key
+from src.services.trading_calendar import get_trading_calendar
+
+logger = logging.getLogger(__name__)
+
+Interval = tuple[datetime, datetime]
+
+RTH = (time(9, 30), time(16, 0))
+DEFAULT_REQUEST_SECONDS = 2.0  # typical round trip for one historical request
+_DAY = 86_400
+
+# IB's longest duration per bar size ("Historical data limitations")
+MAX_DURATION_SECONDS: dict[str, int] = {
+    "1 secs": 1_800,
+    "5 secs": 3_600,
+    "10 secs": 14_400,
+    "15 secs": 14_400,
+    "30 secs": 28_800,
+    "1 min": _DAY,
+    "2 mins": 2 * _DAY,
+    "3 mins": 7 * _DAY,
+    "5 mins": 7 * _DAY,
+    "10 mins": 7 * _DAY,
+    "15 mins": 7 * _DAY,
+    "20 mins": 7 * _DAY,
+    "30 mins": 30 * _DAY,
+    "1 hour": 30 * _DAY,
+    "2 hours": 30 * _DAY,
+    "3 hours": 30 * _DAY,
+    "4 hours": 30 * _DAY,
+    "8 hours": 30 * _DAY,
+    "1 day": 365 * _DAY,
+}
+
+_BAR = re.compile(r"^\s*(\d+)\s*([a-z]+)\s*$", re.IGNORECASE)
+_UNITS = {"sec": "secs", "min": "min", "hour": "hour", "day": "day"}
+
+
+def normalize_bar_size(bar_size: str) -> str:
+    """IB spelling of ``bar_size``: ``"1 sec"`` -> ``"1 secs"``, ``"5 min"`` -> ``"5 mins"``."""
+    m = _BAR.match(bar_size)
+    if not m:
+        raise ValueError(f"Unrecognized bar size: {bar_size!r}")
+    n, unit = int(m.group(1)), m.group(2).lower()
+    base = next((v for k, v in _UNITS.items() if unit.startswith(k)), None)
+    if base is None:
+        raise ValueError(f"Unrecognized bar size: {bar_size!r}")
+    if base != "secs" and n > 1:
+        base += "s"
+    normalized = f"{n} {base}"
+    if normalized not in MAX_DURATION_SECONDS:
+        raise ValueError(f"Bar size not supported by IB: {bar_size!r}")
+    return normalized
+
+
+def ib_duration(start: datetime, end: datetime) -> str:
+    """IB duration string for bars in ``(start, end]``.
+
+    Up to a day it is exact seconds (``S``). IB counts ``D`` in trading
+    days back from the end, so longer spans count the sessions they touch
+    rather than calendar days (a Friday-to-Tuesday window is ``3 D``, not
+    ``5 D``).
+    """
+    seconds = (end - start).total_seconds()
+    if seconds <= _DAY:
+        return f"{max(1, math.ceil(seconds))} S"
+    return f"{max(1, len(_trading_days(start.date(), end.date())))} D"
+
+
+@dataclass(frozen=True)
+class RequestWindow:
+    """One historical request: bars in ``(start, end]`` for ``symbol``."""
+
+    symbol: str
+    bar_size: str
+    start: datetime
+    end: datetime
+
+    @property
+    def duration(self) -> str:
+        return ib_duration(self.start, self.end)
+
+    @property
+    def end_datetime(self) -> str:
+        """``endDateTime`` in the format the backfill tools pass to IB."""
+        return self.end.strftime("%Y%m%d %H:%M:%S")
+
+    @property
+    def key(self) -> str:
+        """Stable identity, used for plan checkpoints."""
+        return f"{self.symbol}|{self.bar_size}|{self.end.isoformat()}|{self.duration}"
+
+    def to_dict(self) -> dict[str, str]:
+        return {
+            "symbol": self.symbol,
+            "bar_size": self.bar_size,
+            "start": self.start.isoformat(),
+            "end": self.end.isoformat(),
+            "duration": self.duration,
+            "end_datetime": self.end_datetime,
+        }
+
+
+@dataclass
+class RequestPlan:
+    bar_size: str
+    windows: list[RequestWindow]
+    estimated_seconds: float
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "bar_size": self.bar_size,
+            "requests": len(self.windows),
+            "estimated_seconds": round(self.estimated_seconds, 1),
+            "windows": [w.to_dict() for w in self.windows],
+        }
+
+
+def merge_intervals(intervals: Iterable[Interval]) -> list[Interval]:
+    """Sorted union of ``intervals`` (touching intervals are merged)."""
+    merged: list[Interval] = []
+    for s, e in sorted(i for i in intervals if i[1] > i[0]):
+        if merged and s <= merged[-1][1]:
+            if e > merged[-1][1]:
+                merged[-1] = (merged[-1][0], e)
+        else:
+            merged.append((s, e))
+    return merged
+
+
+def subtract_intervals(target: Interval, covered: Sequence[Interval]) -> list[Interval]:
+    """Parts of ``target`` not in ``covered`` (which must be merged/sorted)."""
+    gaps: list[Interval] = []
+    cursor, end = target
+    for s, e in covered:
+        if e <= cursor:
+            continue
+        if s >= end:
+            break
+        if s > cursor:
+            gaps.append((cursor, s))
+        cursor = max(cursor, e)
+    if cursor < end:
+        gaps.append((cursor, end))
+    return gaps
+
+
+def windows_for_gaps(
+    symbol: str, bar_size: str, gaps: Iterable[Interval]
+) -> list[RequestWindow]:
+    """Fewest windows of at most IB's max duration covering every gap."""
+    bar_size = normalize_bar_size(bar_size)
+    max_span = timedelta(seconds=MAX_DURATION_SECONDS[bar_size])
+    out: list[RequestWindow] = []
+    ws: datetime | None = None
+    we: datetime | None = None
+    for s, e in merge_intervals(gaps):
+        while True:
+            if ws is None or we is None:
+                ws = we = s
+            limit = ws + max_span
+            if e <= limit:
+                we = e
+                break
+            if s < limit:  # the gap overflows this window; continue from limit
+                out.append(RequestWindow(symbol, bar_size, ws, limit))
+                s = limit
+            else:  # the gap starts beyond this window
+                out.append(RequestWindow(symbol, bar_size, ws, we))
+            ws = we = None
+    if ws is not None and we is not None and we > ws:
+        out.append(RequestWindow(symbol, bar_size, ws, we))
+    return out
+
+
+def _naive(value: str) -> datetime:
+    # Coverage times are ET-relative by convention; drop any offset
+    return datetime.fromisoformat(value.rstrip("Z")).replace(tzinfo=None)
+
+
+def covered_from_coverage(
+    coverage: Mapping[str, Any], bar_size: str
+) -> dict[str, list[Interval]]:
+    """Covered intervals per symbol from a ``bars_coverage.v1`` manifest."""
+    wanted = normalize_bar_size(bar_size)
+    out: dict[str, list[Interval]] = {}
+    for entry in coverage.get("entries", []):
+        try:
+            if normalize_bar_size(str(entry.get("bar_size", ""))) != wanted:
+                continue
+        except ValueError:
+            continue
+        spans = out.setdefault(str(entry.get("symbol", "")).upper(), [])
+        for day in entry.get("days", []):
+            try:
+                spans.append((_naive(day["time_start"]), _naive(day["time_end"])))
+            except (KeyError, TypeError, ValueError):
+                continue
+    return {sym: merge_intervals(spans) for sym, spans in out.items()}
+
+
+def load_coverage(path: Path) -> dict[str, Any]:
+    """Read ``bars_coverage_manifest.json``; empty when missing."""
+    if not path.exists():
+        return {"entries": []}
+    return json.loads(path.read_text())
+
+
+def _trading_days(start: date, end: date) -> list[date]:
+    """NYSE sessions from the calendar index; weekdays when it is unavailable."""
+    index = get_trading_calendar()
+    if index is not None and index.covers(start) and index.covers(end):
+        return index.trading_days(start, end).tolist()
+    return [
+        start + timedelta(days=i)
+        for i in range((end - start).days + 1)
+        if (start + timedelta(days=i)).weekday() < 5
+    ]
+
+
+def estimate_completion(
+    windows: Sequence[RequestWindow],
+    request_seconds: float = DEFAULT_REQUEST_SECONDS,
+    limits: PacingLimits | None = None,
+) -> float:
+    """Seconds to run ``windows`` sequentially under the IB pacing limits."""
+    clock = [0.0]
+
+    def advance(seconds: float) -> None:
+        clock[0] += seconds
+
+    governor = PacingGovernor(limits=limits, clock=lambda: clock[0])
+    for w in windows:
+        key = contract_key(w.symbol)
+        request = request_key(
+            key, w.bar_size, end_datetime=w.end_datetime, duration=w.duration
+        )
+        governor.acquire(key, bar_size=w.bar_size, request=request, sleep=advance)
+        advance(request_seconds)
+    return clock[0]
+
+
+def plan_requests(
+    symbols: Iterable[str],
+    bar_size: str,
+    start: date,
+    end: date,
+    *,
+    covered: Mapping[str, Sequence[Interval]] | None = None,
+    session: tuple[time, time] = RTH,
+    days: Iterable[date] | None = None,
+    request_seconds: float = DEFAULT_REQUEST_SECONDS,
+) -> RequestPlan:
+    """Minimal, pacing-friendly request windows for a backfill.
+
+    Args:
+        symbols: Symbols to backfill.
+        bar_size: IB bar size (``"1 sec"``/``"1 secs"``, ``"1 min"``, ...).
+        start, end: Inclusive date range.
+        covered: Already-covered intervals per symbol, e.g. from
+            :func:`covered_from_coverage`.
+        session: Daily window to cover (default RTH).
+        days: Trading days to use; defaults to the exchange sessions in the
+            range (weekdays without the calendar index).
+        request_seconds: Expected round trip per request, for the estimate.
+    """
+    bar_size = normalize_bar_size(bar_size)
+    covered = covered or {}
+    trading_days = sorted(
+        d for d in (days or _trading_days(start, end)) if start <= d <= end
+    )
+    targets = [
+        (datetime.combine(d, session[0]), datetime.combine(d, session[1]))
+        for d in trading_days
+    ]
+    per_symbol: list[list[RequestWindow]] = []
+    for symbol in dict.fromkeys(s.upper() for s in symbols):
+        have = merge_intervals(covered.get(symbol, ()))
+        gaps = [g for t in targets for g in subtract_intervals(t, have)]
+        per_symbol.append(windows_for_gaps(symbol, bar_size, gaps))
+    windows = [
+        w
+        for batch in itertools.zip_longest(*per_symbol)
+        for w in batch
+        if w is not None
+    ]
+    return RequestPlan(bar_size, windows, estimate_completion(windows, request_seconds))
+
+
+class PlanCheckpoint:
+    """Append-only record of completed window keys (one per line)."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.done: set[str] = set()
+        if path.exists():
+            self.done = {line.strip() for line in path.read_text().splitlines()}
+            self.done.discard("")
+
+    def mark(self, key: str) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a", encoding="utf-8") as fh:
+            fh.write(key + "\n")
+        self.done.add(key)
+
+
+async def execute_plan(
+    plan: RequestPlan,
+    fetch: Callable[[RequestWindow], Awaitable[bool] | bool],
+    checkpoint: Path | None = None,
+) -> dict[str, int]:
+    """Run ``fetch`` for each window not yet in ``checkpoint``.
+
+    ``fetch`` may be sync or async; returning False (or raising) leaves the
+    window unrecorded so the next run retries it.
+    """
+    state = PlanCheckpoint(checkpoint) if checkpoint is not None else None
+    counts = {"completed": 0, "skipped": 0, "failed": 0}
+    for window in plan.windows:
+        if state is not None and window.key in state.done:
+            counts["skipped"] += 1
+            continue
+        try:
+            result = fetch(window)
+            ok = await result if inspect.isawaitable(result) else result
+        except Exception as e:  # noqa: BLE001 - one window must not stop the plan
+            logger.warning("request %s failed: %s", window.key, e)
+            ok = False
+        if ok is False:
+            counts["failed"] += 1
+            continue
+        counts["completed"] += 1
+        if state is not None:
+            state.mark(window.key)
+    return counts
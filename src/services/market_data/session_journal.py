@@ -0,0 +1,124 @@
+"""Append-only per-session journal for streaming capture.
+
+A recording session writes its rows through one ``SessionJournal`` per data
+kind (DOM ticks, L2 snapshots). While the session is open each flush is
+appended as a record batch to an Arrow IPC stream next to the target file
+(``<name>.arrows``) and flushed to the OS, so persistence cost is proportional
+to the new rows only and a crash leaves every completed flush readable: the
+stream format needs no footer. ``close`` rewrites the stream once into the
+final Parquet file, one row group per flush, and removes the journal.
+
+``recover_journals`` finalizes journals left behind by a crashed session.
+"""
+
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+from typing import Any
+
+from src.services.market_data.column_buffer import PYARROW_AVAILABLE, pa, pq
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_SUFFIX = ".arrows"
+
+
+def _read_batches(path: Path) -> tuple[Any, list[Any]]:
+    """Schema and every complete batch in a (possibly truncated) stream."""
+    batches: list[Any] = []
+    with pa.OSFile(str(path), "rb") as source:
+        reader = pa.ipc.open_stream(source)
+        while True:
+            try:
+                batches.append(reader.read_next_batch())
+            except StopIteration:
+                break
+            except (pa.ArrowInvalid, OSError) as e:
+                logger.warning(
+                    "journal %s truncated after %d batches: %s", path, len(batches), e
+                )
+                break
+    return reader.schema, batches
+
+
+def _finalize(journal: Path, dest: Path) -> int:
+    """Rewrite ``journal`` as Parquet at ``dest``; returns rows written."""
+    schema, batches = _read_batches(journal)
+    tmp = dest.with_suffix(dest.suffix + ".tmp")
+    with pq.ParquetWriter(tmp, schema) as writer:
+        for batch in batches:
+            writer.write_batch(batch)  # one row group per flush
+    tmp.replace(dest)
+    journal.unlink()
+    return sum(b.num_rows for b in batches)
+
+
+class SessionJournal:
+    """``ColumnBuffer`` sink that appends flushes to one per-session file.
+
+    Args:
+        path: Final Parquet file; the journal lives at ``path`` with the
+            ``.arrows`` suffix until ``close``.
+        schema: Arrow schema of every batch.
+    """
+
+    def __init__(self, path: Path | str, schema: Any) -> None:
+        if not PYARROW_AVAILABLE:
+            raise RuntimeError("pyarrow is required for session journals")
+        self.path = Path(path)
+        self.journal_path = self.path.with_suffix(JOURNAL_SUFFIX)
+        self.schema = schema
+        self.rows = 0
+        self.flushes = 0
+        self.closed = False
+        self._sink: Any = None
+        self._writer: Any = None
+
+    def write(self, table: Any) -> None:
+        if self.closed:
+            raise RuntimeError(f"journal {self.path} is closed")
+        if self._writer is None:
+            self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+            self._sink = pa.OSFile(str(self.journal_path), "wb")
+            self._writer = pa.ipc.new_stream(self._sink, self.schema)
+        self._writer.write_table(table)
+        self._sink.flush()
+        self.rows += table.num_rows
+        self.flushes += 1
+
+    def read(self) -> Any:
+        """Everything written so far, as an Arrow table."""
+        if self.closed and self.path.exists():
+            return pq.read_table(self.path)
+        if self._writer is None:
+            return self.schema.empty_table()
+        _, batches = _read_batches(self.journal_path)
+        return pa.Table.from_batches(batches, schema=self.schema)
+
+    def close(self) -> Path | None:
+        """Finish the journal and write the Parquet file (None if empty)."""
+        if self.closed:
+            return self.path if self.path.exists() else None
+        self.closed = True
+        if self._writer is None:
+            return None
+        self._writer.close()
+        self._sink.close()
+        _finalize(self.journal_path, self.path)
+        return self.path
+
+
+def recover_journals(root: Path | str) -> list[Path]:
+    """Finalize journals under ``root`` left open by a crashed session."""
+    recovered = []
+    for journal in sorted(Path(root).rglob(f"*{JOURNAL_SUFFIX}")):
+        dest = journal.with_suffix(".parquet")
+        try:
+            rows = _finalize(journal, dest)
+        except Exception as e:  # noqa: BLE001
+            logger.warning("could not recover %s: %s", journal, e)
+            continue
+        logger.info("recovered %d rows from %s", rows, journal)
+        recovered.append(dest)
+    return recovered
@@ -15,11 +15,10 @@ import threading
 import time
 from collections import defaultdict, deque
 from collections.abc import Callable
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from queue import Empty, Full, Queue
 from typing import Any
 
 import pandas as pd
@@ -30,6 +29,13 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from src.core.config import get_config
 from src.core.integrated_error_handling import with_error_handling
 from src.data.parquet_repository import ParquetRepository
+from src.services.tick_engine import (
+    DEFAULT_CONFLATION_INTERVAL,
+    DEFAULT_QUEUE_SIZE,
+    DEFAULT_SHARDS,
+    ShardedTickEngine,
+    SnapshotConflator,
+)
 
 
 class MarketDataType(Enum):
@@ -140,17 +146,52 @@ class StreamConfig:
     timeout: float = 30.0
 
 
-class MarketDataService:
-    """Modern market data service with enterprise features"""
+def _to_int_or_none(value: float) -> int | None:
+    return int(value) if value else None
+
+
+def _identity(value: float) -> float:
+    return value
+
+
+# Tick type -> (snapshot attribute, value transform), built once
+SNAPSHOT_FIELDS: dict[TickType, tuple[str, Callable[[float], Any]]] = {
+    TickType.BID_PRICE: ("bid_price", _identity),
+    TickType.BID_SIZE: ("bid_size", _to_int_or_none),
+    TickType.ASK_PRICE: ("ask_price", _identity),
+    TickType.ASK_SIZE: ("ask_size", _to_int_or_none),
+    TickType.LAST_PRICE: ("last_price", _identity),
+    TickType.LAST_SIZE: ("last_size", _to_int_or_none),
+    TickType.VOLUME: ("volume", _to_int_or_none),
+    TickType.HIGH: ("high", _identity),
+    TickType.LOW: ("low", _identity),
+    TickType.OPEN: ("open", _identity),
+    TickType.CLOSE: ("close", _identity),
+}
 
-    def __init__(self):
+
+class MarketDataService:
+    """Modern market data service with enterprise features
+
+    Ticks are processed by a ``ShardedTickEngine`` (one bounded queue and
+    worker per shard, symbols hashed to shards) and snapshot handlers are
+    called through a ``SnapshotConflator`` at most once per
+    ``conflation_interval`` per symbol (0 = on every tick).
+    """
+
+    def __init__(
+        self,
+        *,
+        shards: int = DEFAULT_SHARDS,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        conflation_interval: float = DEFAULT_CONFLATION_INTERVAL,
+    ):
         self.config = get_config()
         self.parquet_repo = ParquetRepository()
         self.logger = logging.getLogger(__name__)
 
         # Streaming infrastructure
         self.active_streams: dict[str, StreamConfig] = {}
-        self.market_data_queue = Queue(maxsize=10000)
         self.snapshots: dict[str, MarketDataSnapshot] = {}
         self.tick_history: dict[str, deque] = defaultdict(lambda: deque(maxlen=1000))
 
@@ -158,6 +199,15 @@ class MarketDataService:
         self.tick_handlers: list[Callable[[MarketDataTick], None]] = []
         self.snapshot_handlers: list[Callable[[MarketDataSnapshot], None]] = []
 
+        # Processing engine
+        self.engine = ShardedTickEngine(
+            self._process_tick,
+            shards=shards,
+            queue_size=queue_size,
+            name="market_data_ticks",
+        )
+        self.conflator = SnapshotConflator(self.snapshot_handlers, conflation_interval)
+
         # Performance tracking
         self.stream_stats = {
             "active_streams": 0,
@@ -169,9 +219,6 @@ class MarketDataService:
             "reconnections": 0,
         }
 
-        # Threading
-        self.processing_thread = None
-        self.running = False
         self._lock = threading.Lock()
 
     @with_error_handling("market_data")
@@ -190,7 +237,7 @@ class MarketDataService:
                     f"Failed to create contract for {stream_config.symbol}"
                 )
 
-            # Start streaming thread if not running
+            # Start processing workers if not running
             if not self.running:
                 self._start_processing_thread()
 
@@ -297,120 +344,62 @@ class MarketDataService:
         """Add callback for snapshot updates"""
         self.snapshot_handlers.append(handler)
 
+    @property
+    def running(self) -> bool:
+        return self.engine.running
+
+    def submit_tick(self, tick: MarketDataTick) -> bool:
+        """Queue a tick for processing; False when its shard queue is full."""
+        return self.engine.submit(tick)
+
     def _start_processing_thread(self):
-        """Start the market data processing thread"""
+        """Start the tick workers and the snapshot conflator"""
 
         if not self.running:
-            self.running = True
-            self.processing_thread = threading.Thread(
-                target=self._process_market_data, daemon=True
+            self.engine.start()
+            self.conflator.start()
+            self.logger.info(
+                f"Market data processing started ({self.engine.shards} shards)"
             )
-            self.processing_thread.start()
-            self.logger.info("Market data processing thread started")
 
     def _stop_processing_thread(self):
-        """Stop the market data processing thread"""
+        """Stop the tick workers and deliver pending snapshots"""
 
         if self.running:
-            self.running = False
-            if self.processing_thread:
-                self.processing_thread.join(timeout=5.0)
-            self.logger.info("Market data processing thread stopped")
-
-    def _process_market_data(self):
-        """Main processing loop for market data"""
-
-        last_stats_update = time.time()
-        tick_count_window = []
-
-        while self.running:
-            try:
-                # Process queued ticks
-                try:
-                    tick = self.market_data_queue.get(timeout=0.1)
-                    self._process_tick(tick)
-
-                    # Update statistics
-                    self.stream_stats["total_ticks_received"] += 1
-                    self.stream_stats["last_tick_time"] = datetime.now()
-
-                    # Track ticks per second
-                    current_time = time.time()
-                    tick_count_window.append(current_time)
-
-                    # Update TPS every second
-                    if current_time - last_stats_update >= 1.0:
-                        # Count ticks in last second
-                        cutoff_time = current_time - 1.0
-                        tick_count_window = [
-                            t for t in tick_count_window if t > cutoff_time
-                        ]
-                        self.stream_stats["ticks_per_second"] = len(tick_count_window)
-                        last_stats_update = current_time
-
-                except Empty:
-                    continue  # No ticks to process
-
-            except Exception as e:
-                self.stream_stats["errors"] += 1
-                self.logger.error(f"Error processing market data: {e}")
-                time.sleep(0.1)  # Brief pause on error
+            self.engine.stop()
+            self.conflator.stop()
+            self.logger.info("Market data processing stopped")
 
     def _process_tick(self, tick: MarketDataTick):
-        """Process a single market data tick"""
+        """Process a single market data tick (on its shard's worker)"""
 
-        try:
-            # Update snapshot
-            with self._lock:
-                snapshot = self.snapshots.get(tick.symbol)
-                if snapshot:
-                    self._update_snapshot(snapshot, tick)
+        self.stream_stats["last_tick_time"] = tick.timestamp
 
-                    # Store in tick history
-                    self.tick_history[tick.symbol].append(tick)
+        # Update snapshot; handlers get a copy so they never see a torn one
+        with self._lock:
+            snapshot = self.snapshots.get(tick.symbol)
+            if snapshot:
+                self._update_snapshot(snapshot, tick)
+                snapshot = replace(snapshot)
 
-            # Call tick handlers
-            for handler in self.tick_handlers:
-                try:
-                    handler(tick)
-                except Exception as e:
-                    self.logger.error(f"Error in tick handler: {e}")
+                # Store in tick history
+                self.tick_history[tick.symbol].append(tick)
 
-            # Call snapshot handlers
-            if snapshot:
-                for handler in self.snapshot_handlers:
-                    try:
-                        handler(snapshot)
-                    except Exception as e:
-                        self.logger.error(f"Error in snapshot handler: {e}")
+        # Call tick handlers
+        for handler in self.tick_handlers:
+            try:
+                handler(tick)
+            except Exception as e:
+                self.logger.error(f"Error in tick handler: {e}")
 
-        except Exception as e:
-            self.logger.error(f"Error processing tick for {tick.symbol}: {e}")
+        # Snapshot handlers see the latest state at the conflation rate
+        if snapshot:
+            self.conflator.offer(tick.symbol, snapshot)
 
-    def _update_snapshot(self, snapshot: MarketDataSnapshot, tick: MarketDataTick):  # noqa: C901
+    def _update_snapshot(self, snapshot: MarketDataSnapshot, tick: MarketDataTick):
         """Update market data snapshot with new tick"""
-        # Update timestamp first
         snapshot.timestamp = tick.timestamp
-
-        # Map tick types to snapshot attributes and value transforms
-        def _to_int_or_none(v):
-            return int(v) if v else None
-
-        actions = {
-            TickType.BID_PRICE: ("bid_price", lambda v: v),
-            TickType.BID_SIZE: ("bid_size", _to_int_or_none),
-            TickType.ASK_PRICE: ("ask_price", lambda v: v),
-            TickType.ASK_SIZE: ("ask_size", _to_int_or_none),
-            TickType.LAST_PRICE: ("last_price", lambda v: v),
-            TickType.LAST_SIZE: ("last_size", _to_int_or_none),
-            TickType.VOLUME: ("volume", _to_int_or_none),
-            TickType.HIGH: ("high", lambda v: v),
-            TickType.LOW: ("low", lambda v: v),
-            TickType.OPEN: ("open", lambda v: v),
-            TickType.CLOSE: ("close", lambda v: v),
-        }
-
-        attr_transform = actions.get(tick.tick_type)
+        attr_transform = SNAPSHOT_FIELDS.get(tick.tick_type)
         if attr_transform:
             attr, transform = attr_transform
             setattr(snapshot, attr, transform(tick.value))
@@ -476,16 +465,9 @@ class MarketDataService:
                             ),
                         ]
 
-                        # Queue ticks
+                        # Queue ticks (full shards drop and count)
                         for tick in ticks:
-                            try:
-                                self.market_data_queue.put_nowait(tick)
-                            except Full:
-                                # Fallback to blocking put with short timeout; drop if still full
-                                try:
-                                    self.market_data_queue.put(tick, timeout=0.01)
-                                except Full:
-                                    pass
+                            self.submit_tick(tick)
 
                         # Update base price slowly
                         base_price += random.uniform(-0.01, 0.01)
@@ -566,6 +548,15 @@ class MarketDataService:
         """Get comprehensive streaming statistics"""
 
         stats = self.stream_stats.copy()
+        engine = self.engine.stats()
+        stats["total_ticks_received"] = engine["processed"]
+        stats["ticks_per_second"] = engine["ticks_per_second"]
+        stats["ticks_dropped"] = engine["dropped"]
+        stats["queue_depth"] = engine["queue_depth"]
+        stats["queue_lag_ms"] = engine["queue_lag_ms"]
+        stats["queue_lag_max_ms"] = engine["queue_lag_max_ms"]
+        stats["errors"] += engine["errors"]
+        stats["snapshots_conflated"] = self.conflator.stats()["conflated"]
 
         # Add derived metrics
         if stats["stream_start_time"]:
@@ -597,7 +588,9 @@ class MarketDataService:
             f"📊 Snapshots: {stats['snapshot_count']}",
             f"📈 Total Ticks: {stats['total_ticks_received']:,}",
             f"⚡ Current TPS: {stats['ticks_per_second']:.1f}",
-            f"📋 Queue Size: {self.market_data_queue.qsize()}",
+            f"📋 Queue Size: {stats['queue_depth']} "
+            f"(lag {stats['queue_lag_ms']:.1f} ms, max {stats['queue_lag_max_ms']:.1f} ms)",
+            f"🗑️ Dropped Ticks: {stats['ticks_dropped']:,}",
             f"❌ Errors: {stats['errors']}",
         ]
 
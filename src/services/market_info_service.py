@@ -12,6 +12,8 @@ from typing import Any
 
 import pandas as pd
 
+from .trading_calendar import TradingCalendarIndex, get_trading_calendar
+
 try:
     import pandas_market_calendars as market_cal
 except ImportError:
@@ -34,7 +36,13 @@ except ImportError:
 
 
 class MarketInfo:
-    """Market information and calendar management"""
+    """Market information and calendar management
+
+    Day lookups use the shared ``TradingCalendarIndex`` (O(1) per date) when
+    the date is inside its range, and the schedule DataFrame otherwise.
+    """
+
+    calendar_index: TradingCalendarIndex | None
 
     def __init__(self, stock_market: str = "NYSE"):
         self.stock_market = stock_market
@@ -42,6 +50,7 @@ class MarketInfo:
 
     def _initialize_calendar(self):
         """Initialize market calendar"""
+        self.calendar_index = None
         if market_cal is None:
             print(
                 f"Warning: Market calendar functionality unavailable for {self.stock_market}"
@@ -51,9 +60,15 @@ class MarketInfo:
         else:
             try:
                 self.calendar = market_cal.get_calendar(self.stock_market)
-                self.market_schedule = self.calendar.schedule(
-                    start_date="2012-07-01", end_date="2030-01-01"
-                )
+                self.calendar_index = get_trading_calendar(self.stock_market)
+                if self.calendar_index is not None:
+                    self.market_schedule = self.calendar_index.schedule(
+                        "2012-07-01", "2030-01-01"
+                    )
+                else:
+                    self.market_schedule = self.calendar.schedule(
+                        start_date="2012-07-01", end_date="2030-01-01"
+                    )
             except Exception as e:
                 print(
                     f"Warning: Could not initialize {self.stock_market} calendar: {e}"
@@ -61,6 +76,10 @@ class MarketInfo:
                 self.calendar = None
                 self.market_schedule = None
 
+    def _index_for(self, value: datetime | date) -> TradingCalendarIndex | None:
+        index = self.calendar_index
+        return index if index is not None and index.covers(value) else None
+
     def is_market_open(self) -> bool:
         """Check if market is currently open"""
         if self.calendar is None:
@@ -86,6 +105,12 @@ class MarketInfo:
                 last_trade_day -= timedelta(days=1)
             return last_trade_day
 
+        if (index := self._index_for(for_date)) is not None:
+            last = index.previous_trading_day(for_date)
+            session = index.session(last, utc=True) if last is not None else None
+            if session is not None:
+                return session[1].replace(tzinfo=None)
+
         try:
             # Normalize input to datetime (naive) for comparison
             if isinstance(for_date, date) and not isinstance(for_date, datetime):
@@ -127,7 +152,7 @@ class MarketInfo:
                 last_trade_day -= timedelta(days=1)
             return last_trade_day
 
-    def get_trade_dates(
+    def get_trade_dates(  # noqa: C901
         self, for_date: datetime | date, bar_config: Any = None, days_wanted: int = 3
     ) -> list[str]:
         """Get list of trading dates"""
@@ -156,6 +181,10 @@ class MarketInfo:
                 and hasattr(bar_config, "bar_type")
                 and bar_config.bar_type == 2
             ):  # 1 min bars
+                if (index := self._index_for(for_date)) is not None:
+                    days = index.trading_days(index.start, for_date)
+                    return [str(d) for d in days[-days_wanted:]]
+
                 # Normalize input date
                 if isinstance(for_date, date) and not isinstance(for_date, datetime):
                     for_date_dt = datetime.combine(for_date, datetime.min.time())
@@ -191,6 +220,9 @@ class MarketInfo:
             # Fallback: check if it's a weekday
             return check_date.weekday() < 5
 
+        if (index := self._index_for(check_date)) is not None:
+            return index.is_trading_day(check_date)
+
         try:
             date_str = check_date.strftime("%Y-%m-%d")
             # Convert index to string format for comparison
@@ -213,6 +245,12 @@ class MarketInfo:
                 next_day += timedelta(days=1)
             return next_day
 
+        if (index := self._index_for(from_date)) is not None:
+            following = index.next_trading_day(from_date)
+            session = index.session(following, utc=True) if following else None
+            if session is not None:
+                return session[0].replace(tzinfo=None)
+
         try:
             future_dates = self.market_schedule.loc[from_date.strftime("%Y-%m-%d") :]
             # Normalize input to datetime
@@ -265,6 +303,12 @@ class MarketInfo:
             )
             return (market_open, market_close)
 
+        if (index := self._index_for(for_date)) is not None:
+            session = index.session(for_date, utc=True)
+            if session is None:
+                return None
+            return (session[0].replace(tzinfo=None), session[1].replace(tzinfo=None))
+
         try:
             date_str = for_date.strftime("%Y-%m-%d")
             # Check if date exists in schedule
@@ -23,10 +23,16 @@ Input contract (manifest JSON object):
   "metrics": {
     "sharpe": 1.7,
     "f1": 0.45,
-    "max_drawdown": -0.10
+    "max_drawdown": -0.10,
+    "sharpe_ci": [1.1, 2.3],          # optional bootstrap intervals
+    "max_drawdown_ci": [-0.18, -0.06]
   }
 }
 
+Promotion rules threshold point estimates by default. With
+``"threshold_on": "lower_bound"`` the Sharpe, MaxDD and (optional
+``min_win_rate``) checks use the lower end of the ``*_ci`` intervals instead.
+
 Return shape:
 {"ok": bool, "errors": [str], "warnings": [str]}
 """
@@ -148,6 +154,20 @@ def _extract_alias(manifest: dict[str, Any]) -> str | None:
     return alias_any if isinstance(alias_any, str) else None
 
 
+def _as_float(value: Any) -> float | None:
+    try:
+        return float(value) if isinstance(value, (int, float, str)) else None  # noqa: UP038
+    except ValueError:
+        return None
+
+
+def _ci_lower(metrics: dict[str, Any], key: str) -> float | None:
+    ci_any = metrics.get(f"{key}_ci")
+    if isinstance(ci_any, list | tuple) and len(ci_any) == 2:
+        return _as_float(ci_any[0])
+    return None
+
+
 def _apply_promotion_thresholds(
     manifest: dict[str, Any], rule: dict[str, Any]
 ) -> list[str]:
@@ -162,18 +182,28 @@ def _apply_promotion_thresholds(
         min_maxdd = float(rule.get("min_max_drawdown", -0.15))
     except Exception:
         min_sharpe, min_f1, min_maxdd = 1.5, 0.40, -0.15
-    sharpe_any = metrics.get("sharpe")
-    f1_any = metrics.get("f1")
-    maxdd_any = metrics.get("max_drawdown")
-    sharpe = float(sharpe_any) if isinstance(sharpe_any, (int, float, str)) else None  # noqa: UP038
-    f1 = float(f1_any) if isinstance(f1_any, (int, float, str)) else None  # noqa: UP038
-    maxdd = float(maxdd_any) if isinstance(maxdd_any, (int, float, str)) else None  # noqa: UP038
+    min_win_rate = _as_float(rule.get("min_win_rate"))
+    use_lower = str(rule.get("threshold_on", "point")) == "lower_bound"
+
+    f1 = _as_float(metrics.get("f1"))
+    if use_lower:
+        sharpe = _ci_lower(metrics, "sharpe")
+        maxdd = _ci_lower(metrics, "max_drawdown")
+        win_rate = _ci_lower(metrics, "win_rate")
+        label = " (CI lower bound)"
+    else:
+        sharpe = _as_float(metrics.get("sharpe"))
+        maxdd = _as_float(metrics.get("max_drawdown"))
+        win_rate = _as_float(metrics.get("win_rate"))
+        label = ""
     if sharpe is None or sharpe < min_sharpe:
-        errs.append(f"Sharpe below threshold: {sharpe} < {min_sharpe}")
+        errs.append(f"Sharpe{label} below threshold: {sharpe} < {min_sharpe}")
     if f1 is None or f1 < min_f1:
         errs.append(f"F1 below threshold: {f1} < {min_f1}")
     if maxdd is None or maxdd < min_maxdd:
-        errs.append(f"MaxDD below threshold: {maxdd} < {min_maxdd}")
+        errs.append(f"MaxDD{label} below threshold: {maxdd} < {min_maxdd}")
+    if min_win_rate is not None and (win_rate is None or win_rate < min_win_rate):
+        errs.append(f"Win rate{label} below threshold: {win_rate} < {min_win_rate}")
     return errs
 
 
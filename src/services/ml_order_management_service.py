@@ -28,6 +28,7 @@ from src.core.config import get_config
 from src.core.integrated_error_handling import handle_error, with_error_handling
 from src.data.parquet_repository import ParquetRepository
 from src.execution.ml_signal_executor import MLTradingSignal
+from src.observability.latency import LatencyStage, get_latency_tracker
 from src.services.order_management_service import (
     Fill,
     Order,
@@ -216,6 +217,7 @@ class MLOrderManagementService:
         self.latency_history: deque[float] = deque(
             maxlen=10000
         )  # Recent latency measurements
+        self.latency_tracker = get_latency_tracker()  # Per-stage histograms
 
         # Real-time monitoring
         self.execution_alerts: list[str] = []
@@ -261,10 +263,19 @@ class MLOrderManagementService:
                     f"Stale signal {signal.signal_id}: {signal_age_ms:.0f}ms old"
                 )
 
+            tracker = self.latency_tracker
+            tracker.mark(
+                signal.signal_id,
+                LatencyStage.SIGNAL_RECEIVED,
+                signal.strategy_name,
+                at=signal.signal_timestamp,
+            )
+
             # Place order through base service
             order = self.base_service.place_order(
                 None, order_request
             )  # Connection handled by base service
+            tracker.mark(signal.signal_id, LatencyStage.ORDER_SUBMITTED)
 
             # Create ML metadata
             ml_metadata = MLOrderMetadata(
@@ -323,6 +334,13 @@ class MLOrderManagementService:
 
             # Calculate execution quality
             fill_time = datetime.now(UTC)
+            self.latency_tracker.mark(
+                ml_metadata.signal_id, LatencyStage.FIRST_FILL, at=fill_time
+            )
+            if order.is_filled:
+                self.latency_tracker.mark(
+                    ml_metadata.signal_id, LatencyStage.COMPLETE, at=fill_time
+                )
 
             # Calculate latencies
             signal_to_order_latency = ml_metadata.signal_to_order_latency_ms or 0
@@ -741,6 +759,7 @@ class MLOrderManagementService:
                 else "declining"
                 if len(recent_quality) >= 2
                 else "stable",
+                "latency_percentiles": self.latency_tracker.summary(),
                 "active_alerts": len(self.execution_alerts),
                 "orders_processed_today": len(
                     [
@@ -18,11 +18,16 @@ from time import perf_counter
 from types import FrameType
 from typing import Any
 
-from joblib import dump, load
-
 # Add src to path for imports
 sys.path.append(str(Path(__file__).resolve().parent.parent))
 
+from src.infra.ib_pacing import (
+    PacingGovernor,
+    contract_key,
+    get_pacing_governor,
+    request_key,
+)
+
 try:
     from src.core.config import get_config
     from src.core.error_handler import TradingSystemError as _TradingSystemError
@@ -80,9 +85,8 @@ class RequestManagerService:
         self.sleep_total: float = 0.0
         self.total_slept: float = 0.0
 
-        # Request history for pacing
-        self.timeframe_requests: list[float] = []
-        self.all_requests: list[float] = []
+        # Pacing is shared with every other IB client process
+        self.pacing: PacingGovernor = get_pacing_governor()
 
         # Previous request tracking for duplicate detection
         self.symbol_prev = ""
@@ -100,7 +104,6 @@ class RequestManagerService:
 
         # Load configuration and initialize
         self._load_config()
-        self._load_request_history()
 
     def _load_config(self) -> None:
         """Load configuration settings."""
@@ -111,38 +114,6 @@ class RequestManagerService:
             cfg = None
         self.config = cfg
 
-    def _load_request_history(self) -> None:
-        """Load request history from disk for pacing calculations."""
-        from src.core.config import get_config as _gc
-
-        history_file = _gc().get_special_file("request_checker_bin")
-        hf = Path(history_file)
-
-        if hf.exists():
-            try:
-                self.timeframe_requests, self.all_requests = load(str(hf))
-
-                # Adjust times based on file age
-                file_age = time.time() - hf.stat().st_mtime
-                max_time = (
-                    max(max(self.timeframe_requests), max(self.all_requests)) + file_age
-                )
-
-                # Reset performance counter timing
-                self.all_requests = [x - max_time for x in self.all_requests]
-                self.timeframe_requests = [
-                    x - max_time for x in self.timeframe_requests
-                ]
-            except Exception as e:
-                handle_error(
-                    e, module="RequestManager", function="_load_request_history"
-                )
-                self.timeframe_requests = []
-                self.all_requests = []
-        else:
-            self.timeframe_requests = []
-            self.all_requests = []
-
     def send_request(
         self, timeframe: str, symbol: str, end_date_time: datetime, what_to_show: str
     ) -> int | None:
@@ -166,20 +137,24 @@ class RequestManagerService:
         ):
             return None
 
-        # Check rate limiting
-        if not self._can_send_request():
-            sleep_time = self._calculate_sleep_time()
-            if sleep_time > 0:
-                self._sleep_with_monitoring(sleep_time)
+        # Wait for the shared pacing governor, then record the request
+        key = contract_key(symbol)
+        request = request_key(
+            key, timeframe, what_to_show, end_datetime=str(end_date_time)
+        )
+        while (
+            sleep_time := self.pacing.try_acquire(
+                key, bar_size=timeframe, what_to_show=what_to_show, request=request
+            )
+        ) > 0:
+            self._sleep_with_monitoring(sleep_time)
+            if self.exit_flag:
+                return None
 
         # Generate request ID and track
         req_id = self._generate_request_id()
         self.req_dict[req_id] = (symbol, timeframe, end_date_time)
-
-        # Update request history
         current_time = perf_counter()
-        self.all_requests.append(current_time)
-        self.timeframe_requests.append(current_time)
 
         # Update previous request tracking
         self.symbol_prev = symbol
@@ -199,25 +174,7 @@ class RequestManagerService:
         Returns:
             True if request can be sent, False if rate limited
         """
-        current_time = perf_counter()
-
-        # Remove old requests (older than 10 minutes)
-        cutoff_time = current_time - 600  # 10 minutes
-        self.all_requests = [t for t in self.all_requests if t > cutoff_time]
-        self.timeframe_requests = [
-            t for t in self.timeframe_requests if t > cutoff_time
-        ]
-
-        # Check rate limits
-        recent_requests = len(
-            [t for t in self.all_requests if t > current_time - 60]
-        )  # Last minute
-
-        # IB allows ~50 requests per second, be conservative with 30
-        if recent_requests >= 30:
-            return False
-
-        return True
+        return self._calculate_sleep_time() <= 0
 
     def _calculate_sleep_time(self) -> float:
         """
@@ -226,18 +183,7 @@ class RequestManagerService:
         Returns:
             Sleep time in seconds
         """
-        current_time = perf_counter()
-
-        # Find the oldest request in the last minute
-        recent_requests = [t for t in self.all_requests if t > current_time - 60]
-
-        if len(recent_requests) >= 30:
-            # Sleep until the oldest request is more than 60 seconds old
-            oldest_recent = min(recent_requests)
-            sleep_time = 61 - (current_time - oldest_recent)
-            return max(0, sleep_time)
-
-        return 0
+        return self.pacing.projected_wait()
 
     def _sleep_with_monitoring(self, sleep_time: float) -> None:
         """
@@ -310,9 +256,7 @@ class RequestManagerService:
         Returns:
             Number of requests that can be sent immediately
         """
-        current_time = perf_counter()
-        recent_requests = len([t for t in self.all_requests if t > current_time - 60])
-        return max(0, 30 - recent_requests)
+        return self.pacing.remaining()
 
     def sleep_remaining(self) -> float:
         """
@@ -342,24 +286,7 @@ class RequestManagerService:
         self.downloading = downloading
 
     def save_request_history(self) -> None:
-        """Save request history to disk for persistence across sessions."""
-        from pathlib import Path
-
-        Path("./Files").mkdir(parents=True, exist_ok=True)
-
-        for _ in range(3):  # Retry up to 3 times
-            try:
-                dump(
-                    [self.timeframe_requests, self.all_requests],
-                    str(get_config().get_special_file("request_checker_bin")),
-                    compress=True,
-                )
-                break
-            except Exception as e:
-                handle_error(
-                    e, module="RequestManager", function="save_request_history"
-                )
-                continue
+        """Kept for legacy callers; pacing history lives in the shared ledger."""
 
     def get_statistics(self) -> dict[str, Any]:
         """
@@ -373,9 +300,6 @@ class RequestManagerService:
         return {
             "active_requests": len(self.req_dict),
             "total_sleep_time": self.sleep_total,
-            "requests_last_minute": len(
-                [t for t in self.all_requests if t > current_time - 60]
-            ),
             "requests_remaining": self.requests_remaining(),
             "sleep_remaining": self.sleep_remaining(),
             "is_downloading": self.downloading,
@@ -4,13 +4,21 @@ Stock Split Detection Service
 This service detects stock splits and ensures data integrity for machine learning models.
 Stock splits create artificial price discontinuities that can mislead ML algorithms.
 
+Detection is vectorized: returns, rolling volume ratios and the nearest common
+split ratio are computed for a whole series with NumPy masks, and only the
+hits become ``SplitEvent`` objects. ``scan_split_directory`` runs the same
+detector over a directory of daily bar files in a process pool and returns
+one consolidated split table.
+
 Author: Interactive Brokers Trading System
 Created: July 2025 (ML Data Integrity Enhancement)
 """
 
 import logging
+import os
 import sys
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date as date_type
 from datetime import datetime, timedelta
 
@@ -111,6 +119,397 @@ class SplitEvent:
         }
 
 
+COMMON_SPLIT_RATIOS = (2.0, 3.0, 1.5, 0.5, 0.333, 0.25)  # 2:1, 3:1, 3:2, 1:2, 1:3, 1:4
+_BONUS_RATIOS = (2.0, 0.5, 3.0, 0.333)  # most common ratios get a confidence bonus
+
+SPLIT_TABLE_COLUMNS = [
+    "symbol",
+    "split_date",
+    "split_ratio",
+    "confidence",
+    "detection_method",
+]
+
+
+def nearest_split_ratio(
+    ratios: np.ndarray, common_ratios: Sequence[float] = COMMON_SPLIT_RATIOS
+) -> np.ndarray:
+    """Closest common split ratio for each ratio (1.0 = not a split)."""
+    ratios = np.asarray(ratios, dtype=float)
+    common = np.asarray(common_ratios, dtype=float)
+    if ratios.size == 0:
+        return ratios.copy()
+    # First of equally close ratios wins, as with min() over the list
+    closest = common[np.abs(common[None, :] - ratios[:, None]).argmin(axis=1)]
+    invalid = np.isnan(ratios) | (ratios <= 0) | (np.abs(closest - 1.0) < 0.1)
+    return np.where(invalid, 1.0, closest)
+
+
+def _expected_change(split_ratio: np.ndarray) -> np.ndarray:
+    return np.where(split_ratio > 1, -(1 - 1 / split_ratio), -(1 - split_ratio))
+
+
+def _accuracy(change: np.ndarray, split_ratio: np.ndarray) -> np.ndarray:
+    expected = _expected_change(split_ratio)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return 1 - np.abs(change - expected) / np.abs(expected)
+
+
+def _implied_ratio(change: np.ndarray) -> np.ndarray:
+    # Previous close over new close: a 2:1 split (-50%) implies 2.0
+    with np.errstate(divide="ignore"):
+        return 1 / (1 + change)
+
+
+def _pct_change(values: np.ndarray) -> np.ndarray:
+    out = np.full(values.shape, np.nan)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out[1:] = values[1:] / values[:-1] - 1
+    return out
+
+
+def _split_dates(index: pd.Index, positions: np.ndarray) -> list[Any]:
+    return [
+        index[i].date() if hasattr(index[i], "date") else index[i]  # pyright: ignore[reportUnknownMemberType]  # pandas datetime index
+        for i in positions
+    ]
+
+
+def _events(
+    symbol: str,
+    index: pd.Index,
+    positions: np.ndarray,
+    ratios: np.ndarray,
+    confidence: np.ndarray,
+    method: str,
+) -> list[SplitEvent]:
+    return [
+        SplitEvent(symbol, d, float(r), float(c), method)
+        for d, r, c in zip(
+            _split_dates(index, positions), ratios, confidence, strict=True
+        )
+    ]
+
+
+def detect_price_gaps(
+    symbol: str,
+    df: pd.DataFrame,
+    threshold: float = 0.4,
+    common_ratios: Sequence[float] = COMMON_SPLIT_RATIOS,
+) -> list[SplitEvent]:
+    """Overnight drops beyond ``threshold``; ``df`` must be sorted by date."""
+    close = df["close"].to_numpy(dtype=float)
+    returns = _pct_change(close)
+    hits = np.flatnonzero(returns < -threshold)
+    change = returns[hits]
+    ratios = nearest_split_ratio(_implied_ratio(change), common_ratios)
+    confidence = _accuracy(change, ratios) + np.where(
+        np.isin(ratios, _BONUS_RATIOS), 0.2, 0.0
+    )
+    if "volume" in df.columns:
+        volume = df["volume"].to_numpy(dtype=float)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            volume_ratio = volume[hits] / volume[hits - 1]
+        # Expected volume spike missing
+        confidence -= np.where(volume_ratio < 1.5, 0.2, 0.0)
+    confidence = np.clip(confidence, 0.0, 1.0)
+    return _events(symbol, df.index, hits, ratios, confidence, "price_gap")
+
+
+def detect_volume_anomalies(
+    symbol: str,
+    df: pd.DataFrame,
+    spike_threshold: float = 3.0,
+    common_ratios: Sequence[float] = COMMON_SPLIT_RATIOS,
+) -> list[SplitEvent]:
+    """Volume spikes (vs. the 20-day mean) with a 20%+ price drop."""
+    volume = df["volume"].astype(float)
+    volume_ma = volume.rolling(window=20, min_periods=5).mean().to_numpy()
+    with np.errstate(divide="ignore", invalid="ignore"):
+        volume_ratio = volume.to_numpy() / volume_ma
+    price_changes = _pct_change(df["close"].to_numpy(dtype=float))
+    hits = np.flatnonzero(
+        (volume_ratio > spike_threshold) & (price_changes < -0.2)  # 20% price drop
+    )
+    change = price_changes[hits]
+    ratios = nearest_split_ratio(_implied_ratio(change), common_ratios)
+    confidence = np.clip(
+        (np.minimum(1.0, volume_ratio[hits] / 10.0) + _accuracy(change, ratios)) / 2,
+        0.0,
+        1.0,
+    )
+    return _events(symbol, df.index, hits, ratios, confidence, "volume_anomaly")
+
+
+def detect_adjustment_ratios(
+    symbol: str,
+    df: pd.DataFrame,
+    common_ratios: Sequence[float] = COMMON_SPLIT_RATIOS,
+) -> list[SplitEvent]:
+    """10%+ changes in the close / adjusted close factor."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        factor = df["close"].to_numpy(dtype=float) / df["adjusted_close"].to_numpy(
+            dtype=float
+        )
+    changes = _pct_change(factor)
+    hits = np.flatnonzero(np.abs(changes) > 0.1)  # 10% change in adjustment factor
+    ratios = nearest_split_ratio(factor[hits] / factor[hits - 1], common_ratios)
+    # High confidence for adjustment factor method
+    confidence = np.minimum(0.95, np.abs(changes[hits]) * 2)
+    return _events(symbol, df.index, hits, ratios, confidence, "adjustment_ratio")
+
+
+def consolidate_split_events(
+    splits: list[SplitEvent], common_ratios: Sequence[float] = COMMON_SPLIT_RATIOS
+) -> list[SplitEvent]:
+    """Consolidate multiple detections of the same split event."""
+    if not splits:
+        return splits
+
+    # Group splits by date (within 2 days) and symbol
+    consolidated: list[SplitEvent] = []
+    used_indices = set()
+
+    for i, split1 in enumerate(splits):
+        if i in used_indices:
+            continue
+
+        # Find other splits for same symbol within 2 days
+        similar_splits = [split1]
+        used_indices.add(i)
+
+        for j, split2 in enumerate(splits[i + 1 :], start=i + 1):
+            if j in used_indices:
+                continue
+
+            days_diff = abs((split1.split_date - split2.split_date).days)
+            if (
+                split1.symbol == split2.symbol
+                and days_diff <= 2
+                and abs(split1.split_ratio - split2.split_ratio) < 0.5
+            ):
+                similar_splits.append(split2)
+                used_indices.add(j)
+
+        # Create consolidated split with highest confidence
+        best_split = max(similar_splits, key=lambda s: s.confidence)
+
+        # Average the ratios if multiple detections
+        if len(similar_splits) > 1:
+            avg_ratio = np.mean([s.split_ratio for s in similar_splits])
+            best_split.split_ratio = float(
+                nearest_split_ratio(np.array([avg_ratio]), common_ratios)[0]
+            )
+            best_split.confidence = min(
+                1.0, best_split.confidence * 1.2
+            )  # Boost for multiple detections
+            best_split.detection_method += f"+{len(similar_splits) - 1}_confirmations"
+
+        consolidated.append(best_split)
+
+    return consolidated
+
+
+def detect_splits(
+    symbol: str,
+    df: pd.DataFrame,
+    *,
+    price_jump_threshold: float = 0.4,
+    volume_spike_threshold: float = 3.0,
+    min_confidence: float = 0.7,
+    common_ratios: Sequence[float] = COMMON_SPLIT_RATIOS,
+) -> list[SplitEvent]:
+    """All detection methods, consolidated and filtered by confidence.
+
+    ``df`` needs ``close`` and ``volume`` (``adjusted_close`` optional) and
+    at least 10 rows; it is sorted by index first.
+    """
+    if df is None or len(df) < 10 or not {"close", "volume"} <= set(df.columns):
+        return []
+    df = df.sort_index()
+    splits = detect_price_gaps(symbol, df, price_jump_threshold, common_ratios)
+    splits += detect_volume_anomalies(symbol, df, volume_spike_threshold, common_ratios)
+    if "adjusted_close" in df.columns:
+        splits += detect_adjustment_ratios(symbol, df, common_ratios)
+    splits = consolidate_split_events(splits, common_ratios)
+    return [s for s in splits if s.confidence >= min_confidence]
+
+
+def refresh_strategy(
+    symbol: str,
+    splits: list[SplitEvent],
+    current_data_range: tuple[date_type, date_type],
+) -> dict[str, Any]:
+    """Refresh recommendation for data containing ``splits``."""
+    if not splits:
+        return {"action": "no_refresh_needed", "reason": "No splits detected"}
+
+    start_date, end_date = current_data_range
+    earliest_split = min(splits, key=lambda s: s.split_date)
+
+    # Recommend getting fresh data from before the earliest split
+    fresh_start_date = earliest_split.split_date - timedelta(days=30)  # Buffer period
+
+    recommendation = {
+        "action": "refresh_required",
+        "reason": f"Detected {len(splits)} split(s) in data period",
+        "splits_detected": [str(split) for split in splits],
+        "current_range": f"{start_date} to {end_date}",
+        "recommended_fresh_start": fresh_start_date,
+        "recommended_fresh_end": date_type.today(),
+        "priority": "high" if any(s.confidence > 0.8 for s in splits) else "medium",
+        "data_quality_impact": "ML models may learn incorrect patterns from unadjusted split data",
+    }
+
+    return recommendation
+
+
+def split_analysis(
+    symbol: str, df: pd.DataFrame, splits: list[SplitEvent]
+) -> dict[str, Any]:
+    """Data-quality verdict and refresh recommendation for detected splits."""
+    if not splits:
+        return {
+            "symbol": symbol,
+            "splits_detected": 0,
+            "data_quality": "good",
+            "action_required": False,
+            "message": "No stock splits detected. Data is suitable for ML training.",
+        }
+
+    # Determine data quality impact
+    high_confidence_splits = [s for s in splits if s.confidence > 0.8]
+
+    if high_confidence_splits:
+        data_quality = "poor"
+        action_required = True
+        message = f"HIGH PRIORITY: {len(high_confidence_splits)} high-confidence splits detected. Fresh data required for ML training."
+    else:
+        data_quality = "questionable"
+        action_required = True
+        message = f"MEDIUM PRIORITY: {len(splits)} potential splits detected. Consider refreshing data."
+
+    # Get data date range
+    data_start = (
+        df.index.min().date() if hasattr(df.index.min(), "date") else df.index.min()  # pyright: ignore[reportUnknownMemberType]  # pandas datetime index
+    )
+    data_end = (
+        df.index.max().date() if hasattr(df.index.max(), "date") else df.index.max()  # pyright: ignore[reportUnknownMemberType]  # pandas datetime index
+    )
+
+    recommendation = refresh_strategy(symbol, splits, (data_start, data_end))
+
+    return {
+        "symbol": symbol,
+        "splits_detected": len(splits),
+        "high_confidence_splits": len(high_confidence_splits),
+        "data_quality": data_quality,
+        "action_required": action_required,
+        "message": message,
+        "detected_splits": [split.to_dict() for split in splits],
+        "recommendation": recommendation,
+        "analysis_date": datetime.now().isoformat(),
+    }
+
+
+_DATE_COLUMNS = ("date", "datetime", "timestamp", "time")
+
+
+def read_daily_bars(path: Path) -> pd.DataFrame:
+    """Daily bars from a feather/parquet/csv file, indexed by date."""
+    suffix = path.suffix.lower()
+    if suffix in (".ftr", ".feather"):
+        df = pd.read_feather(path)
+    elif suffix == ".parquet":
+        df = pd.read_parquet(path)
+    else:
+        df = pd.read_csv(path)
+    df.columns = [str(c).lower() for c in df.columns]
+    date_col = next((c for c in _DATE_COLUMNS if c in df.columns), None)
+    if date_col is not None:
+        df = df.set_index(pd.to_datetime(df[date_col])).drop(columns=date_col)
+    return df
+
+
+def _symbol_from_path(path: Path) -> str:
+    # IB download names look like ``AAPL_USUSD_1D.ftr``
+    return path.stem.split("_")[0].upper()
+
+
+def _scan_file(
+    path: Path,
+    symbol_from_path: Callable[[Path], str],
+    options: dict[str, Any],
+) -> tuple[list[dict[str, Any]], str | None]:
+    try:
+        symbol = symbol_from_path(path)
+        splits = detect_splits(symbol, read_daily_bars(path), **options)
+    except Exception as e:  # noqa: BLE001 - one bad file must not stop the scan
+        return [], f"{path.name}: {e}"
+    return [
+        {
+            "symbol": s.symbol,
+            "split_date": s.split_date,
+            "split_ratio": s.split_ratio,
+            "confidence": s.confidence,
+            "detection_method": s.detection_method,
+        }
+        for s in splits
+    ], None
+
+
+def scan_split_directory(
+    directory: Path | str,
+    pattern: str = "*",
+    *,
+    max_workers: int | None = None,
+    symbol_from_path: Callable[[Path], str] = _symbol_from_path,
+    errors: list[str] | None = None,
+    **options: Any,
+) -> pd.DataFrame:
+    """
+    Detect splits in every daily bar file of ``directory``.
+
+    Args:
+        directory: Directory of per-symbol daily bar files
+        pattern: Glob for the files (feather, parquet and csv are read)
+        max_workers: Process count (default: CPU count); 1 scans in-process
+        symbol_from_path: Maps a file to its symbol (module-level function)
+        errors: Receives one message per unreadable file
+        **options: Thresholds passed to :func:`detect_splits`
+
+    Returns:
+        One row per detected split (``SPLIT_TABLE_COLUMNS``), sorted by
+        symbol and date
+    """
+    files = sorted(
+        p
+        for p in Path(directory).glob(pattern)
+        if p.suffix.lower() in (".ftr", ".feather", ".parquet", ".csv")
+    )
+    workers = max_workers or os.cpu_count() or 1
+    if workers > 1 and len(files) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            results: Iterable[tuple[list[dict[str, Any]], str | None]] = list(
+                ex.map(
+                    _scan_file,
+                    files,
+                    [symbol_from_path] * len(files),
+                    [options] * len(files),
+                    chunksize=max(1, len(files) // (workers * 8)),
+                )
+            )
+    else:
+        results = [_scan_file(p, symbol_from_path, options) for p in files]
+    rows: list[dict[str, Any]] = []
+    for found, error in results:
+        rows.extend(found)
+        if error is not None and errors is not None:
+            errors.append(error)
+    table = pd.DataFrame(rows, columns=SPLIT_TABLE_COLUMNS)
+    return table.sort_values(["symbol", "split_date"], ignore_index=True)
+
+
 class StockSplitDetectionService:
     """
     Detects stock splits in historical data to maintain ML model integrity.
@@ -140,14 +539,7 @@ class StockSplitDetectionService:
         self.min_confidence = 0.7  # Minimum confidence to report split
 
         # Common split ratios to check
-        self.common_ratios = [
-            2.0,
-            3.0,
-            1.5,
-            0.5,
-            0.333,
-            0.25,
-        ]  # 2:1, 3:1, 3:2, 1:2, 1:3, 1:4
+        self.common_ratios = list(COMMON_SPLIT_RATIOS)
 
         self._load_config()
         self._setup_split_tracking()
@@ -239,250 +631,39 @@ class StockSplitDetectionService:
 
     def _detect_price_gaps(self, symbol: str, df: pd.DataFrame) -> list[SplitEvent]:
         """Detect splits based on overnight price gaps."""
-        splits: list[SplitEvent] = []
-
-        # Calculate overnight returns
-        df_sorted = df.sort_index()
-        overnight_returns = df_sorted["close"].pct_change()
-
-        # Look for significant negative jumps (splits cause price to drop)
-        for i, return_val in enumerate(overnight_returns):
-            if pd.isna(return_val) or i == 0:
-                continue
-
-            # Check for significant negative return
-            if return_val < -self.price_jump_threshold:
-                split_date = (
-                    df_sorted.index[i].date()
-                    if hasattr(df_sorted.index[i], "date")  # pyright: ignore[reportUnknownMemberType]  # pandas datetime index
-                    else df_sorted.index[i]
-                )
-
-                # Calculate implied split ratio
-                price_ratio = abs(return_val) + 1  # Convert to ratio
-                split_ratio = self._find_closest_split_ratio(price_ratio)
-
-                # Calculate confidence based on how close to common ratio
-                confidence = self._calculate_price_gap_confidence(
-                    return_val, split_ratio, df_sorted, i
-                )
-
-                split = SplitEvent(
-                    symbol=symbol,
-                    split_date=split_date,
-                    split_ratio=split_ratio,
-                    confidence=confidence,
-                    detection_method="price_gap",
-                )
-                splits.append(split)
-
-        return splits
+        return detect_price_gaps(
+            symbol, df.sort_index(), self.price_jump_threshold, self.common_ratios
+        )
 
     def _detect_volume_anomalies(
         self, symbol: str, df: pd.DataFrame
     ) -> list[SplitEvent]:
         """Detect splits based on volume spikes with price changes."""
-        splits: list[SplitEvent] = []
-
         if "volume" not in df.columns:
-            return splits
-
-        df_sorted = df.sort_index()
-
-        # Calculate rolling volume average (20-day)
-        volume_ma = df_sorted["volume"].rolling(window=20, min_periods=5).mean()
-        volume_ratio = df_sorted["volume"] / volume_ma
-
-        # Calculate price changes
-        price_changes = df_sorted["close"].pct_change()
-
-        for i in range(len(df_sorted)):
-            if pd.isna(volume_ratio.iloc[i]) or pd.isna(price_changes.iloc[i]):
-                continue
-
-            # Look for volume spike + significant price drop
-            if (
-                volume_ratio.iloc[i] > self.volume_spike_threshold
-                and price_changes.iloc[i] < -0.2
-            ):  # 20% price drop
-                split_date = (
-                    df_sorted.index[i].date()
-                    if hasattr(df_sorted.index[i], "date")  # pyright: ignore[reportUnknownMemberType]  # pandas datetime index
-                    else df_sorted.index[i]
-                )
-
-                # Calculate split ratio from price change
-                price_ratio = abs(price_changes.iloc[i]) + 1
-                split_ratio = self._find_closest_split_ratio(price_ratio)
-
-                # Calculate confidence
-                confidence = self._calculate_volume_confidence(
-                    volume_ratio.iloc[i], price_changes.iloc[i], split_ratio
-                )
-
-                split = SplitEvent(
-                    symbol=symbol,
-                    split_date=split_date,
-                    split_ratio=split_ratio,
-                    confidence=confidence,
-                    detection_method="volume_anomaly",
-                )
-                splits.append(split)
-
-        return splits
+            return []
+        return detect_volume_anomalies(
+            symbol, df.sort_index(), self.volume_spike_threshold, self.common_ratios
+        )
 
     def _detect_adjustment_ratios(
         self, symbol: str, df: pd.DataFrame
     ) -> list[SplitEvent]:
         """Detect splits using adjusted close ratios."""
-        splits: list[SplitEvent] = []
-
         if "adjusted_close" not in df.columns:
-            return splits
-
-        df_sorted = df.sort_index()
-
-        # Calculate adjustment factor
-        adjustment_factor = df_sorted["close"] / df_sorted["adjusted_close"]
-        adjustment_changes = adjustment_factor.pct_change()
-
-        for i in range(1, len(df_sorted)):
-            change = adjustment_changes.iloc[i]
-
-            if pd.isna(change):
-                continue
-
-            # Significant change in adjustment factor indicates corporate action
-            if abs(change) > 0.1:  # 10% change in adjustment factor
-                split_date = (
-                    df_sorted.index[i].date()
-                    if hasattr(df_sorted.index[i], "date")  # pyright: ignore[reportUnknownMemberType]  # pandas datetime index
-                    else df_sorted.index[i]
-                )
-
-                # Calculate split ratio
-                split_ratio = adjustment_factor.iloc[i] / adjustment_factor.iloc[i - 1]
-                split_ratio = self._find_closest_split_ratio(split_ratio)
-
-                confidence = min(
-                    0.95, abs(change) * 2
-                )  # High confidence for adjustment factor method
-
-                split = SplitEvent(
-                    symbol=symbol,
-                    split_date=split_date,
-                    split_ratio=split_ratio,
-                    confidence=confidence,
-                    detection_method="adjustment_ratio",
-                )
-                splits.append(split)
-
-        return splits
+            return []
+        return detect_adjustment_ratios(symbol, df.sort_index(), self.common_ratios)
 
     def _find_closest_split_ratio(self, calculated_ratio: float) -> float:
         """Find the closest common split ratio to the calculated ratio."""
-        if pd.isna(calculated_ratio) or calculated_ratio <= 0:
-            return 1.0
-
-        # Find closest common ratio
-        closest_ratio = min(self.common_ratios, key=lambda x: abs(x - calculated_ratio))
-
-        # If very close to 1, probably not a split
-        if abs(closest_ratio - 1.0) < 0.1:
-            return 1.0
-
-        return closest_ratio
-
-    def _calculate_price_gap_confidence(
-        self, return_val: float, split_ratio: float, df: pd.DataFrame, index: int
-    ) -> float:
-        """Calculate confidence for price gap detection."""
-        # Base confidence on how close the return matches expected split
-        expected_return = (
-            -(1 - 1 / split_ratio) if split_ratio > 1 else -(1 - split_ratio)
-        )
-        ratio_accuracy = 1 - abs(return_val - expected_return) / abs(expected_return)
-
-        # Boost confidence if it's a common split ratio
-        ratio_bonus = 0.2 if split_ratio in [2.0, 0.5, 3.0, 0.333] else 0.0
-
-        # Reduce confidence if volume data doesn't support (if available)
-        volume_penalty = 0.0
-        if "volume" in df.columns and index > 0:
-            volume_ratio = df["volume"].iloc[index] / df["volume"].iloc[index - 1]
-            if volume_ratio < 1.5:  # Expected volume spike missing
-                volume_penalty = 0.2
-
-        confidence = max(0.0, min(1.0, ratio_accuracy + ratio_bonus - volume_penalty))
-        return confidence
-
-    def _calculate_volume_confidence(
-        self, volume_ratio: float, price_change: float, split_ratio: float
-    ) -> float:
-        """Calculate confidence for volume anomaly detection."""
-        # Higher volume spike = higher confidence
-        volume_confidence = min(1.0, volume_ratio / 10.0)
-
-        # Price change should match split ratio
-        expected_change = (
-            -(1 - 1 / split_ratio) if split_ratio > 1 else -(1 - split_ratio)
+        return float(
+            nearest_split_ratio(np.array([calculated_ratio]), self.common_ratios)[0]
         )
-        price_accuracy = 1 - abs(price_change - expected_change) / abs(expected_change)
-
-        confidence = (volume_confidence + price_accuracy) / 2
-        return max(0.0, min(1.0, confidence))
 
     def _consolidate_split_detections(
         self, splits: list[SplitEvent]
     ) -> list[SplitEvent]:
         """Consolidate multiple detections of the same split event."""
-        if not splits:
-            return splits
-
-        # Group splits by date (within 2 days) and symbol
-        consolidated: list[SplitEvent] = []
-        used_indices = set()
-
-        for i, split1 in enumerate(splits):
-            if i in used_indices:
-                continue
-
-            # Find other splits for same symbol within 2 days
-            similar_splits = [split1]
-            used_indices.add(i)
-
-            for j, split2 in enumerate(splits[i + 1 :], start=i + 1):
-                if j in used_indices:
-                    continue
-
-                days_diff = abs((split1.split_date - split2.split_date).days)
-                if (
-                    split1.symbol == split2.symbol
-                    and days_diff <= 2
-                    and abs(split1.split_ratio - split2.split_ratio) < 0.5
-                ):
-                    similar_splits.append(split2)
-                    used_indices.add(j)
-
-            # Create consolidated split with highest confidence
-            best_split = max(similar_splits, key=lambda s: s.confidence)
-
-            # Average the ratios if multiple detections
-            if len(similar_splits) > 1:
-                avg_ratio = np.mean([s.split_ratio for s in similar_splits])
-                best_split.split_ratio = self._find_closest_split_ratio(
-                    float(avg_ratio)
-                )
-                best_split.confidence = min(
-                    1.0, best_split.confidence * 1.2
-                )  # Boost for multiple detections
-                best_split.detection_method += (
-                    f"+{len(similar_splits) - 1}_confirmations"
-                )
-
-            consolidated.append(best_split)
-
-        return consolidated
+        return consolidate_split_events(splits, self.common_ratios)
 
     def _record_split_detection(self, split: SplitEvent) -> None:
         """Record a split detection in the tracking DataFrame."""
@@ -491,6 +672,34 @@ class StockSplitDetectionService:
             [self.detected_splits, new_row], ignore_index=True
         )
 
+    def record_splits(self, splits: list[dict[str, Any]]) -> None:
+        """Record ``SplitEvent.to_dict()`` rows found outside this service.
+
+        Used for batch and cached detections; a split already recorded for
+        the same symbol and date is not added again.
+        """
+        if not splits:
+            return
+        rows = pd.DataFrame(splits)
+        known = set(
+            zip(
+                self.detected_splits["symbol"],
+                self.detected_splits["split_date"].astype(str),
+                strict=True,
+            )
+        )
+        new = [
+            (symbol, str(split_date)) not in known
+            for symbol, split_date in zip(
+                rows["symbol"], rows["split_date"], strict=True
+            )
+        ]
+        rows = rows[new].drop_duplicates(["symbol", "split_date"])
+        if not rows.empty:
+            self.detected_splits = pd.concat(
+                [self.detected_splits, rows], ignore_index=True
+            )
+
     def check_data_needs_refresh(
         self, symbol: str, data_start_date: date_type, data_end_date: date_type
     ) -> tuple[bool, list[SplitEvent]]:
@@ -552,29 +761,7 @@ class StockSplitDetectionService:
         Returns:
             Dictionary with refresh recommendations
         """
-        if not splits:
-            return {"action": "no_refresh_needed", "reason": "No splits detected"}
-
-        start_date, end_date = current_data_range
-        earliest_split = min(splits, key=lambda s: s.split_date)
-
-        # Recommend getting fresh data from before the earliest split
-        fresh_start_date = earliest_split.split_date - timedelta(
-            days=30
-        )  # Buffer period
-
-        recommendation = {
-            "action": "refresh_required",
-            "reason": f"Detected {len(splits)} split(s) in data period",
-            "splits_detected": [str(split) for split in splits],
-            "current_range": f"{start_date} to {end_date}",
-            "recommended_fresh_start": fresh_start_date,
-            "recommended_fresh_end": date_type.today(),
-            "priority": "high" if any(s.confidence > 0.8 for s in splits) else "medium",
-            "data_quality_impact": "ML models may learn incorrect patterns from unadjusted split data",
-        }
-
-        return recommendation
+        return refresh_strategy(symbol, splits, current_data_range)
 
     def analyze_data_for_splits(self, symbol: str, df: pd.DataFrame) -> dict[str, Any]:
         """
@@ -587,52 +774,53 @@ class StockSplitDetectionService:
         Returns:
             Complete analysis results
         """
-        splits = self.detect_splits_in_data(symbol, df)
+        return split_analysis(symbol, df, self.detect_splits_in_data(symbol, df))
 
-        if not splits:
-            return {
-                "symbol": symbol,
-                "splits_detected": 0,
-                "data_quality": "good",
-                "action_required": False,
-                "message": "No stock splits detected. Data is suitable for ML training.",
-            }
-
-        # Determine data quality impact
-        high_confidence_splits = [s for s in splits if s.confidence > 0.8]
-
-        if high_confidence_splits:
-            data_quality = "poor"
-            action_required = True
-            message = f"HIGH PRIORITY: {len(high_confidence_splits)} high-confidence splits detected. Fresh data required for ML training."
-        else:
-            data_quality = "questionable"
-            action_required = True
-            message = f"MEDIUM PRIORITY: {len(splits)} potential splits detected. Consider refreshing data."
+    def scan_directory(
+        self,
+        directory: Path | str,
+        pattern: str = "*",
+        max_workers: int | None = None,
+    ) -> pd.DataFrame:
+        """
+        Detect splits across a directory of daily bar files.
 
-        # Get data date range
-        data_start = (
-            df.index.min().date() if hasattr(df.index.min(), "date") else df.index.min()  # pyright: ignore[reportUnknownMemberType]  # pandas datetime index
-        )
-        data_end = (
-            df.index.max().date() if hasattr(df.index.max(), "date") else df.index.max()  # pyright: ignore[reportUnknownMemberType]  # pandas datetime index
-        )
+        Runs :func:`scan_split_directory` with this service's thresholds and
+        records every detection in the split history.
 
-        recommendation = self.recommend_refresh_strategy(
-            symbol, splits, (data_start, data_end)
-        )
+        Args:
+            directory: Directory of per-symbol daily bar files
+            pattern: Glob for the files
+            max_workers: Process count (default: CPU count)
 
-        return {
-            "symbol": symbol,
-            "splits_detected": len(splits),
-            "high_confidence_splits": len(high_confidence_splits),
-            "data_quality": data_quality,
-            "action_required": action_required,
-            "message": message,
-            "detected_splits": [split.to_dict() for split in splits],
-            "recommendation": recommendation,
-            "analysis_date": datetime.now().isoformat(),
-        }
+        Returns:
+            Consolidated split table
+        """
+        errors: list[str] = []
+        table = scan_split_directory(
+            directory,
+            pattern,
+            max_workers=max_workers,
+            errors=errors,
+            price_jump_threshold=self.price_jump_threshold,
+            volume_spike_threshold=self.volume_spike_threshold,
+            min_confidence=self.min_confidence,
+            common_ratios=tuple(self.common_ratios),
+        )
+        for error in errors:
+            self.logger.warning(f"Split scan skipped {error}")
+        if not table.empty:
+            recorded = table.assign(
+                split_date=[d.isoformat() for d in table["split_date"]],
+                detected_at=datetime.now().isoformat(),
+            )
+            self.detected_splits = pd.concat(
+                [self.detected_splits, recorded], ignore_index=True
+            )
+            self.logger.info(
+                f"Detected {len(table)} splits across {table['symbol'].nunique()} symbols"
+            )
+        return table
 
     def get_split_history(self, symbol: str | None = None) -> pd.DataFrame:
         """
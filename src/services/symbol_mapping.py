@@ -2,16 +2,37 @@
 
 Mapping file is a simple JSON object: {"LOCAL_SYMBOL": "VENDOR_SYMBOL", ...}
 Missing file or entry -> identity mapping.
+
+Each mapping file is parsed once into a ``SymbolMappingRegistry`` holding the
+per-symbol (vendor symbol, dataset, schema) overrides; it is re-read only
+when the file's mtime or size changes, so resolving inside a backfill loop
+costs a ``stat`` and a dict lookup. ``resolve_many`` resolves a whole symbol
+list at once for planners.
 """
 
 from __future__ import annotations
 
 import json
 import sys
+import threading
+from collections.abc import Iterable
+from functools import lru_cache
 from pathlib import Path
-from typing import Literal
+from typing import Any, Literal
+
+_BENTO_DATASET_ALIASES: dict[str, str] = {
+    "NASDAQ.ITCH": "XNAS.ITCH",
+    "NASDAQ.BASIC": "XNAS.BASIC",
+    "NASDAQ.QBBO": "XNAS.QBBO",
+    "NASDAQ.NLS": "XNAS.NLS",
+    "NYSE.PILLAR": "XNYS.PILLAR",
+    "NYSE.BBO": "XNYS.BBO",
+    "NYSE.TRADES": "XNYS.TRADES",
+    "NYSE.TRADESBBO": "XNYS.TRADESBBO",
+}
 
 
+@lru_cache(maxsize=256)
 def _normalize_bento_dataset(dataset: str) -> str:
     """Map common aliases to canonical DataBento dataset codes.
 
@@ -27,52 +48,138 @@ def _normalize_bento_dataset(dataset: str) -> str:
     """
     if not dataset:
         return dataset
-    ds = dataset.strip().upper()
-    aliases: dict[str, str] = {
-        "NASDAQ.ITCH": "XNAS.ITCH",
-        "NASDAQ.BASIC": "XNAS.BASIC",
-        "NASDAQ.QBBO": "XNAS.QBBO",
-        "NASDAQ.NLS": "XNAS.NLS",
-        "NYSE.PILLAR": "XNYS.PILLAR",
-        "NYSE.BBO": "XNYS.BBO",
-        "NYSE.TRADES": "XNYS.TRADES",
-        "NYSE.TRADESBBO": "XNYS.TRADESBBO",
-    }
-    return aliases.get(ds, dataset)
+    return _BENTO_DATASET_ALIASES.get(dataset.strip().upper(), dataset)
+
+
+# symbol -> (vendor symbol, dataset or None, schema or None); None = default
+_Override = tuple[str, str | None, str | None]
+
+
+def _parse_mapping(obj: Any) -> tuple[dict[str, str], dict[str, _Override]]:
+    """Flat string mapping (``load_symbol_mapping`` form) and resolved overrides."""
+    if not isinstance(obj, dict):
+        return {}, {}
+    flat: dict[str, str] = {}
+    overrides: dict[str, _Override] = {}
+    for k, v in obj.items():
+        try:
+            ks = str(k)
+            # If nested object, keep string form for compatibility
+            vs = v if isinstance(v, str) else json.dumps(v)
+            if ks == vs:
+                print(
+                    f"WARN symbol_mapping identity mapping {ks}->{vs} (consider removing)",
+                    file=sys.stderr,
+                )
+            flat[ks] = str(vs)
+        except Exception:  # pragma: no cover - defensive
+            continue
+        if isinstance(v, str):
+            overrides[ks] = (v, None, None)
+        elif isinstance(v, dict):
+            dataset = v.get("dataset")
+            schema = v.get("schema")
+            overrides[ks] = (
+                str(v.get("symbol", ks)),
+                _normalize_bento_dataset(str(dataset)) if dataset is not None else None,
+                str(schema) if schema is not None else None,
+            )
+    return flat, overrides
+
+
+class SymbolMappingRegistry:
+    """
+    Parsed symbol mapping file, reloaded when its mtime or size changes
+
+    Identity-mapping warnings are printed once per (re)load, not per lookup.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.loads = 0
+        self._stamp: tuple[int, int] | None = None
+        self._flat: dict[str, str] = {}
+        self._overrides: dict[str, _Override] = {}
+        self._lock = threading.Lock()
+
+    def _current(self) -> tuple[dict[str, str], dict[str, _Override]]:
+        try:
+            stat = self.path.stat()
+            stamp: tuple[int, int] | None = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            stamp = None
+        with self._lock:
+            if stamp != self._stamp:
+                self._flat, self._overrides = {}, {}
+                if stamp is not None:
+                    try:
+                        obj = json.loads(self.path.read_text())
+                        self._flat, self._overrides = _parse_mapping(obj)
+                    except Exception:  # parse errors -> empty mapping
+                        pass
+                    self.loads += 1
+                self._stamp = stamp
+            return self._flat, self._overrides
+
+    def mapping(self) -> dict[str, str]:
+        """``{local: vendor}``; nested entries keep their JSON string form"""
+        return dict(self._current()[0])
+
+    def to_vendor(self, symbol: str) -> str:
+        override = self._current()[1].get(symbol)
+        return override[0] if override is not None else symbol
+
+    def resolve(
+        self, symbol: str, default_dataset: str, default_schema: str
+    ) -> tuple[str, str, str]:
+        """(vendor_symbol, dataset, schema) with per-symbol overrides applied"""
+        return self.resolve_many([symbol], default_dataset, default_schema)[symbol]
+
+    def resolve_many(
+        self, symbols: Iterable[str], default_dataset: str, default_schema: str
+    ) -> dict[str, tuple[str, str, str]]:
+        """Resolve every symbol against one snapshot of the mapping"""
+        overrides = self._current()[1]
+        dataset = _normalize_bento_dataset(default_dataset)
+        resolved: dict[str, tuple[str, str, str]] = {}
+        for symbol in symbols:
+            override = overrides.get(symbol)
+            if override is None:
+                resolved[symbol] = (symbol, dataset, default_schema)
+            else:
+                resolved[symbol] = (
+                    override[0],
+                    override[1] or dataset,
+                    override[2] or default_schema,
+                )
+        return resolved
+
+
+_registries: dict[Path, SymbolMappingRegistry] = {}
+_registries_lock = threading.Lock()
+
+
+def get_symbol_mapping_registry(path: Path) -> SymbolMappingRegistry:
+    """Process-wide registry for the mapping file at ``path``"""
+    key = Path(path)
+    with _registries_lock:
+        registry = _registries.get(key)
+        if registry is None:
+            registry = _registries[key] = SymbolMappingRegistry(key)
+        return registry
 
 
 def load_symbol_mapping(path: Path) -> dict[str, str]:
-    if not path or not path.exists():
-        return {}
-    try:
-        mapping = json.loads(path.read_text())
-        if isinstance(mapping, dict):
-            norm: dict[str, str] = {}
-            for k, v in list(mapping.items()):
-                try:
-                    ks = str(k)
-                    # If nested object, keep string form for compatibility; resolved later
-                    vs = v if isinstance(v, str) else json.dumps(v)
-                    if ks == vs:
-                        print(
-                            f"WARN symbol_mapping identity mapping {ks}->{vs} (consider removing)",
-                            file=sys.stderr,
-                        )
-                    norm[ks] = str(vs)
-                except Exception:  # pragma: no cover - defensive
-                    continue
-            return norm
-        return {}
-    except Exception:  # pragma: no cover - parse errors -> empty mapping
+    if not path:
         return {}
+    return get_symbol_mapping_registry(path).mapping()
 
 
 def to_vendor(
     symbol: str, vendor: Literal["databento"], mapping_file: Path | None
 ) -> str:  # noqa: ARG001
-    if mapping_file and mapping_file.exists():
-        mapping = load_symbol_mapping(mapping_file)
-        return mapping.get(symbol, symbol)
+    if mapping_file:
+        return get_symbol_mapping_registry(mapping_file).to_vendor(symbol)
     return symbol
 
 
@@ -90,22 +197,21 @@ def resolve_vendor_params(
 
     Unknown or missing fields fall back to provided defaults.
     """
-    vendor_symbol = symbol
+    return resolve_many(
+        [symbol], vendor, mapping_file, default_dataset, default_schema
+    )[symbol]
+
+
+def resolve_many(
+    symbols: Iterable[str],
+    vendor: Literal["databento"],  # noqa: ARG001
+    mapping_file: Path | None,
+    default_dataset: str,
+    default_schema: str,
+) -> dict[str, tuple[str, str, str]]:
+    """Bulk :func:`resolve_vendor_params`: ``{symbol: (vendor_symbol, dataset, schema)}``."""
+    if mapping_file:
+        registry = get_symbol_mapping_registry(mapping_file)
+        return registry.resolve_many(symbols, default_dataset, default_schema)
     dataset = _normalize_bento_dataset(default_dataset)
-    schema = default_schema
-    if mapping_file and mapping_file.exists():
-        try:
-            obj = json.loads(mapping_file.read_text())
-            if isinstance(obj, dict) and symbol in obj:
-                entry = obj[symbol]
-                if isinstance(entry, str):
-                    vendor_symbol = entry
-                elif isinstance(entry, dict):
-                    vendor_symbol = str(entry.get("symbol", vendor_symbol))
-                    dataset = _normalize_bento_dataset(
-                        str(entry.get("dataset", dataset))
-                    )
-                    schema = str(entry.get("schema", schema))
-        except Exception:
-            pass
-    return vendor_symbol, dataset, schema
+    return {symbol: (symbol, dataset, default_schema) for symbol in symbols}
@@ -0,0 +1,266 @@
+"""Sharded tick processing and snapshot conflation for streaming market data.
+
+``ShardedTickEngine`` replaces a single queue drained by one thread: each
+tick is routed by a stable hash of its symbol to one of N shards, each with
+its own bounded queue and worker thread. Ticks for a symbol therefore stay
+in order while different symbols are processed in parallel, and one busy
+symbol can only fill its own shard. A full shard drops the tick instead of
+blocking the producer (the IB callback thread); drops and queue lag (time
+from ``submit`` to processing) are counted per shard.
+
+``SnapshotConflator`` sits between the per-tick snapshot update and the
+snapshot handlers. Updates are recorded per symbol and delivered at most
+once per interval, latest value wins, so a handler that redraws a row sees a
+bounded call rate however fast the ticks arrive. An interval of 0 delivers
+every update synchronously.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+import zlib
+from collections.abc import Callable
+from queue import Empty, Full, Queue
+from typing import Any
+
+from src.observability.metrics import inc
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SHARDS = 4
+DEFAULT_QUEUE_SIZE = 10_000
+DEFAULT_CONFLATION_INTERVAL = 0.1  # seconds between snapshot deliveries
+_POLL_SECONDS = 0.1  # worker wake-up to notice stop()
+
+
+def shard_for(symbol: str, shards: int) -> int:
+    """Stable shard index for ``symbol`` (independent of hash seeding)."""
+    return zlib.crc32(symbol.encode()) % shards
+
+
+class _Shard:
+    """Bounded queue plus counters; counters are written by one thread each."""
+
+    def __init__(self, index: int, queue_size: int) -> None:
+        self.index = index
+        self.queue: Queue[tuple[float, Any]] = Queue(maxsize=queue_size)
+        self.thread: threading.Thread | None = None
+        self.processed = 0  # worker thread
+        self.errors = 0  # worker thread
+        self.lag_last = 0.0  # worker thread
+        self.lag_max = 0.0  # worker thread
+        self.dropped = 0  # guarded by the engine lock
+
+
+class ShardedTickEngine:
+    """Per-symbol sharded worker pool.
+
+    Args:
+        process: Called with each tick on its shard's worker thread.
+        shards: Number of worker threads / queues.
+        queue_size: Capacity of each shard queue.
+        key: Extracts the routing key (symbol) from a tick.
+        name: Thread name prefix and metrics prefix.
+    """
+
+    def __init__(
+        self,
+        process: Callable[[Any], None],
+        *,
+        shards: int = DEFAULT_SHARDS,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        key: Callable[[Any], str] = lambda tick: tick.symbol,
+        name: str = "ticks",
+    ) -> None:
+        self._process = process
+        self._key = key
+        self.name = name
+        self._shards = [_Shard(i, queue_size) for i in range(max(1, shards))]
+        self._lock = threading.Lock()
+        self._running = False
+        self._rate_at = time.monotonic()
+        self._rate_count = 0
+        self._rate = 0.0
+
+    @property
+    def shards(self) -> int:
+        return len(self._shards)
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def start(self) -> None:
+        with self._lock:
+            if self._running:
+                return
+            self._running = True
+            for shard in self._shards:
+                shard.thread = threading.Thread(
+                    target=self._worker,
+                    args=(shard,),
+                    name=f"{self.name}-shard-{shard.index}",
+                    daemon=True,
+                )
+                shard.thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        with self._lock:
+            if not self._running:
+                return
+            self._running = False
+        deadline = time.monotonic() + timeout
+        for shard in self._shards:
+            if shard.thread is not None:
+                shard.thread.join(max(0.0, deadline - time.monotonic()))
+                shard.thread = None
+
+    def submit(self, tick: Any) -> bool:
+        """Queue ``tick`` on its shard; False (and counted) when it is full."""
+        shard = self._shards[shard_for(self._key(tick), len(self._shards))]
+        try:
+            shard.queue.put_nowait((time.monotonic(), tick))
+        except Full:
+            with self._lock:
+                shard.dropped += 1
+            inc(f"{self.name}_dropped_total")
+            return False
+        return True
+
+    def qsize(self) -> int:
+        return sum(s.queue.qsize() for s in self._shards)
+
+    def stats(self) -> dict[str, Any]:
+        """Totals across shards plus per-shard depth/lag (lag in ms)."""
+        processed = sum(s.processed for s in self._shards)
+        now = time.monotonic()
+        with self._lock:
+            elapsed = now - self._rate_at
+            if elapsed >= 1.0:
+                self._rate = (processed - self._rate_count) / elapsed
+                self._rate_at, self._rate_count = now, processed
+            dropped = [s.dropped for s in self._shards]
+        return {
+            "processed": processed,
+            "dropped": sum(dropped),
+            "errors": sum(s.errors for s in self._shards),
+            "ticks_per_second": self._rate,
+            "queue_depth": self.qsize(),
+            "queue_lag_ms": max(s.lag_last for s in self._shards) * 1000,
+            "queue_lag_max_ms": max(s.lag_max for s in self._shards) * 1000,
+            "shards": [
+                {
+                    "depth": s.queue.qsize(),
+                    "processed": s.processed,
+                    "dropped": d,
+                    "lag_ms": s.lag_last * 1000,
+                }
+                for s, d in zip(self._shards, dropped, strict=True)
+            ],
+        }
+
+    def _worker(self, shard: _Shard) -> None:
+        get = shard.queue.get
+        process = self._process
+        while self._running:
+            try:
+                queued_at, tick = get(timeout=_POLL_SECONDS)
+            except Empty:
+                continue
+            lag = time.monotonic() - queued_at
+            shard.lag_last = lag
+            if lag > shard.lag_max:
+                shard.lag_max = lag
+            try:
+                process(tick)
+            except Exception as e:  # noqa: BLE001
+                shard.errors += 1
+                logger.error("%s shard %d: %s", self.name, shard.index, e)
+            shard.processed += 1
+
+
+class SnapshotConflator:
+    """Latest-value-wins delivery of per-symbol updates to handlers.
+
+    Args:
+        handlers: Callables invoked with each delivered value; the list is
+            read at delivery time so handlers may be added later.
+        interval: Seconds between deliveries; 0 delivers synchronously.
+    """
+
+    def __init__(
+        self,
+        handlers: list[Callable[[Any], None]],
+        interval: float = DEFAULT_CONFLATION_INTERVAL,
+    ) -> None:
+        self._handlers = handlers
+        self.interval = max(0.0, interval)
+        self._lock = threading.Lock()
+        self._pending: dict[str, Any] = {}
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self.offered = 0
+        self.delivered = 0
+        self.conflated = 0
+
+    def offer(self, symbol: str, value: Any) -> None:
+        """Record ``value`` as the latest for ``symbol``."""
+        if not self.interval:
+            with self._lock:
+                self.offered += 1
+            self._deliver(value)
+            return
+        with self._lock:
+            self.offered += 1
+            if symbol in self._pending:
+                self.conflated += 1
+            self._pending[symbol] = value
+
+    def flush(self) -> int:
+        """Deliver every pending value now; returns how many were delivered."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        for value in pending.values():
+            self._deliver(value)
+        return len(pending)
+
+    def start(self) -> None:
+        if not self.interval or self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="snapshot-conflator", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join(timeout)
+        self._thread = None
+        self.flush()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "offered": self.offered,
+                "delivered": self.delivered,
+                "conflated": self.conflated,
+                "pending": len(self._pending),
+            }
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.flush()
+
+    def _deliver(self, value: Any) -> None:
+        for handler in list(self._handlers):
+            try:
+                handler(value)
+            except Exception as e:  # noqa: BLE001
+                logger.error("Error in snapshot handler: %s", e)
+        with self._lock:
+            self.delivered += 1
@@ -0,0 +1,359 @@
+"""Precomputed trading-calendar index.
+
+``TradingCalendarIndex`` holds one market's sessions for a fixed range
+(default 2000-2035) in NumPy arrays: trading days, UTC open/close, the
+market's UTC offset on each day (DST) and an early-close flag. Two dense
+per-calendar-day arrays make the common questions constant time:
+
+- ``_slot[k]``: position of day ``k`` in ``days``, or -1 when closed;
+- ``_last[k]``: position of the last trading day on or before day ``k``.
+
+Membership, previous/next trading day and "trading days between" are then
+array lookups, and every query also accepts arrays of dates.
+
+The index is built once from ``pandas_market_calendars`` and cached as an
+``.npz`` file next to the other runtime caches, so later processes load it
+in milliseconds. ``get_trading_calendar`` returns the process-wide index
+(None when ``pandas_market_calendars`` is not installed).
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from datetime import UTC, date, datetime, time, timedelta
+from pathlib import Path
+from typing import Any
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pandas_market_calendars as mcal
+
+    MCAL_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    mcal = None
+    MCAL_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_START = date(2000, 1, 1)
+DEFAULT_END = date(2035, 12, 31)
+_NAT = np.datetime64("NaT", "D")
+
+DateLike = date | datetime | str | np.datetime64
+
+
+def _as_day(value: DateLike) -> np.datetime64:
+    if isinstance(value, datetime):
+        value = value.date()
+    return np.datetime64(value, "D")
+
+
+def _as_days(values: Any) -> np.ndarray:
+    if isinstance(values, pd.Series | pd.Index):
+        values = pd.DatetimeIndex(values).tz_localize(None).to_numpy()
+    return np.asarray(values, dtype="datetime64[D]")
+
+
+def _to_date(day: np.datetime64) -> date | None:
+    return None if np.isnat(day) else day.astype(date)
+
+
+class TradingCalendarIndex:
+    """Sessions of one market over a fixed date range.
+
+    Args:
+        market: Calendar name (``"NYSE"``, ...).
+        tz: Market timezone name.
+        days: Trading days (``datetime64[D]``, ascending).
+        opens / closes: Session open/close in UTC (``datetime64[s]``).
+        utc_offsets: Market UTC offset in minutes on each trading day.
+        early_close: True where the session closes before the regular close.
+        start / end: Inclusive range the index covers.
+    """
+
+    def __init__(
+        self,
+        market: str,
+        tz: str,
+        days: np.ndarray,
+        opens: np.ndarray,
+        closes: np.ndarray,
+        utc_offsets: np.ndarray,
+        early_close: np.ndarray,
+        start: date,
+        end: date,
+    ) -> None:
+        self.market = market
+        self.tz = tz
+        self.days = days.astype("datetime64[D]")
+        self.opens = opens.astype("datetime64[s]")
+        self.closes = closes.astype("datetime64[s]")
+        self.utc_offsets = utc_offsets.astype(np.int16)
+        self.early_close = early_close.astype(bool)
+        self.start = start
+        self.end = end
+        self._origin = np.datetime64(start, "D")
+        span = (np.datetime64(end, "D") - self._origin).astype(int) + 1
+        offsets = (self.days - self._origin).astype(np.int64)
+        self._slot = np.full(span, -1, dtype=np.int32)
+        self._slot[offsets] = np.arange(len(self.days), dtype=np.int32)
+        # Trading days up to and including each day, minus one
+        self._last = (np.cumsum(self._slot >= 0) - 1).astype(np.int32)
+
+    # Construction ------------------------------------------------------
+    @classmethod
+    def from_schedule(
+        cls,
+        market: str,
+        schedule: pd.DataFrame,
+        tz: str,
+        regular_close: time,
+        start: date,
+        end: date,
+    ) -> TradingCalendarIndex:
+        """Index a ``pandas_market_calendars`` schedule."""
+        opens = pd.DatetimeIndex(schedule["market_open"]).tz_convert("UTC")
+        closes = pd.DatetimeIndex(schedule["market_close"]).tz_convert("UTC")
+        local_opens = opens.tz_convert(tz).tz_localize(None)
+        offsets = (local_opens - opens.tz_localize(None)) // pd.Timedelta(minutes=1)
+        local_closes = closes.tz_convert(tz)
+        close_minutes = local_closes.hour * 60 + local_closes.minute
+        early = close_minutes < regular_close.hour * 60 + regular_close.minute
+        return cls(
+            market,
+            tz,
+            days=pd.DatetimeIndex(schedule.index).to_numpy().astype("datetime64[D]"),
+            opens=opens.tz_localize(None).to_numpy(),
+            closes=closes.tz_localize(None).to_numpy(),
+            utc_offsets=np.asarray(offsets),
+            early_close=np.asarray(early),
+            start=start,
+            end=end,
+        )
+
+    @classmethod
+    def build(
+        cls, market: str = "NYSE", start: date = DEFAULT_START, end: date = DEFAULT_END
+    ) -> TradingCalendarIndex:
+        """Build from ``pandas_market_calendars`` (one schedule call)."""
+        if mcal is None:
+            raise RuntimeError("pandas_market_calendars is not installed")
+        calendar = mcal.get_calendar(market)
+        schedule = calendar.schedule(
+            start_date=start.isoformat(), end_date=end.isoformat()
+        )
+        return cls.from_schedule(
+            market, schedule, str(calendar.tz), calendar.close_time, start, end
+        )
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp.npz")
+        np.savez(
+            tmp,
+            meta=np.array(
+                [self.market, self.tz, self.start.isoformat(), self.end.isoformat()]
+            ),
+            version=np.array(_mcal_version()),
+            days=self.days,
+            opens=self.opens,
+            closes=self.closes,
+            utc_offsets=self.utc_offsets,
+            early_close=self.early_close,
+        )
+        tmp.replace(path)
+
+    @classmethod
+    def load(cls, path: Path) -> TradingCalendarIndex | None:
+        """Cached index, or None when missing, unreadable or from another
+        ``pandas_market_calendars`` version."""
+        try:
+            with np.load(path) as data:
+                if str(data["version"]) != _mcal_version():
+                    return None
+                market, tz, start, end = (str(v) for v in data["meta"])
+                return cls(
+                    market,
+                    tz,
+                    data["days"],
+                    data["opens"],
+                    data["closes"],
+                    data["utc_offsets"],
+                    data["early_close"],
+                    date.fromisoformat(start),
+                    date.fromisoformat(end),
+                )
+        except FileNotFoundError:
+            return None
+        except (OSError, KeyError, ValueError) as e:
+            logger.warning("Unreadable calendar cache %s (%s); rebuilding", path, e)
+            return None
+
+    # Lookups -----------------------------------------------------------
+    def covers(self, value: DateLike) -> bool:
+        """True when ``value`` is inside the indexed range."""
+        return self.start <= _to_date(_as_day(value)) <= self.end  # type: ignore[operator]
+
+    def _offsets(self, days: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        k = (days - self._origin).astype(np.int64)
+        inside = (k >= 0) & (k < len(self._slot)) & ~np.isnat(days)
+        return np.where(inside, k, 0), inside
+
+    def _offset(self, value: DateLike) -> int:
+        k = int((_as_day(value) - self._origin).astype(np.int64))
+        if not 0 <= k < len(self._slot):
+            raise ValueError(
+                f"{value} is outside the {self.market} calendar index "
+                f"({self.start} to {self.end})"
+            )
+        return k
+
+    def is_trading_day(self, value: DateLike) -> bool:
+        return bool(self._slot[self._offset(value)] >= 0)
+
+    def trading_day_mask(self, values: Any) -> np.ndarray:
+        """Vectorized :meth:`is_trading_day`; dates outside the range are False."""
+        k, inside = self._offsets(_as_days(values))
+        return inside & (self._slot[k] >= 0)
+
+    def previous_trading_day(
+        self, value: DateLike, inclusive: bool = True
+    ) -> date | None:
+        """Last trading day on (``inclusive``) or before ``value``."""
+        k = self._offset(value) - (0 if inclusive else 1)
+        pos = self._last[k] if k >= 0 else -1
+        return _to_date(self.days[pos]) if pos >= 0 else None
+
+    def next_trading_day(self, value: DateLike, inclusive: bool = False) -> date | None:
+        """First trading day after (or on, with ``inclusive``) ``value``."""
+        k = self._offset(value)
+        pos = self._last[k] + (0 if inclusive and self._slot[k] >= 0 else 1)
+        return _to_date(self.days[pos]) if pos < len(self.days) else None
+
+    def previous_trading_days(self, values: Any, inclusive: bool = True) -> np.ndarray:
+        """Vectorized :meth:`previous_trading_day` (NaT where there is none)."""
+        k, inside = self._offsets(_as_days(values) - (0 if inclusive else 1))
+        pos = self._last[k]
+        ok = inside & (pos >= 0)
+        return np.where(ok, self.days[np.where(ok, pos, 0)], _NAT)
+
+    def next_trading_days(self, values: Any, inclusive: bool = False) -> np.ndarray:
+        """Vectorized :meth:`next_trading_day` (NaT where there is none)."""
+        k, inside = self._offsets(_as_days(values))
+        on_day = self._slot[k] >= 0
+        pos = self._last[k] + np.where(inclusive & on_day, 0, 1)
+        ok = inside & (pos < len(self.days))
+        return np.where(ok, self.days[np.where(ok, pos, 0)], _NAT)
+
+    def count_trading_days(self, start: Any, end: Any) -> Any:
+        """Trading days in ``[start, end]``; scalars or arrays (out of range: 0)."""
+        s, s_in = self._offsets(_as_days(start))
+        e, e_in = self._offsets(_as_days(end))
+        before_start = self._last[s] + 1 - (self._slot[s] >= 0)
+        counts = np.where(
+            s_in & e_in, np.maximum(self._last[e] + 1 - before_start, 0), 0
+        )
+        return int(counts) if counts.ndim == 0 else counts
+
+    def trading_days(self, start: DateLike, end: DateLike) -> np.ndarray:
+        """Trading days in ``[start, end]`` clipped to the index range."""
+        lo = np.searchsorted(self.days, _as_day(start), side="left")
+        hi = np.searchsorted(self.days, _as_day(end), side="right")
+        return self.days[lo:hi]
+
+    def session(
+        self, value: DateLike, utc: bool = False
+    ) -> tuple[datetime, datetime] | None:
+        """Open and close of ``value`` in the market timezone (or UTC);
+        None when the market is closed."""
+        pos = self._slot[self._offset(value)]
+        if pos < 0:
+            return None
+        tz = UTC if utc else ZoneInfo(self.tz)
+        return (
+            _utc_datetime(self.opens[pos]).astimezone(tz),
+            _utc_datetime(self.closes[pos]).astimezone(tz),
+        )
+
+    def is_early_close(self, value: DateLike) -> bool:
+        pos = self._slot[self._offset(value)]
+        return bool(pos >= 0 and self.early_close[pos])
+
+    def schedule(self, start: DateLike, end: DateLike) -> pd.DataFrame:
+        """``pandas_market_calendars``-style schedule for ``[start, end]``."""
+        lo = np.searchsorted(self.days, _as_day(start), side="left")
+        hi = np.searchsorted(self.days, _as_day(end), side="right")
+        return pd.DataFrame(
+            {
+                "market_open": pd.DatetimeIndex(self.opens[lo:hi]).tz_localize("UTC"),
+                "market_close": pd.DatetimeIndex(self.closes[lo:hi]).tz_localize("UTC"),
+            },
+            index=pd.DatetimeIndex(self.days[lo:hi].astype("datetime64[ns]")),
+        )
+
+
+def _utc_datetime(value: np.datetime64) -> datetime:
+    return datetime(1970, 1, 1, tzinfo=UTC) + timedelta(
+        seconds=int(value.astype(np.int64))
+    )
+
+
+def _mcal_version() -> str:
+    return str(getattr(mcal, "__version__", "unknown"))
+
+
+def default_cache_path(
+    market: str, start: date = DEFAULT_START, end: date = DEFAULT_END
+) -> Path:
+    """Cache file under the data cache directory (temp dir without config)."""
+    name = f"trading_calendar_{market}_{start:%Y%m%d}_{end:%Y%m%d}.npz"
+    try:
+        from src.core.config import get_config
+
+        return get_config().data_paths.base_path / "cache" / name
+    except Exception:  # noqa: BLE001 - config is optional here
+        import tempfile
+
+        return Path(tempfile.gettempdir()) / name
+
+
+_indexes: dict[tuple[str, date, date], TradingCalendarIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_trading_calendar(
+    market: str = "NYSE",
+    start: date = DEFAULT_START,
+    end: date = DEFAULT_END,
+    cache_path: Path | None = None,
+) -> TradingCalendarIndex | None:
+    """Process-wide index for ``market``, loaded from or written to the cache.
+
+    Returns None when ``pandas_market_calendars`` is unavailable or does not
+    know ``market``.
+    """
+    if not MCAL_AVAILABLE:
+        return None
+    key = (market.upper(), start, end)
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is not None:
+            return index
+        path = cache_path or default_cache_path(key[0], start, end)
+        index = TradingCalendarIndex.load(path)
+        if index is None:
+            try:
+                index = TradingCalendarIndex.build(key[0], start, end)
+            except Exception as e:  # noqa: BLE001 - callers fall back per call
+                logger.warning("Could not build %s calendar index: %s", key[0], e)
+                return None
+            try:
+                index.save(path)
+            except OSError as e:
+                logger.warning("Could not cache calendar index at %s: %s", path, e)
+        _indexes[key] = index
+        return index
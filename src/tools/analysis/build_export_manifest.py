@@ -8,6 +8,9 @@ Usage examples:
     --returns 0.01,-0.005,0.007 \
     --out artifacts/manifest.json --validate
 
+  # Add block-bootstrap confidence intervals (sharpe_ci, max_drawdown_ci, ...)
+  python -m src.tools.analysis.build_export_manifest ... --bootstrap 10000
+
   python -m src.tools.analysis.build_export_manifest --describe
 """
 
@@ -18,6 +21,7 @@ import json
 from pathlib import Path
 from typing import Any
 
+from src.analytics.bootstrap import bootstrap_trading_metrics
 from src.analytics.evaluation import evaluate_trading_metrics, metrics_to_manifest
 from src.integrations.wandb_integration import log_trading_metrics
 from src.tools._cli_helpers import emit_describe_early
@@ -38,6 +42,14 @@ def tool_describe() -> dict[str, Any]:
             "--returns": {"type": "list[number]", "required": False},
             "--pnl": {"type": "list[number]", "required": False},
             "--f1": {"type": "number", "required": False, "default": 0.0},
+            "--bootstrap": {
+                "type": "int",
+                "required": False,
+                "default": 0,
+                "description": "Block-bootstrap resamples for metric confidence intervals (0 = off)",
+            },
+            "--block-size": {"type": "int", "required": False},
+            "--confidence": {"type": "number", "required": False, "default": 0.95},
             "--out": {"type": "path", "required": True},
             "--validate": {"type": "flag"},
             "--wandb": {
@@ -110,6 +122,9 @@ def main() -> int:
     p.add_argument("--returns")
     p.add_argument("--pnl")
     p.add_argument("--f1", type=float, default=0.0)
+    p.add_argument("--bootstrap", type=int, default=0)
+    p.add_argument("--block-size", type=int)
+    p.add_argument("--confidence", type=float, default=0.95)
     p.add_argument("--out", required=True)
     p.add_argument("--validate", action="store_true")
     p.add_argument("--wandb", action="store_true")
@@ -125,6 +140,15 @@ def main() -> int:
 
     metrics_obj = evaluate_trading_metrics(returns=returns, pnl=pnl)
     metrics_dict = metrics_to_manifest(metrics_obj, f1_value=args.f1, style="tf1")
+    if args.bootstrap > 0 and (returns or pnl):
+        ci = bootstrap_trading_metrics(
+            returns=returns,
+            pnl=pnl,
+            n_resamples=args.bootstrap,
+            block_size=args.block_size,
+            confidence=args.confidence,
+        )
+        metrics_dict.update(ci.to_manifest_metrics())
 
     if args.wandb:
         # Log plain metrics to W&B using TF_1 keys
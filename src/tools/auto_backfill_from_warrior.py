@@ -134,8 +134,22 @@ def _fetch_ib_bars_for_task(  # noqa: C901
         from datetime import time as _time_cls
         from datetime import timedelta as _td
 
+        import pandas as _pd  # type: ignore
+
         from src.core.config import get_config as _getcfg  # type: ignore
         from src.lib.ib_async_wrapper import IBAsync as _IBAsync  # type: ignore
+        from src.services.market_data.request_planner import (
+            covered_from_coverage as _covered_from_coverage,
+        )
+        from src.services.market_data.request_planner import (
+            execute_plan as _execute_plan,
+        )
+        from src.services.market_data.request_planner import (
+            load_coverage as _load_coverage,
+        )
+        from src.services.market_data.request_planner import (
+            plan_requests as _plan_requests,
+        )
     except Exception:
         log.debug("Skipping IB bars fetch due to missing deps", exc_info=True)
         return
@@ -327,20 +341,58 @@ def _fetch_ib_bars_for_task(  # noqa: C901
                 log.warning("1-min bars fetch error for %s %s: %s", symbol, ds, _e_min)
             if force_bars or need_seconds:
                 _t_s0 = time.monotonic()
-                df_s = await ib.req_historical_data(
-                    contract,
-                    duration="1 D",
-                    bar_size="1 sec",
-                    end_datetime=end_ts_eod,
-                    use_rth=False,
+                # IB caps 1-sec requests at 1800 S: plan legal windows for the
+                # parts of 09:00-11:00 the coverage manifest does not have yet
+                start_0900 = _dt.combine(day, _time_cls(hour=9, minute=0))
+                end_1100_dt = _dt.combine(day, _time_cls(hour=11, minute=0))
+                covered = {}
+                parts = []
+                if not force_bars and sec_path.exists():
+                    covered = _covered_from_coverage(
+                        _load_coverage(
+                            cfg.data_paths.base_path / "bars_coverage_manifest.json"
+                        ),
+                        "1 secs",
+                    )
+                    parts.append(_pd.read_parquet(sec_path))
+                plan = _plan_requests(
+                    [symbol],
+                    "1 secs",
+                    day,
+                    day,
+                    covered=covered,
+                    session=(start_0900.time(), end_1100_dt.time()),
+                    days=[day],
+                )
+                log.debug(
+                    "1-sec plan %s %s: %d requests, ~%.0fs",
+                    symbol,
+                    ds,
+                    len(plan.windows),
+                    plan.estimated_seconds,
                 )
+
+                async def _fetch_window(window: Any) -> bool:
+                    part = await ib.req_historical_data(
+                        contract,
+                        duration=window.duration,
+                        bar_size=window.bar_size,
+                        end_datetime=window.end_datetime,
+                        use_rth=False,
+                    )
+                    if part is not None and not part.empty:
+                        parts.append(part)
+                    return part is not None
+
+                await _execute_plan(plan, _fetch_window)
+                df_s = _pd.concat(parts).sort_index() if parts else None
                 _s_dur = time.monotonic() - _t_s0
                 if df_s is not None and not df_s.empty:
                     try:
-                        start_0900 = _dt.combine(day, _time_cls(hour=9, minute=0))
-                        end_1100_dt = _dt.combine(day, _time_cls(hour=11, minute=0))
                         df_sf = df_s.loc[
-                            (df_s.index >= start_0900) & (df_s.index <= end_1100_dt)
+                            ~df_s.index.duplicated()
+                            & (df_s.index >= start_0900)
+                            & (df_s.index <= end_1100_dt)
                         ]
                     except Exception:
                         df_sf = df_s
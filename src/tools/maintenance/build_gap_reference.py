@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""Build or check the gap scanner's per-session prev-close/ADV20 reference file.
+
+Run before the open. The default source is local daily bars from the Parquet
+repository (no network). ``--source ib`` issues one ``21 D`` daily request per
+symbol, which covers both prev close and ADV20. ``--check`` only reports
+freshness and exits non-zero when the file is missing or stale.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from src.tools._cli_helpers import emit_describe_early, print_json
+
+logger = logging.getLogger("build_gap_reference")
+
+
+def tool_describe() -> dict[str, Any]:
+    return {
+        "name": "build_gap_reference",
+        "description": "Build or freshness-check the per-session prev-close/ADV20 reference file used by GapRvolScanner.",
+        "inputs": {
+            "--session": {
+                "type": "YYYY-MM-DD",
+                "required": False,
+                "description": "Trading session the file is for (default: today US/Eastern)",
+            },
+            "--symbols": {"type": "csv", "required": False},
+            "--universe-file": {
+                "type": "path",
+                "required": False,
+                "description": "One symbol per line",
+            },
+            "--source": {"type": "str", "default": "local", "enum": ["local", "ib"]},
+            "--root": {"type": "path", "required": False},
+            "--check": {"type": "flag", "description": "Only report freshness"},
+            "--force": {"type": "flag", "description": "Rebuild even when fresh"},
+        },
+        "outputs": {"stdout": "JSON build/freshness report"},
+        "dependencies": [
+            "pyarrow",
+            "config:GAP_SCANNER_REFERENCE_DIR",
+            "optional:ib_async (--source ib)",
+        ],
+        "examples": [
+            "python -m src.tools.maintenance.build_gap_reference",
+            "python -m src.tools.maintenance.build_gap_reference --check",
+            "python -m src.tools.maintenance.build_gap_reference --source ib --universe-file universe.txt",
+        ],
+    }
+
+
+def describe() -> dict[str, Any]:  # alias
+    return tool_describe()
+
+
+if emit_describe_early(tool_describe):  # pragma: no cover
+    raise SystemExit(0)
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    p = argparse.ArgumentParser(description="Build gap scanner reference data")
+    p.add_argument("--session", default="", help="Session date YYYY-MM-DD")
+    p.add_argument("--symbols", default="", help="Comma list of symbols")
+    p.add_argument("--universe-file", default="", help="File with one symbol per line")
+    p.add_argument("--source", choices=("local", "ib"), default="local")
+    p.add_argument("--root", default="", help="Reference directory override")
+    p.add_argument("--check", action="store_true", help="Only check freshness")
+    p.add_argument("--force", action="store_true", help="Rebuild even if fresh")
+    return p.parse_args(argv)
+
+
+def _symbols(args: argparse.Namespace) -> list[str]:
+    symbols = [s.strip().upper() for s in args.symbols.split(",") if s.strip()]
+    if args.universe_file:
+        text = Path(args.universe_file).read_text(encoding="utf-8")
+        symbols += [ln.strip().upper() for ln in text.splitlines() if ln.strip()]
+    return list(dict.fromkeys(symbols))
+
+
+def _local_bars(symbols: list[str]) -> dict[str, Any]:
+    from src.data.parquet_repository import ParquetRepository
+
+    repo = ParquetRepository()
+    return {sym: repo.load_data(sym, "1 day") for sym in symbols or repo.list_symbols()}
+
+
+def _ib_bars(symbols: list[str]) -> dict[str, Any]:
+    import pandas as pd
+
+    from src.scanner.gap_rvol_scanner import _ADV_BARS, _stock
+    from src.utils.ib_connection_helper import get_ib_connection_sync
+
+    ib, _tracker = get_ib_connection_sync(live_mode=False)
+    out: dict[str, Any] = {}
+    try:
+        for sym in symbols:
+            try:
+                bars = ib.reqHistoricalData(_stock(sym), endDateTime="", **_ADV_BARS)
+            except Exception as e:  # noqa: BLE001
+                logger.warning("daily bars failed for %s: %s", sym, e)
+                continue
+            if bars is not None and not isinstance(bars, pd.DataFrame):
+                bars = pd.DataFrame([vars(b) for b in bars])
+            out[sym] = bars
+    finally:
+        ib.disconnect()
+    return out
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    from src.scanner.reference_data import (
+        build_reference_frame,
+        check_freshness,
+        write_reference,
+    )
+    from src.utils.time_utils import now_eastern
+
+    session = (
+        datetime.strptime(args.session, "%Y-%m-%d").date()
+        if args.session
+        else now_eastern().date()
+    )
+    root = args.root or None
+    status = check_freshness(session, root)
+    if args.check or (status.fresh and not args.force):
+        print_json({"ok": status.fresh, "built": False, **status.to_dict()})
+        return 0 if status.fresh else 1
+
+    symbols = _symbols(args)
+    if args.source == "ib" and not symbols:
+        print_json(
+            {"ok": False, "errors": ["--source ib needs --symbols or --universe-file"]}
+        )
+        return 2
+    started = time.perf_counter()
+    bars = _ib_bars(symbols) if args.source == "ib" else _local_bars(symbols)
+    frame = build_reference_frame(bars, session, status.expected_prev_session)
+    path = write_reference(frame, session, root, source=args.source)
+    status = check_freshness(session, root)
+    missing = sorted(set(bars) - set(frame["symbol"]))
+    print_json(
+        {
+            "ok": status.fresh,
+            "built": True,
+            "source": args.source,
+            "requested": len(bars),
+            "missing": missing[:50],
+            "missing_count": len(missing),
+            "elapsed_s": round(time.perf_counter() - started, 3),
+            **status.to_dict(),
+            "path": str(path),
+        }
+    )
+    return 0 if status.fresh else 1
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
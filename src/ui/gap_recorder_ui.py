@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
 import queue
 import threading
 import tkinter as tk
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
 from datetime import datetime
 from tkinter import ttk
 from typing import Any, cast
@@ -50,6 +51,11 @@ class App:
             self.ib = None  # type: ignore[assignment]
         # Core scanner components
         self.scanner = GapRvolScanner(None)
+        try:
+            # Pre-open reference file: prev close/ADV20 without IB requests
+            self.scanner.load_reference()
+        except Exception:  # noqa: BLE001
+            pass
         self.ib_scanner = IBMarketScanner(self.ib)
 
         # Pass IB to MarketDataService – if unavailable, use a NullIB stub
@@ -170,40 +176,67 @@ class App:
         t.start()
 
     def _scan_worker(self) -> None:
-        """Background thread: fetch universe -> compute gap/RVOL -> filter -> queue UI update."""
+        """Background thread: fetch universe -> compute gap/RVOL -> filter -> queue UI update.
+
+        Candidates are queued as ``scan_partial`` events while the concurrent
+        scan is still running; the final ``scan_result`` replaces the table.
+        """
         try:
-            universe = self.ib_scanner.fetch_universe(max_symbols=200)
-            # Defensive price bound filter again (server-side already attempts this)
-            price_min, price_max = cfg_ext.price_min(), cfg_ext.price_max()
-            cands = self.scanner.scan(universe)
-            mg = self.min_gap_var.get()
-            mr = self.min_rvol_var.get()
-            filtered: list[Candidate] = []
-            for c in cands:
-                if (
-                    c.gap_pct * 100 >= mg
-                    and c.rvol >= mr
-                    and price_min <= c.last <= price_max
-                    and c.symbol not in self._hidden
-                    and (
-                        not self.exclude_etf_var.get()
-                        or c.symbol not in self._etf_blacklist
-                    )
-                ):
-                    filtered.append(c)
-            self.event_q.put(("scan_result", filtered))
+            universe = self.ib_scanner.fetch_universe(
+                max_symbols=cfg_ext.universe_max_symbols()
+            )
+            wanted = self._candidate_filter()
+
+            def on_candidate(c: Candidate) -> None:
+                if wanted(c):
+                    self.event_q.put(("scan_partial", [c]))
+
+            asyncio.run(self.scanner.scan_async(universe, on_candidate=on_candidate))
+            # Final table: one columnar screen over the now-cached inputs
+            excluded = set(self._hidden)
+            if self.exclude_etf_var.get():
+                excluded |= self._etf_blacklist
+            ranked = self.scanner.screen(
+                universe,
+                min_gap_pct=self.min_gap_var.get(),
+                min_rvol=self.min_rvol_var.get(),
+                exclude=excluded,
+            )
+            self.event_q.put(("scan_result", ranked))
         except Exception as e:  # noqa: BLE001
             self.event_q.put(("error", str(e)))
         finally:
             self._schedule_scan()
 
+    def _candidate_filter(self) -> Callable[[Candidate], bool]:
+        """Snapshot the UI thresholds into a predicate usable off the UI thread."""
+        # Defensive price bound filter again (server-side already attempts this)
+        price_min, price_max = cfg_ext.price_min(), cfg_ext.price_max()
+        mg = self.min_gap_var.get()
+        mr = self.min_rvol_var.get()
+        exclude_etf = self.exclude_etf_var.get()
+
+        def wanted(c: Candidate) -> bool:
+            return (
+                c.gap_pct * 100 >= mg
+                and c.rvol >= mr
+                and price_min <= c.last <= price_max
+                and c.symbol not in self._hidden
+                and (not exclude_etf or c.symbol not in self._etf_blacklist)
+            )
+
+        return wanted
+
     def process_events(self) -> None:
         """Poll event queue (UI thread safe) and update UI/state."""
         try:
             while True:
                 evt, payload = self.event_q.get_nowait()
                 if evt == "scan_result":
+                    self.session_mgr.update_scores({c.symbol: c.score for c in payload})
                     self._refresh_table(payload)
+                elif evt == "scan_partial":
+                    self._refresh_table(payload, prune=False)
                 elif evt == "error":
                     # Non-intrusive error display
                     self.status_var.set(f"Last error: {payload}")
@@ -213,7 +246,9 @@ class App:
         self.session_mgr.upgrade_cycle()
         self.root.after(250, self.process_events)
 
-    def _refresh_table(self, candidates: Iterable[Candidate]) -> None:
+    def _refresh_table(
+        self, candidates: Iterable[Candidate], prune: bool = True
+    ) -> None:
         existing = set(self.tree.get_children())
         iid_by_sym: dict[str, str] = {
             self.tree.set(iid, "Symbol"): iid for iid in existing
@@ -240,12 +275,14 @@ class App:
             else:
                 row_iid = self.tree.insert("", "end", values=values)
             keep.add(row_iid)
+        if not prune:
+            return  # partial update: rows from the previous scan stay until it ends
         for iid in existing - keep:
             self.tree.delete(iid)
         summary = self.session_mgr.active_summary()
         size = len(cand_list)
         self.status_var.set(
-            f"Last: {datetime.now().strftime('%H:%M:%S')} Candidates: {size} Active ticks {summary['ticks']} / L2 {summary['l2']} ({summary['l2']}/5) Queue {summary['queued']} Hidden {len(self._hidden)} ETFs {'ON' if self.exclude_etf_var.get() else 'OFF'}"
+            f"Last: {datetime.now().strftime('%H:%M:%S')} Candidates: {size} Active ticks {summary['ticks']} / L2 {summary['l2']} ({summary['l2']}/{summary['l2_capacity']}) Queue {summary['queued']} Hidden {len(self._hidden)} ETFs {'ON' if self.exclude_etf_var.get() else 'OFF'}"
         )
 
     def _session_status(self, sym: str) -> str:
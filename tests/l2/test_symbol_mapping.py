@@ -1,7 +1,14 @@
 import json
+import os
 from pathlib import Path
 
-from src.services.symbol_mapping import load_symbol_mapping, to_vendor
+from src.services.symbol_mapping import (
+    get_symbol_mapping_registry,
+    load_symbol_mapping,
+    resolve_many,
+    resolve_vendor_params,
+    to_vendor,
+)
 
 
 def test_symbol_mapping_identity(tmp_path: Path):
@@ -11,3 +18,45 @@ def test_symbol_mapping_identity(tmp_path: Path):
     assert mapping["TSLA"] == "TSLAQ"
     assert to_vendor("AAPL", "databento", path) == "AAPL"  # fallback
     assert to_vendor("TSLA", "databento", path) == "TSLAQ"
+
+
+def test_resolve_many_uses_cached_registry(tmp_path: Path, capsys):
+    path = tmp_path / "mapping.json"
+    path.write_text(
+        json.dumps(
+            {
+                "TSLA": "TSLAQ",
+                "BRK.B": {"symbol": "BRK B", "dataset": "NYSE.PILLAR"},
+                "SPY": "SPY",
+            }
+        )
+    )
+    registry = get_symbol_mapping_registry(path)
+    resolved = resolve_many(
+        ["TSLA", "BRK.B", "AAPL"], "databento", path, "NASDAQ.ITCH", "mbp-10"
+    )
+    assert resolved == {
+        "TSLA": ("TSLAQ", "XNAS.ITCH", "mbp-10"),
+        "BRK.B": ("BRK B", "XNYS.PILLAR", "mbp-10"),
+        "AAPL": ("AAPL", "XNAS.ITCH", "mbp-10"),
+    }
+    for _ in range(3):
+        assert resolve_vendor_params(
+            "BRK.B", "databento", path, "XNAS.ITCH", "mbo"
+        ) == ("BRK B", "XNYS.PILLAR", "mbo")
+    assert to_vendor("BRK.B", "databento", path) == "BRK B"
+    assert registry.loads == 1
+    assert capsys.readouterr().err.count("identity mapping SPY->SPY") == 1
+
+    # Rewriting the file invalidates the registry
+    path.write_text(json.dumps({"TSLA": {"symbol": "TSLA", "schema": "mbo"}}))
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    assert resolve_vendor_params("TSLA", "databento", path, "XNAS.ITCH", "mbp-10") == (
+        "TSLA",
+        "XNAS.ITCH",
+        "mbo",
+    )
+    assert registry.loads == 2
+    path.unlink()
+    assert load_symbol_mapping(path) == {}
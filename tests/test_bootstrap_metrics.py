@@ -0,0 +1,96 @@
+import numpy as np
+import pytest
+
+from src.analytics import bootstrap as bs
+from src.analytics.bootstrap import bootstrap_trading_metrics
+
+
+def test_block_summaries_match_materialized_resamples():
+    rng = np.random.default_rng(5)
+    series = rng.normal(0.0005, 0.01, size=997)  # last block is truncated
+    table = bs._block_table(series, 9)
+    starts = bs._block_starts(series.size, 9, 300, rng)
+
+    fast = bs._returns_stats_from_blocks(table, starts, series.size, 252)
+    sample = bs._materialize(table, starts, series.size)
+    slow = np.vstack(
+        [
+            bs._sharpe_rows(sample, 252),
+            bs._drawdown_rows(np.cumprod(sample + 1.0, axis=1)),
+            bs._win_rate_rows(sample),
+        ]
+    )
+    assert np.allclose(fast, slow, rtol=1e-9, atol=1e-12)
+
+
+def _materialized_reference(sample: np.ndarray, is_pnl: bool) -> np.ndarray:
+    if is_pnl:
+        eq = np.cumsum(sample, axis=1) + 1.0
+        rets = eq[:, 1:] / eq[:, :-1] - 1.0
+    else:
+        eq = np.cumprod(sample + 1.0, axis=1)
+        rets = sample
+    return np.vstack(
+        [
+            bs._sharpe_rows(rets, 252),
+            bs._drawdown_rows(eq),
+            bs._win_rate_rows(sample),
+        ]
+    )
+
+
+@pytest.mark.parametrize("case", ["pnl", "pnl_ruin", "returns_below_-1"])
+def test_path_statistics_match_materialized_resamples(case):
+    rng = np.random.default_rng(6)
+    series = rng.normal(0.0005, 0.01, size=997)
+    is_pnl = case.startswith("pnl")
+    if case == "pnl_ruin":
+        series[[100, 700]] = -0.6  # equity <= 0 in some resamples
+    elif not is_pnl:
+        series[[10, 500]] = [-1.2, 0.0]  # no log equity: drawdown walks the path
+    table = bs._block_table(series, 9)
+    # More resamples than one path row group, not a multiple of it
+    starts = bs._block_starts(series.size, 9, bs._PATH_ROWS * 2 + 37, rng)
+
+    chunk = bs._evaluate_chunk(
+        series, 9, starts.shape[0], np.random.SeedSequence(0), is_pnl, 252
+    )
+    assert chunk.shape == (3, starts.shape[0])
+
+    rng_chunk = np.random.default_rng(np.random.SeedSequence(0))
+    starts = bs._block_starts(series.size, 9, starts.shape[0], rng_chunk)
+    expected = _materialized_reference(
+        bs._materialize(table, starts, series.size), is_pnl
+    )
+    assert np.allclose(chunk, expected, rtol=1e-9, atol=1e-12)
+
+
+def test_intervals_bracket_point_and_are_reproducible():
+    returns = np.random.default_rng(1).normal(0.001, 0.01, size=1500)
+    a = bootstrap_trading_metrics(returns=returns, n_resamples=2000, seed=7)
+    b = bootstrap_trading_metrics(returns=returns, n_resamples=2000, seed=7)
+    assert a == b
+    for ci in (a.sharpe, a.max_drawdown, a.win_rate):
+        assert ci.lower <= ci.point <= ci.upper
+    assert a.max_drawdown.upper <= 0.0
+    manifest = a.to_manifest_metrics()
+    assert manifest["sharpe_ci"] == [a.sharpe.lower, a.sharpe.upper]
+    assert manifest["bootstrap"]["resamples"] == 2000
+
+
+def test_pnl_path_and_process_pool_agree():
+    pnl = np.random.default_rng(2).normal(0.002, 0.02, size=400)
+    serial = bootstrap_trading_metrics(pnl=pnl, n_resamples=600, chunk_size=200, seed=3)
+    parallel = bootstrap_trading_metrics(
+        pnl=pnl, n_resamples=600, chunk_size=200, seed=3, n_jobs=2
+    )
+    assert serial == parallel
+    assert serial.sharpe.lower < serial.sharpe.upper
+
+
+def test_degenerate_inputs():
+    res = bootstrap_trading_metrics(returns=[0.01], n_resamples=100)
+    assert res.n_resamples == 0
+    assert res.sharpe.lower == res.sharpe.upper == res.sharpe.point
+    with pytest.raises(ValueError):
+        bootstrap_trading_metrics(n_resamples=10)
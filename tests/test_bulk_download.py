@@ -0,0 +1,122 @@
+"""Bulk download planning and concurrent execution."""
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+from src.core.connection_pool import ConnectionConfig, ConnectionPool
+from src.services.historical_data.bulk_download import (
+    BulkDownloader,
+    BulkJob,
+    plan_bulk_jobs,
+)
+from src.services.historical_data.download_tracker import DownloadTracker
+from src.services.historical_data.historical_data_service import (
+    HistoricalDataService,
+)
+
+
+def _tracker():
+    # Tracking sheets without the Excel round trip
+    tracker = object.__new__(DownloadTracker)
+    tracker.df_downloaded = pd.DataFrame(
+        {"1 min": ["Yes"], "Stock": ["AAPL"]},
+        index=pd.Index(["2024-01-02-AAPL"], name="DateStock"),
+    )
+    tracker.df_failed = pd.DataFrame(
+        {"NonExistant": ["Yes", "No"], "1 min-LatestFailed": [None, "2024-01-01"]},
+        index=pd.Index(["GONE", "TSLA"], name="Stock"),
+    )
+    tracker.df_downloadable = pd.DataFrame()
+    return tracker
+
+
+def test_plan_dedupes_and_prefilters_in_one_pass():
+    jobs, report = plan_bulk_jobs(
+        ["aapl", "AAPL", "MSFT", "GONE", "TSLA"],
+        ["1 min"],
+        ["2024-01-02", "2024-01-03"],
+        _tracker(),
+    )
+    assert [(j.symbol, j.for_date) for j in jobs] == [
+        ("AAPL", "2024-01-03"),
+        ("MSFT", "2024-01-02"),
+        ("MSFT", "2024-01-03"),
+    ]
+    assert report.requested == 10 and report.duplicates == 2
+    assert report.skipped == {"downloaded": 1, "unavailable": 4}
+    assert report.to_dict()["skipped"] == 7
+
+
+def test_downloader_runs_jobs_across_pooled_connections():
+    stored, completed, failed = [], [], []
+
+    async def fetch(connection, job):
+        await asyncio.sleep(0.05)
+        if job.symbol == "NONE":
+            return None
+        return pd.DataFrame({"close": [1.0, 2.0]})
+
+    async def scenario():
+        async def factory(client_id):
+            return SimpleNamespace(client_id=client_id)
+
+        pool = ConnectionPool(
+            ConnectionConfig(min_connections=3, max_connections=3), factory=factory
+        )
+        await pool.start_async()
+        jobs = [BulkJob(f"S{i}", "1 min", "2024-01-02") for i in range(8)]
+        jobs.append(BulkJob("NONE", "1 min", "2024-01-02"))
+        downloader = BulkDownloader(
+            fetch,
+            lambda job, bars: stored.append(job) or True,
+            pool=pool,
+            on_success=lambda job, rows: completed.append((job.symbol, rows)),
+            on_failure=lambda job, error: failed.append(error),
+        )
+        t0 = time.monotonic()
+        report = await downloader.run(jobs)
+        elapsed = time.monotonic() - t0
+        pool.shutdown()
+        return report, elapsed
+
+    report, elapsed = asyncio.run(scenario())
+    assert report.successful == 8 and report.failed == 1 and report.rows == 16
+    assert len(stored) == 8 and len(completed) == 8
+    assert failed == ["No data returned from IB"]
+    # Three connections share the nine jobs, so this takes ~3 fetches, not 9
+    assert sorted(report.by_connection.values()) == [3, 3, 3]
+    assert elapsed < 0.3
+    assert report.jobs_per_second > 0
+
+
+def test_sync_bulk_download_runs_on_the_connection_loop():
+    async def bulk_download_async(*args, **kwargs):
+        return {"loop": asyncio.get_running_loop()}
+
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    try:
+        service = object.__new__(HistoricalDataService)
+        service.ib_connection = SimpleNamespace(wrapper=SimpleNamespace(_loop=loop))
+        service.bulk_download_async = bulk_download_async
+        assert service.bulk_download(["AAPL"], ["1 min"])["loop"] is loop
+
+        # No connection loop to hand over to: refuse to block the caller's loop
+        service.ib_connection = None
+
+        async def from_async_code():
+            with pytest.raises(RuntimeError, match="bulk_download_async"):
+                service.bulk_download(["AAPL"], ["1 min"])
+
+        asyncio.run(from_async_code())
+        assert service.bulk_download(["AAPL"], ["1 min"])["loop"] is not loop
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
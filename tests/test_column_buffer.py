@@ -0,0 +1,132 @@
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.services.market_data import market_data_service as mds
+from src.services.market_data.column_buffer import PYARROW_AVAILABLE, ColumnBuffer
+from src.services.market_data.market_data_service import TickByTickManager
+
+SCHEMA = {"timestamp": "timestamp", "price": "float", "size": "int", "ex": "str"}
+T0 = datetime(2025, 3, 4, 14, 30, tzinfo=UTC)
+
+
+def test_append_grows_and_builds_frame_on_demand():
+    buf = ColumnBuffer(SCHEMA, capacity=2)
+    for i in range(5):
+        buf.append(T0 + timedelta(seconds=i), 1.5 + i, 100 * i, "ARCA")
+    buf.extend(
+        {
+            "timestamp": [T0 + timedelta(seconds=9)],
+            "price": [9.0],
+            "size": [7],
+            "ex": ["NSDQ"],
+        }
+    )
+    assert len(buf) == 6 and buf._capacity == 8
+
+    df = buf.to_frame()
+    assert list(df.columns) == list(SCHEMA)
+    assert str(df["timestamp"].dt.tz) == "UTC"
+    assert df["timestamp"].iloc[1] == T0 + timedelta(seconds=1)
+    assert df["price"].tolist() == [1.5, 2.5, 3.5, 4.5, 5.5, 9.0]
+    assert df["size"].dtype == np.int64 and df["ex"].iloc[-1] == "NSDQ"
+
+
+@pytest.mark.skipif(not PYARROW_AVAILABLE, reason="pyarrow required")
+def test_spills_parquet_segments_and_reassembles(tmp_path):
+    buf = ColumnBuffer(SCHEMA, capacity=4, spill_rows=10, spill_dir=tmp_path)
+    for i in range(25):
+        buf.append(T0 + timedelta(milliseconds=i), float(i), i, "X")
+    assert len(buf.segments) == 2 and buf.in_memory == 5 and len(buf) == 25
+    assert buf._capacity == 10  # growth stops at the spill threshold
+
+    df = buf.to_frame()
+    assert df["size"].tolist() == list(range(25))
+    assert df["timestamp"].is_monotonic_increasing
+
+
+def test_pandas_timestamps_are_stored_exactly():
+    buf = ColumnBuffer(SCHEMA)
+    ts = pd.Timestamp("2025-03-04 14:30:00.123457", tz="UTC") + pd.Timedelta(
+        nanoseconds=999
+    )
+    buf.append(ts, 1.0, 1, "X")
+    assert buf._arrays["timestamp"][0] == ts.value // 1000
+
+
+def test_naive_datetimes_and_timestamps_are_both_utc():
+    buf = ColumnBuffer(SCHEMA)
+    naive = datetime(2025, 3, 4, 14, 30, 0, 123457)
+    buf.append(naive, 1.0, 1, "X")
+    buf.append(pd.Timestamp(naive), 1.0, 1, "X")
+    buf.append(naive.replace(tzinfo=UTC), 1.0, 1, "X")
+    assert len(set(buf._arrays["timestamp"][:3])) == 1
+
+
+def test_tick_by_tick_manager_appends_without_concat():
+    mgr = TickByTickManager(ib=None, symbol="ABC")  # type: ignore[arg-type]
+    ticks = [
+        SimpleNamespace(
+            time=T0 + timedelta(seconds=i),
+            price=10.0 + i,
+            size=100,
+            exchange="ARCA",
+            specialConditions="",
+        )
+        for i in range(3)
+    ]
+    mgr._on_update(SimpleNamespace(ticks=ticks))
+    mgr._on_update(SimpleNamespace(ticks=ticks[:1]))
+    df = mgr.tick_data
+    assert len(df) == 4
+    assert df["price"].tolist() == [10.0, 11.0, 12.0, 10.0]
+    assert list(df.columns) == [
+        "timestamp",
+        "price",
+        "size",
+        "exchange",
+        "special_conditions",
+    ]
+
+
+@pytest.mark.skipif(not PYARROW_AVAILABLE, reason="pyarrow required")
+def test_tick_by_tick_stop_saves_from_session_file(tmp_path, monkeypatch):
+    import pyarrow.parquet as pq
+
+    ticker = SimpleNamespace(updateEvent=SimpleNamespace(connect=lambda cb: None))
+    monkeypatch.setattr(mds, "req_tick_by_tick_data", lambda *a, **k: ticker)
+    monkeypatch.setattr(mds, "SPILL_ROWS", 3)
+    mgr = TickByTickManager(ib=SimpleNamespace(), symbol="ABC")  # type: ignore[arg-type]
+    mgr.notifications = None
+    mgr.config = SimpleNamespace(
+        get_env=lambda key, default=None: default,
+        data_paths=SimpleNamespace(base_path=tmp_path),
+    )
+
+    def _broken_recovery(directory):
+        raise OSError("unreadable leftover journal")
+
+    # A failed recovery of earlier sessions must not stop a new one
+    (tmp_path / "TickByTick" / "ABC").mkdir(parents=True)
+    monkeypatch.setattr(mds, "recover_journals", _broken_recovery)
+    assert mgr.start()
+    ticks = [
+        SimpleNamespace(time=T0 + timedelta(seconds=i), price=10.0 + i, size=100)
+        for i in range(7)
+    ]
+    mgr._on_update(SimpleNamespace(ticks=ticks))
+
+    def _no_rebuild():
+        raise AssertionError("stop() must not rebuild the session frame")
+
+    monkeypatch.setattr(mgr._ticks, "to_frame", _no_rebuild)
+    assert mgr.stop()
+
+    path = mgr.saved_path
+    assert path == tmp_path / "TickByTick" / "ABC" / f"{mgr.session_id}_ticks.parquet"
+    meta = pq.ParquetFile(path).metadata
+    assert meta.num_row_groups == 3 and meta.num_rows == 7
+    assert pq.read_table(path).column("price").to_pylist()[-1] == 16.0
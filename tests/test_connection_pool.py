@@ -1,9 +1,11 @@
 """
 Functional tests for src/core/connection_pool.py
 Covers multi-acquire/release, pool exhaustion, timeouts, and circuit breaker logic.
-All IB dependencies are mocked/faked.
+All IB dependencies are mocked/faked; async tests run against a fake
+gateway on localhost.
 """
 
+import asyncio
 import time
 
 import pytest
@@ -15,6 +17,7 @@ from src.core.connection_pool import (
     ConnectionPriority,
     ConnectionState,
 )
+from src.core.error_handler import TradingSystemError
 
 
 class DummyConnection:
@@ -81,3 +84,135 @@ def test_circuit_breaker():
     with pytest.raises(TradingSystemError):
         cb.call(fail)
     assert cb.state in [ConnectionState.HALF_OPEN, ConnectionState.OPEN]
+
+
+class FakeGateway:
+    """Localhost TCP server that accepts one session per distinct client id."""
+
+    def __init__(self):
+        self.client_ids: list[int] = []
+        self.active: set[int] = set()
+        self.port = 0
+
+    async def start(self):
+        self.server = await asyncio.start_server(self._serve, "127.0.0.1", 0)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def _serve(self, reader, writer):
+        client_id = int((await reader.readline()).split()[1])
+        if client_id in self.active:  # IB error 326: client id already in use
+            writer.write(b"ERR 326\n")
+            writer.close()
+            return
+        self.active.add(client_id)
+        self.client_ids.append(client_id)
+        writer.write(b"OK\n")
+        await reader.read()  # until the client disconnects
+        self.active.discard(client_id)
+        writer.close()
+
+    async def connect(self, client_id):
+        reader, writer = await asyncio.open_connection("127.0.0.1", self.port)
+        writer.write(f"HELLO {client_id}\n".encode())
+        if await reader.readline() != b"OK\n":
+            raise ConnectionError(f"client id {client_id} rejected")
+        return FakeSession(client_id, writer)
+
+
+class FakeSession:
+    def __init__(self, client_id, writer):
+        self.client_id = client_id
+        self.writer = writer
+
+    async def disconnect(self):
+        self.writer.close()
+
+
+def _gateway_pool(gateway, **config):
+    config.setdefault("connection_timeout", 2.0)
+    return ConnectionPool(ConnectionConfig(**config), factory=gateway.connect)
+
+
+def test_prewarm_and_distinct_client_ids():
+    async def scenario():
+        gateway = FakeGateway()
+        await gateway.start()
+        pool = _gateway_pool(gateway, min_connections=2, max_connections=3)
+        assert await pool.start_async() == 2
+        assert sorted(gateway.client_ids) == [1000, 1001]
+
+        leases = [await pool.acquire() for _ in range(3)]
+        assert sorted(lease.client_id for lease in leases) == [1000, 1001, 1002]
+        assert sorted(gateway.client_ids) == [1000, 1001, 1002]
+        assert all(lease.connection.client_id == lease.client_id for lease in leases)
+        for lease in leases:
+            lease.return_to_pool()
+        pool.shutdown()
+        await asyncio.sleep(0.05)
+        assert gateway.active == set()
+
+    asyncio.run(scenario())
+
+
+def test_priority_handoff_and_wait_histogram():
+    async def scenario():
+        gateway = FakeGateway()
+        await gateway.start()
+        pool = _gateway_pool(gateway, max_connections=1)
+        held = await pool.acquire()
+        order = []
+
+        async def request(priority):
+            async with await pool.acquire(priority):
+                order.append(priority)
+
+        low = asyncio.create_task(request(ConnectionPriority.LOW))
+        await asyncio.sleep(0.01)
+        critical = asyncio.create_task(request(ConnectionPriority.CRITICAL))
+        await asyncio.sleep(0.05)
+        assert pool.get_pool_status()["waiting_requests"] == 2
+        held.return_to_pool()
+        await asyncio.gather(low, critical)
+        assert order == [ConnectionPriority.CRITICAL, ConnectionPriority.LOW]
+
+        waits = pool.get_pool_status()["wait_times"]
+        assert waits["LOW"]["count"] == 1 and waits["LOW"]["max_ms"] >= 40
+        assert waits["CRITICAL"]["count"] == 1
+        with pytest.raises(TradingSystemError):
+            async with await pool.acquire(ConnectionPriority.LOW, timeout=0.01):
+                async with await pool.acquire(ConnectionPriority.LOW, timeout=0.01):
+                    pass
+        assert pool.get_pool_status()["wait_times"]["LOW"]["timeouts"] == 1
+        pool.shutdown()
+
+    asyncio.run(scenario())
+
+
+def test_least_loaded_routing_and_per_connection_pacing():
+    async def scenario():
+        gateway = FakeGateway()
+        await gateway.start()
+        pool = _gateway_pool(
+            gateway, min_connections=2, max_connections=2, max_requests_per_second=0
+        )
+        await pool.start_async()
+        held = await pool.acquire()
+        for _ in range(3):
+            async with await pool.acquire() as session:
+                assert session.client_id != held.client_id
+        held.return_to_pool()
+        # The connection that was held has the lighter load and gets the work
+        for _ in range(2):
+            async with await pool.acquire() as session:
+                assert session.client_id == held.client_id
+        pool.shutdown()
+
+        paced = _gateway_pool(gateway, max_connections=1, max_requests_per_second=2)
+        t0 = time.monotonic()
+        for _ in range(3):
+            async with await paced.acquire():
+                pass
+        assert time.monotonic() - t0 >= 0.9
+        paced.shutdown()
+
+    asyncio.run(scenario())
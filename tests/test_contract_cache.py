@@ -0,0 +1,130 @@
+"""Tests for the shared contract-details cache."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+from src.infra.contract_cache import ContractCache
+from src.scanner.gap_rvol_scanner import GapRvolScanner
+
+_CON_IDS = {"AAPL": 265598, "MSFT": 272093, "TSLA": 76792991}
+
+
+class _FakeIB:
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def isConnected(self) -> bool:  # noqa: N802
+        return True
+
+    async def reqContractDetailsAsync(self, contract: Any) -> list[Any]:  # noqa: N802
+        self.calls.append(contract.symbol)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        con_id = _CON_IDS.get(contract.symbol)
+        if con_id is None:
+            return []
+        qualified = SimpleNamespace(
+            symbol=contract.symbol,
+            conId=con_id,
+            primaryExchange="NASDAQ",
+            currency="USD",
+        )
+        return [
+            SimpleNamespace(
+                contract=qualified,
+                minTick=0.01,
+                tradingHours="20240102:0400-20240102:2000",
+                liquidHours="20240102:0930-20240102:1600",
+                timeZoneId="US/Eastern",
+                longName=f"{contract.symbol} INC",
+            )
+        ]
+
+    def qualifyContracts(self, contract: Any) -> list[Any]:  # noqa: N802
+        self.calls.append(contract.symbol)
+        contract.conId = _CON_IDS[contract.symbol]
+        return [contract]
+
+
+def test_qualify_many_persists_and_skips_known_symbols(tmp_path):
+    path = tmp_path / "contracts.json"
+    ib = _FakeIB()
+    cache = ContractCache(path)
+    infos = asyncio.run(
+        cache.qualify_many(
+            ib,
+            ["aapl", "MSFT", "TSLA", "NOPE", "AAPL"],
+            concurrency=2,
+            rate_per_sec=1000,
+        )
+    )
+    assert list(infos) == ["AAPL", "MSFT", "TSLA", "NOPE"]
+    assert infos["AAPL"].con_id == 265598 and infos["AAPL"].min_tick == 0.01
+    assert infos["NOPE"] is None
+    assert sorted(ib.calls) == ["AAPL", "MSFT", "NOPE", "TSLA"]
+    assert ib.max_in_flight <= 2
+
+    # A fresh process: known symbols need no round trip at all
+    ib2 = _FakeIB()
+    restarted = ContractCache(path)
+    again = asyncio.run(restarted.qualify_many(ib2, ["AAPL", "MSFT", "TSLA"]))
+    assert ib2.calls == [] and again["TSLA"].liquid_hours.endswith("1600")
+    scanner = GapRvolScanner(ib2, contracts=restarted)  # type: ignore[arg-type]
+    contract = scanner._qualify("MSFT")
+    assert (contract.conId, contract.primaryExchange) == (272093, "NASDAQ")
+    assert ib2.calls == []
+    stats = restarted.stats()
+    assert stats["hits"] == 4 and stats["misses"] == 0 and stats["hit_rate"] == 1.0
+
+    # Past the TTL entries are still served but refreshed by qualify_many
+    expired = ContractCache(path, ttl=0)
+    assert expired.contract("AAPL").conId == 265598
+    asyncio.run(expired.qualify_many(ib2, ["AAPL"]))
+    assert ib2.calls == ["AAPL"]
+
+
+def test_qualify_records_contract_and_merges_on_save(tmp_path):
+    path = tmp_path / "contracts.json"
+    ib = _FakeIB()
+    first, second = ContractCache(path), ContractCache(path)
+    assert first.qualify(ib, "AAPL").conId == 265598
+    assert first.qualify(ib, "AAPL").conId == 265598
+    assert ib.calls == ["AAPL"]
+    assert not first.get("AAPL").has_details  # type: ignore[union-attr]
+
+    second.qualify(ib, "MSFT")  # saved by another process meanwhile
+    merged = ContractCache(path)
+    assert len(merged) == 2 and "AAPL" in merged and "MSFT" in merged
+
+    # No IB session: a plain, unqualified contract and no request
+    assert ContractCache().qualify(None, "TSLA").symbol == "TSLA"
+
+    # Past the TTL qualify asks IB again, and serves the stale entry if IB fails
+    expired = ContractCache(path, ttl=0)
+    ib.calls.clear()
+    assert expired.qualify(ib, "AAPL").conId == 265598 and ib.calls == ["AAPL"]
+    ib.qualifyContracts = lambda contract: []  # type: ignore[method-assign]
+    assert expired.qualify(ib, "MSFT").conId == 272093
+    assert expired.stats()["failures"] == 1
+
+
+def test_scan_async_qualifies_the_universe_first():
+    class _ScanIB(_FakeIB):
+        async def reqHistoricalDataAsync(self, contract, **params):  # noqa: N802
+            return []
+
+    ib = _ScanIB()
+    cache = ContractCache()
+    scanner = GapRvolScanner(ib, contracts=cache)  # type: ignore[arg-type]
+    asyncio.run(scanner.scan_async(["AAPL", "MSFT"], rate_per_sec=1000))
+    assert sorted(ib.calls) == ["AAPL", "MSFT"] and cache.get("MSFT").has_details
+    ib.calls.clear()
+    asyncio.run(scanner.scan_async(["AAPL", "MSFT"], rate_per_sec=1000))
+    assert ib.calls == []  # warm and fresh: no contract requests
@@ -79,3 +79,51 @@ def test_requires_alias_file_when_model_dir_provided(tmp_path: Path) -> None:
         manifest, repo_root=tmp_path, require_alias_file_in=tmp_path
     )
     assert res2["ok"]
+
+
+def test_lower_bound_thresholds_use_confidence_intervals(tmp_path: Path) -> None:
+    rule = {
+        "min_sharpe": 1.0,
+        "min_f1": 0.40,
+        "min_max_drawdown": -0.15,
+        "min_win_rate": 0.5,
+        "threshold_on": "lower_bound",
+    }
+    (tmp_path / "promotion.rule.json").write_text(json.dumps(rule))
+
+    base: dict[str, Any] = {
+        "schema_version": "1.0",
+        "model": {"metadata": {"production": {"alias": "ok"}}},
+    }
+    # Point estimates pass but the interval lower bounds do not
+    wide = {
+        **base,
+        "metrics": {
+            "sharpe": 1.6,
+            "f1": 0.45,
+            "max_drawdown": -0.10,
+            "sharpe_ci": [0.4, 2.8],
+            "max_drawdown_ci": [-0.22, -0.05],
+            "win_rate_ci": [0.45, 0.60],
+        },
+    }
+    res = validate_export_manifest(wide, repo_root=tmp_path)
+    assert not res["ok"]
+    assert sum("CI lower bound" in e for e in res["errors"]) == 3
+
+    tight = {
+        **base,
+        "metrics": {
+            "sharpe": 1.6,
+            "f1": 0.45,
+            "max_drawdown": -0.10,
+            "sharpe_ci": [1.2, 2.0],
+            "max_drawdown_ci": [-0.14, -0.07],
+            "win_rate_ci": [0.52, 0.58],
+        },
+    }
+    assert validate_export_manifest(tight, repo_root=tmp_path)["ok"]
+
+    # Missing intervals fail closed under lower-bound rules
+    no_ci = {**base, "metrics": {"sharpe": 1.6, "f1": 0.45, "max_drawdown": -0.1}}
+    assert not validate_export_manifest(no_ci, repo_root=tmp_path)["ok"]
@@ -36,3 +36,63 @@ def test_max_drawdown_from_returns_equity_curve() -> None:
     # Max drawdown happens from 1.1 down to 0.825 => -0.25
     max_dd = compute_max_drawdown(equity)
     assert math.isclose(max_dd, -0.25, rel_tol=1e-9)
+
+
+def test_to_array_is_zero_copy_for_clean_float_arrays() -> None:
+    from src.analytics.financial_metrics import _to_array
+
+    arr = np.array([0.01, -0.02, 0.03])
+    assert np.shares_memory(_to_array(arr), arr)
+    assert _to_array(np.array([1.0, np.nan, 2.0])).tolist() == [1.0, 2.0]
+    assert _to_array(x for x in (1, 2)).tolist() == [1.0, 2.0]
+
+
+def test_batch_metrics_match_scalar_evaluation() -> None:
+    from src.analytics.evaluation import (
+        evaluate_trading_metrics,
+        evaluate_trading_metrics_batch,
+    )
+
+    rng = np.random.default_rng(3)
+    pnl = rng.normal(0.001, 0.02, size=(250, 6))
+    pnl[:, 5] = 0.0  # flat strategy
+    batch = evaluate_trading_metrics_batch(pnl=pnl)
+    assert len(batch) == 6
+    for i in range(6):
+        scalar = evaluate_trading_metrics(pnl=pnl[:, i])
+        col = batch.column(i)
+        assert math.isclose(col.sharpe_sim, scalar.sharpe_sim, abs_tol=1e-9)
+        assert math.isclose(
+            col.max_drawdown_sim, scalar.max_drawdown_sim, abs_tol=1e-12
+        )
+        assert col.profit_factor == scalar.profit_factor or math.isclose(
+            col.profit_factor, scalar.profit_factor
+        )
+        assert math.isclose(col.win_rate, scalar.win_rate)
+        assert math.isclose(col.var_95, scalar.var_95)
+
+    returns = rng.normal(0.0005, 0.01, size=(300, 3))
+    by_returns = evaluate_trading_metrics_batch(returns=returns)
+    for i in range(3):
+        scalar = evaluate_trading_metrics(returns=returns[:, i])
+        assert math.isclose(by_returns.sharpe_sim[i], scalar.sharpe_sim)
+        assert math.isclose(by_returns.max_drawdown_sim[i], scalar.max_drawdown_sim)
+
+
+def test_online_metrics_track_batch_evaluation() -> None:
+    from src.analytics.evaluation import OnlineTradingMetrics, evaluate_trading_metrics
+
+    rng = np.random.default_rng(11)
+    pnl = rng.normal(0.002, 0.03, size=2000)
+    online = OnlineTradingMetrics()
+    for x in pnl:
+        online.update(float(x))
+
+    snap = online.snapshot()
+    ref = evaluate_trading_metrics(pnl=pnl)
+    assert math.isclose(snap.sharpe_sim, ref.sharpe_sim, rel_tol=1e-9)
+    assert math.isclose(snap.max_drawdown_sim, ref.max_drawdown_sim, rel_tol=1e-9)
+    assert math.isclose(snap.profit_factor, ref.profit_factor, rel_tol=1e-9)
+    assert math.isclose(snap.win_rate, ref.win_rate)
+    # P² estimate of the 5th percentile stays close to the exact value
+    assert abs(snap.var_95 - ref.var_95) < 0.005
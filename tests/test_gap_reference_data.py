@@ -0,0 +1,108 @@
+import asyncio
+from datetime import date
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from src.scanner.gap_rvol_scanner import GapRvolScanner  # noqa: E402
+from src.scanner.reference_data import (  # noqa: E402
+    ReferenceData,
+    build_reference_frame,
+    check_freshness,
+    load_reference,
+    reference_path,
+    write_reference,
+)
+
+SESSION = date(2025, 3, 4)  # Tuesday
+PREV = date(2025, 3, 3)
+
+
+def _daily(last: date, n: int = 25, close: float = 10.0) -> pd.DataFrame:
+    dates = pd.bdate_range(end=pd.Timestamp(last), periods=n)
+    return pd.DataFrame(
+        {
+            "date": dates,
+            "close": np.linspace(close - 1, close, n),
+            "volume": np.arange(n, dtype=float) * 1000 + 1000,
+        }
+    )
+
+
+def _build(tmp_path, last: date = PREV) -> ReferenceData:
+    bars = {"abc": _daily(last), "XYZ": _daily(last, close=4.0)}
+    write_reference(build_reference_frame(bars, SESSION), SESSION, tmp_path)
+    return ReferenceData.open(reference_path(SESSION, tmp_path))
+
+
+def test_frame_uses_last_twenty_bars_before_session():
+    # A partial bar dated on the session itself must be ignored
+    frame = build_reference_frame({"ABC": _daily(SESSION, n=26)}, SESSION)
+    row = frame.iloc[0]
+    assert row["symbol"] == "ABC"
+    assert row["bar_date"] == PREV
+    volumes = np.arange(26) * 1000 + 1000
+    assert row["adv20"] == round(volumes[5:25].mean())
+    assert build_reference_frame({"EMPTY": pd.DataFrame()}, SESSION).empty
+
+
+def test_memory_mapped_lookups(tmp_path):
+    ref = _build(tmp_path)
+    assert len(ref) == 2 and "ABC" in ref
+    assert ref.session == SESSION and ref.prev_session == PREV
+    assert ref.get_prev_close("XYZ") == pytest.approx(4.0)
+    assert ref.get_adv20("ABC") == round((np.arange(5, 25) * 1000 + 1000).mean())
+    assert ref.get_prev_close("NOPE") is None
+    rows = ref.rows(["XYZ", "NOPE", "ABC"])
+    assert rows[1] == -1
+    assert ref.prev_close[rows[[0, 2]]].tolist() == pytest.approx([4.0, 10.0])
+
+
+def test_freshness(tmp_path):
+    missing = check_freshness(SESSION, tmp_path, expected_prev_session=PREV)
+    assert not missing.fresh and missing.reason == "missing"
+
+    _build(tmp_path)
+    fresh = check_freshness(SESSION, tmp_path, expected_prev_session=PREV)
+    assert fresh.fresh and fresh.symbols == 2
+
+    # Bars stopping a day early (e.g. yesterday's download failed) are stale
+    _build(tmp_path, last=date(2025, 2, 28))
+    stale = check_freshness(SESSION, tmp_path, expected_prev_session=PREV)
+    assert not stale.fresh and "expected" in stale.reason
+    assert load_reference(date(2025, 3, 5), tmp_path) is None
+
+
+def test_stale_symbol_in_fresh_file_is_not_served(tmp_path):
+    bars = {"ABC": _daily(PREV), "OLD": _daily(date(2025, 2, 26), close=7.0)}
+    assert build_reference_frame(bars, SESSION, PREV)["symbol"].tolist() == ["ABC"]
+
+    # A file written without the build-time filter is still guarded on lookup
+    write_reference(build_reference_frame(bars, SESSION), SESSION, tmp_path)
+    status = check_freshness(SESSION, tmp_path, expected_prev_session=PREV)
+    assert status.fresh and status.symbols == 1 and status.stale_symbols == 1
+    ref = load_reference(SESSION, tmp_path)
+    assert ref.get_prev_close("ABC") == pytest.approx(10.0)
+    assert ref.get_prev_close("OLD") is None and ref.get_adv20("OLD") is None
+    assert ref.rows(["OLD", "ABC"]).tolist() == [-1, 0]
+
+
+def test_scanner_with_reference_skips_daily_requests(tmp_path):
+    ref = _build(tmp_path)
+    calls: list[str] = []
+
+    class IB:
+        def isConnected(self) -> bool:  # noqa: N802
+            return True
+
+        def reqHistoricalData(self, contract: Any, **kwargs: Any):  # noqa: N802
+            calls.append(kwargs["barSizeSetting"])
+            return pd.DataFrame({"open": [11.0], "close": [11.0], "volume": [10]})
+
+    scanner = GapRvolScanner(IB(), reference=ref)
+    asyncio.run(scanner.scan_async(["ABC", "XYZ"], concurrency=2, rate_per_sec=100))
+    assert calls and set(calls) == {"1 min"}
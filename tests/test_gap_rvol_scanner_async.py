@@ -0,0 +1,109 @@
+import asyncio
+import threading
+import time
+from datetime import timedelta
+from typing import Any
+
+import pandas as pd
+
+from src.scanner.gap_rvol_scanner import GapRvolScanner
+from src.utils.time_utils import now_eastern
+
+
+def _symbol(contract: Any) -> str:
+    return contract["symbol"] if isinstance(contract, dict) else contract.symbol
+
+
+def _bars(symbol: str, **kwargs: Any) -> pd.DataFrame:
+    if kwargs.get("barSizeSetting") == "1 min":
+        price = 11.0 if symbol.startswith("GAP") else 9.0
+        return pd.DataFrame(
+            {"open": [price] * 5, "close": [price] * 5, "volume": [400_000] * 5}
+        )
+    return pd.DataFrame({"close": [10.0] * 3, "volume": [100_000] * 3})
+
+
+class BlockingIB:
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+        self.calls: list[tuple[str, str]] = []
+        self.in_flight = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def isConnected(self) -> bool:  # noqa: N802
+        return True
+
+    def reqHistoricalData(self, contract: Any, **kwargs: Any) -> pd.DataFrame:  # noqa: N802
+        sym = _symbol(contract)
+        with self._lock:
+            self.calls.append((sym, kwargs["durationStr"]))
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        time.sleep(self.delay)
+        with self._lock:
+            self.in_flight -= 1
+        return _bars(sym, **kwargs)
+
+
+class AsyncIB:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def isConnected(self) -> bool:  # noqa: N802
+        return True
+
+    async def reqHistoricalDataAsync(self, contract: Any, **kwargs: Any):  # noqa: N802
+        self.calls += 1
+        await asyncio.sleep(0.001)
+        return _bars(_symbol(contract), **kwargs)
+
+
+UNIVERSE = ["GAP1", "FLAT1", "GAP2", "FLAT2", "GAP3"]
+
+
+def test_scan_async_matches_sequential_scan():
+    expected = GapRvolScanner(BlockingIB()).scan(UNIVERSE)
+    got = asyncio.run(
+        GapRvolScanner(BlockingIB()).scan_async(
+            UNIVERSE, concurrency=4, rate_per_sec=1000
+        )
+    )
+    assert [c.symbol for c in got] == [c.symbol for c in expected]
+    assert [c.symbol for c in got] == ["GAP1", "GAP2", "GAP3"]
+    assert got[0].prev_close == 10.0 and got[0].adv20 == 100_000
+
+
+def test_scan_async_streams_candidates_and_bounds_concurrency():
+    ib = BlockingIB(delay=0.01)
+    seen: list[str] = []
+    scanner = GapRvolScanner(ib)
+    scanner.set_hidden(["GAP3"])
+    asyncio.run(
+        scanner.scan_async(
+            UNIVERSE, on_candidate=lambda c: seen.append(c.symbol), concurrency=2
+        )
+    )
+    assert sorted(seen) == ["GAP1", "GAP2"]
+    assert ib.peak <= 2
+    # Non-gappers are rejected before the ADV request
+    adv_requests = {sym for sym, duration in ib.calls if duration == "21 D"}
+    assert adv_requests == {"GAP1", "GAP2"}
+
+
+def test_scan_async_prioritizes_cached_symbols():
+    ib = BlockingIB()
+    scanner = GapRvolScanner(ib)
+    now = now_eastern()
+    scanner._prev_close_cache["GAP3"] = (10.0, now)
+    scanner._adv_cache["GAP3"] = (100_000, now - timedelta(minutes=1))
+    asyncio.run(scanner.scan_async(UNIVERSE, concurrency=1, rate_per_sec=1000))
+    assert ib.calls[0] == ("GAP3", "1 D")
+    assert sum(1 for sym, _ in ib.calls if sym == "GAP3") == 1
+
+
+async def test_scan_async_uses_native_async_client():
+    ib = AsyncIB()
+    got = await GapRvolScanner(ib).scan_async(UNIVERSE, rate_per_sec=1000)
+    assert [c.symbol for c in got] == ["GAP1", "GAP2", "GAP3"]
+    assert ib.calls == 2 * len(UNIVERSE) + 3
@@ -0,0 +1,67 @@
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from src.scanner.gap_rvol_scanner import GapRvolScanner
+from src.scanner.screening import screen
+from src.utils.time_utils import US_EASTERN, normalized_time_fraction
+
+NOW = datetime(2025, 3, 4, 11, 0, tzinfo=US_EASTERN)
+
+
+def _universe(n: int, seed: int = 7):
+    rng = np.random.default_rng(seed)
+    prev = rng.uniform(0.5, 35.0, n)
+    last = prev * rng.uniform(0.9, 1.3, n)
+    volume = rng.integers(0, 5_000_000, n)
+    adv = rng.integers(0, 2_000_000, n).astype(float)
+    prev[::17] = np.nan
+    last[::23] = np.nan
+    return [f"S{i:05d}" for i in range(n)], last, prev, volume, adv
+
+
+def test_vectorized_screen_matches_scalar_rules():
+    symbols, last, prev, volume, adv = _universe(5000)
+    tf = normalized_time_fraction(NOW)
+    frame = screen(symbols, last, prev, volume, adv, tf)
+
+    expected = {}
+    for i, sym in enumerate(symbols):
+        if np.isnan(prev[i]) or prev[i] <= 0:
+            continue
+        price = None if np.isnan(last[i]) else float(last[i])
+        if not GapRvolScanner._price_and_gap_ok(price, float(prev[i])):
+            continue
+        cand = GapRvolScanner._build_candidate(
+            sym, NOW, tf, float(prev[i]), price, int(volume[i]), int(adv[i])
+        )
+        if cand is not None:
+            expected[sym] = cand
+
+    assert len(frame) > 0
+    assert set(frame["symbol"]) == set(expected)
+    assert frame["score"].is_monotonic_decreasing
+    row = frame.iloc[0]
+    assert np.isclose(row["rvol"], expected[row["symbol"]].rvol)
+    assert np.isclose(row["gap_pct"], expected[row["symbol"]].gap_pct)
+
+
+def test_scanner_screen_uses_cached_inputs_only():
+    scanner = GapRvolScanner(None)
+    for sym, price in (("UP", 11.0), ("BIGUP", 12.0), ("FLAT", 10.0)):
+        scanner._prev_close_cache[sym] = (10.0, NOW)
+        scanner._adv_cache[sym] = (100_000, NOW)
+        bars = pd.DataFrame(
+            {"open": [price], "close": [price], "volume": [2_000_000]},
+            index=pd.DatetimeIndex([NOW.replace(minute=0)]),
+        )
+        scanner._intraday.apply_bars(sym, bars, NOW, seed=True)
+
+    got = scanner.screen(["UP", "FLAT", "BIGUP", "NODATA"], NOW)
+    assert [c.symbol for c in got] == ["BIGUP", "UP"]
+    assert got[0].adv20 == 100_000 and got[0].cum_volume == 2_000_000
+    assert [
+        c.symbol for c in scanner.screen(["UP", "BIGUP"], NOW, exclude=["bigup"])
+    ] == ["UP"]
+    assert scanner.screen(["UP"], NOW, min_gap_pct=50) == []
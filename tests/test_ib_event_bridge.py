@@ -0,0 +1,94 @@
+import asyncio
+import threading
+
+from src.lib.event_queue import EventQueue, OverflowPolicy, StreamLimit
+from src.lib.ib_async_wrapper import AsyncIBWrapper, get_batch
+
+
+def test_callbacks_from_another_thread_arrive_in_order_and_batched():
+    async def run():
+        wrapper = AsyncIBWrapper()
+        wrapper.set_event_loop(asyncio.get_running_loop())
+        wrapper.set_pending_request(7, "AAPL")
+        n = 5000
+
+        def producer():
+            for i in range(n):
+                wrapper.tickSize(7, 8, i)
+
+        thread = threading.Thread(target=producer)
+        thread.start()
+        seen: list[float] = []
+        while len(seen) < n:
+            batch = await asyncio.wait_for(
+                get_batch(wrapper.get_market_data_events()), timeout=5
+            )
+            seen.extend(tick["value"] for tick in batch)
+        thread.join()
+        return seen, wrapper.get_bridge_stats()
+
+    seen, stats = asyncio.run(run())
+    assert seen == [float(i) for i in range(5000)]
+    assert stats["events"] == 5000 and stats["pending"] == 0
+    assert stats["batches"] < 5000
+
+
+def test_enqueue_without_loop_puts_directly():
+    wrapper = AsyncIBWrapper()
+    wrapper.error(1, 200, "no security definition")
+    assert wrapper.get_error_events().get_nowait()["errorCode"] == 200
+
+
+def test_drop_oldest_and_conflate_bound_the_queue():
+    q = EventQueue("depth", StreamLimit(3))
+    for i in range(5):
+        q.put_nowait(i)
+    assert [q.get_nowait() for _ in range(3)] == [2, 3, 4]
+    assert q.stats()["dropped"] == 2 and q.stats()["high_water"] == 3
+
+    wrapper = AsyncIBWrapper({"market_data": StreamLimit(4, OverflowPolicy.CONFLATE)})
+    wrapper.set_pending_request(1, "AAPL")
+    wrapper.set_pending_request(2, "MSFT")
+    for i in range(100):
+        wrapper.tickSize(1, 8, i)
+    wrapper.tickSize(2, 8, 5)
+    events = wrapper.get_market_data_events()
+    queued = [events.get_nowait() for _ in range(events.qsize())]
+    # once full, AAPL's newest tick is overwritten; MSFT evicts the oldest
+    assert [(t["symbol"], t["value"]) for t in queued] == [
+        ("AAPL", 1.0),
+        ("AAPL", 2.0),
+        ("AAPL", 99.0),
+        ("MSFT", 5.0),
+    ]
+    stats = wrapper.get_queue_stats()["market_data"]
+    assert stats["conflated"] == 96 and stats["dropped"] == 1
+
+
+def test_block_policy_holds_the_producer_instead_of_dropping():
+    async def run():
+        wrapper = AsyncIBWrapper(
+            {"historical": StreamLimit(2, OverflowPolicy.BLOCK, block_timeout=5)}
+        )
+        wrapper.set_event_loop(asyncio.get_running_loop())
+        wrapper._enqueue(wrapper.get_error_events(), {})  # learn the loop thread
+        await asyncio.sleep(0)
+        thread = threading.Thread(
+            target=lambda: [wrapper.historicalDataEnd(i, "", "") for i in range(6)]
+        )
+        thread.start()
+        await asyncio.sleep(0.1)
+        received = []
+        while len(received) < 6:
+            req_id, _bars = await asyncio.wait_for(
+                wrapper.get_historical_data_events().get(), timeout=5
+            )
+            received.append(req_id)
+            await asyncio.sleep(0.01)
+        thread.join()
+        return received, wrapper.get_queue_stats()["historical"]
+
+    received, stats = asyncio.run(run())
+    assert received == list(range(6))
+    assert stats["dropped"] == 0 and stats["high_water"] <= 2
+    assert stats["blocked"] > 0
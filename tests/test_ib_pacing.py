@@ -0,0 +1,78 @@
+import asyncio
+
+import pytest
+
+from src.infra.ib_pacing import (
+    PacingGovernor,
+    contract_key,
+    is_small_bar,
+    request_key,
+)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def test_limits_and_projected_waits():
+    clock = _Clock()
+    gov = PacingGovernor(clock=clock)
+    # same contract: five per 2 s, the sixth waits for the first to age out
+    for _ in range(5):
+        assert gov.try_acquire(contract_key("AAPL"), bar_size="1 secs") == 0
+    assert gov.projected_wait(contract_key("AAPL"), bar_size="1 secs") == 2.0
+    assert gov.projected_wait(contract_key("MSFT"), bar_size="1 secs") == 0
+    # BID_ASK is its own tick type but counts twice
+    for _ in range(2):
+        assert gov.try_acquire(contract_key("AAPL"), what_to_show="BID_ASK") == 0
+    assert gov.try_acquire(contract_key("AAPL"), what_to_show="BID_ASK") == 2.0
+
+    # 60 per 10 minutes across contracts: 9 used so far
+    for i in range(51):
+        clock.now += 0.5
+        assert gov.try_acquire(contract_key(f"S{i}"), bar_size="5 secs") == 0
+    assert gov.remaining() == 0
+    assert gov.projected_wait("X") == pytest.approx(600 - 25.5)
+    assert gov.try_acquire("X", bar_size="1 min") == 0  # large bars are not paced
+
+    # identical requests 15 s apart
+    clock.now += 600
+    key = request_key("Y", "1 secs", end_datetime="20240102 16:00:00")
+    assert key == request_key("Y", "1 secs", "TRADES", end_datetime="20240102 16:00:00")
+    assert key != request_key(
+        "Y", "1 secs", end_datetime="20240102 16:00:00", use_rth=0
+    )
+    assert gov.try_acquire("Y", request=key) == 0
+    clock.now += 10
+    assert gov.try_acquire("Y", request=key) == pytest.approx(5)
+    assert gov.acquire("Y", request=key, sleep=clock.sleep) == pytest.approx(5)
+    assert gov.stats()["waits"] == 1
+
+
+def test_ledger_is_shared_between_governors(tmp_path):
+    clock = _Clock()
+    ledger = tmp_path / "pacing.json"
+    recorder = PacingGovernor(ledger, clock=clock)
+    backfill = PacingGovernor(ledger, clock=clock)
+    for _ in range(3):
+        recorder.try_acquire(contract_key("AAPL"), bar_size="1 secs")
+    for _ in range(2):
+        backfill.try_acquire(contract_key("AAPL"), bar_size="1 secs")
+    assert recorder.projected_wait(contract_key("AAPL"), bar_size="1 secs") == 2.0
+    assert backfill.remaining() == recorder.remaining() == 55
+
+    assert backfill.acquire(contract_key("AAPL"), sleep=clock.sleep) == 2.0
+    assert asyncio.run(recorder.acquire_async(contract_key("MSFT"))) == 0
+    assert ledger.exists()
+
+
+def test_small_bar_detection():
+    assert is_small_bar("1 secs") and is_small_bar("30 secs") and is_small_bar(None)
+    assert not is_small_bar("1 min") and not is_small_bar("1 day")
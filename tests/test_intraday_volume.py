@@ -0,0 +1,121 @@
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+from src.scanner.gap_rvol_scanner import GapRvolScanner
+from src.scanner.intraday_volume import IntradayVolumeAccumulator
+from src.utils.time_utils import US_EASTERN
+
+NOW = datetime(2025, 3, 4, 10, 0, 30, tzinfo=US_EASTERN)
+
+
+def _bars(start: datetime, volumes: list[int], price: float = 5.0) -> pd.DataFrame:
+    index = pd.date_range(start=start, periods=len(volumes), freq="min")
+    return pd.DataFrame(
+        {"open": price, "close": price + 0.1, "volume": volumes}, index=index
+    )
+
+
+def test_seed_then_increment_replaces_forming_bar():
+    acc = IntradayVolumeAccumulator()
+    assert acc.request_params("ABC", NOW)["durationStr"] == "1 D"
+
+    seed_start = NOW.replace(minute=55, hour=9, second=0)
+    acc.apply_bars("ABC", _bars(seed_start, [100, 100, 100, 100, 100, 40]), NOW, True)
+    assert acc.price_volume("ABC", NOW) == (5.0, 540)
+
+    later = NOW + timedelta(minutes=2)
+    params = acc.request_params("ABC", later)
+    assert params["durationStr"].endswith(" S")
+    assert int(params["durationStr"].split()[0]) <= 240
+
+    # Re-delivered 10:00 bar is now complete (100), plus two new bars
+    update = _bars(NOW.replace(second=0), [100, 70, 10])
+    assert acc.apply_bars("ABC", update, later, seed=False) == 3
+    assert acc.price_volume("ABC", later)[1] == 500 + 100 + 70 + 10
+
+    # Re-applying the same response only re-reads the newest bar
+    acc.apply_bars("ABC", update, later, seed=False)
+    assert acc.price_volume("ABC", later)[1] == 680
+
+
+def test_realtime_bars_suppress_requests():
+    acc = IntradayVolumeAccumulator()
+    acc.apply_bars("ABC", _bars(NOW.replace(second=0), [100]), NOW, seed=True)
+    t = NOW.replace(second=0) + timedelta(minutes=1)
+    acc.apply_realtime_bar("ABC", t, 5.0, 5.2, 25)
+    acc.apply_realtime_bar("ABC", t + timedelta(seconds=5), 5.2, 5.3, 15)
+    now = t + timedelta(seconds=6)
+    assert acc.is_streaming("ABC", now)
+    assert acc.request_params("ABC", now) is None
+    assert acc.price_volume("ABC", now)[1] == 140
+    later = now + timedelta(minutes=1)
+    assert acc.request_params("ABC", later) is not None
+
+    # The stream stopped: the fetched 10:01 bar replaces its streamed 40
+    update = _bars(NOW.replace(second=0), [100, 60, 20])
+    assert acc.apply_bars("ABC", update, later, seed=False) == 3
+    assert acc.price_volume("ABC", later)[1] == 100 + 60 + 20
+
+
+def test_new_session_reseeds():
+    acc = IntradayVolumeAccumulator()
+    acc.apply_bars("ABC", _bars(NOW.replace(second=0), [100]), NOW, seed=True)
+    tomorrow = NOW + timedelta(days=1)
+    assert acc.price_volume("ABC", tomorrow) == (None, 0)
+    assert acc.request_params("ABC", tomorrow)["durationStr"] == "1 D"
+
+
+class _MinuteIB:
+    def __init__(self) -> None:
+        self.durations: list[str] = []
+
+    def isConnected(self) -> bool:  # noqa: N802
+        return True
+
+    def reqHistoricalData(self, contract, **kwargs):  # noqa: N802
+        self.durations.append(kwargs["durationStr"])
+        n = 300 if kwargs["durationStr"] == "1 D" else 2
+        end = pd.Timestamp.now(tz=US_EASTERN).floor("min")
+        index = pd.date_range(end=end, periods=n, freq="min")
+        return pd.DataFrame(
+            {"open": 10.0, "close": 10.0, "volume": [1000] * n}, index=index
+        )
+
+
+def test_scanner_reports_bars_fetched_per_cycle():
+    ib = _MinuteIB()
+    scanner = GapRvolScanner(ib)
+    now = datetime.now(US_EASTERN)
+    scanner._get_intraday_price_volume("ABC", now)
+    assert scanner.fetch_stats.seed_requests == 1
+    assert scanner.fetch_stats.bars == 300
+
+    scanner.fetch_stats = type(scanner.fetch_stats)()
+    _, cum = scanner._get_intraday_price_volume("ABC", now)
+    assert ib.durations[-1].endswith(" S")
+    assert scanner.fetch_stats.bars == 2
+    assert scanner.fetch_stats.seed_requests == 0
+    assert 0 < scanner.fetch_stats.bytes < 1000
+    assert cum >= 300_000
+
+
+def test_stream_before_seed_still_seeds_and_merges_overlap():
+    acc = IntradayVolumeAccumulator()
+    t0 = NOW.replace(minute=30, second=20)  # 10:30:20, mid-minute
+    for i, vol in enumerate([10, 10, 10, 10, 10, 10, 10, 10]):  # to 10:30:55
+        acc.apply_realtime_bar("ABC", t0 + timedelta(seconds=5 * i), 5.0, 5.1, vol)
+    now = t0 + timedelta(seconds=40)
+    assert acc.is_streaming("ABC", now)
+    assert acc.request_params("ABC", now)["durationStr"] == "1 D"
+
+    # History to 10:30; its 10:30 bar (whole minute, 200) overlaps the
+    # streamed part (80) and the stream's 10:31 bars are not in it yet
+    acc.apply_realtime_bar("ABC", t0 + timedelta(seconds=40), 5.1, 5.2, 30)
+    seed = _bars(NOW.replace(minute=28, second=0), [100, 100, 200])
+    acc.apply_bars("ABC", seed, now, seed=True)
+    assert acc.price_volume("ABC", now) == (5.0, 100 + 100 + 200 + 30)
+    assert acc.request_params("ABC", now) is None
+
+    acc.apply_realtime_bar("ABC", t0 + timedelta(seconds=45), 5.2, 5.3, 5)
+    assert acc.price_volume("ABC", now)[1] == 435
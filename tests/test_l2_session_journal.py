@@ -0,0 +1,118 @@
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+pq = pytest.importorskip("pyarrow.parquet")
+
+from src.services.market_data import market_data_service as mds  # noqa: E402
+from src.services.market_data.column_buffer import (  # noqa: E402
+    ColumnBuffer,
+    arrow_schema,
+)
+from src.services.market_data.session_journal import (  # noqa: E402
+    SessionJournal,
+    recover_journals,
+)
+
+SCHEMA = {"timestamp": "timestamp", "price": "float", "mm": "str"}
+T0 = datetime(2025, 3, 4, 14, 30, tzinfo=UTC)
+
+
+def _buffer(path):
+    return ColumnBuffer(SCHEMA, sink=SessionJournal(path, arrow_schema(SCHEMA)))
+
+
+def _fill(buf, start, n):
+    for i in range(start, start + n):
+        buf.append(T0 + timedelta(seconds=i), float(i), "MM")
+
+
+def test_each_flush_appends_a_row_group(tmp_path):
+    path = tmp_path / "s_dom.parquet"
+    buf = _buffer(path)
+    for flush in range(3):
+        _fill(buf, flush * 4, 4)
+        assert buf.spill() == 4
+    _fill(buf, 12, 2)
+    assert buf.sink.journal_path.exists() and not path.exists()
+    assert buf.to_frame()["price"].tolist() == [float(i) for i in range(14)]
+
+    assert buf.close() == path
+    assert not buf.sink.journal_path.exists()
+    meta = pq.ParquetFile(path).metadata
+    assert meta.num_row_groups == 4 and meta.num_rows == 14
+    assert buf.to_frame()["timestamp"].iloc[-1] == T0 + timedelta(seconds=13)
+
+
+def test_crashed_session_is_recovered_up_to_last_flush(tmp_path):
+    path = tmp_path / "AAA" / "s_dom.parquet"
+    buf = _buffer(path)
+    _fill(buf, 0, 5)
+    buf.spill()
+    _fill(buf, 5, 5)
+    buf.spill()
+    _fill(buf, 10, 3)  # never flushed: lost with the process
+    # Simulate a write cut off mid-batch
+    with buf.sink.journal_path.open("ab") as fh:
+        fh.write(b"\xff\xff\xff\xff\x10\x00")
+
+    assert recover_journals(tmp_path) == [path]
+    table = pq.read_table(path)
+    assert table.num_rows == 10
+    assert table.column("price").to_pylist() == [float(i) for i in range(10)]
+
+
+def test_depth_manager_persists_session_on_stop(tmp_path, monkeypatch):
+    ticker = SimpleNamespace(
+        updateEvent=SimpleNamespace(connect=lambda cb: None),
+        domBids=[SimpleNamespace(price=9.99, size=300, marketMaker="ARCA")],
+        domAsks=[SimpleNamespace(price=10.01, size=200, marketMaker="NSDQ")],
+    )
+    monkeypatch.setattr(mds, "req_mkt_depth", lambda *a, **k: ticker)
+    mgr = mds.MarketDepthManager(SimpleNamespace(), "ABC")  # type: ignore[arg-type]
+    mgr.notifications = None
+    mgr.config = SimpleNamespace(
+        get_env=lambda key, default=None: default,
+        data_paths=SimpleNamespace(base_path=tmp_path),
+    )
+    assert mgr.start()
+
+    dom = [SimpleNamespace(position=0, operation=1, side=1, price=9.99, size=300)]
+    for _ in range(3):
+        mgr._process_dom_ticks(dom * 2)
+        mgr._snapshot(ticker)
+        mgr.flush()
+    mgr._process_dom_ticks(dom)
+    assert mgr.stop()
+
+    paths = mgr.session_paths()
+    assert mgr.saved_paths == [paths["dom"], paths["snapshots"]]
+    assert paths["dom"].parent == tmp_path / "Level2" / "ABC"
+    assert pq.ParquetFile(paths["dom"]).metadata.num_row_groups == 4
+    assert pq.read_table(paths["dom"]).num_rows == 7
+    snaps = pq.read_table(paths["snapshots"]).to_pandas()
+    assert len(snaps) == 3
+    assert list(snaps["ask_prices"].iloc[0]) == [10.01]
+    assert list(snaps["bid_market_makers"].iloc[0]) == ["ARCA"]
+
+
+def test_depth_manager_start_recovers_crashed_session(tmp_path, monkeypatch):
+    base = tmp_path / "Level2" / "ABC"
+    crashed = _buffer(base / "ABC_20250303_093000_dom.parquet")
+    _fill(crashed, 0, 4)
+    crashed.spill()  # the process dies before close()
+
+    ticker = SimpleNamespace(updateEvent=SimpleNamespace(connect=lambda cb: None))
+    monkeypatch.setattr(mds, "req_mkt_depth", lambda *a, **k: ticker)
+    mgr = mds.MarketDepthManager(SimpleNamespace(), "ABC")  # type: ignore[arg-type]
+    mgr.notifications = None
+    mgr.config = SimpleNamespace(
+        get_env=lambda key, default=None: default,
+        data_paths=SimpleNamespace(base_path=tmp_path),
+    )
+    assert mgr.start()
+
+    assert not list(base.glob("*.arrows"))
+    assert pq.read_table(base / "ABC_20250303_093000_dom.parquet").num_rows == 4
+    assert mgr.stop()
@@ -0,0 +1,133 @@
+import random
+
+from src.observability import metrics
+from src.recording.l2_slot_manager import L2SlotManager
+from src.recording.session_manager import SessionManager
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.t = 0.0
+
+    def __call__(self) -> float:
+        return self.t
+
+
+class FakeMD:
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+        self.ticks: set[str] = set()
+        self.l2: set[str] = set()
+        self.fail: set[str] = set()
+        self.peak = 0
+
+    def start_ticks(self, symbol: str) -> None:
+        self.ticks.add(symbol)
+
+    def stop_ticks(self, symbol: str) -> None:
+        self.ticks.discard(symbol)
+
+    def start_level2(self, symbol: str) -> bool:
+        if symbol in self.fail:
+            return False
+        assert symbol not in self.l2
+        self.l2.add(symbol)
+        self.peak = max(self.peak, len(self.l2))
+        assert len(self.l2) <= self.capacity
+        return True
+
+    def stop_level2(self, symbol: str) -> None:
+        self.l2.remove(symbol)
+
+
+def _manager(capacity: int = 2, **kwargs):
+    clock = Clock()
+    md = FakeMD(capacity)
+    slots = L2SlotManager(
+        capacity,
+        hysteresis=kwargs.get("hysteresis", 0.25),
+        min_hold_seconds=kwargs.get("min_hold", 60),
+        half_life_seconds=kwargs.get("half_life", 300),
+        clock=clock,
+    )
+    return clock, md, slots, SessionManager(md, slots)
+
+
+def test_fifo_without_scores_and_failed_subscription_retries_first():
+    clock, md, slots, mgr = _manager()
+    for sym in ("A", "B", "C", "D"):
+        mgr.start(sym)
+    assert md.l2 == {"A", "B"} and slots.queued() == ["C", "D"]
+
+    mgr.stop("C")  # a queued session leaves the queue too
+    md.fail.add("D")
+    mgr.stop("A")
+    mgr.upgrade_cycle()
+    assert slots.queued() == ["D"] and md.l2 == {"B"}
+    md.fail.clear()
+    mgr.upgrade_cycle()
+    assert md.l2 == {"B", "D"}
+    clock.t = 1000
+    mgr.upgrade_cycle()  # nothing scored: never preempts
+    assert md.l2 == {"B", "D"}
+
+
+def test_preemption_respects_hysteresis_and_min_hold():
+    clock, md, slots, mgr = _manager()
+    mgr.update_scores({"A": 10, "B": 20, "C": 12})
+    for sym in ("A", "B", "C"):
+        mgr.start(sym)
+    clock.t = 30
+    mgr.update_scores({"A": 10, "B": 20, "C": 50})
+    mgr.upgrade_cycle()
+    assert md.l2 == {"A", "B"}  # A is still within its minimum hold
+    clock.t = 61
+    mgr.update_scores({"A": 10, "B": 20, "C": 12})
+    mgr.upgrade_cycle()
+    assert md.l2 == {"A", "B"}  # 12 does not beat 10 by 25%
+    mgr.update_scores({"A": 10, "B": 20, "C": 13})
+    mgr.upgrade_cycle()
+    assert md.l2 == {"B", "C"}
+    info = {s.symbol: s.mode for s in mgr.list_sessions()}
+    assert info == {"A": "queued", "B": "l2", "C": "l2"}
+    assert "A" in md.ticks
+
+
+def test_replayed_morning_hands_slots_to_best_without_thrash():
+    """09:00-10:30 in 30 s cycles: an early gapper fades, five steady names
+    jitter within the hysteresis band and a strong late gapper appears."""
+    clock, md, slots, mgr = _manager(capacity=5)
+    rng = random.Random(3)
+    steady = dict.fromkeys("ABCDE", 45.0)
+    before = metrics.get("l2_preemptions_total")
+    late_l2_at = None
+
+    for step in range(180):
+        clock.t = step * 30.0
+        minute = step // 2
+        scores = {s: base * rng.uniform(0.9, 1.1) for s, base in steady.items()}
+        if minute < 15:
+            scores["EARLY"] = 300.0
+        if minute >= 45:
+            scores["LATE"] = 200.0
+        mgr.update_scores(scores)
+        if step == 0:
+            for sym in ("EARLY", "A", "B", "C", "D", "E"):
+                mgr.start(sym)
+        if minute == 45 and "LATE" not in md.ticks:
+            mgr.start("LATE")
+        mgr.upgrade_cycle()
+        if late_l2_at is None and "LATE" in md.l2:
+            late_l2_at = minute
+
+    assert md.peak == 5
+    assert "EARLY" not in md.l2 and "LATE" in md.l2
+    assert late_l2_at is not None and late_l2_at <= 46
+    # Exactly two hand-offs: E over the faded EARLY, LATE over a steady name
+    assert metrics.get("l2_preemptions_total") - before == 2
+    assert mgr.active_summary() == {
+        "ticks": 7,
+        "l2": 5,
+        "queued": 2,
+        "l2_capacity": 5,
+    }
@@ -0,0 +1,81 @@
+import random
+
+import numpy as np
+
+from src.observability.latency import (
+    END_TO_END,
+    SIGNAL_TO_FIRST_FILL,
+    LatencyHistogram,
+    LatencyStage,
+    LatencyTracker,
+)
+
+
+def test_histogram_percentiles_within_bucket_error():
+    rng = random.Random(7)
+    values = [int(rng.lognormvariate(9, 1.2)) for _ in range(20000)]
+    hist = LatencyHistogram()
+    for v in values:
+        hist.record(v)
+
+    assert hist.count == len(values)
+    assert hist.max_us == max(values)
+    assert hist.min_us == min(values)
+    exact = np.percentile(values, [50, 90, 99])
+    approx = hist.percentiles((50.0, 90.0, 99.0))
+    for q, want in zip((50.0, 90.0, 99.0), exact, strict=True):
+        assert abs(approx[q] - want) / want < 0.05
+
+
+def test_histogram_small_values_exact_and_merge():
+    a, b = LatencyHistogram(), LatencyHistogram()
+    for v in range(10):
+        a.record(v)
+    b.record(1_000_000)
+    a.merge(b)
+    assert a.count == 11
+    assert a.percentile(50.0) == 5.0
+    assert a.percentile(100.0) == 1_000_000
+    assert a.summary()["max_ms"] == 1000.0
+
+
+def test_tracker_records_stage_intervals_per_strategy():
+    tracker = LatencyTracker()
+    t0 = 1_000.0
+    tracker.mark("s1", LatencyStage.SIGNAL_RECEIVED, "momentum", at=t0)
+    tracker.mark("s1", LatencyStage.VALIDATED, at=t0 + 0.002)
+    tracker.mark("s1", LatencyStage.RISK_ASSESSED, at=t0 + 0.003)
+    tracker.mark("s1", LatencyStage.ORDER_SUBMITTED, at=t0 + 0.010)
+    tracker.mark("s1", LatencyStage.FIRST_FILL, at=t0 + 0.110)
+    tracker.mark("s1", LatencyStage.FIRST_FILL, at=t0 + 0.500)  # ignored
+    tracker.mark("s1", LatencyStage.COMPLETE, at=t0 + 0.200)
+
+    summary = tracker.summary()
+    stages = summary["momentum"]
+    assert stages["validated"]["count"] == 1
+    assert abs(stages["validated"]["p50_ms"] - 2.0) < 0.1
+    assert abs(stages["order_submitted"]["p50_ms"] - 7.0) < 0.25
+    assert abs(stages["first_fill"]["p50_ms"] - 100.0) < 3.0
+    assert abs(stages[SIGNAL_TO_FIRST_FILL]["p50_ms"] - 110.0) < 3.5
+    assert abs(stages[END_TO_END]["p50_ms"] - 200.0) < 6.0
+    assert summary["all"][END_TO_END]["count"] == 1
+    assert tracker.open_signals() == 0
+
+    # Late marks for a closed signal do not reopen it
+    tracker.mark("s1", LatencyStage.COMPLETE, at=t0 + 1.0)
+    tracker.mark("s1", LatencyStage.FIRST_FILL, at=t0 + 1.0)
+    assert tracker.open_signals() == 0
+    assert tracker.histogram("momentum", END_TO_END).count == 1
+
+
+def test_tracker_late_origin_and_eviction():
+    tracker = LatencyTracker(max_open=2)
+    tracker.mark("a", LatencyStage.RISK_ASSESSED, "meanrev", at=10.0)
+    tracker.mark("a", LatencyStage.SIGNAL_RECEIVED, at=9.5)
+    tracker.mark("a", LatencyStage.COMPLETE, at=11.0)
+    assert abs(tracker.histogram("meanrev", END_TO_END).max_us - 1_500_000) < 1
+
+    for sid in ("x", "y", "z"):
+        tracker.mark(sid, LatencyStage.SIGNAL_RECEIVED, "meanrev", at=20.0)
+    assert tracker.open_signals() == 2
+    assert tracker.evicted == 1
@@ -0,0 +1,64 @@
+import statistics
+from datetime import UTC, datetime, timedelta
+
+import numpy as np
+
+from src.monitoring.metric_buffer import MetricRingBuffer, TagTable
+
+
+def test_append_and_wraparound_keeps_order():
+    buf = MetricRingBuffer(capacity=5, stats_window=3)
+    for i in range(8):
+        buf.append(float(i), timestamp=1000.0 + i, symbol="AAPL" if i % 2 else None)
+
+    assert len(buf) == 5
+    assert buf.values().tolist() == [3.0, 4.0, 5.0, 6.0, 7.0]
+    assert buf.tail(2).tolist() == [6.0, 7.0]
+    assert buf.last_value == 7.0
+    assert buf.last_timestamp == datetime.fromtimestamp(1007.0, UTC)
+
+    records = list(buf.iter_records(last=2))
+    assert [r["symbol"] for r in records] == [None, "AAPL"]
+
+
+def test_tail_is_view_when_contiguous():
+    buf = MetricRingBuffer(capacity=10)
+    for i in range(6):
+        buf.append(float(i), timestamp=float(i))
+    assert np.shares_memory(buf.tail(4), buf._values)
+
+
+def test_rolling_stats_match_statistics_module():
+    buf = MetricRingBuffer(capacity=50, stats_window=20)
+    rng = np.random.default_rng(0)
+    values = (rng.normal(100.0, 5.0, size=73)).tolist()
+    for v in values:
+        buf.append(v)
+
+    count, mean, stdev = buf.rolling_stats()
+    window = values[-20:]
+    assert count == 20
+    assert abs(mean - statistics.mean(window)) < 1e-9
+    assert abs(stdev - statistics.stdev(window)) < 1e-9
+
+
+def test_since_uses_time_window_across_wrap():
+    now = datetime.now(UTC)
+    buf = MetricRingBuffer(capacity=4)
+    for minutes, v in [(90, 1.0), (80, 2.0), (70, 3.0), (30, 4.0), (10, 5.0)]:
+        buf.append(v, timestamp=now - timedelta(minutes=minutes))
+
+    summary = buf.summary_since(now - timedelta(hours=1))
+    assert summary == {"current": 5.0, "avg": 4.5, "min": 4.0, "max": 5.0, "count": 2}
+    assert buf.summary_since(now) is None
+
+
+def test_shared_tag_table_and_compact_footprint():
+    tags = TagTable()
+    a = MetricRingBuffer(capacity=10000, tags=tags)
+    b = MetricRingBuffer(capacity=10000, tags=tags)
+    a.append(1.0, strategy_name="s1", model_version="v1")
+    b.append(2.0, strategy_name="s1", model_version="v2")
+    assert len(tags) == 3
+    # 8B timestamp + 8B value + 3 x 4B tag codes per slot
+    assert a.nbytes == 10000 * 28
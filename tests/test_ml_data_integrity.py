@@ -0,0 +1,107 @@
+"""Tests for parallel, cached ML data-integrity validation."""
+
+from __future__ import annotations
+
+import os
+
+import numpy as np
+import pandas as pd
+
+from src.integrations.ml_data_integrity import (
+    BarFileCache,
+    MLDataIntegrityManager,
+    ValidationCache,
+    frame_fingerprint,
+)
+
+
+def _manager(cache, max_workers: int) -> MLDataIntegrityManager:
+    return MLDataIntegrityManager(
+        cache_path=cache,
+        max_workers=max_workers,
+        data_service=object(),  # persistence is not used by validation
+    )
+
+
+def _bars(split_at: int | None = None, seed: int = 7, n: int = 120) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    idx = pd.bdate_range("2024-01-02", periods=n, name="date")
+    close = 100 * np.cumprod(1 + rng.normal(0, 0.005, n))
+    volume = rng.normal(1_000_000, 50_000, n)
+    if split_at is not None:
+        close[split_at:] /= 2
+        volume[split_at] *= 8
+    return pd.DataFrame({"close": close, "volume": volume}, index=idx)
+
+
+def _write(path, df: pd.DataFrame) -> None:
+    df.reset_index().to_feather(path)
+
+
+def test_batch_validate_files_caches_by_fingerprint(tmp_path):
+    data = tmp_path / "bars"
+    data.mkdir()
+    _write(data / "AAA_USUSD_1D.ftr", _bars(split_at=60))
+    _write(data / "BBB_USUSD_1D.ftr", _bars(seed=8))
+    _write(data / "CCC_USUSD_1D.ftr", _bars(seed=9))
+    cache = tmp_path / "cache.json"
+
+    manager = _manager(cache, 2)
+    results = manager.batch_validate_files(data)
+    assert list(results) == ["AAA", "BBB", "CCC"]
+    assert results["AAA"]["validation_status"] == "failed"
+    assert results["AAA"]["detected_splits"][0]["split_ratio"] == 2.0
+    assert [results[s]["validation_status"] for s in ("BBB", "CCC")] == ["passed"] * 2
+    assert manager.last_batch_stats == {"symbols": 3, "cached": 0, "validated": 3}
+    assert manager.split_detected_symbols == {"AAA"}
+    history = manager.split_service.get_split_history()
+    assert list(history["symbol"]) == ["AAA"] and history["split_ratio"][0] == 2.0
+
+    # Next run: only the rewritten file is validated again
+    _write(data / "CCC_USUSD_1D.ftr", _bars(split_at=40, seed=9))
+    stat = (data / "CCC_USUSD_1D.ftr").stat()
+    os.utime(data / "CCC_USUSD_1D.ftr", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    rerun = _manager(cache, 1)
+    again = rerun.batch_validate_files(data)
+    assert rerun.last_batch_stats == {"symbols": 3, "cached": 2, "validated": 1}
+    assert again["AAA"] == results["AAA"]
+    assert again["CCC"]["validation_status"] == "failed"
+    # Cached detections reach the split history too, without duplicates
+    rerun.batch_validate_files(data)
+    assert sorted(rerun.split_service.get_split_history()["symbol"]) == ["AAA", "CCC"]
+
+
+def test_batch_validate_symbols_pool_matches_in_process(tmp_path):
+    frames = {"AAA": _bars(split_at=30), "BBB": _bars(seed=3), "CCC": _bars(n=5)}
+    pooled = _manager(tmp_path / "a.json", 2)
+    serial = _manager(tmp_path / "b.json", 1)
+    a = pooled.batch_validate_symbols(frames)
+    b = serial.batch_validate_symbols(frames)
+    assert {s: r["validation_status"] for s, r in a.items()} == {
+        "AAA": "failed",
+        "BBB": "passed",
+        "CCC": "passed",
+    }
+    assert [r["message"] for r in a.values()] == [r["message"] for r in b.values()]
+
+    # Same content in a new frame object is a cache hit; changed content is not
+    frames["BBB"] = frames["BBB"].copy()
+    frames["CCC"] = _bars(n=6)
+    serial.batch_validate_symbols(frames)
+    assert serial.last_batch_stats["validated"] == 1
+    assert frame_fingerprint(_bars()) == frame_fingerprint(_bars())
+
+
+def test_bar_file_cache_and_validation_cache(tmp_path):
+    path = tmp_path / "AAA_USUSD_1D.ftr"
+    _write(path, _bars())
+    bars = BarFileCache(max_entries=1)
+    first = bars.get(path)
+    assert bars.get(path) is first and (bars.hits, bars.misses) == (1, 1)
+    _write(path, _bars(seed=1))
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    assert bars.get(path) is not first and bars.misses == 2
+
+    (tmp_path / "broken.json").write_text("{not json")
+    assert len(ValidationCache(tmp_path / "broken.json")) == 0
@@ -0,0 +1,105 @@
+import asyncio
+from datetime import date, datetime, time
+
+import pytest
+
+from src.services.market_data.request_planner import (
+    covered_from_coverage,
+    execute_plan,
+    normalize_bar_size,
+    plan_requests,
+    windows_for_gaps,
+)
+
+D = date(2025, 3, 3)  # Monday
+
+
+def test_windows_respect_max_duration_and_merge_gaps():
+    t = lambda h, m=0: datetime.combine(D, time(h, m))  # noqa: E731
+    gaps = [(t(9), t(9, 20)), (t(9, 25), t(9, 40)), (t(10), t(11))]
+    windows = windows_for_gaps("AAPL", "1 sec", gaps)
+    # 1 secs bars allow 1800 S: 09:00-09:30, 09:30-09:40 (+ 10:00 too far), 10:00-11:00
+    assert [(w.start, w.end, w.duration) for w in windows] == [
+        (t(9), t(9, 30), "1800 S"),
+        (t(9, 30), t(9, 40), "600 S"),
+        (t(10), t(10, 30), "1800 S"),
+        (t(10, 30), t(11), "1800 S"),
+    ]
+    # IB counts D in trading days: Friday to Tuesday is three sessions
+    friday, tuesday = datetime(2025, 2, 28, 16), datetime(2025, 3, 4, 16)
+    (window,) = windows_for_gaps("AAPL", "30 mins", [(friday, tuesday)])
+    assert window.duration == "3 D"
+    assert normalize_bar_size("5 min") == "5 mins"
+    with pytest.raises(ValueError):
+        normalize_bar_size("7 secs")
+
+
+def test_plan_skips_coverage_interleaves_symbols_and_estimates():
+    coverage = {
+        "entries": [
+            {
+                "symbol": "AAPL",
+                "bar_size": "1 sec",
+                "days": [
+                    {
+                        "date": "2025-03-03",
+                        "time_start": "2025-03-03T09:00:00-05:00",
+                        "time_end": "2025-03-03T11:00:00-05:00",
+                    }
+                ],
+            }
+        ]
+    }
+    covered = covered_from_coverage(coverage, "1 secs")
+    plan = plan_requests(
+        ["AAPL", "MSFT"],
+        "1 sec",
+        D,
+        date(2025, 3, 9),  # weekend days are dropped
+        covered=covered,
+        session=(time(9), time(11)),
+        request_seconds=1.0,
+    )
+    symbols = [w.symbol for w in plan.windows]
+    assert symbols.count("AAPL") == 4 * 4 and symbols.count("MSFT") == 4 * 5
+    assert symbols[:4] == ["AAPL", "MSFT", "AAPL", "MSFT"]
+    assert all(w.start.date() != D for w in plan.windows if w.symbol == "AAPL")
+    # 36 small-bar requests fit the 60 per 10 minute budget: ~1 s each
+    assert plan.estimated_seconds == pytest.approx(36.0)
+
+    many = plan_requests(
+        ["AAPL"], "1 secs", D, date(2025, 3, 24), session=(time(9), time(11))
+    )
+    assert len(many.windows) == 64
+    # the 61st request waits for the first to leave the 10 minute window
+    assert many.estimated_seconds == pytest.approx(600 + 4 * 2.0)
+
+
+def test_execute_plan_resumes_from_checkpoint(tmp_path):
+    plan = plan_requests(["AAPL"], "1 min", D, date(2025, 3, 5))
+    assert [w.duration for w in plan.windows] == ["23400 S"] * 3  # RTH, one per day
+    checkpoint = tmp_path / "plan.ckpt"
+    seen: list[str] = []
+
+    def flaky(window):
+        seen.append(window.key)
+        if len(seen) == 2:
+            raise ConnectionError("gateway went away")
+        return True
+
+    assert asyncio.run(execute_plan(plan, flaky, checkpoint)) == {
+        "completed": 2,
+        "skipped": 0,
+        "failed": 1,
+    }
+
+    async def fetch(window):
+        seen.append(window.key)
+        return True
+
+    assert asyncio.run(execute_plan(plan, fetch, checkpoint)) == {
+        "completed": 1,
+        "skipped": 2,
+        "failed": 0,
+    }
+    assert seen[-1] == seen[1]
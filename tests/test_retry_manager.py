@@ -6,16 +6,31 @@ non-retryable fast‑fail behavior. These cover previously missed branches.
 
 from __future__ import annotations
 
+import asyncio
+import time
+
 import pytest
 
+from src.core.error_handler import TradingSystemError
 from src.core.retry_manager import (
+    FailurePolicy,
+    FailureType,
+    HedgeConfig,
     RetryConfig,
     RetryManager,
     RetryStrategy,
+    classify_failure,
+    failure_type_policies,
     retry_on_failure,
 )
 
 
+class _HttpError(Exception):
+    def __init__(self, message: str, http_status: int):
+        super().__init__(message)
+        self.http_status = http_status
+
+
 def _raise_n_times(exc: Exception, n: int):
     """Return a function that raises `exc` the first n calls then returns marker.
 
@@ -151,3 +166,97 @@ def test_decorator_retry_on_failure(monkeypatch):
 
     assert sometimes() == "OK"
     assert attempts["n"] == 2  # First failed, second succeeded
+
+
+def test_failure_policies_classify_and_override_delay():
+    rate_limited = _HttpError("Too Many Requests", http_status=429)
+    paced = TradingSystemError("HMDS query", context={"errorCode": 420})
+    assert classify_failure(rate_limited) is FailureType.RATE_LIMIT_ERROR
+    assert classify_failure(paced) is FailureType.RATE_LIMIT_ERROR
+    # Message text alone never makes a rate limit
+    assert classify_failure(Exception("order 429 rejected")) is FailureType.SYSTEM_ERROR
+    assert classify_failure(TimeoutError()) is FailureType.TIMEOUT_ERROR
+    assert classify_failure(ValueError()) is FailureType.DATA_ERROR
+
+    # Without opting in, retries depend on the exception type only
+    config = RetryConfig(max_attempts=3, base_delay=0.1, jitter=False)
+    assert RetryManager(config).config.failure_policies == {}
+    assert not RetryManager(config)._should_retry(rate_limited, 1)
+
+    # Opted in: rate limits are retried, linearly from 5s
+    config.failure_policies = failure_type_policies()
+    rm = RetryManager(config)
+    assert not rm._should_retry(Exception("boom"), 1)
+    assert rm._should_retry(rate_limited, 1)
+    policy = rm.config.failure_policies[FailureType.RATE_LIMIT_ERROR]
+    assert rm._calculate_delay(2, policy) == pytest.approx(10.0)
+
+    rm = RetryManager(
+        RetryConfig(
+            max_attempts=2,
+            jitter=False,
+            failure_policies={
+                FailureType.CONNECTION_ERROR: FailurePolicy(max_attempts=4)
+            },
+        )
+    )
+    assert rm._should_retry(ConnectionError(), 3)
+    assert not rm._should_retry(ConnectionError(), 4)
+
+
+def test_async_retry_backoff_does_not_block_loop(monkeypatch):
+    def no_blocking_sleep(_s):
+        raise AssertionError("time.sleep called on the event loop")
+
+    monkeypatch.setattr("time.sleep", no_blocking_sleep)
+    rm = RetryManager(RetryConfig(max_attempts=3, base_delay=0.1, jitter=False))
+    calls = {"n": 0}
+
+    async def flaky() -> str:
+        calls["n"] += 1
+        if calls["n"] < 3:
+            raise ConnectionError("reset")
+        return "OK"
+
+    async def main() -> tuple[str, int]:
+        ticks = 0
+
+        async def ticker() -> None:
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        result = await rm.execute_with_retry_async(flaky)
+        task.cancel()
+        return result, ticks
+
+    result, ticks = asyncio.run(main())
+    assert result == "OK" and calls["n"] == 3
+    assert ticks >= 10  # the loop kept running through ~0.2s of backoff
+    assert rm.stats.failure_classes == {"connection_error": 2}
+
+
+def test_hedged_request_takes_first_response():
+    rm = RetryManager(RetryConfig(max_attempts=1))
+    hedge = HedgeConfig(initial_delay=0.02, min_samples=1000, name="range")
+    delays = [0.5, 0.01]
+
+    async def fetch() -> float:
+        delay = delays.pop(0) if delays else 0.0
+        await asyncio.sleep(delay)
+        return delay
+
+    async def main() -> float:
+        started = time.monotonic()
+        assert await rm.execute_with_retry_async(fetch, hedge=hedge) == 0.01
+        return time.monotonic() - started
+
+    assert asyncio.run(main()) < 0.2
+    # A fast call does not hedge
+    assert asyncio.run(rm.execute_with_retry_async(fetch, hedge=hedge)) == 0.0
+    summary = rm.stats.get_summary()
+    assert summary["hedges_launched"] == 1 and summary["hedges_won"] == 1
+    assert summary["added_load"] == pytest.approx(50.0)
+    assert rm.latency("range").count == 2
@@ -0,0 +1,73 @@
+from datetime import UTC, datetime, timedelta
+
+import numpy as np
+
+from src.monitoring.outcome_store import SignalOutcomeStore
+
+
+def _populate(store: SignalOutcomeStore, n: int = 500):
+    rng = np.random.default_rng(7)
+    now = datetime.now(UTC)
+    rows = []
+    for i in range(n):
+        model = "v1" if i % 3 else "v2"
+        strategy = "gap" if i % 2 else "fade"
+        # Deliberately out of time order
+        ts = now - timedelta(hours=float(rng.uniform(0, 24 * 60)))
+        store.add_signal(f"s{i}", model, strategy, ts, 0.5 + (i % 5) / 10, i % 7)
+        pnl = float(rng.normal(0, 10)) if i % 4 else None
+        if pnl is not None:
+            store.record_pnl(f"s{i}", pnl)
+        if i % 5 == 0:
+            store.record_execution(f"s{i}", 80.0, 100.0 + i, 1.5)
+        rows.append((model, strategy, ts, pnl, i % 5 == 0))
+    return now, rows
+
+
+def test_window_matches_bruteforce_filter():
+    store = SignalOutcomeStore()
+    now, rows = _populate(store)
+    start = now - timedelta(days=30)
+
+    window = store.window("v1", "gap", start=start)
+    expected = sorted(
+        (r for r in rows if r[0] == "v1" and r[1] == "gap" and r[2] >= start),
+        key=lambda r: r[2],
+    )
+    assert len(window) == len(expected)
+    assert np.all(np.diff(window.ts) >= 0)
+    exp_pnl = [r[3] for r in expected if r[3] is not None]
+    assert np.allclose(window.pnl[~np.isnan(window.pnl)], exp_pnl)
+    assert int(window.executed.sum()) == sum(1 for r in expected if r[4])
+
+    # Strategy omitted merges partitions in time order
+    all_v1 = store.window("v1", start=start)
+    assert len(all_v1) == sum(1 for r in rows if r[0] == "v1" and r[2] >= start)
+    assert np.all(np.diff(all_v1.ts) >= 0)
+
+
+def test_aggregates_track_pnl_and_execution_updates():
+    store = SignalOutcomeStore()
+    t = datetime.now(UTC)
+    store.add_signal("a", "v1", "s", t, 0.8, 10)
+    store.add_signal("b", "v1", "s", t, 0.6, 5)
+    store.record_pnl("a", 5.0)
+    store.record_pnl("a", -2.0)  # replaced, not double counted
+    store.record_pnl("b", 3.0)
+    store.record_execution("a", 90.0, 200.0, 1.0)
+    store.record_execution("a", 70.0, 100.0, 2.0)
+    assert store.record_pnl("missing", 1.0) is False
+
+    agg = store.aggregates("v1")
+    assert agg.total_signals == 2
+    assert agg.pnl_count == 2 and agg.pnl_sum == 1.0
+    assert agg.win_count == 1 and agg.loss_count == 1
+    assert agg.signals_executed == 1 and agg.latency_sum_ms == 100.0
+    summary = store.model_summaries()["v1"]
+    assert summary["avg_confidence"] == 0.7
+    assert summary["win_rate"] == 0.5
+
+
+def test_empty_window():
+    store = SignalOutcomeStore()
+    assert len(store.window("nope")) == 0
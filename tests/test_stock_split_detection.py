@@ -0,0 +1,68 @@
+"""Tests for vectorized and batch stock split detection."""
+
+from __future__ import annotations
+
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from src.services.stock_split_detection_service import (
+    SPLIT_TABLE_COLUMNS,
+    detect_splits,
+    nearest_split_ratio,
+    scan_split_directory,
+)
+
+
+def _bars(
+    split_at: int | None = None, ratio: float = 2.0, n: int = 120
+) -> pd.DataFrame:
+    rng = np.random.default_rng(7)
+    idx = pd.bdate_range("2024-01-02", periods=n)
+    close = 100 * np.cumprod(1 + rng.normal(0, 0.005, n))
+    volume = rng.normal(1_000_000, 50_000, n)
+    if split_at is not None:
+        close[split_at:] /= ratio
+        volume[split_at] *= 8
+    return pd.DataFrame({"close": close, "volume": volume}, index=idx)
+
+
+def test_nearest_split_ratio_vectorized():
+    ratios = np.array([1.9, np.nan, -1.0, 0.3, 1.6, 2.7, np.inf])
+    assert nearest_split_ratio(ratios).tolist() == [2.0, 1.0, 1.0, 0.333, 1.5, 3.0, 2.0]
+    assert nearest_split_ratio(np.array([])).size == 0
+
+
+def test_detect_splits_finds_gap_with_volume_confirmation():
+    df = _bars(split_at=60)
+    splits = detect_splits("AAPL", df.iloc[::-1])  # unsorted input is fine
+    assert len(splits) == 1
+    split = splits[0]
+    assert split.split_date == df.index[60].date()
+    assert split.split_ratio == 2.0
+    assert split.detection_method == "price_gap+1_confirmations"
+    assert detect_splits("AAPL", _bars()) == []
+
+
+def test_scan_split_directory_builds_one_table(tmp_path):
+    _bars(split_at=30).rename_axis("date").reset_index().to_feather(
+        tmp_path / "AAA_USUSD_1D.ftr"
+    )
+    _bars(split_at=90, ratio=3.0).rename_axis("date").reset_index().to_csv(
+        tmp_path / "BBB_USUSD_1D.csv", index=False
+    )
+    _bars().rename_axis("date").reset_index().to_feather(tmp_path / "CCC_USUSD_1D.ftr")
+    (tmp_path / "BAD_USUSD_1D.csv").write_text("close\n")
+    (tmp_path / "notes.txt").write_text("ignored")
+
+    errors: list[str] = []
+    table = scan_split_directory(tmp_path, max_workers=2, errors=errors)
+    assert list(table.columns) == SPLIT_TABLE_COLUMNS
+    assert table["symbol"].tolist() == ["AAA", "BBB"]
+    assert table["split_date"].tolist() == [date(2024, 2, 13), date(2024, 5, 7)]
+    assert table["split_ratio"].tolist() == [2.0, 3.0]
+    assert errors == []  # too short to analyse is not an error
+
+    in_process = scan_split_directory(tmp_path, max_workers=1)
+    pd.testing.assert_frame_equal(table, in_process)
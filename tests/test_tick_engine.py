@@ -0,0 +1,97 @@
+import threading
+import time
+
+from src.services.market_data_service import (
+    MarketDataService,
+    MarketDataSnapshot,
+    MarketDataTick,
+    TickType,
+)
+from src.services.tick_engine import ShardedTickEngine, SnapshotConflator, shard_for
+
+
+def _wait(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+def test_engine_keeps_per_symbol_order_and_counts_drops():
+    seen: dict[str, list[int]] = {}
+    threads: dict[str, set[str]] = {}
+    lock = threading.Lock()
+
+    def process(tick):
+        with lock:
+            seen.setdefault(tick.symbol, []).append(int(tick.value))
+            threads.setdefault(tick.symbol, set()).add(threading.current_thread().name)
+
+    engine = ShardedTickEngine(process, shards=3, queue_size=4)
+    symbols = ["AAPL", "MSFT", "TSLA", "NVDA"]
+    # Not started: each shard accepts queue_size ticks, the rest are dropped
+    accepted = [
+        engine.submit(MarketDataTick(sym, TickType.LAST_PRICE, i))
+        for i in range(10)
+        for sym in symbols
+    ]
+    per_shard = {shard_for(s, 3) for s in symbols}
+    assert sum(accepted) == 4 * len(per_shard)
+    assert engine.stats()["dropped"] == 40 - sum(accepted)
+
+    engine.start()
+    _wait(lambda: engine.stats()["processed"] == sum(accepted))
+    for i in range(10, 200):
+        for sym in symbols:
+            while not engine.submit(MarketDataTick(sym, TickType.LAST_PRICE, i)):
+                time.sleep(0.001)
+    expected = sum(accepted) + 190 * len(symbols)
+    _wait(lambda: sum(map(len, seen.values())) == expected)
+    engine.stop()
+
+    for sym in symbols:
+        assert seen[sym] == sorted(seen[sym])
+        assert len(threads[sym]) == 1  # a symbol never moves between shards
+    stats = engine.stats()
+    assert stats["queue_lag_max_ms"] >= stats["queue_lag_ms"] >= 0
+
+
+def test_conflator_delivers_latest_value_per_symbol():
+    delivered = []
+    conflator = SnapshotConflator([delivered.append], interval=60)
+    for i in range(100):
+        conflator.offer("AAPL", ("AAPL", i))
+    conflator.offer("MSFT", ("MSFT", 1))
+    assert delivered == []
+
+    assert conflator.flush() == 2
+    assert sorted(delivered) == [("AAPL", 99), ("MSFT", 1)]
+    assert conflator.stats()["conflated"] == 99
+
+    immediate = []
+    SnapshotConflator([immediate.append], interval=0).offer("AAPL", 1)
+    assert immediate == [1]
+
+
+def test_service_updates_snapshot_and_conflates_handlers():
+    service = MarketDataService(shards=2, conflation_interval=0.05)
+    calls: list[MarketDataSnapshot] = []
+    service.add_snapshot_handler(calls.append)
+    service.snapshots["AAPL"] = MarketDataSnapshot(symbol="AAPL")
+    service._start_processing_thread()
+    try:
+        for i in range(500):
+            service.submit_tick(MarketDataTick("AAPL", TickType.BID_PRICE, 10 + i))
+        service.submit_tick(MarketDataTick("AAPL", TickType.BID_SIZE, 300.0))
+        _wait(lambda: service.get_stream_statistics()["total_ticks_received"] == 501)
+    finally:
+        service._stop_processing_thread()
+
+    snap = service.get_market_data_snapshot("AAPL")
+    assert snap.bid_price == 509 and snap.bid_size == 300
+    assert 0 < len(calls) < 501
+    # Handlers get copies taken under the lock, never the live snapshot
+    assert all(call is not service.snapshots["AAPL"] for call in calls)
+    stats = service.get_stream_statistics()
+    assert stats["ticks_dropped"] == 0
+    assert stats["snapshots_conflated"] == 501 - len(calls)
@@ -0,0 +1,102 @@
+"""Tests for the precomputed trading-calendar index."""
+
+from __future__ import annotations
+
+from datetime import date, time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.services.trading_calendar import TradingCalendarIndex
+
+
+def _index() -> TradingCalendarIndex:
+    # Two weeks of NYSE-like sessions: holiday on Thu 2024-11-28, early close
+    # on Fri 2024-11-29; EST throughout
+    days = pd.bdate_range("2024-11-25", "2024-12-06").drop(pd.Timestamp("2024-11-28"))
+    opens = (days + pd.Timedelta(hours=14, minutes=30)).tz_localize("UTC")
+    closes = (days + pd.Timedelta(hours=21)).tz_localize("UTC")
+    closes = closes.where(
+        days != pd.Timestamp("2024-11-29"), opens + pd.Timedelta(hours=3.5)
+    )
+    schedule = pd.DataFrame({"market_open": opens, "market_close": closes}, index=days)
+    return TradingCalendarIndex.from_schedule(
+        "NYSE",
+        schedule,
+        "America/New_York",
+        time(16),
+        date(2024, 11, 23),
+        date(2024, 12, 8),
+    )
+
+
+def test_scalar_lookups():
+    idx = _index()
+    assert idx.is_trading_day(date(2024, 11, 27))
+    assert not idx.is_trading_day("2024-11-28")
+    assert idx.previous_trading_day(date(2024, 11, 28)) == date(2024, 11, 27)
+    assert idx.previous_trading_day(date(2024, 11, 29), inclusive=False) == date(
+        2024, 11, 27
+    )
+    assert idx.previous_trading_day(date(2024, 11, 24)) is None
+    assert idx.next_trading_day(date(2024, 11, 27)) == date(2024, 11, 29)
+    assert idx.next_trading_day(date(2024, 11, 30), inclusive=True) == date(2024, 12, 2)
+    assert idx.next_trading_day(date(2024, 12, 6)) is None
+    assert idx.count_trading_days(date(2024, 11, 25), date(2024, 12, 1)) == 4
+    assert idx.trading_days("2024-11-27", "2024-12-02").tolist() == [
+        date(2024, 11, 27),
+        date(2024, 11, 29),
+        date(2024, 12, 2),
+    ]
+    with pytest.raises(ValueError):
+        idx.is_trading_day(date(2025, 1, 2))
+
+
+def test_sessions_and_early_close():
+    idx = _index()
+    assert idx.session(date(2024, 11, 28)) is None
+    open_, close = idx.session(date(2024, 11, 29))
+    assert (open_.time(), close.time()) == (time(9, 30), time(13))
+    assert idx.is_early_close(date(2024, 11, 29))
+    assert not idx.is_early_close(date(2024, 12, 2))
+    assert set(idx.utc_offsets.tolist()) == {-300}
+    schedule = idx.schedule("2024-11-27", "2024-11-29")
+    assert list(schedule.index.date) == [date(2024, 11, 27), date(2024, 11, 29)]
+    assert str(schedule["market_close"].dt.tz) == "UTC"
+
+
+def test_vectorized_lookups():
+    idx = _index()
+    days = np.array(["2024-11-22", "2024-11-28", "2024-11-29", "2024-12-07"], "M8[D]")
+    assert idx.trading_day_mask(days).tolist() == [False, False, True, False]
+    prev = idx.previous_trading_days(days)
+    assert [str(d) for d in prev] == ["NaT", "2024-11-27", "2024-11-29", "2024-12-06"]
+    nxt = idx.next_trading_days(days)
+    assert [str(d) for d in nxt] == ["NaT", "2024-11-29", "2024-12-02", "NaT"]
+    counts = idx.count_trading_days(
+        pd.Series(pd.to_datetime(["2024-11-25", "2024-11-30"])),
+        np.array(["2024-11-29", "2024-12-06"], "M8[D]"),
+    )
+    assert counts.tolist() == [4, 5]
+
+
+def test_matches_market_calendar_and_round_trips_cache(tmp_path):
+    mcal = pytest.importorskip("pandas_market_calendars")
+    idx = TradingCalendarIndex.build("NYSE", date(2023, 1, 1), date(2024, 12, 31))
+    path = tmp_path / "nyse.npz"
+    idx.save(path)
+    loaded = TradingCalendarIndex.load(path)
+    assert loaded is not None
+
+    valid = {
+        d.date()
+        for d in mcal.get_calendar("NYSE").valid_days("2023-01-01", "2024-12-31")
+    }
+    days = np.arange(np.datetime64("2023-01-01"), np.datetime64("2025-01-01"))
+    expected = [d in valid for d in days.tolist()]
+    assert loaded.trading_day_mask(days).tolist() == expected
+    # DST: 14:30 UTC in winter, 13:30 UTC in summer, both 09:30 New York
+    assert loaded.utc_offsets[0] == -300
+    assert loaded.session(date(2024, 7, 1))[0].time() == time(9, 30)
+    assert loaded.is_early_close(date(2024, 12, 24))